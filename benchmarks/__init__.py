@@ -0,0 +1 @@
+"""Performance benchmarks for CCC Schedule utilities."""
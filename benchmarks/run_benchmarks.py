@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Benchmark the schedule hot paths on synthetic data.
+
+Each benchmark is timed (best and mean of ``--repeat`` runs) and then run once
+more under ``tracemalloc`` to record peak memory. Results are written as JSON
+named after the current git commit so runs can be compared between commits:
+
+    python benchmarks/run_benchmarks.py --sizes 1000 10000
+    python benchmarks/run_benchmarks.py --compare results/OLD.json results/NEW.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import (  # noqa: E402
+    generate_legacy_courses,
+    generate_schedule,
+    generate_standardized,
+)
+from src.college_rules import load_college_rules  # noqa: E402
+from src.data_utils import (  # noqa: E402
+    filter_courses,
+    get_unique_values,
+    load_schedule_data,
+    save_schedule_data,
+)
+from src.models import FilterOptions  # noqa: E402
+from src.schedule_changes import diff_schedules, section_index  # noqa: E402
+from src.schema_validator import ExtensibleSchemaValidator  # noqa: E402
+from src.validators import CourseValidator, StandardizedValidator  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+RESULTS_DIR = Path(__file__).parent / "results"
+BASE_SCHEMA = PROJECT_ROOT / "data" / "schemas" / "base.json"
+COLLEGE_CONFIG = PROJECT_ROOT / "colleges" / "rio-hondo" / "config.json"
+
+# name -> setup(size, workdir) returning the zero-argument callable to measure
+BENCHMARKS: dict[str, Callable[[int, Path], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under ``name``."""
+
+    def register(setup: Callable[[int, Path], Callable[[], Any]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _schedule_file(size: int, workdir: Path) -> Path:
+    """Write (once per size) a synthetic schedule file and return its path."""
+    path = workdir / f"schedule_{size}.json"
+    if not path.exists():
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(generate_schedule(size), f)
+    return path
+
+
+@benchmark("load_schedule_data")
+def _bench_load(size: int, workdir: Path) -> Callable[[], Any]:
+    path = _schedule_file(size, workdir)
+    return lambda: load_schedule_data(path)
+
+
+@benchmark("filter_courses")
+def _bench_filter(size: int, workdir: Path) -> Callable[[], Any]:
+    courses = load_schedule_data(_schedule_file(size, workdir)).courses
+    filters = FilterOptions(
+        term="202570", days=["M"], open_only=True, keyword="principles"
+    )
+    return lambda: filter_courses(courses, filters)
+
+
+@benchmark("get_unique_values")
+def _bench_unique(size: int, workdir: Path) -> Callable[[], Any]:
+    schedule = load_schedule_data(_schedule_file(size, workdir))
+    return lambda: get_unique_values(schedule)
+
+
+@benchmark("CourseValidator.validate_courses")
+def _bench_course_validator(size: int, _workdir: Path) -> Callable[[], Any]:
+    courses = generate_legacy_courses(size)
+    validator = CourseValidator()
+    return lambda: validator.validate_courses(courses)
+
+
+@benchmark("ExtensibleSchemaValidator.validate")
+def _bench_schema_validator(size: int, _workdir: Path) -> Callable[[], Any]:
+    data = generate_standardized(size)
+    validator = ExtensibleSchemaValidator(BASE_SCHEMA, COLLEGE_CONFIG)
+    return lambda: validator.validate(data, strict=True)
+
+
+@benchmark("StandardizedValidator.validate")
+def _bench_standardized_validator(size: int, _workdir: Path) -> Callable[[], Any]:
+    data = generate_standardized(size)
+    validator = StandardizedValidator(load_college_rules(COLLEGE_CONFIG))
+    return lambda: validator.validate(data)
+
+
+@benchmark("save_schedule_data")
+def _bench_save(size: int, workdir: Path) -> Callable[[], Any]:
+    schedule = load_schedule_data(_schedule_file(size, workdir))
+    output = workdir / f"saved_{size}.json"
+    return lambda: save_schedule_data(schedule, output)
+
+
+@benchmark("diff_schedules")
+def _bench_diff(size: int, workdir: Path) -> Callable[[], Any]:
+    old = load_schedule_data(_schedule_file(size, workdir))
+    new = load_schedule_data(_schedule_file(size, workdir))
+    # An enrollment update: one section in 20 gains a student
+    for index, (_course, section) in enumerate(section_index(new.courses).values()):
+        if index % 20 == 0:
+            section.enrollment.enrolled += 1
+    return lambda: diff_schedules(old, new)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Time ``func`` and measure its peak traced memory."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "best_seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+        "peak_bytes": peak,
+    }
+
+
+def git_commit() -> str:
+    """Get the current commit hash, or "unknown" outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(sizes: list[int], names: list[str], repeat: int) -> dict[str, Any]:
+    """Run the selected benchmarks for every size."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for size in sizes:
+            for name in names:
+                func = BENCHMARKS[name](size, workdir)
+                stats = measure(func, repeat)
+                results.append({"name": name, "size": size, **stats})
+                print(
+                    f"{name:<38} {size:>8,}  "
+                    f"{stats['best_seconds'] * 1000:>10.1f} ms  "
+                    f"{stats['peak_bytes'] / 1_048_576:>8.1f} MiB"
+                )
+
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(old_path: Path, new_path: Path, threshold: float) -> int:
+    """Compare two result files and report regressions above ``threshold``."""
+    with open(old_path) as f:
+        old = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    for result in new:
+        before = old.get((result["name"], result["size"]))
+        if before is None:
+            continue
+
+        for metric in ("best_seconds", "peak_bytes"):
+            ratio = result[metric] / before[metric] if before[metric] else 1.0
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(
+                f"{result['name']:<38} {result['size']:>8,} {metric:<13} "
+                f"{ratio:>6.2f}x{flag}"
+            )
+
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Section counts to benchmark (up to 500000)",
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("--output", help="Result file (default: results/<commit>.json)")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("OLD", "NEW"),
+        help="Compare two result files instead of running",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown reported as a regression (default: 0.10)",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        return compare(Path(args.compare[0]), Path(args.compare[1]), args.threshold)
+
+    report = run(args.sizes, args.only or list(BENCHMARKS), args.repeat)
+
+    output = (
+        Path(args.output) if args.output else RESULTS_DIR / f"{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""Deterministic synthetic schedule generator for benchmarks.
+
+The same seed and size always produce the same data. Sections are generated
+once as plain records and rendered into the three shapes the code base works
+with: the ``Schedule`` model layout read by ``load_schedule_data``, the
+standardized transformer output checked by ``ExtensibleSchemaValidator``, and
+the legacy flat course layout checked by ``CourseValidator``.
+"""
+
+import random
+from collections.abc import Iterator
+from typing import Any
+
+SUBJECTS = [
+    ("ACCT", "Accounting"),
+    ("ART", "Art"),
+    ("BIOL", "Biology"),
+    ("CHEM", "Chemistry"),
+    ("CS", "Computer Science"),
+    ("ECON", "Economics"),
+    ("ENGL", "English"),
+    ("HIST", "History"),
+    ("MATH", "Mathematics"),
+    ("MUS", "Music"),
+    ("PHYS", "Physics"),
+    ("PSY", "Psychology"),
+]
+TERMS = [
+    ("202530", "Spring 2025", "2025-01-20", "2025-05-25"),
+    ("202570", "Fall 2025", "2025-08-25", "2025-12-20"),
+]
+MODES = ["INP", "ONL", "HYB", "SYNC", "ARR"]
+LEGACY_MODES = {"INP": "INP", "ONL": "AON", "HYB": "HYB", "SYNC": "SON", "ARR": "INP"}
+STATUSES = ["Open", "Open", "Open", "Closed", "Waitlist"]
+DAY_PATTERNS = [["M", "W"], ["T", "R"], ["M", "W", "F"], ["F"], ["S"]]
+TEXTBOOK_COSTS = ["ZTC", "ZTC", "LTC", "REG"]
+GE_AREAS = ["A1", "A2", "B1", "B2", "C1", "D", "E"]
+WORDS = [
+    "Introduction",
+    "Principles",
+    "Advanced",
+    "Topics",
+    "Methods",
+    "Theory",
+    "Applied",
+    "Survey",
+    "Foundations",
+    "Laboratory",
+]
+
+SECTIONS_PER_COURSE = 4
+
+
+def generate_sections(size: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield ``size`` deterministic section records.
+
+    Args:
+        size: Number of sections to generate
+        seed: Random seed
+
+    Yields:
+        Flat section records including their course fields
+    """
+    rng = random.Random(seed)
+    instructor_count = max(10, size // 8)
+    room_count = max(10, size // 20)
+
+    for index in range(size):
+        course_index = index // SECTIONS_PER_COURSE
+        subject, _subject_name = SUBJECTS[course_index % len(SUBJECTS)]
+        course_number = str(100 + course_index // len(SUBJECTS))
+        term = TERMS[index % len(TERMS)]
+        start_hour = rng.randint(7, 20)
+        duration = rng.choice([50, 75, 110, 170])
+        end_minutes = start_hour * 60 + duration
+        capacity = rng.choice([25, 30, 35, 40, 45])
+        instructor = rng.randrange(instructor_count)
+
+        yield {
+            "course_key": f"{subject}-{course_number}",
+            "subject": subject,
+            "course_number": course_number,
+            "title": f"{WORDS[course_index % len(WORDS)]} of {subject} {course_number}",
+            "units": float(rng.choice([1, 2, 3, 3, 4, 5])),
+            "crn": str(10000 + index),
+            "section_number": f"{index % SECTIONS_PER_COURSE + 1:02d}",
+            "term": term,
+            "mode": rng.choice(MODES),
+            "status": rng.choice(STATUSES),
+            "capacity": capacity,
+            "enrolled": rng.randint(0, capacity),
+            "waitlist": rng.randint(0, 10),
+            "days": rng.choice(DAY_PATTERNS),
+            "start_time": f"{start_hour:02d}:00",
+            "end_time": f"{end_minutes // 60:02d}:{end_minutes % 60:02d}",
+            "building": f"B{rng.randrange(room_count) // 10}",
+            "room": str(100 + rng.randrange(room_count)),
+            "instructor_id": str(instructor),
+            "instructor_name": f"Instructor{instructor:05d}, Pat",
+            "instructor_email": f"instructor{instructor:05d}@example.edu",
+            "textbook": rng.choice(TEXTBOOK_COSTS),
+            "ge_area": rng.choice(GE_AREAS),
+        }
+
+
+def _group_by_course(
+    size: int, seed: int
+) -> Iterator[tuple[dict[str, Any], list[dict[str, Any]]]]:
+    """Group consecutive section records into courses."""
+    current: list[dict[str, Any]] = []
+    for record in generate_sections(size, seed):
+        if current and current[0]["course_key"] != record["course_key"]:
+            yield current[0], current
+            current = []
+        current.append(record)
+    if current:
+        yield current[0], current
+
+
+def generate_schedule(size: int, seed: int = 0) -> dict[str, Any]:
+    """Generate data in the ``Schedule`` model layout.
+
+    Args:
+        size: Number of sections
+        seed: Random seed
+
+    Returns:
+        Dictionary readable by ``load_schedule_data``
+    """
+    courses = []
+    instructors: dict[str, dict[str, Any]] = {}
+
+    for first, records in _group_by_course(size, seed):
+        sections = []
+        for r in records:
+            instructors.setdefault(
+                r["instructor_id"],
+                {
+                    "id": r["instructor_id"],
+                    "name": r["instructor_name"],
+                    "email": r["instructor_email"],
+                    "departments": [r["subject"]],
+                },
+            )
+            sections.append(
+                {
+                    "crn": r["crn"],
+                    "section_number": r["section_number"],
+                    "term": r["term"][0],
+                    "college": "synthetic",
+                    "instruction_mode": r["mode"],
+                    "status": r["status"],
+                    "enrollment": {
+                        "enrolled": r["enrolled"],
+                        "capacity": r["capacity"],
+                        "waitlist": r["waitlist"],
+                        "waitlist_capacity": 10,
+                    },
+                    "meetings": [
+                        {
+                            "type": "Lecture",
+                            "days": r["days"],
+                            "start_time": r["start_time"],
+                            "end_time": r["end_time"],
+                            "location": {
+                                "building": r["building"],
+                                "room": r["room"],
+                                "campus": "Main",
+                            },
+                        }
+                    ],
+                    "instructors": [r["instructor_id"]],
+                    "dates": {
+                        "start": r["term"][2],
+                        "end": r["term"][3],
+                        "duration_weeks": 16,
+                    },
+                    "textbook": {
+                        "required": True,
+                        "cost_category": r["textbook"],
+                        "details": "",
+                    },
+                }
+            )
+
+        courses.append(
+            {
+                "course_key": first["course_key"],
+                "subject": first["subject"],
+                "course_number": first["course_number"],
+                "title": first["title"],
+                "description": f"{first['title']} - synthetic course",
+                "units": first["units"],
+                "unit_type": "semester",
+                "attributes": {
+                    "transferable": {"csu": True, "uc": False, "private": False},
+                    "general_education": {
+                        "csu_area": [first["ge_area"]],
+                        "igetc_area": [],
+                        "local": [],
+                    },
+                },
+                "sections": sections,
+            }
+        )
+
+    return {
+        "schedule": {
+            "metadata": {
+                "version": "1.0.0",
+                "last_updated": "2025-01-01T00:00:00",
+                "terms": [
+                    {"code": c, "name": n, "start_date": s, "end_date": e}
+                    for c, n, s, e in TERMS
+                ],
+                "colleges": [
+                    {
+                        "id": "synthetic",
+                        "name": "Synthetic Community College",
+                        "abbreviation": "SCC",
+                        "logo_url": "/assets/logo.png",
+                        "theme": {
+                            "primary_color": "#003366",
+                            "secondary_color": "#0066CC",
+                        },
+                    }
+                ],
+            },
+            "subjects": [
+                {"code": code, "name": name, "department": name}
+                for code, name in SUBJECTS
+            ],
+            "instructors": list(instructors.values()),
+            "courses": courses,
+        }
+    }
+
+
+def generate_standardized(size: int, seed: int = 0) -> dict[str, Any]:
+    """Generate data in the standardized transformer output layout.
+
+    Args:
+        size: Number of sections
+        seed: Random seed
+
+    Returns:
+        Dictionary valid against ``data/schemas/base.json``
+    """
+    courses = []
+    for first, records in _group_by_course(size, seed):
+        courses.append(
+            {
+                "course_id": first["course_key"],
+                "subject": first["subject"],
+                "course_number": first["course_number"],
+                "title": first["title"],
+                "units": first["units"],
+                "description": f"{first['title']} - synthetic course",
+                "sections": [
+                    {
+                        "crn": r["crn"],
+                        "status": r["status"],
+                        "instruction_mode": r["mode"],
+                        "enrollment": {
+                            "enrolled": r["enrolled"],
+                            "capacity": r["capacity"],
+                            "available": r["capacity"] - r["enrolled"],
+                            "waitlist": r["waitlist"],
+                        },
+                        "meetings": [
+                            {
+                                "type": "Lecture",
+                                "days": r["days"],
+                                "start_time": r["start_time"],
+                                "end_time": r["end_time"],
+                                "location": {
+                                    "building": r["building"],
+                                    "room": r["room"],
+                                },
+                            }
+                        ],
+                        "instructor": {
+                            "name": r["instructor_name"],
+                            "email": r["instructor_email"],
+                        },
+                        "dates": {
+                            "start": r["term"][2],
+                            "end": r["term"][3],
+                            "duration_weeks": 16,
+                        },
+                        "attributes": {
+                            "zero_textbook_cost": r["textbook"] == "ZTC",
+                        },
+                    }
+                    for r in records
+                ],
+            }
+        )
+
+    code, name, start, end = TERMS[0]
+    return {
+        "schedule": {
+            "metadata": {
+                "version": "1.0.0",
+                "last_updated": "2025-01-01T00:00:00",
+                "college": {"id": "synthetic", "name": "Synthetic College"},
+                "term": {
+                    "code": code,
+                    "name": name,
+                    "start_date": start,
+                    "end_date": end,
+                },
+            },
+            "courses": courses,
+        }
+    }
+
+
+def generate_legacy_courses(size: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Generate courses in the legacy flat layout used by ``CourseValidator``.
+
+    Args:
+        size: Number of sections
+        seed: Random seed
+
+    Returns:
+        List of legacy course dictionaries
+    """
+    return [
+        {
+            "course_id": f"{first['subject']}{first['course_number']}",
+            "title": first["title"],
+            "units": first["units"],
+            "college": "Synthetic College",
+            "term": first["term"][0],
+            "creditType": "CR",
+            "sections": [
+                {
+                    "crn": r["crn"],
+                    "instrMethod": LEGACY_MODES[r["mode"]],
+                    "instructorName": r["instructor_name"],
+                    "instructorEmail": r["instructor_email"],
+                    "days": "".join(r["days"]),
+                    "startTime": r["start_time"],
+                    "endTime": r["end_time"],
+                    "location": f"{r['building']} {r['room']}",
+                    "capacity": r["capacity"],
+                    "enrolled": r["enrolled"],
+                    "waitlist": r["waitlist"],
+                    "enrollStatus": r["status"],
+                    "textbookCost": r["textbook"],
+                }
+                for r in records
+            ],
+        }
+        for first, records in _group_by_course(size, seed)
+    ]
@@ -1,62 +1,16 @@
-import json
-import os
-from urllib.request import Request, urlopen
+"""Download West Valley's Banner schedule archive into data/.
 
+Equivalent to ``python -m src.cli download ccc-schedule-examples/west-valley-mission/data``
+from the project root.
+"""
 
-def getTermData(term):
-    # Trick Page Builder into thinking we are a browser
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/51.0.2704.103 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    }
+import sys
+from pathlib import Path
 
-    isExist = os.path.exists("data/" + term)
-    if not isExist:
-        # Create a new directory because it does not exist
-        os.makedirs("data/" + term)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-    # Term data
-    term_domains = {
-        "courses": "scheduleCourses",
-        "crns": "scheduleCRNs",
-        "ssrattr": "scheduleSsrattr",
-        "section-attributes": "scheduleSectionAttributes",
-        "ssrmeet": "searchableSchedule",
-        "sobptrm": "scheduleSobptrm",
-        "section-instructors": "scheduleSectionInstructors",
-        "instructors": "scheduleInstructors",
-        "subjcrse": "scheduleSubjCrse",
-        "subjects": "scheduleSubj",
-        "xlst": "scheduleXlst",
-        "cohorts": "scheduleCohorts",
-    }
+from src.banner_download import download_banner_archive
 
-    for fileName, virtualDomain in term_domains.items():
-        url = (
-            "https://generalssb-prod.ec.wvm.edu/BannerExtensibility/internalPb/virtualDomains."
-            + virtualDomain
-            + "?term_code="
-            + term
-        )
-        print(url)
-        request = Request(url, headers=headers)
-        html = urlopen(request).read()
-        with open("data/" + term + "/" + fileName + ".json", "wb") as f:
-            f.write(html)
-
-
-# Trick Page Builder into thinking we are a browser
-headers = {
-    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/51.0.2704.103 Safari/537.36",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-}
-url = "https://generalssb-prod.ec.wvm.edu/BannerExtensibility/internalPb/virtualDomains.scheduleSobterm"
-print(url)
-request = Request(url, headers=headers)
-html = urlopen(request).read()
-with open("data/sobterm.json", "wb") as f:
-    f.write(html)
-
-# Loop through each term in scheduleSobterm and download all data
-for x in json.loads(html):
-    getTermData(x["SOBTERM_TERM_CODE"])
+results = download_banner_archive(Path(__file__).parent / "data")
+for result in results:
+    print(result.url, result.error or f"{result.size} bytes")
@@ -0,0 +1,330 @@
+"""Parallel multi-term backfill of standardized schedules.
+
+Every term directory of a Banner archive (``data/<term>/``) is transformed and
+validated in a process pool. Each term gets its own standardized output, and a
+combined catalog lists every term and course. A manifest records the hash of
+the inputs used for each term so unchanged terms are skipped on the next run.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .data_utils import atomic_replace
+from .transformers.registry import transformer_for_config
+from .transformers.section_cache import transformer_fingerprint
+from .validators import StandardizedValidator
+
+MANIFEST_NAME = "manifest.json"
+CATALOG_NAME = "catalog.json"
+MANIFEST_VERSION = 1
+
+# Term-independent files in the archive root that feed every term
+SHARED_INPUTS = ("sobterm.json",)
+
+
+@dataclass
+class TermResult:
+    """Outcome of transforming one term."""
+
+    term: str
+    input_hash: str
+    output: str = ""
+    courses: int = 0
+    sections: int = 0
+    errors: int = 0
+    warnings: int = 0
+    skipped: bool = False
+    failure: str = ""
+
+    def to_manifest(self) -> dict[str, Any]:
+        """Convert to a manifest entry."""
+        return {
+            "input_hash": self.input_hash,
+            "output": self.output,
+            "courses": self.courses,
+            "sections": self.sections,
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+
+@dataclass
+class BackfillReport:
+    """Results of a backfill run."""
+
+    results: list[TermResult] = field(default_factory=list)
+    catalog_path: Optional[Path] = None
+
+    @property
+    def transformed(self) -> list[TermResult]:
+        """Terms transformed in this run."""
+        return [r for r in self.results if not r.skipped and not r.failure]
+
+    @property
+    def skipped(self) -> list[TermResult]:
+        """Terms skipped because their inputs did not change."""
+        return [r for r in self.results if r.skipped]
+
+    @property
+    def failed(self) -> list[TermResult]:
+        """Terms whose transformation raised an error."""
+        return [r for r in self.results if r.failure]
+
+
+def find_term_dirs(data_dir: Union[str, Path]) -> list[Path]:
+    """Find term directories (named by term code) in an archive.
+
+    Args:
+        data_dir: Archive root containing one directory per term
+
+    Returns:
+        Term directories sorted by term code
+    """
+    return sorted(
+        path
+        for path in Path(data_dir).iterdir()
+        if path.is_dir() and path.name.isdigit()
+    )
+
+
+def hash_inputs(paths: Iterable[Path]) -> str:
+    """Hash file names and contents.
+
+    Args:
+        paths: Files to hash (missing files are skipped)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        if not path.is_file():
+            continue
+        digest.update(path.name.encode("utf-8") + b"\0")
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def term_input_hash(term_dir: Path, config_path: Path, fingerprint: str = "") -> str:
+    """Hash everything a term's output depends on.
+
+    Covers the term's files, shared archive files, the college config and
+    the transformer ``fingerprint`` (see ``transformer_fingerprint``), so a
+    fix to the transformer code rebuilds every term.
+    """
+    files = sorted(term_dir.glob("*.json"))
+    shared = [term_dir.parent / name for name in SHARED_INPUTS]
+    inputs = hash_inputs([*files, *shared, config_path])
+    if not fingerprint:
+        return inputs
+    return hashlib.sha256(f"{inputs}\0{fingerprint}".encode()).hexdigest()
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Replace a JSON file atomically."""
+    with atomic_replace(path) as temp_path, open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def transform_term(
+    term_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    config_path: Union[str, Path],
+    input_hash: str = "",
+) -> TermResult:
+    """Transform, validate and save one term.
+
+    Runs in worker processes, so it only takes picklable arguments.
+
+    Args:
+        term_dir: Term directory
+        output_dir: Directory receiving ``<term>.json``
+        config_path: College configuration file; its ``college.id`` selects
+            the transformer
+        input_hash: Input hash recorded in the result
+
+    Returns:
+        TermResult for the term
+    """
+    term_dir = Path(term_dir)
+    transformer = transformer_for_config(config_path)
+    data = transformer.transform(transformer.load_input(term_dir))
+
+    result = StandardizedValidator(transformer.rules).validate(data)
+
+    # A crash must not leave a truncated output behind the manifest's hash
+    output = Path(output_dir) / f"{term_dir.name}.json"
+    _write_json(output, data)
+
+    courses = data["schedule"]["courses"]
+    return TermResult(
+        term=term_dir.name,
+        input_hash=input_hash,
+        output=output.name,
+        courses=len(courses),
+        sections=sum(len(course["sections"]) for course in courses),
+        errors=result.error_count,
+        warnings=result.warning_count,
+    )
+
+
+def load_manifest(output_dir: Path) -> dict[str, Any]:
+    """Load the backfill manifest, or an empty one."""
+    path = output_dir / MANIFEST_NAME
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            manifest: dict[str, Any] = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    return {"version": MANIFEST_VERSION, "terms": {}}
+
+
+def backfill(
+    data_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    config_path: Union[str, Path],
+    jobs: Optional[int] = None,
+    force: bool = False,
+) -> BackfillReport:
+    """Transform every changed term of an archive in parallel.
+
+    Args:
+        data_dir: Archive root containing one directory per term
+        output_dir: Directory for per-term outputs, catalog and manifest
+        config_path: College configuration file
+        jobs: Maximum worker processes (default: CPU count; 1 runs inline)
+        force: Transform every term even if its inputs are unchanged
+
+    Returns:
+        BackfillReport with one result per term
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    config_path = Path(config_path)
+    manifest = load_manifest(output_dir)
+    previous = manifest["terms"]
+    fingerprint = transformer_fingerprint(transformer_for_config(config_path))
+
+    report = BackfillReport()
+    pending: list[tuple[Path, str]] = []
+    for term_dir in find_term_dirs(data_dir):
+        input_hash = term_input_hash(term_dir, config_path, fingerprint)
+        entry = previous.get(term_dir.name)
+        if (
+            not force
+            and entry
+            and entry["input_hash"] == input_hash
+            and (output_dir / entry["output"]).exists()
+        ):
+            report.results.append(TermResult(term=term_dir.name, skipped=True, **entry))
+        else:
+            pending.append((term_dir, input_hash))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(pending) <= 1:
+        for term_dir, input_hash in pending:
+            report.results.append(
+                _run_term(term_dir, output_dir, config_path, input_hash)
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            futures = {
+                pool.submit(
+                    transform_term, term_dir, output_dir, config_path, input_hash
+                ): (term_dir, input_hash)
+                for term_dir, input_hash in pending
+            }
+            for future in as_completed(futures):
+                term_dir, input_hash = futures[future]
+                try:
+                    report.results.append(future.result())
+                except Exception as e:
+                    report.results.append(
+                        TermResult(term_dir.name, input_hash, failure=str(e))
+                    )
+
+    report.results.sort(key=lambda r: r.term)
+
+    # Failed terms are left out so they are retried next run
+    manifest["terms"] = {
+        r.term: r.to_manifest() for r in report.results if not r.failure
+    }
+    _write_json(output_dir / MANIFEST_NAME, manifest)
+
+    report.catalog_path = write_catalog(output_dir, report.results)
+    return report
+
+
+def _run_term(
+    term_dir: Path, output_dir: Path, config_path: Path, input_hash: str
+) -> TermResult:
+    """Transform a term in this process, capturing failures."""
+    try:
+        return transform_term(term_dir, output_dir, config_path, input_hash)
+    except Exception as e:
+        return TermResult(term_dir.name, input_hash, failure=str(e))
+
+
+def write_catalog(output_dir: Path, results: list[TermResult]) -> Path:
+    """Combine per-term outputs into a catalog of terms and courses.
+
+    Args:
+        output_dir: Directory holding the per-term outputs
+        results: Term results (failed terms are left out)
+
+    Returns:
+        Path of the written catalog
+    """
+    college: dict[str, Any] = {}
+    terms = []
+    courses: dict[str, dict[str, Any]] = {}
+
+    for result in results:
+        if result.failure:
+            continue
+        with open(output_dir / result.output, encoding="utf-8") as f:
+            schedule = json.load(f)["schedule"]
+
+        metadata = schedule["metadata"]
+        college = metadata["college"]
+        terms.append(
+            {
+                **metadata["term"],
+                "file": result.output,
+                "courses": result.courses,
+                "sections": result.sections,
+            }
+        )
+
+        code = metadata["term"]["code"]
+        for course in schedule["courses"]:
+            entry = courses.get(course["course_id"])
+            if entry is None:
+                entry = courses[course["course_id"]] = {
+                    "course_id": course["course_id"],
+                    "subject": course["subject"],
+                    "course_number": course["course_number"],
+                    "terms": [],
+                }
+            # Later terms carry the current title and units
+            entry["title"] = course["title"]
+            entry["units"] = course["units"]
+            entry["terms"].append(code)
+
+    catalog = {
+        "college": college,
+        "terms": terms,
+        "courses": [courses[key] for key in sorted(courses)],
+    }
+    path = output_dir / CATALOG_NAME
+    _write_json(path, catalog)
+    return path
@@ -0,0 +1,523 @@
+"""Concurrent downloads of Banner Extensibility schedule exports.
+
+West Valley publishes its schedule as Banner "virtual domains", one JSON
+document per domain and term. The downloader fetches them with a small
+HTTP/1.1 client on asyncio streams:
+
+- connections are kept alive and reused per host
+- at most ``concurrency`` requests are in flight
+- failed requests are retried with exponential backoff
+- response bodies are streamed to a temporary file that is renamed into
+  place only once complete, so a failed download never replaces a good file
+- a download manifest records each URL's ETag, Last-Modified, size and
+  content hash, so refreshes send conditional requests and leave files with
+  unchanged content untouched
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import ssl
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import urlsplit
+
+from .data_utils import atomic_replace
+
+WEST_VALLEY_BASE_URL = (
+    "https://generalssb-prod.ec.wvm.edu/BannerExtensibility/internalPb/virtualDomains."
+)
+
+# Virtual domain listing the terms, saved in the archive root
+TERM_LIST_DOMAIN = "scheduleSobterm"
+TERM_LIST_FILE = "sobterm.json"
+
+# Download manifest in the archive root
+MANIFEST_NAME = "download-manifest.json"
+MANIFEST_VERSION = 1
+
+# Per-term output file name (without .json) -> virtual domain
+TERM_DOMAINS = {
+    "courses": "scheduleCourses",
+    "crns": "scheduleCRNs",
+    "ssrattr": "scheduleSsrattr",
+    "section-attributes": "scheduleSectionAttributes",
+    "ssrmeet": "searchableSchedule",
+    "sobptrm": "scheduleSobptrm",
+    "section-instructors": "scheduleSectionInstructors",
+    "instructors": "scheduleInstructors",
+    "subjcrse": "scheduleSubjCrse",
+    "subjects": "scheduleSubj",
+    "xlst": "scheduleXlst",
+    "cohorts": "scheduleCohorts",
+}
+
+# Page Builder only answers requests that look like they come from a browser
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/51.0.2704.103 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+# Statuses worth retrying; other errors are permanent
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+CHUNK_SIZE = 1 << 16
+
+# (scheme, host, port) of a connection
+HostKey = tuple[str, str, int]
+
+
+class HttpError(Exception):
+    """A request was answered with an error status."""
+
+    def __init__(self, url: str, status: int, reason: str):
+        super().__init__(f"HTTP {status} {reason}: {url}")
+        self.status = status
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of downloading one URL."""
+
+    url: str
+    path: Path
+    status: int = 0
+    # Bytes received
+    size: int = 0
+    attempts: int = 0
+    error: str = ""
+    # Not modified on the server, or downloaded with identical content; the
+    # file was left as it was
+    unchanged: bool = False
+
+
+@dataclass
+class Response:
+    """Status and headers of a response whose body is still on the wire."""
+
+    status: int
+    reason: str
+    # Header names are lowercased
+    headers: dict[str, str] = field(default_factory=dict)
+    keep_alive: bool = True
+
+
+class Connection:
+    """An HTTP/1.1 connection that can carry several requests in turn."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def usable(self) -> bool:
+        """Whether the connection is still open at both ends."""
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.writer.close()
+
+    async def request(
+        self, host: str, target: str, headers: dict[str, str]
+    ) -> Response:
+        """Send a GET request and read the response status and headers.
+
+        The body must be consumed with ``body`` before the next request.
+
+        Raises:
+            ConnectionError: If the server closed the connection
+            ValueError: If the response is not HTTP/1.x
+        """
+        lines = [f"GET {target} HTTP/1.1", f"Host: {host}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        lines.extend(["Accept-Encoding: identity", "Connection: keep-alive"])
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by server")
+        version, _, rest = status_line.decode("latin-1").strip().partition(" ")
+        code, _, reason = rest.partition(" ")
+        if not version.startswith("HTTP/1.") or not code.isdigit():
+            raise ValueError(f"Malformed status line: {status_line!r}")
+
+        response = Response(int(code), reason)
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response.headers[name.strip().lower()] = value.strip()
+
+        connection = response.headers.get("connection", "").lower()
+        response.keep_alive = (
+            version == "HTTP/1.1"
+            and connection != "close"
+            and (
+                not _has_body(response)
+                or "content-length" in response.headers
+                or _is_chunked(response)
+            )
+        )
+        return response
+
+    async def body(self, response: Response) -> AsyncIterator[bytes]:
+        """Yield the response body in chunks.
+
+        Raises:
+            asyncio.IncompleteReadError: If the connection closes early
+        """
+        if not _has_body(response):
+            return
+        if _is_chunked(response):
+            while True:
+                size_line = await self.reader.readline()
+                size = int(size_line.split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    # Skip trailers
+                    while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return
+                async for data in self._read(size):
+                    yield data
+                await self.reader.readexactly(2)
+        elif "content-length" in response.headers:
+            async for data in self._read(int(response.headers["content-length"])):
+                yield data
+        else:
+            # Delimited by the server closing the connection
+            while True:
+                data = await self.reader.read(CHUNK_SIZE)
+                if not data:
+                    return
+                yield data
+
+    async def _read(self, size: int) -> AsyncIterator[bytes]:
+        """Yield exactly ``size`` bytes in chunks."""
+        remaining = size
+        while remaining > 0:
+            data = await self.reader.read(min(remaining, CHUNK_SIZE))
+            if not data:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(data)
+            yield data
+
+
+def _has_body(response: Response) -> bool:
+    """Whether a response to a GET request carries a body."""
+    return response.status >= 200 and response.status not in (204, 304)
+
+
+def _is_chunked(response: Response) -> bool:
+    """Whether the body uses chunked transfer encoding."""
+    return response.headers.get("transfer-encoding", "").lower() == "chunked"
+
+
+class ConnectionPool:
+    """Idle keep-alive connections, per host."""
+
+    def __init__(self) -> None:
+        self._idle: dict[HostKey, list[Connection]] = {}
+        self.opened = 0
+
+    async def acquire(self, key: HostKey) -> tuple[Connection, bool]:
+        """Take an idle connection to a host, or open one.
+
+        Returns:
+            The connection, and whether it was reused
+        """
+        idle = self._idle.get(key, [])
+        while idle:
+            connection = idle.pop()
+            if connection.usable:
+                return connection, True
+            connection.close()
+        return await self.open(key), False
+
+    async def open(self, key: HostKey) -> Connection:
+        """Open a new connection to a host."""
+        scheme, host, port = key
+        ssl_context = ssl.create_default_context() if scheme == "https" else None
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        self.opened += 1
+        return Connection(reader, writer)
+
+    def release(self, key: HostKey, connection: Connection) -> None:
+        """Return a connection for reuse."""
+        self._idle.setdefault(key, []).append(connection)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+
+
+class BannerDownloader:
+    """Downloads Banner virtual domains concurrently over reused connections.
+
+    Use as an async context manager so connections are closed afterwards.
+    """
+
+    def __init__(
+        self,
+        base_url: str = WEST_VALLEY_BASE_URL,
+        concurrency: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 120.0,
+    ):
+        """Initialize downloader.
+
+        Args:
+            base_url: URL prefix the virtual domain name is appended to
+            concurrency: Maximum requests in flight
+            retries: Retries after a failed attempt
+            backoff: Delay before the first retry, doubled for each next one
+            timeout: Seconds allowed for each attempt, including the body
+        """
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.pool = ConnectionPool()
+        # URL -> validators and content hash of the file last downloaded
+        self.manifest: dict[str, dict[str, Any]] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "BannerDownloader":
+        # Created here so it belongs to the running event loop
+        self._slots = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *_exc_info: Any) -> None:
+        self.pool.close()
+
+    def url(self, domain: str, term: Optional[str] = None) -> str:
+        """URL of a virtual domain, for one term if given."""
+        url = self.base_url + domain
+        return f"{url}?term_code={term}" if term else url
+
+    async def fetch(self, url: str, path: Union[str, Path]) -> DownloadResult:
+        """Download a URL to a file, retrying transient failures.
+
+        If the manifest has an entry for the URL and the file exists, the
+        request is conditional, and a response with the same content hash
+        does not rewrite the file. Failures are reported in the result
+        rather than raised.
+
+        Args:
+            url: URL to download
+            path: File to write; replaced only by a complete download
+
+        Returns:
+            DownloadResult for the URL
+        """
+        if self._slots is None:
+            raise RuntimeError("BannerDownloader must be used with 'async with'")
+
+        result = DownloadResult(url, Path(path))
+        for attempt in range(1, self.retries + 2):
+            result.attempts = attempt
+            try:
+                async with self._slots:
+                    await asyncio.wait_for(self._fetch_once(result), self.timeout)
+                result.error = ""
+                return result
+            except HttpError as e:
+                result.error = str(e)
+                if e.status not in RETRY_STATUSES:
+                    return result
+            except asyncio.TimeoutError:
+                # Checked first: it is an OSError from Python 3.11
+                result.error = f"Timed out after {self.timeout}s: {url}"
+            except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+                result.error = f"{type(e).__name__}: {e}"
+
+            if attempt <= self.retries:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+        return result
+
+    async def _fetch_once(self, result: DownloadResult) -> None:
+        """Make one attempt at a download."""
+        parts = urlsplit(result.url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname or ""
+        key = (scheme, host, parts.port or (443 if scheme == "https" else 80))
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host_header = parts.netloc
+
+        headers = dict(HEADERS)
+        entry = self.manifest.get(result.url) if result.path.exists() else None
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        connection, reused = await self.pool.acquire(key)
+        try:
+            try:
+                response = await connection.request(host_header, target, headers)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if not reused:
+                    raise
+                # The server dropped the idle connection; use a fresh one
+                connection.close()
+                connection = await self.pool.open(key)
+                response = await connection.request(host_header, target, headers)
+
+            result.status = response.status
+            if response.status == 304 and entry:
+                result.unchanged = True
+            elif response.status != 200:
+                async for _ in connection.body(response):
+                    pass
+                raise HttpError(result.url, response.status, response.reason)
+            else:
+                result.size, digest, replaced = await write_atomic(
+                    result.path,
+                    connection.body(response),
+                    entry.get("sha256") if entry else None,
+                )
+                result.unchanged = not replaced
+                self.manifest[result.url] = {
+                    "etag": response.headers.get("etag"),
+                    "last_modified": response.headers.get("last-modified"),
+                    "size": result.size,
+                    "sha256": digest,
+                }
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.keep_alive:
+            self.pool.release(key, connection)
+        else:
+            connection.close()
+
+    async def download_archive(
+        self,
+        data_dir: Union[str, Path],
+        terms: Optional[Iterable[str]] = None,
+        since: Optional[str] = None,
+    ) -> list[DownloadResult]:
+        """Refresh the term list and every term's files.
+
+        The archive's download manifest is loaded first and saved afterwards.
+
+        Args:
+            data_dir: Archive root; term files go to ``<term>/<name>.json``
+            terms: Terms to download (default: every term in the term list)
+            since: Skip terms before this term code entirely
+
+        Returns:
+            Results, the term list's first
+        """
+        data_dir = Path(data_dir)
+        self.manifest = load_download_manifest(data_dir)
+        try:
+            term_list = await self.fetch(
+                self.url(TERM_LIST_DOMAIN), data_dir / TERM_LIST_FILE
+            )
+            if terms is None:
+                if term_list.error:
+                    return [term_list]
+                with open(term_list.path, encoding="utf-8") as f:
+                    terms = [row["SOBTERM_TERM_CODE"] for row in json.load(f)]
+
+            downloads = [
+                self.fetch(self.url(domain, term), data_dir / term / f"{name}.json")
+                for term in terms
+                if since is None or term >= since
+                for name, domain in TERM_DOMAINS.items()
+            ]
+            return [term_list, *await asyncio.gather(*downloads)]
+        finally:
+            save_download_manifest(data_dir, self.manifest)
+
+
+def load_download_manifest(data_dir: Path) -> dict[str, dict[str, Any]]:
+    """Load an archive's download manifest entries, or none."""
+    path = data_dir / MANIFEST_NAME
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            files: dict[str, dict[str, Any]] = manifest["files"]
+            return files
+    return {}
+
+
+def save_download_manifest(data_dir: Path, files: dict[str, dict[str, Any]]) -> None:
+    """Replace an archive's download manifest."""
+    manifest = {"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+    with atomic_replace(data_dir / MANIFEST_NAME) as temp_path:
+        temp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+async def write_atomic(
+    path: Path, chunks: AsyncIterator[bytes], unchanged_sha256: Optional[str] = None
+) -> tuple[int, str, bool]:
+    """Stream chunks to a temporary file, then rename it to ``path``.
+
+    Args:
+        path: Destination file
+        chunks: File content
+        unchanged_sha256: Hash of the current file; content with this hash
+            is discarded instead of rewriting the file
+
+    Returns:
+        Bytes received, their SHA-256 hex digest, and whether ``path`` was
+        replaced
+    """
+    size = 0
+    digest = hashlib.sha256()
+    with atomic_replace(path) as temp_path:
+        with open(temp_path, "wb") as f:
+            async for chunk in chunks:
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        sha256 = digest.hexdigest()
+        replaced = sha256 != unchanged_sha256 or not path.exists()
+        if not replaced:
+            os.unlink(temp_path)
+    return size, sha256, replaced
+
+
+def download_banner_archive(
+    data_dir: Union[str, Path],
+    terms: Optional[Iterable[str]] = None,
+    base_url: str = WEST_VALLEY_BASE_URL,
+    concurrency: int = 8,
+    retries: int = 3,
+    since: Optional[str] = None,
+) -> list[DownloadResult]:
+    """Download or refresh a Banner schedule archive (see ``BannerDownloader``).
+
+    Args:
+        data_dir: Archive root
+        terms: Terms to download (default: every term in the term list)
+        base_url: URL prefix the virtual domain name is appended to
+        concurrency: Maximum requests in flight
+        retries: Retries after a failed attempt
+        since: Skip terms before this term code entirely
+
+    Returns:
+        One DownloadResult per file
+    """
+
+    async def run() -> list[DownloadResult]:
+        async with BannerDownloader(base_url, concurrency, retries) as downloader:
+            return await downloader.download_archive(data_dir, terms, since)
+
+    return asyncio.run(run())
@@ -2,13 +2,23 @@
 """Command-line interface for CCC Schedule utilities."""
 
 import argparse
+import contextlib
+import itertools
 import json
+import os
 import sys
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
 
+from src.course_export import EXPORT_FORMATS, write_courses, write_summary
 from src.data_utils import (
-    filter_courses,
+    COMPRESSED_SUFFIXES,
+    atomic_replace,
     filter_courses_by_units,
     get_unique_values,
+    iter_filtered_courses,
+    iter_schedule_courses,
     load_json_data,
     load_schedule_data,
     save_schedule_data,
@@ -16,6 +26,39 @@ from src.data_utils import (
 )
 from src.models import FilterOptions
 
+# Modules of the other commands are imported in their branches of main(), so
+# the commands that don't need them start quickly.
+
+PROJECT_ROOT = Path(__file__).parent.parent
+WEST_VALLEY_CONFIG = PROJECT_ROOT / "colleges" / "west-valley-mission" / "config.json"
+
+
+def _positive_int(value: str) -> int:
+    """Parse an argument that must be a whole number of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """Parse an argument that must be a whole number of at least 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, not {number}")
+    return number
+
+
+@contextlib.contextmanager
+def _reader_may_exit() -> Iterator[None]:
+    """Stop quietly when the reader of stdout (e.g. head) exits early."""
+    try:
+        yield
+    except BrokenPipeError:
+        # Point stdout at /dev/null so flushing it at exit does not fail too
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+
 
 def main() -> int:
     """Main CLI entry point."""
@@ -76,6 +119,213 @@ def main() -> int:
         "--open-only", action="store_true", help="Show only open sections"
     )
     schedule_filter_parser.add_argument("--output", help="Output file path (optional)")
+    schedule_filter_parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        help="Stream matching courses in this format (to --output or stdout) "
+        "instead of printing a summary",
+    )
+    schedule_filter_parser.add_argument(
+        "--offset", type=int, default=0, help="Skip this many matching courses"
+    )
+    schedule_filter_parser.add_argument(
+        "--limit", type=int, help="Return at most this many matching courses"
+    )
+    schedule_filter_parser.add_argument(
+        "--server",
+        nargs="?",
+        const="",
+        help="Ask a running `serve` daemon instead (default: the local daemon)",
+    )
+
+    # Diff command
+    diff_parser = subparsers.add_parser(
+        "diff", help="Show the changes between two schedule files"
+    )
+    diff_parser.add_argument("old", help="Earlier schedule JSON file")
+    diff_parser.add_argument("new", help="Later schedule JSON file")
+    diff_parser.add_argument(
+        "--json", action="store_true", help="Print the change set as JSON"
+    )
+    diff_parser.add_argument("--output", help="Save the change set as JSON")
+
+    # Patch command
+    patch_parser = subparsers.add_parser(
+        "patch", help="Apply a change set from diff --output to a schedule file"
+    )
+    patch_parser.add_argument("base", help="Schedule JSON file to patch")
+    patch_parser.add_argument("changes", help="Change set JSON file")
+    patch_parser.add_argument(
+        "--output", help="Save the result here instead of over the base file"
+    )
+    patch_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Apply even where the base does not match the change set",
+    )
+    patch_parser.add_argument(
+        "--compress",
+        action="append",
+        choices=COMPRESSED_SUFFIXES,
+        default=[],
+        help="Also write a precompressed sibling (repeatable)",
+    )
+
+    # Backfill command
+    backfill_parser = subparsers.add_parser(
+        "backfill", help="Transform every term of a Banner archive in parallel"
+    )
+    backfill_parser.add_argument(
+        "data_dir", help="Archive directory with one directory per term"
+    )
+    backfill_parser.add_argument(
+        "--output", required=True, help="Directory for per-term outputs and catalog"
+    )
+    backfill_parser.add_argument(
+        "--config",
+        default=str(WEST_VALLEY_CONFIG),
+        help="College configuration (default: West Valley Mission)",
+    )
+    backfill_parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        help="Maximum worker processes (default: CPU count)",
+    )
+    backfill_parser.add_argument(
+        "--force", action="store_true", help="Rebuild terms whose inputs are unchanged"
+    )
+
+    # Download command
+    download_parser = subparsers.add_parser(
+        "download", help="Download a Banner schedule archive concurrently"
+    )
+    download_parser.add_argument(
+        "data_dir", help="Archive directory receiving one directory per term"
+    )
+    download_parser.add_argument(
+        "--term",
+        action="append",
+        dest="terms",
+        help="Term code to download (repeatable; default: every listed term)",
+    )
+    download_parser.add_argument(
+        "--since",
+        help="Skip terms before this term code (e.g. closed historical terms)",
+    )
+    download_parser.add_argument(
+        "--base-url",
+        help="Virtual domain URL prefix (default: West Valley Mission)",
+    )
+    download_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum requests in flight (default: 8)",
+    )
+    download_parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Retries per file after a failure (default: 3)",
+    )
+
+    # Poll command
+    poll_parser = subparsers.add_parser(
+        "poll", help="Poll live seat counts and publish enrollment deltas"
+    )
+    poll_parser.add_argument(
+        "output_dir", help="Directory receiving seats.json and enrollment-delta.json"
+    )
+    poll_parser.add_argument(
+        "--source",
+        help="Feed URL or file: a scheduleCRNs feed or a Rio Hondo capture "
+        "(default: the Banner scheduleCRNs feed of --term)",
+    )
+    poll_parser.add_argument(
+        "--term", help="Banner term code (default: the newest listed term)"
+    )
+    poll_parser.add_argument(
+        "--base-url",
+        help="Virtual domain URL prefix (default: West Valley Mission)",
+    )
+    poll_parser.add_argument(
+        "--interval",
+        type=float,
+        default=60,
+        help="Seconds between polls (default: 60)",
+    )
+    poll_parser.add_argument("--once", action="store_true", help="Poll once and exit")
+    poll_parser.add_argument(
+        "--history",
+        type=_non_negative_int,
+        help="Deltas kept in enrollment-delta.json; 0 keeps none (default: 60)",
+    )
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep schedules loaded and answer filter queries over HTTP"
+    )
+    serve_parser.add_argument("files", nargs="+", help="Schedule JSON files to serve")
+    serve_parser.add_argument(
+        "--host", help="Address to listen on (default: 127.0.0.1)"
+    )
+    serve_parser.add_argument("--port", type=int, help="Port (default: 8737)")
+
+    # History commands
+    history_import_parser = subparsers.add_parser(
+        "history-import", help="Append collector snapshots to an enrollment history"
+    )
+    history_import_parser.add_argument("history", help="History file (JSON Lines)")
+    history_import_parser.add_argument(
+        "snapshots",
+        nargs="+",
+        help="Snapshot files, or directories of schedule_*.json snapshots",
+    )
+
+    fill_curve_parser = subparsers.add_parser(
+        "fill-curve", help="Show the fill rate of a section or subject over time"
+    )
+    fill_curve_parser.add_argument("history", help="History file (JSON Lines)")
+    fill_curve_target = fill_curve_parser.add_mutually_exclusive_group(required=True)
+    fill_curve_target.add_argument("--crn", help="Section CRN")
+    fill_curve_target.add_argument("--subject", help="Subject code (e.g. MATH)")
+
+    # Transform command
+    transform_parser = subparsers.add_parser(
+        "transform", help="Convert a college export to the standardized format"
+    )
+    transform_target = transform_parser.add_mutually_exclusive_group(required=True)
+    transform_target.add_argument(
+        "--college", help="College ID from colleges/<college>/config.json"
+    )
+    transform_target.add_argument(
+        "--all",
+        action="store_true",
+        help="Convert the example export of every configured college",
+    )
+    transform_parser.add_argument(
+        "input",
+        nargs="?",
+        help="College export (default: the college's example export)",
+    )
+    transform_parser.add_argument(
+        "--output",
+        help="Output file, or directory with --all "
+        "(default: standardized_schedule.json, or output/)",
+    )
+    transform_parser.add_argument(
+        "--state",
+        help="Incremental state file; only rows changed since the last run "
+        "are transformed again",
+    )
+    transform_parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Take timestamps from the source (or SOURCE_DATE_EPOCH) and sort "
+        "courses, so identical input gives byte-identical output; exports that "
+        "record no collection time, such as north-orange-county's, need "
+        "SOURCE_DATE_EPOCH",
+    )
 
     args = parser.parse_args()
 
@@ -146,7 +396,35 @@ def main() -> int:
             return 0
 
         elif args.command == "schedule-filter":
-            schedule = load_schedule_data(args.file)
+            if args.offset < 0 or (args.limit is not None and args.limit < 0):
+                raise ValueError("--offset and --limit must not be negative")
+
+            if args.server is not None:
+                from src.schedule_server import (
+                    DEFAULT_URL,
+                    FILTER_PARAMS,
+                    request_courses,
+                )
+
+                if args.output and not args.format:
+                    raise ValueError("--server saves results only with --format")
+                params = {name: getattr(args, name) for name in FILTER_PARAMS}
+                params.update(
+                    file=args.file,
+                    offset=args.offset or None,
+                    limit=args.limit,
+                    format=args.format or "text",
+                )
+                url = args.server or DEFAULT_URL
+                if args.output:
+                    # A refused or unreachable query keeps the previous output
+                    with atomic_replace(args.output) as temp, open(temp, "wb") as f:
+                        request_courses(url, params, f)
+                    print(f"Results saved to: {args.output}", file=sys.stderr)
+                else:
+                    with _reader_may_exit():
+                        request_courses(url, params, sys.stdout.buffer)
+                return 0
 
             # Build filter options
             filters = FilterOptions(
@@ -159,41 +437,259 @@ def main() -> int:
                 units_max=args.max_units,
                 open_only=args.open_only,
             )
+            stop = None if args.limit is None else args.offset + args.limit
+
+            # Apply filters while the courses are read, one page of them
+            matches = iter_filtered_courses(iter_schedule_courses(args.file), filters)
+            page = itertools.islice(matches, args.offset, stop)
+
+            if args.format:
+                if args.output:
+                    # A schedule that fails to parse keeps the previous output
+                    with (
+                        atomic_replace(args.output) as temp,
+                        open(temp, "w", encoding="utf-8", newline="") as f,
+                    ):
+                        count = write_courses(page, f, args.format)
+                    print(f"Wrote {count} courses to: {args.output}", file=sys.stderr)
+                else:
+                    with _reader_may_exit():
+                        write_courses(page, sys.stdout, args.format, flush=True)
+                return 0
+
+            if not args.output:
+                # Show the first few results as they are found
+                with _reader_may_exit():
+                    write_summary(page, sys.stdout)
+                return 0
+
+            # Saving a schedule needs its metadata, subjects and instructors
+            schedule = load_schedule_data(args.file)
+            filtered_courses = list(
+                itertools.islice(
+                    iter_filtered_courses(schedule.courses, filters), args.offset, stop
+                )
+            )
+            write_summary(filtered_courses, sys.stdout)
+            save_schedule_data(replace(schedule, courses=filtered_courses), args.output)
+            print(f"\nFiltered schedule saved to: {args.output}")
+            return 0
+
+        elif args.command == "diff":
+            from src.schedule_changes import diff_schedules, format_change_set
+
+            change_set = diff_schedules(
+                load_schedule_data(args.old), load_schedule_data(args.new)
+            )
+            if args.output:
+                with atomic_replace(args.output) as temp:
+                    temp.write_text(
+                        json.dumps(change_set.to_dict(), indent=2, ensure_ascii=False),
+                        encoding="utf-8",
+                    )
+            if args.json:
+                print(json.dumps(change_set.to_dict(), indent=2, ensure_ascii=False))
+            else:
+                for line in format_change_set(change_set):
+                    print(line)
+            return 0
 
-            # Apply filters
-            filtered_courses = filter_courses(schedule.courses, filters)
+        elif args.command == "patch":
+            from src.schedule_changes import patch_schedule_file
+
+            change_set = patch_schedule_file(
+                args.base,
+                args.changes,
+                args.output,
+                strict=not args.force,
+                compress=args.compress,
+            )
+            output = args.output or args.base
+            count = len(change_set.changes) + bool(change_set.metadata)
+            print(f"Applied {count} changes to {output}")
+            return 0
+
+        elif args.command == "backfill":
+            from src.backfill import backfill
+
+            report = backfill(
+                args.data_dir, args.output, args.config, args.jobs, args.force
+            )
+            for result in report.results:
+                if result.failure:
+                    status = f"FAILED: {result.failure}"
+                elif result.skipped:
+                    status = "unchanged"
+                else:
+                    status = f"{result.errors} errors, {result.warnings} warnings"
+                print(
+                    f"  {result.term}: {result.courses} courses, "
+                    f"{result.sections} sections ({status})"
+                )
+            print(
+                f"\nTransformed {len(report.transformed)} terms, "
+                f"skipped {len(report.skipped)} unchanged, "
+                f"{len(report.failed)} failed"
+            )
+            print(f"Catalog saved to: {report.catalog_path}")
+            return 1 if report.failed else 0
 
-            # Count results
-            total_sections = sum(len(course.sections) for course in filtered_courses)
+        elif args.command == "download":
+            from src.banner_download import (
+                WEST_VALLEY_BASE_URL,
+                download_banner_archive,
+            )
 
+            results = download_banner_archive(
+                args.data_dir,
+                args.terms,
+                base_url=args.base_url or WEST_VALLEY_BASE_URL,
+                concurrency=args.concurrency,
+                retries=args.retries,
+                since=args.since,
+            )
+            failed = [r for r in results if r.error]
+            for result in failed:
+                print(f"  FAILED {result.path}: {result.error}")
+            unchanged = [r for r in results if r.unchanged]
+            updated = len(results) - len(unchanged) - len(failed)
+            total = sum(r.size for r in results)
             print(
-                f"Found {len(filtered_courses)} courses with {total_sections} sections"
+                f"Updated {updated} files, {len(unchanged)} unchanged, "
+                f"{len(failed)} failed ({total / 1_000_000:.1f} MB received)"
+            )
+            return 1 if failed else 0
+
+        elif args.command == "poll":
+            import asyncio
+
+            from src.banner_download import WEST_VALLEY_BASE_URL
+            from src.enrollment_poll import (
+                DELTA_HISTORY,
+                PollResult,
+                poll_enrollment,
+                resolve_feed_url,
             )
 
-            # Show first few results
-            for course in filtered_courses[:5]:
-                print(f"\n{course.course_key}: {course.title}")
-                print(f"  Units: {course.units}")
-                print(f"  Sections: {len(course.sections)}")
-                for section in course.sections[:2]:
+            source = args.source or asyncio.run(
+                resolve_feed_url(args.base_url or WEST_VALLEY_BASE_URL, args.term)
+            )
+            print(f"Polling {source}")
+
+            def report(result: PollResult) -> None:
+                if result.error:
+                    print(f"  FAILED: {result.error}")
+                elif result.published:
                     print(
-                        f"    - CRN {section.crn}: {section.instruction_mode}, {section.status}"
+                        f"  #{result.sequence}: {result.changed} sections changed, "
+                        f"{result.removed} removed"
                     )
-                if len(course.sections) > 2:
-                    print(f"    ... and {len(course.sections) - 2} more sections")
 
-            if len(filtered_courses) > 5:
-                print(f"\n... and {len(filtered_courses) - 5} more courses")
+            try:
+                results = poll_enrollment(
+                    source,
+                    args.output_dir,
+                    args.interval,
+                    polls=1 if args.once else None,
+                    history=DELTA_HISTORY if args.history is None else args.history,
+                    report=report,
+                )
+            except KeyboardInterrupt:
+                return 0
+            return 1 if any(r.error for r in results) else 0
 
-            # Save to file if requested
-            if args.output:
-                filtered_schedule = schedule
-                filtered_schedule.courses = filtered_courses
-                save_schedule_data(filtered_schedule, args.output)
-                print(f"\nFiltered schedule saved to: {args.output}")
+        elif args.command == "serve":
+            from src.schedule_server import DEFAULT_HOST, DEFAULT_PORT, ScheduleServer
+
+            server = ScheduleServer(
+                args.files,
+                args.host or DEFAULT_HOST,
+                DEFAULT_PORT if args.port is None else args.port,
+            )
+            print(f"Serving {len(server.store.paths)} schedules at {server.url}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                server.server_close()
+            return 0
 
+        elif args.command == "history-import":
+            from src.enrollment_history import EnrollmentHistory
+
+            history = EnrollmentHistory(args.history)
+            imported = history.import_snapshots(args.snapshots)
+            for path in imported:
+                print(f"  {path.name}")
+            print(
+                f"Imported {len(imported)} snapshots; "
+                f"{len(history.records)} recorded in {args.history}"
+            )
+            return 0
+
+        elif args.command == "fill-curve":
+            from src.enrollment_history import EnrollmentHistory
+
+            history = EnrollmentHistory(args.history)
+            try:
+                if args.crn:
+                    curve = history.section_curve(args.crn)
+                else:
+                    curve = history.subject_curve(args.subject)
+            except KeyError as e:
+                print(f"Error: {e.args[0]}", file=sys.stderr)
+                return 1
+            for point in curve:
+                rate = "-" if point.fill_rate is None else f"{point.fill_rate:.1%}"
+                line = (
+                    f"  {point.time}  {point.enrolled:>5}/{point.capacity:<5} {rate:>7}"
+                )
+                if point.waitlist is not None:
+                    line += f"  waitlist {point.waitlist}"
+                print(line)
             return 0
 
+        elif args.command == "transform":
+            from src.convert import OUTPUT_NAME, convert, convert_all, example_input
+
+            if args.all:
+                if args.input or args.state:
+                    parser.error("transform --all does not take an input or --state")
+                results = convert_all(
+                    args.output or "output", reproducible=args.reproducible
+                )
+            else:
+                input_path = args.input or example_input(args.college)
+                output = args.output or OUTPUT_NAME
+                results = [
+                    convert(
+                        args.college,
+                        input_path,
+                        output,
+                        state_path=args.state,
+                        reproducible=args.reproducible,
+                    )
+                ]
+
+            for result in results:
+                if result.failure:
+                    status = f"FAILED: {result.failure}"
+                else:
+                    status = (
+                        f"{result.courses} courses, {result.sections} sections "
+                        f"({result.errors} errors, {result.warnings} warnings) "
+                        f"-> {result.output}"
+                    )
+                    if args.state:
+                        status += f"; {result.reused} sections unchanged"
+                print(f"  {result.college_id}: {status}")
+            failed = [r for r in results if r.failure]
+            print(
+                f"\nConverted {len(results) - len(failed)} colleges, {len(failed)} failed"
+            )
+            return 1 if failed else 0
+
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -0,0 +1,164 @@
+"""Compiled college configuration rules.
+
+College configs (``colleges/*/config.json``) are compiled once into an
+immutable ``CollegeRules`` object and cached per file, so validators and
+transformers working on many files for one college never re-derive them.
+"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Union
+
+
+@dataclass(frozen=True)
+class CollegeRules:
+    """Precompiled validation and mapping rules for one college."""
+
+    college_id: str
+    college_name: str
+    config: dict[str, Any] = field(repr=False, compare=False)
+
+    # Textbook cost codes allowed in section attributes
+    textbook_cost_enabled: bool = False
+    textbook_cost_codes: frozenset[str] = frozenset()
+
+    # Instruction mode codes, plus raw source labels mapped to codes
+    instruction_modes_enabled: bool = False
+    instruction_mode_codes: frozenset[str] = frozenset()
+    instruction_mode_map: dict[str, str] = field(default_factory=dict, compare=False)
+
+    # Attributes every section must carry when enrollment tracking is on
+    enrollment_tracking_enabled: bool = False
+    enrollment_fields: tuple[str, ...] = ()
+
+    # Error templates with the valid values already rendered
+    textbook_cost_error: str = ""
+    instruction_mode_error: str = ""
+    enrollment_fields_error: str = ""
+
+    def check_section(
+        self, section: dict[str, Any], enrollment_fields: bool = True
+    ) -> Iterator[str]:
+        """Yield college-specific errors for one standardized section.
+
+        Args:
+            section: Standardized section dictionary
+            enrollment_fields: Check the required enrollment fields; pass
+                False for sections whose source has no attributes
+        """
+        attributes = section.get("attributes") or {}
+
+        if self.textbook_cost_enabled:
+            textbook_cost = attributes.get("textbook_cost")
+            if textbook_cost and textbook_cost not in self.textbook_cost_codes:
+                yield self.textbook_cost_error.format(
+                    value=textbook_cost, crn=section.get("crn")
+                )
+
+        if self.instruction_modes_enabled:
+            mode = section.get("instruction_mode")
+            if mode and mode not in self.instruction_mode_codes:
+                yield self.instruction_mode_error.format(
+                    value=mode, crn=section.get("crn")
+                )
+
+        if enrollment_fields and self.enrollment_fields:
+            missing_fields = [f for f in self.enrollment_fields if f not in attributes]
+            if missing_fields:
+                yield self.enrollment_fields_error.format(
+                    crn=section.get("crn"), missing=missing_fields
+                )
+
+
+def compile_college_rules(config: dict[str, Any]) -> CollegeRules:
+    """Compile a college configuration dictionary into rules.
+
+    Args:
+        config: Parsed college configuration
+
+    Returns:
+        CollegeRules for the college
+    """
+    college = config.get("college", {})
+    features = config.get("features", {})
+
+    textbook = features.get("textbook_cost", {})
+    textbook_codes = frozenset(cat["code"] for cat in textbook.get("categories", []))
+
+    modes = features.get("instruction_modes", {})
+    mode_map = {}
+    for key, mode_info in modes.get("modes", {}).items():
+        if isinstance(mode_info, dict) and "code" in mode_info:
+            mode_map[key] = mode_info["code"]
+        else:
+            # Handle simple string values
+            mode_map[key] = key
+    mode_codes = frozenset(mode_map.values())
+
+    enrollment = features.get("enrollment_tracking", {})
+    enrollment_enabled = bool(enrollment.get("enabled"))
+    enrollment_fields = (
+        tuple(enrollment.get("fields", [])) if enrollment_enabled else ()
+    )
+
+    return CollegeRules(
+        college_id=college.get("id", ""),
+        college_name=college.get("name", ""),
+        config=config,
+        textbook_cost_enabled=bool(textbook.get("enabled")),
+        textbook_cost_codes=textbook_codes,
+        instruction_modes_enabled=bool(modes.get("enabled")),
+        instruction_mode_codes=mode_codes,
+        instruction_mode_map=mode_map,
+        enrollment_tracking_enabled=enrollment_enabled,
+        enrollment_fields=enrollment_fields,
+        textbook_cost_error=(
+            "Invalid textbook cost '{value}' in section {crn}. "
+            f"Valid values: {_render_codes(textbook_codes)}"
+        ),
+        instruction_mode_error=(
+            "Invalid instruction mode '{value}' in section {crn}. "
+            f"Valid values: {_render_codes(mode_codes)}"
+        ),
+        enrollment_fields_error=(
+            "Section {crn} missing enrollment tracking fields: {missing}"
+        ),
+    )
+
+
+def _render_codes(codes: frozenset[str]) -> str:
+    """Render a set of codes for error messages, escaping format braces."""
+    rendered = "{" + ", ".join(repr(code) for code in sorted(codes)) + "}"
+    return rendered.replace("{", "{{").replace("}", "}}")
+
+
+def load_college_config(path: Union[str, Path]) -> dict[str, Any]:
+    """Load a college configuration file, cached until the file changes.
+
+    The returned dictionary is shared between callers and must not be mutated.
+    """
+    resolved = Path(path).resolve()
+    return _load_config_cached(str(resolved), resolved.stat().st_mtime_ns)
+
+
+def load_college_rules(path: Union[str, Path]) -> CollegeRules:
+    """Load and compile college rules, cached until the file changes."""
+    resolved = Path(path).resolve()
+    return _load_rules_cached(str(resolved), resolved.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path: str, _mtime_ns: int) -> dict[str, Any]:
+    """Load a configuration file (cache keyed by path and modification time)."""
+    with open(path, encoding="utf-8") as f:
+        config: dict[str, Any] = json.load(f)
+        return config
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(path: str, mtime_ns: int) -> CollegeRules:
+    """Compile rules for a configuration file (cache keyed like the config)."""
+    return compile_college_rules(_load_config_cached(path, mtime_ns))
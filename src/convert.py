@@ -0,0 +1,165 @@
+"""Convert college exports to the standardized format.
+
+Each college's export is streamed through its registered transformer, the
+validator and the JSON writer one course at a time, so memory use does not
+grow with the size of the export.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .data_utils import atomic_replace, write_json_stream
+from .transformers.registry import (
+    COLLEGES_DIR,
+    EXAMPLES_DIR,
+    create_transformer,
+    find_college_configs,
+    get_transformer_spec,
+)
+from .transformers.section_cache import SectionCache, transformer_fingerprint
+from .validators import StandardizedValidator, ValidationResult
+
+OUTPUT_NAME = "standardized_schedule.json"
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting one college's export."""
+
+    college_id: str
+    output: Optional[Path] = None
+    courses: int = 0
+    sections: int = 0
+    # Sections reused unchanged from the incremental state
+    reused: int = 0
+    validation: ValidationResult = field(default_factory=ValidationResult)
+    failure: str = ""
+
+    @property
+    def errors(self) -> int:
+        """Number of validation errors."""
+        return self.validation.error_count
+
+    @property
+    def warnings(self) -> int:
+        """Number of validation warnings."""
+        return self.validation.warning_count
+
+
+def example_input(
+    college_id: str, examples_dir: Union[str, Path] = EXAMPLES_DIR
+) -> Path:
+    """Path of a college's example export.
+
+    Raises:
+        ValueError: If no transformer is registered for the college
+    """
+    return Path(examples_dir) / get_transformer_spec(college_id).example_input
+
+
+def convert(
+    college_id: str,
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    colleges_dir: Union[str, Path] = COLLEGES_DIR,
+    state_path: Optional[Union[str, Path]] = None,
+    reproducible: bool = False,
+) -> ConversionResult:
+    """Transform, validate and save one college's export.
+
+    Args:
+        college_id: College ID from the college config
+        input_path: College export (file or directory, per transformer)
+        output_path: Standardized schedule to write
+        colleges_dir: Directory holding the college configs
+        state_path: Incremental state file; sections of rows unchanged since
+            the previous run are reused from it, and it is rewritten with
+            this run's sections
+        reproducible: Take ``last_updated`` from the source and write
+            courses in canonical order, so identical input gives
+            byte-identical output
+
+    Returns:
+        ConversionResult for the college
+
+    Raises:
+        ValueError: If the college has no config or no registered transformer
+    """
+    transformer = create_transformer(college_id, colleges_dir)
+    transformer.reproducible = reproducible
+    cache = None
+    if state_path is not None:
+        cache = SectionCache.load(state_path, transformer_fingerprint(transformer))
+        transformer.section_cache = cache
+    data = transformer.transform_stream(transformer.load_input(input_path))
+    schedule = data["schedule"]
+
+    output = Path(output_path)
+    result = ConversionResult(college_id, output=output)
+    validator = StandardizedValidator(transformer.rules)
+    # Validate from a copy; "courses" is replaced below with the counting stream
+    validated = validator.iter_validate(dict(schedule), result.validation)
+
+    def count(courses: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for course in courses:
+            result.courses += 1
+            result.sections += len(course["sections"])
+            yield course
+
+    schedule["courses"] = count(validated)
+
+    # An export failing partway through leaves the previous output in place
+    with (
+        atomic_replace(output) as temp_path,
+        open(temp_path, "w", encoding="utf-8") as f,
+    ):
+        write_json_stream(data, f, indent=2)
+
+    if cache is not None and state_path is not None:
+        if cache.changed or not Path(state_path).exists():
+            cache.save(state_path)
+        result.reused = cache.hits
+    return result
+
+
+def convert_all(
+    output_dir: Union[str, Path],
+    examples_dir: Union[str, Path] = EXAMPLES_DIR,
+    colleges_dir: Union[str, Path] = COLLEGES_DIR,
+    reproducible: bool = False,
+) -> list[ConversionResult]:
+    """Convert the example export of every configured college.
+
+    Colleges without a registered transformer or example export are reported
+    as failures; they do not stop the others.
+
+    Args:
+        output_dir: Directory receiving ``<college_id>.json`` per college
+        examples_dir: Directory holding the example exports
+        colleges_dir: Directory holding the college configs
+        reproducible: Write reproducible output (see ``convert``)
+
+    Returns:
+        One ConversionResult per configured college, sorted by college ID
+    """
+    results = []
+    for college_id in find_college_configs(colleges_dir):
+        output = Path(output_dir) / f"{college_id}.json"
+        try:
+            input_path = example_input(college_id, examples_dir)
+            if not input_path.exists():
+                raise FileNotFoundError(f"Example export not found: {input_path}")
+            results.append(
+                convert(
+                    college_id,
+                    input_path,
+                    output,
+                    colleges_dir,
+                    reproducible=reproducible,
+                )
+            )
+        except Exception as e:
+            results.append(ConversionResult(college_id, failure=str(e)))
+    return results
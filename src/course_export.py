@@ -0,0 +1,161 @@
+"""Write filtered courses as JSON, JSON Lines, CSV or a text summary.
+
+Writers take any iterable of courses, such as ``iter_filtered_courses`` over
+``iter_schedule_courses``, and write each course as soon as it arrives, so a
+reader at the other end of a pipe sees the first results before the schedule
+has been read to the end.
+"""
+
+import csv
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
+
+from .data_utils import model_to_json, write_models_json
+from .models import Course, Meeting
+
+EXPORT_FORMATS = ("json", "jsonl", "csv")
+
+# Courses listed in full by write_summary
+SUMMARY_COURSES = 5
+
+# One CSV row per section, with its course's fields repeated
+CSV_COLUMNS = (
+    "course_key",
+    "subject",
+    "course_number",
+    "title",
+    "units",
+    "crn",
+    "section_number",
+    "term",
+    "college",
+    "instruction_mode",
+    "status",
+    "enrolled",
+    "capacity",
+    "waitlist",
+    "meetings",
+    "instructors",
+)
+
+
+def format_meeting(meeting: Meeting) -> str:
+    """Render a meeting like ``TR 09:00-10:50 B0 101``."""
+    location = meeting.location
+    return (
+        f"{''.join(meeting.days)} {meeting.start_time}-{meeting.end_time} "
+        f"{location.building} {location.room}"
+    ).strip()
+
+
+def section_rows(course: Course) -> Iterator[list[Any]]:
+    """CSV rows (in ``CSV_COLUMNS`` order) of a course's sections."""
+    for section in course.sections:
+        yield [
+            course.course_key,
+            course.subject,
+            course.course_number,
+            course.title,
+            course.units,
+            section.crn,
+            section.section_number,
+            section.term,
+            section.college,
+            section.instruction_mode,
+            section.status,
+            section.enrollment.enrolled,
+            section.enrollment.capacity,
+            section.enrollment.waitlist,
+            "; ".join(map(format_meeting, section.meetings)),
+            ";".join(section.instructors),
+        ]
+
+
+def _flushed(courses: Iterable[Course], f: TextIO, flush: bool) -> Iterator[Course]:
+    """Pass courses through, flushing what was written for the previous one."""
+    for course in courses:
+        yield course
+        if flush:
+            f.flush()
+
+
+def write_courses(
+    courses: Iterable[Course], f: TextIO, fmt: str, flush: bool = False
+) -> int:
+    """Write courses in an export format as they are produced.
+
+    Args:
+        courses: Courses to write; consumed lazily
+        f: Text file to write to (opened with ``newline=""`` for CSV)
+        fmt: One of ``EXPORT_FORMATS``: ``json`` (an indented array of
+            courses), ``jsonl`` (one course per line) or ``csv`` (one row per
+            section)
+        flush: Flush after each course, so pipes get results immediately
+
+    Returns:
+        Number of courses written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    courses = _flushed(courses, f, flush)
+    if fmt == "json":
+        count = write_models_json(courses, f)
+        f.write("\n")
+        return count
+
+    count = 0
+    if fmt == "jsonl":
+        for course in courses:
+            f.write(model_to_json(course) + "\n")
+            count += 1
+    else:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for course in courses:
+            writer.writerows(section_rows(course))
+            count += 1
+    return count
+
+
+def write_summary(
+    courses: Iterable[Course], f: TextIO, flush: bool = False
+) -> tuple[int, int]:
+    """Write the first few courses as text, then the number of matches.
+
+    Args:
+        courses: Courses to summarize; consumed lazily
+        f: Text file to write to
+        flush: Flush after each course listed
+
+    Returns:
+        Number of courses and of their sections
+    """
+    total_courses = total_sections = 0
+    for course in courses:
+        total_courses += 1
+        total_sections += len(course.sections)
+        if total_courses > SUMMARY_COURSES:
+            continue
+        lines = [
+            f"\n{course.course_key}: {course.title}",
+            f"  Units: {course.units}",
+            f"  Sections: {len(course.sections)}",
+        ]
+        lines.extend(
+            f"    - CRN {section.crn}: {section.instruction_mode}, {section.status}"
+            for section in course.sections[:2]
+        )
+        if len(course.sections) > 2:
+            lines.append(f"    ... and {len(course.sections) - 2} more sections")
+        f.write("\n".join(lines) + "\n")
+        if flush:
+            f.flush()
+
+    if total_courses > SUMMARY_COURSES:
+        f.write(f"\n... and {total_courses - SUMMARY_COURSES} more courses\n")
+    f.write(f"\nFound {total_courses} courses with {total_sections} sections\n")
+    return total_courses, total_sections
@@ -1,10 +1,24 @@
 """Utilities for processing schedule data."""
 
+import contextlib
+import functools
+import gzip
 import json
-from dataclasses import asdict
+import os
+import secrets
+import shutil
+import stat
+from collections.abc import Iterable, Iterator
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from json.encoder import encode_basestring, encode_basestring_ascii
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, TextIO, Union
+
+try:
+    import brotli
+except ImportError:  # optional: only needed for .br siblings
+    brotli = None
 
 from .models import (
     College,
@@ -50,6 +64,274 @@ def load_json_data(file_path: Union[str, Path]) -> dict[str, Any]:
         return data
 
 
+_WHITESPACE = " \t\n\r"
+# Characters that may follow a complete array item, object member or key
+_ITEM_ENDS = " \t\n\r,]"
+_MEMBER_ENDS = " \t\n\r,}"
+_KEY_ENDS = " \t\n\r:"
+
+
+class _ChunkedJsonReader:
+    """Decode JSON values one at a time from a file read in fixed-size chunks."""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        # Start of the last decoded value; buffer[start:pos] is its source
+        self.start = 0
+        self.eof = False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at the end)."""
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if self.eof:
+                return ""
+            self.buffer, self.pos = self.f.read(self.chunk_size), 0
+            self.eof = not self.buffer
+
+    def expect(self, chars: str, message: str) -> str:
+        """Consume the next character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(message, self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def decode(self, ends: str) -> Any:
+        """Decode the next value, which must be followed by one of ``ends``."""
+        if not self.peek():
+            raise json.JSONDecodeError("Expecting value", self.buffer, self.pos)
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                end = len(self.buffer)
+            # A value must be followed by a separator; one reaching the end of
+            # the buffer may be cut short (e.g. "4.5" of "4.5e3"), so decode it
+            # again with more data
+            if not self.eof and (
+                end == len(self.buffer) or self.buffer[end] not in ends
+            ):
+                chunk = self.f.read(self.chunk_size)
+                self.eof = not chunk
+                self.buffer, self.pos = self.buffer[self.pos :] + chunk, 0
+                continue
+
+            self.start, self.pos = self.pos, end
+            return value
+
+    def items(self, with_source: bool = False) -> Iterator[Any]:
+        """Yield the items of the array starting at the current position.
+
+        With ``with_source``, yield ``(item, source_text)`` pairs.
+        """
+        self.expect("[", "Expected a JSON array")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            item = self.decode(_ITEM_ENDS)
+            yield (item, self.buffer[self.start : self.pos]) if with_source else item
+            if self.expect(",]", "Expecting ',' delimiter") == "]":
+                return
+
+    def members(self) -> Iterator[str]:
+        """Yield the keys of the object starting at the current position.
+
+        The caller must consume each member's value (with ``decode`` or
+        ``items``) before asking for the next key.
+        """
+        self.expect("{", "Expected a JSON object")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.decode(_KEY_ENDS)
+            if not isinstance(key, str):
+                raise json.JSONDecodeError(
+                    "Expecting property name", self.buffer, self.pos
+                )
+            self.expect(":", "Expecting ':' delimiter")
+            yield key
+            if self.expect(",}", "Expecting ',' delimiter") == "}":
+                return
+
+
+def iter_json_array(
+    file_path: Union[str, Path],
+    chunk_size: int = 1 << 16,
+    key: Optional[str] = None,
+    with_source: bool = False,
+) -> Iterator[Any]:
+    """Stream the items of a JSON array.
+
+    Items are decoded one at a time from fixed-size chunks, so only the
+    current item (plus one chunk) is held in memory instead of the whole list.
+
+    Args:
+        file_path: Path to the JSON file
+        chunk_size: Characters read per chunk
+        key: Top-level object member holding the array (default: the file's
+            top level is the array itself)
+        with_source: Yield ``(item, source_text)`` pairs, where source_text
+            is the item exactly as written in the file
+
+    Yields:
+        Array items in file order
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        KeyError: If ``key`` is not a member of the top-level object
+        json.JSONDecodeError: If the file does not hold the expected array
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    with open(path, encoding="utf-8") as f:
+        reader = _ChunkedJsonReader(f, chunk_size)
+        if key is None:
+            yield from reader.items(with_source)
+            return
+
+        for name in reader.members():
+            if name == key:
+                yield from reader.items(with_source)
+                return
+            reader.decode(_MEMBER_ENDS)
+        raise KeyError(key)
+
+
+def load_json_header(
+    file_path: Union[str, Path], key: str, chunk_size: int = 1 << 16
+) -> dict[str, Any]:
+    """Load the top-level members that precede a large member.
+
+    Collector files put small fields (term, timestamps) before the large
+    ``courses`` array, so they can be read without decoding the array.
+
+    Args:
+        file_path: Path to a JSON file whose top level is an object
+        key: Member to stop at
+        chunk_size: Characters read per chunk
+
+    Returns:
+        Members before ``key`` (all members if ``key`` is absent)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the top level is not a JSON object
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    header = {}
+    with open(path, encoding="utf-8") as f:
+        reader = _ChunkedJsonReader(f, chunk_size)
+        for name in reader.members():
+            if name == key:
+                break
+            header[name] = reader.decode(_MEMBER_ENDS)
+    return header
+
+
+class JsonArrayFile:
+    """Re-iterable view of a JSON array on disk.
+
+    Each iteration streams the array again with ``iter_json_array``, so it
+    can stand in for a list that would otherwise be loaded whole.
+    """
+
+    def __init__(self, file_path: Union[str, Path], key: Optional[str] = None):
+        """Initialize view.
+
+        Args:
+            file_path: Path to the JSON file
+            key: Top-level object member holding the array
+        """
+        self.file_path = Path(file_path)
+        self.key = key
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter_json_array(self.file_path, key=self.key)
+
+    def with_source(self) -> Iterator[tuple[Any, str]]:
+        """Iterate ``(item, source_text)`` pairs; see ``iter_json_array``."""
+        return iter_json_array(self.file_path, key=self.key, with_source=True)
+
+
+def write_json_stream(
+    data: Any, f: TextIO, indent: int = 2, ensure_ascii: bool = True
+) -> None:
+    """Write JSON incrementally, streaming any iterators in ``data`` as arrays.
+
+    Iterator values (e.g. generators of courses) are consumed and written one
+    item at a time, so the output document never exists in memory as a
+    whole. The output is byte-identical to ``json.dump`` of the same data with
+    the iterators replaced by lists.
+
+    Args:
+        data: Value to write; dictionaries may hold iterators at any depth
+        f: Text file to write to
+        indent: Indentation width
+        ensure_ascii: Escape non-ASCII characters
+    """
+    encoder = json.JSONEncoder(indent=indent, ensure_ascii=ensure_ascii)
+
+    def write(value: Any, level: int):
+        if isinstance(value, Iterator):
+            write_items(value, level)
+        elif isinstance(value, dict) and _contains_iterator(value):
+            write_members(value, level)
+        else:
+            text = encoder.encode(value)
+            if level and "\n" in text:
+                text = text.replace("\n", "\n" + " " * (indent * level))
+            f.write(text)
+
+    def write_items(items: Iterator[Any], level: int):
+        inner = "\n" + " " * (indent * (level + 1))
+        separator = "["
+        for item in items:
+            f.write(separator + inner)
+            write(item, level + 1)
+            separator = ","
+        f.write("[]" if separator == "[" else "\n" + " " * (indent * level) + "]")
+
+    def write_members(members: dict[str, Any], level: int):
+        inner = "\n" + " " * (indent * (level + 1))
+        separator = "{"
+        for name, value in members.items():
+            f.write(separator + inner + encoder.encode(name) + ": ")
+            write(value, level + 1)
+            separator = ","
+        f.write("\n" + " " * (indent * level) + "}")
+
+    write(data, 0)
+
+
+def _contains_iterator(value: Any) -> bool:
+    """Check whether a dictionary holds an iterator at any depth."""
+    return any(
+        isinstance(item, Iterator)
+        or (isinstance(item, dict) and _contains_iterator(item))
+        for item in value.values()
+    )
+
+
 def validate_course_data(courses: list[dict[str, Any]]) -> None:
     """Validate course data structure.
 
@@ -137,89 +419,452 @@ def load_schedule_data(file_path: Union[str, Path]) -> Schedule:
     instructors = [Instructor(**inst) for inst in data.get("instructors", [])]
 
     # Parse courses with sections
-    courses = []
-    for course_data in data.get("courses", []):
-        sections = []
-        for section_data in course_data.get("sections", []):
-            meetings = []
-            for meeting_data in section_data.get("meetings", []):
-                meeting = Meeting(
-                    type=meeting_data["type"],
-                    days=meeting_data["days"],
-                    start_time=meeting_data["start_time"],
-                    end_time=meeting_data["end_time"],
-                    location=Location(**meeting_data["location"]),
-                )
-                meetings.append(meeting)
-
-            section = Section(
-                crn=section_data["crn"],
-                section_number=section_data["section_number"],
-                term=section_data["term"],
-                college=section_data["college"],
-                instruction_mode=section_data["instruction_mode"],
-                status=section_data["status"],
-                enrollment=Enrollment(**section_data["enrollment"]),
-                meetings=meetings,
-                instructors=section_data["instructors"],
-                dates=SectionDates(**section_data["dates"]),
-                textbook=Textbook(**section_data["textbook"]),
-                notes=section_data.get("notes", ""),
-                fees=section_data.get("fees", 0.0),
-            )
-            sections.append(section)
-
-        # Parse course attributes if present
-        attributes = None
-        if "attributes" in course_data:
-            attr_data = course_data["attributes"]
-            attributes = CourseAttributes(
-                transferable=Transferable(**attr_data["transferable"]),
-                general_education=GeneralEducation(
-                    csu_area=attr_data["general_education"].get("csu_area", []),
-                    igetc_area=attr_data["general_education"].get("igetc_area", []),
-                    local=attr_data["general_education"].get("local", []),
-                ),
-                c_id=attr_data.get("c_id"),
-                degree_applicable=attr_data.get("degree_applicable", True),
-                basic_skills=attr_data.get("basic_skills", False),
-            )
-
-        course = Course(
-            course_key=course_data["course_key"],
-            subject=course_data["subject"],
-            course_number=course_data["course_number"],
-            title=course_data["title"],
-            description=course_data["description"],
-            units=course_data["units"],
-            unit_type=course_data["unit_type"],
-            prerequisites=course_data.get("prerequisites", ""),
-            corequisites=course_data.get("corequisites", ""),
-            advisory=course_data.get("advisory", ""),
-            attributes=attributes,
-            sections=sections,
-        )
-        courses.append(course)
+    courses = [_parse_course(course_data) for course_data in data.get("courses", [])]
 
     return Schedule(
         metadata=metadata, subjects=subjects, instructors=instructors, courses=courses
     )
 
 
-def save_schedule_data(schedule: Schedule, file_path: Union[str, Path]) -> None:
-    """Save schedule data to JSON file.
+def _parse_course(course_data: dict[str, Any]) -> Course:
+    """Build a Course, with its sections, from its JSON form."""
+    sections = []
+    for section_data in course_data.get("sections", []):
+        meetings = []
+        for meeting_data in section_data.get("meetings", []):
+            meeting = Meeting(
+                type=meeting_data["type"],
+                days=meeting_data["days"],
+                start_time=meeting_data["start_time"],
+                end_time=meeting_data["end_time"],
+                location=Location(**meeting_data["location"]),
+            )
+            meetings.append(meeting)
+
+        section = Section(
+            crn=section_data["crn"],
+            section_number=section_data["section_number"],
+            term=section_data["term"],
+            college=section_data["college"],
+            instruction_mode=section_data["instruction_mode"],
+            status=section_data["status"],
+            enrollment=Enrollment(**section_data["enrollment"]),
+            meetings=meetings,
+            instructors=section_data["instructors"],
+            dates=SectionDates(**section_data["dates"]),
+            textbook=Textbook(**section_data["textbook"]),
+            notes=section_data.get("notes", ""),
+            fees=section_data.get("fees", 0.0),
+        )
+        sections.append(section)
+
+    # Parse course attributes if present
+    attributes = None
+    if "attributes" in course_data:
+        attr_data = course_data["attributes"]
+        attributes = CourseAttributes(
+            transferable=Transferable(**attr_data["transferable"]),
+            general_education=GeneralEducation(
+                csu_area=attr_data["general_education"].get("csu_area", []),
+                igetc_area=attr_data["general_education"].get("igetc_area", []),
+                local=attr_data["general_education"].get("local", []),
+            ),
+            c_id=attr_data.get("c_id"),
+            degree_applicable=attr_data.get("degree_applicable", True),
+            basic_skills=attr_data.get("basic_skills", False),
+        )
+
+    return Course(
+        course_key=course_data["course_key"],
+        subject=course_data["subject"],
+        course_number=course_data["course_number"],
+        title=course_data["title"],
+        description=course_data["description"],
+        units=course_data["units"],
+        unit_type=course_data["unit_type"],
+        prerequisites=course_data.get("prerequisites", ""),
+        corequisites=course_data.get("corequisites", ""),
+        advisory=course_data.get("advisory", ""),
+        attributes=attributes,
+        sections=sections,
+    )
+
+
+def iter_schedule_courses(
+    file_path: Union[str, Path], chunk_size: int = 1 << 16
+) -> Iterator[Course]:
+    """Stream the courses of a schedule file without loading the whole file.
+
+    Courses are read from ``{"schedule": {"courses": [...]}}`` or a
+    top-level ``courses`` array and parsed one at a time, so the first
+    course is available as soon as it has been read.
 
     Args:
-        schedule: Schedule object to save
-        file_path: Path where to save the file
+        file_path: Path to the schedule JSON file
+        chunk_size: Characters read per chunk
+
+    Yields:
+        Courses in file order
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not a schedule object
     """
     path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    def find_courses(reader: _ChunkedJsonReader) -> bool:
+        for name in reader.members():
+            if name == "courses":
+                return True
+            if name == "schedule" and reader.peek() == "{":
+                return find_courses(reader)
+            reader.decode(_MEMBER_ENDS)
+        return False
+
+    with open(path, encoding="utf-8") as f:
+        reader = _ChunkedJsonReader(f, chunk_size)
+        if find_courses(reader):
+            for course_data in reader.items():
+                yield _parse_course(course_data)
+
+
+@functools.cache
+def _field_keys(cls: type) -> tuple[tuple[str, str], ...]:
+    """Names of a dataclass's fields, with their JSON-encoded form."""
+    return tuple((f.name, encode_basestring(f.name)) for f in fields(cls))
+
+
+class _ModelEncoder:
+    """JSON encoder for model dataclasses that reads their fields directly.
+
+    Produces the same text as ``json.dumps(asdict(value), ...)``, without
+    first copying the whole tree into dictionaries.
+    """
+
+    def __init__(self, indent: Optional[int], ensure_ascii: bool):
+        self.indent = indent
+        self.encode_string = (
+            encode_basestring_ascii if ensure_ascii else encode_basestring
+        )
+        # json's separators with an indent; compact output drops the space
+        self.item_separator = ","
+        self.key_separator = ": " if indent is not None else ":"
+        self._newlines: list[str] = []
+
+    def newline(self, level: int) -> str:
+        """Line break and indentation for a nesting level ("" if compact)."""
+        if self.indent is None:
+            return ""
+        while len(self._newlines) <= level:
+            self._newlines.append("\n" + " " * (self.indent * len(self._newlines)))
+        return self._newlines[level]
+
+    def encode(self, value: Any, level: int, out: list[str]) -> None:
+        """Append the JSON text of a value to ``out``."""
+        kind = type(value)
+        if kind is str:
+            out.append(self.encode_string(value))
+        elif value is None:
+            out.append("null")
+        elif value is True:
+            out.append("true")
+        elif value is False:
+            out.append("false")
+        elif kind is int:
+            out.append(int.__repr__(value))
+        elif kind is float:
+            out.append(_encode_float(value))
+        elif kind is list or kind is tuple:
+            self.encode_items(value, level, out)
+        elif is_dataclass(value):
+            self.encode_members(
+                [(key, getattr(value, name)) for name, key in _field_keys(kind)],
+                level,
+                out,
+            )
+        elif isinstance(value, dict):
+            self.encode_members(
+                [(self.encode_string(str(k)), v) for k, v in value.items()], level, out
+            )
+        elif isinstance(value, str):
+            out.append(self.encode_string(value))
+        elif isinstance(value, int):
+            out.append(int.__repr__(value))
+        elif isinstance(value, float):
+            out.append(_encode_float(value))
+        elif isinstance(value, (list, tuple)):
+            self.encode_items(value, level, out)
+        else:
+            raise TypeError(f"Object of type {kind.__name__} is not JSON serializable")
+
+    def encode_items(self, items: Any, level: int, out: list[str]) -> None:
+        """Append a JSON array."""
+        if not items:
+            out.append("[]")
+            return
+        inner = self.newline(level + 1)
+        separator = "[" + inner
+        for item in items:
+            out.append(separator)
+            self.encode(item, level + 1, out)
+            separator = self.item_separator + inner
+        out.append(self.newline(level) + "]")
+
+    def encode_members(
+        self, members: list[tuple[str, Any]], level: int, out: list[str]
+    ) -> None:
+        """Append a JSON object from (encoded key, value) pairs."""
+        if not members:
+            out.append("{}")
+            return
+        inner = self.newline(level + 1)
+        separator = "{" + inner
+        for key, value in members:
+            out.append(separator + key + self.key_separator)
+            self.encode(value, level + 1, out)
+            separator = self.item_separator + inner
+        out.append(self.newline(level) + "}")
+
+
+def _encode_float(value: float) -> str:
+    """Encode a float the way ``json`` does."""
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def write_schedule_json(
+    schedule: Schedule,
+    f: TextIO,
+    indent: Optional[int] = 2,
+    ensure_ascii: bool = False,
+) -> None:
+    """Write a schedule as a ``{"schedule": ...}`` JSON document.
+
+    The model is encoded one record at a time (metadata, each subject,
+    instructor and course) and each record's text is written as soon as it
+    is complete, so memory use does not grow with the schedule. The output
+    is byte-identical to ``json.dump({"schedule": asdict(schedule)}, f,
+    indent=indent, ensure_ascii=ensure_ascii)``, except that ``indent=None``
+    writes compact output without spaces after separators.
+
+    Args:
+        schedule: Schedule to write
+        f: Text file to write to
+        indent: Indentation width, or None for compact output
+        ensure_ascii: Escape non-ASCII characters
+    """
+    encoder = _ModelEncoder(indent, ensure_ascii)
+    newline = encoder.newline
+    key_separator = encoder.key_separator
+    f.write("{" + newline(1) + '"schedule"' + key_separator)
+    separator = "{" + newline(2)
+    for name, key in _field_keys(type(schedule)):
+        f.write(separator + key + key_separator)
+        separator = encoder.item_separator + newline(2)
+        value = getattr(schedule, name)
+        if isinstance(value, list):
+            _write_items(encoder, value, f, 2)
+        else:
+            out: list[str] = []
+            encoder.encode(value, 2, out)
+            f.write("".join(out))
+    f.write(newline(1) + "}" + newline(0) + "}")
+
+
+def _write_items(
+    encoder: _ModelEncoder, items: Iterable[Any], f: TextIO, level: int
+) -> int:
+    """Write a JSON array one item at a time; return the number of items."""
+    inner = encoder.newline(level + 1)
+    separator = "[" + inner
+    count = 0
+    for item in items:
+        out = [separator]
+        encoder.encode(item, level + 1, out)
+        f.write("".join(out))
+        separator = encoder.item_separator + inner
+        count += 1
+    f.write(encoder.newline(level) + "]" if count else "[]")
+    return count
+
+
+def write_models_json(
+    items: Iterable[Any],
+    f: TextIO,
+    indent: Optional[int] = 2,
+    ensure_ascii: bool = False,
+) -> int:
+    """Write model records (e.g. courses) as a JSON array as they are produced.
+
+    Each item is written as soon as it is encoded, so a generator of records
+    is never collected into a list. The output is that of ``json.dump`` of
+    the ``asdict`` of each item; see ``write_schedule_json``.
+
+    Args:
+        items: Dataclass instances (or JSON-compatible values)
+        f: Text file to write to
+        indent: Indentation width, or None for compact output
+        ensure_ascii: Escape non-ASCII characters
+
+    Returns:
+        Number of items written
+    """
+    return _write_items(_ModelEncoder(indent, ensure_ascii), items, f, 0)
+
+
+def model_to_json(value: Any, ensure_ascii: bool = False) -> str:
+    """Encode a model record as compact single-line JSON (e.g. for JSON Lines)."""
+    out: list[str] = []
+    _ModelEncoder(None, ensure_ascii).encode(value, 0, out)
+    return "".join(out)
+
+
+# Precompressed siblings save_schedule_data can write, e.g. courses.json.gz
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# Siblings are written once and served many times, so compress them hardest
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Bytes read at a time when compressing
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Make renames in a directory durable (POSIX only)."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _create_temp_file(path: Path) -> Path:
+    """Create an empty, uniquely named file next to ``path``.
+
+    Unlike mkstemp's owner-only 0600, the file gets the mode ``open()``
+    would give a new file: 0666 less the process umask, which the kernel
+    applies without the umask having to be read.
+    """
+    while True:
+        temp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return temp_path
+
+
+@contextlib.contextmanager
+def atomic_replace(path: Union[str, Path], fsync: bool = False) -> Iterator[Path]:
+    """Replace a file through a temporary file renamed over it.
+
+    Yields an empty temporary file next to ``path`` for the caller to write.
+    When the block exits normally, the temporary file takes the permission
+    bits of the file it replaces (the umask default for a new file, instead
+    of mkstemp's owner-only 0600) and is renamed over ``path``, so readers
+    see the old or the new file, never a partial one. If the block raises,
+    or deletes the temporary file, ``path`` is left as it was.
+
+    Args:
+        path: File to replace
+        fsync: Flush the new file and the rename to disk before returning
+    """
+    path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _create_temp_file(path)
+    try:
+        yield temp_path
+        if not temp_path.exists():
+            return
+        # A new file keeps the mode it was created with
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(temp_path, stat.S_IMODE(path.stat().st_mode))
+        if fsync:
+            fd = os.open(temp_path, os.O_RDWR)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        os.replace(temp_path, path)
+        if fsync:
+            _fsync_directory(path.parent)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+
+def _compress_file(source: Path, target: Path, suffix: str) -> None:
+    """Write a gzip or brotli copy of a file."""
+    with open(source, "rb") as src, open(target, "wb") as raw:
+        if suffix == ".gz":
+            # mtime=0 keeps the output identical for identical input
+            with gzip.GzipFile(
+                filename="", mode="wb", fileobj=raw, compresslevel=GZIP_LEVEL, mtime=0
+            ) as f:
+                shutil.copyfileobj(src, f, COPY_CHUNK_SIZE)
+        else:
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            while chunk := src.read(COPY_CHUNK_SIZE):
+                raw.write(compressor.process(chunk))
+            raw.write(compressor.finish())
+
+
+def save_schedule_data(
+    schedule: Schedule,
+    file_path: Union[str, Path],
+    fsync: bool = False,
+    compress: Iterable[str] = (),
+    compact: bool = False,
+) -> None:
+    """Save schedule data to JSON file.
+
+    The file is written to a temporary file in the same directory and renamed
+    over ``file_path``, so readers (such as a web server) see either the old
+    or the new file, never a partial one, and no locking is needed.
 
-    data = {"schedule": asdict(schedule)}
+    Args:
+        schedule: Schedule object to save
+        file_path: Path where to save the file
+        fsync: Flush the data and the rename to disk before returning, so
+            the new file survives a crash or power loss
+        compress: Suffixes from ``COMPRESSED_SUFFIXES`` of precompressed
+            siblings to write too (``courses.json.gz``, ``courses.json.br``).
+            Siblings are renamed into place before the file itself.
+        compact: Write without indentation or spaces (see
+            ``write_schedule_json``)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    Raises:
+        ValueError: If a suffix is unknown, or ``.br`` is requested without
+            the ``brotli`` package installed
+    """
+    path = Path(file_path)
+    suffixes = list(dict.fromkeys(compress))
+    for suffix in suffixes:
+        if suffix not in COMPRESSED_SUFFIXES:
+            raise ValueError(f"Unknown compressed suffix: {suffix}")
+        if suffix == ".br" and brotli is None:
+            raise ValueError("Writing .br files requires the brotli package")
+    # Siblings are entered last, so they are renamed into place first
+    with contextlib.ExitStack() as stack:
+        temp_path = stack.enter_context(atomic_replace(path, fsync))
+        with open(temp_path, "w", encoding="utf-8") as f:
+            write_schedule_json(schedule, f, indent=None if compact else 2)
+        for suffix in suffixes:
+            target = path.with_name(path.name + suffix)
+            sibling = stack.enter_context(atomic_replace(target, fsync))
+            _compress_file(temp_path, sibling, suffix)
 
 
 def filter_courses(courses: list[Course], filters: FilterOptions) -> list[Course]:
@@ -232,8 +877,24 @@ def filter_courses(courses: list[Course], filters: FilterOptions) -> list[Course
     Returns:
         Filtered list of courses
     """
-    filtered_courses = []
+    return list(iter_filtered_courses(courses, filters))
 
+
+def iter_filtered_courses(
+    courses: Iterable[Course], filters: FilterOptions
+) -> Iterator[Course]:
+    """Yield the courses matching the filters, one at a time.
+
+    Like ``filter_courses``, but lazy: courses (e.g. from
+    ``iter_schedule_courses``) are only read as far as the results are.
+
+    Args:
+        courses: Course objects
+        filters: FilterOptions with filter criteria
+
+    Yields:
+        Matching courses, holding only their matching sections
+    """
     for course in courses:
         # First check course-level filters
         if filters.units_min is not None and course.units < filters.units_min:
@@ -357,9 +1018,7 @@ def filter_courses(courses: list[Course], filters: FilterOptions) -> list[Course
                 attributes=course.attributes,
                 sections=filtered_sections,
             )
-            filtered_courses.append(course_copy)
-
-    return filtered_courses
+            yield course_copy
 
 
 def get_unique_values(schedule: Schedule) -> dict[str, list[str]]:
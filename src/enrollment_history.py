@@ -0,0 +1,392 @@
+"""Append-only store of per-section enrollment over successive snapshots.
+
+A collector writes a full snapshot of a term every run (Rio Hondo:
+``schedule_<term>_<YYYYMMDD>_<HHMMSS>.json``), though between two runs only a
+few sections' counts change. The history store records each snapshot as one
+JSON line holding only what changed since the previous one, column by column:
+
+- ``new``: ``[crn, subject, course_number]`` of sections not seen before,
+  which are numbered in order of appearance
+- ``removed``: sections that are no longer offered
+- ``restored``: removed sections that are offered again
+- ``enrolled``, ``capacity``, ``waitlist``, ``status``: ``[indices,
+  values]`` of the sections whose value of that field changed
+
+Section numbers in ``removed``, ``restored`` and the field columns are sorted
+and stored as gaps from the previous number. Replaying the lines in order
+rebuilds every snapshot, and fill-rate curves for a section or a whole
+subject are read from the replay without parsing any snapshot again.
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+HISTORY_VERSION = 1
+
+# Fields tracked per section, in column order
+FIELDS = ("enrolled", "capacity", "waitlist", "status")
+
+# Timestamp in collector snapshot names, e.g. schedule_202570_20250723_174056
+SNAPSHOT_NAME = re.compile(r"_(\d{8})_(\d{6})\.json$")
+
+# subject, course_number and FIELDS values of one section in a snapshot
+SectionState = tuple[str, str, Optional[int], Optional[int], Optional[int], Any]
+
+
+@dataclass(frozen=True)
+class FillPoint:
+    """Enrollment of a section or subject in one snapshot."""
+
+    time: str
+    enrolled: int
+    capacity: int
+    # None when the source has no waitlist counts
+    waitlist: Optional[int]
+    sections: int = 1
+
+    @property
+    def fill_rate(self) -> Optional[float]:
+        """Enrolled seats per seat, or None without capacity."""
+        return self.enrolled / self.capacity if self.capacity else None
+
+
+def snapshot_sections(data: Any) -> dict[str, SectionState]:
+    """Extract the tracked fields of every section in a snapshot.
+
+    Args:
+        data: Decoded Rio Hondo capture, or Banner ``scheduleCRNs`` rows
+
+    Returns:
+        CRN -> ``(subject, course_number, enrolled, capacity, waitlist,
+        status)``
+
+    Raises:
+        ValueError: If the data is neither kind of snapshot
+    """
+    if isinstance(data, dict) and isinstance(data.get("courses"), list):
+        sections = {}
+        for row in data["courses"]:
+            enrollment = row.get("enrollment") or {}
+            sections[str(row["crn"])] = (
+                row.get("subject", ""),
+                row.get("course_number", ""),
+                enrollment.get("actual"),
+                enrollment.get("capacity"),
+                None,
+                row.get("status"),
+            )
+        return sections
+    if isinstance(data, list):
+        return {
+            str(row["CRN"]): (
+                row.get("SUBJ_CODE", ""),
+                row.get("CRSE_NUMB", ""),
+                row.get("SSBSECT_ENRL"),
+                row.get("SSBSECT_MAX_ENRL"),
+                row.get("SSBSECT_WAIT_COUNT"),
+                row.get("SSBSECT_SSTS_CODE"),
+            )
+            for row in data
+        }
+    raise ValueError("Not a Rio Hondo capture or scheduleCRNs feed")
+
+
+def snapshot_time(path: Union[str, Path], data: Any = None) -> str:
+    """Time a snapshot was taken.
+
+    Taken from the capture's ``collection_timestamp``, else from a
+    ``_<YYYYMMDD>_<HHMMSS>.json`` file name, else from the file's
+    modification time.
+    """
+    if isinstance(data, dict) and data.get("collection_timestamp"):
+        return str(data["collection_timestamp"])
+    path = Path(path)
+    match = SNAPSHOT_NAME.search(path.name)
+    if match:
+        return datetime.strptime("".join(match.groups()), "%Y%m%d%H%M%S").isoformat()
+    mtime = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+    return mtime.replace(tzinfo=None).isoformat()
+
+
+def find_snapshots(paths: Iterable[Union[str, Path]]) -> list[Path]:
+    """Expand snapshot files and directories into snapshot files.
+
+    Directories contribute their ``schedule_*.json`` files; symlinks such as
+    ``schedule_<term>_latest.json`` are skipped, since they repeat a
+    snapshot.
+
+    Returns:
+        Snapshot files, oldest first by the time in their name
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(p for p in path.glob("schedule_*.json") if not p.is_symlink())
+        else:
+            files.append(path)
+    return sorted(files, key=lambda p: (snapshot_time(p), p.name))
+
+
+def _gaps(indices: list[int]) -> list[int]:
+    """Encode sorted indices as gaps from the previous one."""
+    return [index - previous for previous, index in zip([0, *indices], indices)]
+
+
+def _ungap(gaps: list[int]) -> Iterator[int]:
+    """Decode gap-encoded indices."""
+    index = 0
+    for gap in gaps:
+        index += gap
+        yield index
+
+
+class _Columns:
+    """Field values of every section as of the last replayed snapshot."""
+
+    def __init__(self) -> None:
+        self.crns: list[str] = []
+        self.subjects: list[str] = []
+        self.course_numbers: list[str] = []
+        self.present: list[bool] = []
+        self.values: dict[str, list[Any]] = {name: [] for name in FIELDS}
+
+    def apply(self, record: dict[str, Any]) -> None:
+        """Replay one snapshot record."""
+        for crn, subject, course_number in record.get("new", ()):
+            self.crns.append(crn)
+            self.subjects.append(subject)
+            self.course_numbers.append(course_number)
+            self.present.append(True)
+            for column in self.values.values():
+                column.append(None)
+        for index in _ungap(record.get("restored", [])):
+            self.present[index] = True
+        for index in _ungap(record.get("removed", [])):
+            self.present[index] = False
+            for column in self.values.values():
+                column[index] = None
+        for name in FIELDS:
+            if name in record:
+                gaps, values = record[name]
+                column = self.values[name]
+                for index, value in zip(_ungap(gaps), values):
+                    column[index] = value
+
+
+class EnrollmentHistory:
+    """Enrollment history of one term, stored in an append-only JSON Lines file.
+
+    The first line is a header; each following line records one snapshot
+    (see the module docstring). The file is replayed when opened, so
+    appending only needs to diff against the last snapshot.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open a history file, creating it on the first append.
+
+        Args:
+            path: History file
+
+        Raises:
+            ValueError: If the file was written by another history version
+        """
+        self.path = Path(path)
+        self.records: list[dict[str, Any]] = []
+        self.columns = _Columns()
+        self.index: dict[str, int] = {}
+        # Length of the file's complete lines
+        self._size = 0
+        self._load()
+
+    @property
+    def times(self) -> list[str]:
+        """Snapshot times, oldest first."""
+        return [record["time"] for record in self.records]
+
+    @property
+    def sources(self) -> set[str]:
+        """Names of the snapshot files recorded."""
+        return {record["source"] for record in self.records if record.get("source")}
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            lines = f.read().split(b"\n")
+        # A line without a newline was cut off while appending; it is
+        # overwritten by the next append
+        complete = lines[:-1]
+        if not complete:
+            return
+        header = json.loads(complete[0])
+        if header.get("version") != HISTORY_VERSION:
+            raise ValueError(
+                f"Unsupported history version {header.get('version')}: {self.path}"
+            )
+        self._size = len(complete[0]) + 1
+        for line in complete[1:]:
+            self._size += len(line) + 1
+            record = json.loads(line)
+            self.records.append(record)
+            self.columns.apply(record)
+        self.index = {crn: i for i, crn in enumerate(self.columns.crns)}
+
+    def append(
+        self, sections: dict[str, SectionState], time: str, source: str = ""
+    ) -> dict[str, Any]:
+        """Record a snapshot.
+
+        Args:
+            sections: Snapshot from ``snapshot_sections``
+            time: Snapshot time (ISO 8601), later than the last recorded
+            source: Snapshot file name
+
+        Returns:
+            The record appended
+
+        Raises:
+            ValueError: If the snapshot is not newer than the last recorded
+        """
+        if self.records and time <= self.records[-1]["time"]:
+            raise ValueError(
+                f"Snapshot at {time} is not newer than the last recorded "
+                f"({self.records[-1]['time']})"
+            )
+
+        columns = self.columns
+        # Indexes of new sections are only kept once the record is written
+        index = dict(self.index)
+        new = []
+        for crn, (subject, course_number, *_values) in sections.items():
+            if crn not in index:
+                index[crn] = len(columns.crns) + len(new)
+                new.append([crn, subject, course_number])
+
+        record: dict[str, Any] = {"time": time}
+        if source:
+            record["source"] = source
+        if new:
+            record["new"] = new
+        known = len(columns.crns)
+        current = {index[crn]: state[2:] for crn, state in sections.items()}
+        restored = sorted(
+            index for index in current if index < known and not columns.present[index]
+        )
+        if restored:
+            record["restored"] = _gaps(restored)
+        removed = [
+            index
+            for index, present in enumerate(columns.present)
+            if present and index not in current
+        ]
+        if removed:
+            record["removed"] = _gaps(removed)
+        for position, name in enumerate(FIELDS):
+            column = columns.values[name]
+            changed = sorted(
+                index
+                for index, values in current.items()
+                if (column[index] if index < known else None) != values[position]
+            )
+            if changed:
+                record[name] = [
+                    _gaps(changed),
+                    [current[index][position] for index in changed],
+                ]
+
+        self._write(record)
+        self.index = index
+        self.records.append(record)
+        columns.apply(record)
+        return record
+
+    def _write(self, record: dict[str, Any]) -> None:
+        """Append a record, dropping any line cut off by an earlier crash."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with open(self.path, "ab") as f:
+            f.truncate(self._size)
+            if not self._size:
+                header = {"version": HISTORY_VERSION, "fields": FIELDS}
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            self._size = f.tell()
+
+    def import_snapshots(self, paths: Iterable[Union[str, Path]]) -> list[Path]:
+        """Append snapshot files not recorded yet.
+
+        Files already recorded, and files older than the last recorded
+        snapshot, are skipped without being parsed, so importing a whole
+        capture directory again only reads the new snapshots.
+
+        Args:
+            paths: Snapshot files or directories of them
+
+        Returns:
+            Files imported
+        """
+        imported = []
+        recorded = self.sources
+        for path in find_snapshots(paths):
+            if path.name in recorded:
+                continue
+            if self.records and snapshot_time(path) < self.records[-1]["time"]:
+                continue
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.append(snapshot_sections(data), snapshot_time(path, data), path.name)
+            imported.append(path)
+        return imported
+
+    def _curve(self, indices: list[int]) -> list[FillPoint]:
+        """Sum the sections' counts at each snapshot they are offered in."""
+        columns = _Columns()
+        curve = []
+        for record in self.records:
+            columns.apply(record)
+            offered = [
+                i for i in indices if i < len(columns.crns) and columns.present[i]
+            ]
+            if not offered:
+                continue
+            enrolled, capacity = (
+                sum(columns.values[name][i] or 0 for i in offered)
+                for name in ("enrolled", "capacity")
+            )
+            waitlists = [columns.values["waitlist"][i] for i in offered]
+            waitlist = None
+            if any(count is not None for count in waitlists):
+                waitlist = sum(count or 0 for count in waitlists)
+            curve.append(
+                FillPoint(record["time"], enrolled, capacity, waitlist, len(offered))
+            )
+        return curve
+
+    def section_curve(self, crn: str) -> list[FillPoint]:
+        """Fill-rate curve of one section.
+
+        Raises:
+            KeyError: If the section was never recorded
+        """
+        if crn not in self.index:
+            raise KeyError(f"No history for CRN {crn}")
+        return self._curve([self.index[crn]])
+
+    def subject_curve(self, subject: str) -> list[FillPoint]:
+        """Fill-rate curve of every section of a subject together.
+
+        Raises:
+            KeyError: If no section of the subject was recorded
+        """
+        indices = [i for i, name in enumerate(self.columns.subjects) if name == subject]
+        if not indices:
+            raise KeyError(f"No history for subject {subject}")
+        return self._curve(indices)
@@ -0,0 +1,393 @@
+"""Live enrollment polling with delta publication.
+
+During registration seat counts change minute by minute while the rest of
+the schedule stays put. The poller fetches only the current term's sections
+feed on an interval, diffs the seat counts by CRN against the previous poll
+and publishes two small files for live frontends:
+
+- ``seats.json``: the current counts of every CRN, compactly encoded as
+  ``[enrolled, capacity, available, waitlist]`` (``null`` where the source has
+  no such count)
+- ``enrollment-delta.json``: the counts that changed in each of the recent
+  polls, so a client holding ``seats.json`` at sequence ``s`` applies the
+  deltas numbered above ``s``, and reloads ``seats.json`` only when ``s`` is
+  older than the deltas go back
+
+Sources are Banner ``scheduleCRNs`` feeds (``SSBSECT_ENRL``,
+``SSBSECT_MAX_ENRL``, ``SSBSECT_SEATS_AVAIL``, ``SSBSECT_WAIT_COUNT``) and Rio
+Hondo collector captures (``enrollment.actual``, ``capacity`` and
+``remaining``), either as URLs or as local files.
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .banner_download import (
+    TERM_LIST_DOMAIN,
+    TERM_LIST_FILE,
+    WEST_VALLEY_BASE_URL,
+    BannerDownloader,
+)
+from .data_utils import atomic_replace
+
+SEATS_NAME = "seats.json"
+DELTA_NAME = "enrollment-delta.json"
+# Last downloaded feed, kept so unchanged feeds are not parsed again
+FEED_NAME = ".enrollment-feed.json"
+FORMAT_VERSION = 1
+
+# Order of the counts in each CRN's entry
+SEAT_FIELDS = ("enrolled", "capacity", "available", "waitlist")
+
+# Deltas kept in enrollment-delta.json
+DELTA_HISTORY = 60
+
+# [enrolled, capacity, available, waitlist]
+Seats = list[Optional[int]]
+
+
+@dataclass
+class PollResult:
+    """Outcome of one poll."""
+
+    # Sequence number of the published state after the poll
+    sequence: int = 0
+    changed: int = 0
+    removed: int = 0
+    # Whether new files were published
+    published: bool = False
+    error: str = ""
+
+
+def seat_counts(data: Any) -> dict[str, Seats]:
+    """Extract the seat counts of every section in a feed.
+
+    Args:
+        data: Decoded Banner ``scheduleCRNs`` rows, or a Rio Hondo capture
+
+    Returns:
+        CRN -> ``[enrolled, capacity, available, waitlist]``, sorted by CRN
+
+    Raises:
+        ValueError: If the data is neither kind of feed
+    """
+    if isinstance(data, dict) and isinstance(data.get("courses"), list):
+        counts = {}
+        for row in data["courses"]:
+            enrollment = row.get("enrollment") or {}
+            counts[str(row["crn"])] = [
+                enrollment.get("actual"),
+                enrollment.get("capacity"),
+                enrollment.get("remaining"),
+                None,
+            ]
+    elif isinstance(data, list):
+        counts = {
+            str(row["CRN"]): [
+                row.get("SSBSECT_ENRL"),
+                row.get("SSBSECT_MAX_ENRL"),
+                row.get("SSBSECT_SEATS_AVAIL"),
+                row.get("SSBSECT_WAIT_COUNT"),
+            ]
+            for row in data
+        }
+    else:
+        raise ValueError("Not a scheduleCRNs feed or Rio Hondo capture")
+    return dict(sorted(counts.items()))
+
+
+def diff_seats(
+    old: dict[str, Seats], new: dict[str, Seats]
+) -> tuple[dict[str, Seats], list[str]]:
+    """Compare two polls' seat counts.
+
+    Returns:
+        Counts of CRNs that are new or changed, and the CRNs that are gone
+    """
+    changed = {crn: seats for crn, seats in new.items() if old.get(crn) != seats}
+    removed = sorted(crn for crn in old if crn not in new)
+    return changed, removed
+
+
+def current_term(term_list: list[dict[str, Any]]) -> str:
+    """Newest term in a Banner term list, the one registration is for.
+
+    Raises:
+        ValueError: If the term list is empty
+    """
+    terms = [row["SOBTERM_TERM_CODE"] for row in term_list]
+    if not terms:
+        raise ValueError("The term list is empty")
+    return str(max(terms))
+
+
+class EnrollmentPoller:
+    """Polls a sections feed and publishes seat counts and their deltas.
+
+    The published files are also the poller's state: a restarted poller
+    picks up the sequence and counts from ``seats.json``. Use as an async
+    context manager so connections are closed afterwards.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        output_dir: Union[str, Path],
+        history: int = DELTA_HISTORY,
+        retries: int = 3,
+    ):
+        """Initialize poller.
+
+        Args:
+            source: URL or local path of the feed
+            output_dir: Directory receiving the published files
+            history: Deltas kept in ``enrollment-delta.json``; with 0, clients
+                always reload ``seats.json``
+            retries: Retries after a failed request
+
+        Raises:
+            ValueError: If ``history`` is negative
+        """
+        if history < 0:
+            raise ValueError(f"Delta history must not be negative: {history}")
+        self.source = source
+        self.output_dir = Path(output_dir)
+        self.history = history
+        self.downloader = BannerDownloader(concurrency=1, retries=retries)
+        self.sequence = 0
+        self.seats: dict[str, Seats] = {}
+        self.deltas: list[dict[str, Any]] = []
+        # (mtime, size) of a local source when last read
+        self._source_stat: Optional[tuple[int, int]] = None
+        self._load()
+
+    @property
+    def is_url(self) -> bool:
+        """Whether the source is fetched over HTTP."""
+        return self.source.startswith(("http://", "https://"))
+
+    async def __aenter__(self) -> "EnrollmentPoller":
+        await self.downloader.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.downloader.__aexit__(*exc_info)
+
+    def _load(self) -> None:
+        """Resume from previously published files, if any."""
+        seats_path = self.output_dir / SEATS_NAME
+        if not seats_path.exists():
+            return
+        with open(seats_path, encoding="utf-8") as f:
+            published = json.load(f)
+        if published.get("version") != FORMAT_VERSION:
+            return
+        self.sequence = published["sequence"]
+        self.seats = published["seats"]
+
+        delta_path = self.output_dir / DELTA_NAME
+        if delta_path.exists():
+            with open(delta_path, encoding="utf-8") as f:
+                delta = json.load(f)
+            if (
+                delta.get("version") == FORMAT_VERSION
+                and delta.get("sequence") == self.sequence
+            ):
+                self.deltas = delta["deltas"]
+
+    async def _read_feed(self) -> Optional[Any]:
+        """Fetch and decode the feed, or return None if it is unchanged.
+
+        Raises:
+            OSError: If the feed cannot be fetched
+        """
+        if self.is_url:
+            result = await self.downloader.fetch(
+                self.source, self.output_dir / FEED_NAME
+            )
+            if result.error:
+                raise OSError(result.error)
+            if result.unchanged and self.sequence:
+                return None
+            path = result.path
+        else:
+            path = Path(self.source)
+            stat = path.stat()
+            source_stat = (stat.st_mtime_ns, stat.st_size)
+            if source_stat == self._source_stat and self.sequence:
+                return None
+            self._source_stat = source_stat
+
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    async def poll(self) -> PollResult:
+        """Fetch the feed once and publish the counts if any changed.
+
+        Failures are reported in the result rather than raised, so a polling
+        loop survives a bad request or a half-written capture.
+
+        Returns:
+            PollResult of the poll
+        """
+        try:
+            data = await self._read_feed()
+            seats = None if data is None else seat_counts(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            return PollResult(self.sequence, error=f"{type(e).__name__}: {e}")
+        if seats is None:
+            return PollResult(self.sequence)
+
+        changed, removed = diff_seats(self.seats, seats)
+        result = PollResult(self.sequence, len(changed), len(removed))
+        if self.sequence and not changed and not removed:
+            return result
+
+        self.sequence += 1
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        if self.sequence == 1:
+            # Nothing to diff against; clients start from seats.json
+            result.changed = 0
+        else:
+            self.deltas.append(
+                {
+                    "sequence": self.sequence,
+                    "updated": timestamp,
+                    "changed": changed,
+                    "removed": removed,
+                }
+            )
+            # Not deltas[:-history]: with a history of 0 that keeps them all
+            del self.deltas[: max(len(self.deltas) - self.history, 0)]
+        self.seats = seats
+        self._publish(timestamp)
+        result.sequence = self.sequence
+        result.published = True
+        return result
+
+    def _publish(self, timestamp: str) -> None:
+        """Write the delta file, then the seat counts it leads up to."""
+        # Deltas reach back to the state before the oldest one kept
+        since = self.deltas[0]["sequence"] - 1 if self.deltas else self.sequence
+        write_json_atomic(
+            self.output_dir / DELTA_NAME,
+            {
+                "version": FORMAT_VERSION,
+                "sequence": self.sequence,
+                "since": since,
+                "fields": SEAT_FIELDS,
+                "deltas": self.deltas,
+            },
+        )
+        write_json_atomic(
+            self.output_dir / SEATS_NAME,
+            {
+                "version": FORMAT_VERSION,
+                "sequence": self.sequence,
+                "updated": timestamp,
+                "source": self.source,
+                "fields": SEAT_FIELDS,
+                "seats": self.seats,
+            },
+        )
+
+    async def run(
+        self,
+        interval: float,
+        polls: Optional[int] = None,
+        report: Optional[Callable[[PollResult], None]] = None,
+    ) -> list[PollResult]:
+        """Poll on a fixed schedule.
+
+        Args:
+            interval: Seconds from the start of one poll to the next
+            polls: Number of polls (default: poll until cancelled)
+            report: Called with the result of each poll
+
+        Returns:
+            Results of the polls made
+        """
+        results = []
+        count = 0
+        while polls is None or count < polls:
+            started = time.monotonic()
+            result = await self.poll()
+            count += 1
+            if report is not None:
+                report(result)
+            # Unbounded runs never return, so they keep no results
+            if polls is not None:
+                results.append(result)
+            if polls is None or count < polls:
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+        return results
+
+
+async def resolve_feed_url(
+    base_url: str = WEST_VALLEY_BASE_URL, term: Optional[str] = None
+) -> str:
+    """URL of a Banner term's ``scheduleCRNs`` feed.
+
+    Args:
+        base_url: URL prefix the virtual domain name is appended to
+        term: Term code (default: the newest term in the term list)
+
+    Returns:
+        Feed URL
+
+    Raises:
+        OSError: If the term list cannot be downloaded
+        ValueError: If the term list is empty
+    """
+    async with BannerDownloader(base_url, concurrency=1) as downloader:
+        if term is None:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                path = Path(temp_dir) / TERM_LIST_FILE
+                result = await downloader.fetch(downloader.url(TERM_LIST_DOMAIN), path)
+                if result.error:
+                    raise OSError(result.error)
+                with open(path, encoding="utf-8") as f:
+                    term = current_term(json.load(f))
+        return downloader.url("scheduleCRNs", term)
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Replace a published file so readers never see a partial one."""
+    with atomic_replace(path) as temp_path:
+        temp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+
+def poll_enrollment(
+    source: str,
+    output_dir: Union[str, Path],
+    interval: float = 60.0,
+    polls: Optional[int] = None,
+    history: int = DELTA_HISTORY,
+    report: Optional[Callable[[PollResult], None]] = None,
+) -> list[PollResult]:
+    """Poll a sections feed (see ``EnrollmentPoller``).
+
+    Args:
+        source: URL or local path of the feed
+        output_dir: Directory receiving the published files
+        interval: Seconds from the start of one poll to the next
+        polls: Number of polls (default: poll until interrupted)
+        history: Deltas kept in ``enrollment-delta.json``
+        report: Called with the result of each poll
+
+    Returns:
+        Results of the polls made
+    """
+
+    async def run() -> list[PollResult]:
+        async with EnrollmentPoller(source, output_dir, history) as poller:
+            return await poller.run(interval, polls, report)
+
+    return asyncio.run(run())
@@ -0,0 +1,724 @@
+"""Structured change sets between two schedules.
+
+A change set lists what changed from one ``Schedule`` to the next as
+operations on keyed records:
+
+- ``add``: a record that is new, with its ``value`` and the key of the record
+  it follows (``after``, None for the first)
+- ``remove``: a record that is gone
+- ``update``: a record whose fields changed, as ``{"field": [old, new]}``;
+  nested objects are compared field by field (``"enrollment.enrolled"``),
+  lists as a whole
+- ``move``: a record placed elsewhere, after the record ``after``; only
+  records outside the longest run kept in order are moved
+
+Records are courses (by ``course_key``, without their sections), sections
+(by CRN, with the ``course_key`` of their course), subjects (by ``code``)
+and instructors (by ``id``). Sections of added or removed courses are part
+of the course's operation. Every schedule is indexed by key once, and
+patching rebuilds each list it edits once, so patching is linear in the
+number of records; diffing adds an n log n search for moved records.
+
+A change set applied to the schedule it was computed from gives the other
+schedule, in the same order; the old values of updates let the patch detect
+a base that does not match.
+"""
+
+import bisect
+import json
+import operator
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union, get_args, get_origin, get_type_hints
+
+from .data_utils import load_json_data, load_schedule_data, save_schedule_data
+from .models import Course, Instructor, Schedule, Section, Subject
+
+CHANGE_SET_VERSION = 1
+
+# Record kinds in the order their operations are listed
+KINDS = ("subject", "instructor", "course", "section")
+
+OPS = {"add": "added", "remove": "removed", "update": "changed", "move": "moved"}
+
+# Summary labels of section updates, in display order
+SECTION_CHANGE_KINDS = ("status", "time", "room", "instructor", "enrollment", "other")
+
+
+@dataclass
+class ChangeSet:
+    """Differences between two schedules."""
+
+    # metadata.last_updated of both schedules
+    old_version: str = ""
+    new_version: str = ""
+    # Changed metadata fields: {"field": [old, new]}
+    metadata: dict[str, list[Any]] = field(default_factory=dict)
+    changes: list[dict[str, Any]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.metadata or self.changes)
+
+    def operations(self, kind: str, op: Optional[str] = None) -> list[dict[str, Any]]:
+        """Operations on one kind of record, optionally of one type."""
+        return [
+            change
+            for change in self.changes
+            if change["kind"] == kind and (op is None or change["op"] == op)
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON."""
+        return {
+            "version": CHANGE_SET_VERSION,
+            "from": self.old_version,
+            "to": self.new_version,
+            "metadata": self.metadata,
+            "changes": self.changes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ChangeSet":
+        """Deserialize a change set written by ``to_dict``.
+
+        Raises:
+            ValueError: If the data is not a supported change set
+        """
+        if data.get("version") != CHANGE_SET_VERSION:
+            raise ValueError(f"Unsupported change set version: {data.get('version')}")
+        return cls(
+            data.get("from", ""),
+            data.get("to", ""),
+            data.get("metadata", {}),
+            data.get("changes", []),
+        )
+
+
+def field_changes(old: Any, new: Any, prefix: str = "") -> dict[str, list[Any]]:
+    """Compare two serialized records field by field.
+
+    Args:
+        old: Old record (``asdict`` output)
+        new: New record
+        prefix: Field path of the records
+
+    Returns:
+        ``{"field.path": [old, new]}`` for every changed field; dictionaries
+        are compared by key, other values as a whole
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key in old.keys() | new.keys():
+            path = f"{prefix}.{key}" if prefix else key
+            changes.update(field_changes(old.get(key), new.get(key), path))
+        return dict(sorted(changes.items()))
+    return {} if old == new else {prefix: [old, new]}
+
+
+# Course fields compared and serialized without the sections
+COURSE_FIELDS = tuple(f.name for f in fields(Course) if f.name != "sections")
+
+
+def _course_record(course: Course) -> dict[str, Any]:
+    """Serialize a course's own fields, without its sections."""
+    return {
+        name: asdict(value) if is_dataclass(value) else value
+        for name, value in ((name, getattr(course, name)) for name in COURSE_FIELDS)
+    }
+
+
+def _same_course(old: Course, new: Course) -> bool:
+    """Whether two courses' own fields are equal, ignoring their sections."""
+    return all(getattr(old, name) == getattr(new, name) for name in COURSE_FIELDS)
+
+
+def _in_order(positions: list[int]) -> set[int]:
+    """Positions of a longest increasing run of ``positions`` (n log n)."""
+    # ends[k]: smallest last position of a run of length k + 1, at tails[k]
+    ends: list[int] = []
+    tails: list[int] = []
+    links: list[Optional[int]] = []
+    for i, position in enumerate(positions):
+        k = bisect.bisect_left(ends, position)
+        links.append(tails[k - 1] if k else None)
+        if k == len(tails):
+            ends.append(position)
+            tails.append(i)
+        else:
+            ends[k] = position
+            tails[k] = i
+
+    kept = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        kept.add(positions[i])
+        i = links[i]
+    return kept
+
+
+def _unmoved(
+    old: dict[str, Any], new: dict[str, Any], group: Callable[[str], Any]
+) -> set[str]:
+    """Keys in both maps that keep their order within their group.
+
+    The other shared keys need a move for the new order to be reproduced.
+    """
+    position = {key: i for i, key in enumerate(old)}
+    groups: dict[Any, list[int]] = {}
+    for key in new:
+        if key in position:
+            groups.setdefault(group(key), []).append(position[key])
+    old_keys = list(old)
+    return {old_keys[i] for positions in groups.values() for i in _in_order(positions)}
+
+
+def _diff_keyed(
+    kind: str,
+    old: dict[str, Any],
+    new: dict[str, Any],
+    serialize: Callable[[Any], dict[str, Any]],
+    context: Callable[[str], dict[str, Any]] = lambda _key: {},
+    same: Callable[[Any, Any], bool] = operator.eq,
+    group: Callable[[str], Any] = lambda _key: None,
+) -> Iterator[dict[str, Any]]:
+    """Diff two key -> record maps whose keys are in document order.
+
+    Only records that are added or not ``same`` are serialized. Records
+    keep their order only within the same ``group``.
+    """
+    for key in old:
+        if key not in new:
+            yield {"op": "remove", "kind": kind, "key": key, **context(key)}
+
+    unmoved = _unmoved(old, new, group)
+    previous = None
+    for key, record in new.items():
+        old_record = old.get(key)
+        if old_record is not None and key not in unmoved:
+            yield {
+                "op": "move",
+                "kind": kind,
+                "key": key,
+                **context(key),
+                "after": previous,
+            }
+        if old_record is None:
+            yield {
+                "op": "add",
+                "kind": kind,
+                "key": key,
+                **context(key),
+                "after": previous,
+                "value": serialize(record),
+            }
+        elif not same(old_record, record):
+            changes = field_changes(serialize(old_record), serialize(record))
+            if changes:
+                yield {
+                    "op": "update",
+                    "kind": kind,
+                    "key": key,
+                    **context(key),
+                    "fields": changes,
+                }
+        previous = key
+
+
+def section_index(courses: Iterable[Course]) -> dict[str, tuple[Course, Section]]:
+    """Index sections by CRN, with the course they belong to."""
+    return {
+        section.crn: (course, section)
+        for course in courses
+        for section in course.sections
+    }
+
+
+def diff_schedules(old: Schedule, new: Schedule) -> ChangeSet:
+    """Compute the changes that turn one schedule into another.
+
+    Args:
+        old: Earlier schedule
+        new: Later schedule
+
+    Returns:
+        ChangeSet of the differences
+    """
+    change_set = ChangeSet(old.metadata.last_updated, new.metadata.last_updated)
+    change_set.metadata = field_changes(asdict(old.metadata), asdict(new.metadata))
+
+    changes = change_set.changes
+    changes.extend(
+        _diff_keyed(
+            "subject",
+            {s.code: s for s in old.subjects},
+            {s.code: s for s in new.subjects},
+            asdict,
+        )
+    )
+    changes.extend(
+        _diff_keyed(
+            "instructor",
+            {i.id: i for i in old.instructors},
+            {i.id: i for i in new.instructors},
+            asdict,
+        )
+    )
+
+    new_courses = {course.course_key: course for course in new.courses}
+    for change in _diff_keyed(
+        "course",
+        {course.course_key: course for course in old.courses},
+        new_courses,
+        _course_record,
+        same=_same_course,
+    ):
+        if change["op"] == "add":
+            change["value"] = asdict(new_courses[change["key"]])
+        changes.append(change)
+
+    # Sections of courses in both schedules; the others come and go with
+    # their course
+    kept = {course.course_key for course in old.courses} & new_courses.keys()
+    old_sections = {
+        crn: entry
+        for crn, entry in section_index(old.courses).items()
+        if entry[0].course_key in kept
+    }
+    new_sections = {
+        crn: entry
+        for crn, entry in section_index(new.courses).items()
+        if entry[0].course_key in kept
+    }
+
+    def course_key(crn: str) -> dict[str, Any]:
+        course, _section = new_sections.get(crn) or old_sections[crn]
+        return {"course_key": course.course_key}
+
+    # A section moved to another course is removed from one and added to
+    # the other
+    moved = {
+        crn
+        for crn, (course, _section) in old_sections.items()
+        if crn in new_sections and new_sections[crn][0].course_key != course.course_key
+    }
+    changes.extend(
+        {
+            "op": "remove",
+            "kind": "section",
+            "key": crn,
+            "course_key": course.course_key,
+        }
+        for crn, (course, _section) in old_sections.items()
+        if crn in moved
+    )
+    for change in _diff_keyed(
+        "section",
+        {crn: entry[1] for crn, entry in old_sections.items() if crn not in moved},
+        {crn: entry[1] for crn, entry in new_sections.items()},
+        asdict,
+        course_key,
+        group=lambda crn: new_sections[crn][0].course_key,
+    ):
+        after = change.get("after")
+        if (
+            after is not None
+            and new_sections[after][0] is not new_sections[change["key"]][0]
+        ):
+            # Sections are placed within their course
+            change["after"] = None
+        changes.append(change)
+    return change_set
+
+
+def section_change_kinds(fields: dict[str, list[Any]]) -> list[str]:
+    """Classify the field changes of a section update.
+
+    Returns:
+        Labels from ``SECTION_CHANGE_KINDS``: status flips, meeting time and
+        room changes, instructor swaps, enrollment counts, anything else
+    """
+    kinds = set()
+    for name, (old, new) in fields.items():
+        if name == "status":
+            kinds.add("status")
+        elif name == "instructors":
+            kinds.add("instructor")
+        elif name.startswith("enrollment."):
+            kinds.add("enrollment")
+        elif name == "meetings":
+            old, new = old or [], new or []
+            times = [
+                [
+                    (m["type"], m["days"], m["start_time"], m["end_time"])
+                    for m in meetings
+                ]
+                for meetings in (old, new)
+            ]
+            if times[0] != times[1]:
+                kinds.add("time")
+            if [m["location"] for m in old] != [m["location"] for m in new]:
+                kinds.add("room")
+        else:
+            kinds.add("other")
+    return [kind for kind in SECTION_CHANGE_KINDS if kind in kinds]
+
+
+def summarize(change_set: ChangeSet) -> dict[str, dict[str, int]]:
+    """Count a change set's operations.
+
+    Returns:
+        Kind -> ``{"added": n, "removed": n, "changed": n}``, plus
+        ``"section_changes"``: section updates per ``section_change_kinds``
+        label
+    """
+    summary = {kind: dict.fromkeys(OPS.values(), 0) for kind in KINDS}
+    section_changes = dict.fromkeys(SECTION_CHANGE_KINDS, 0)
+    for change in change_set.changes:
+        summary[change["kind"]][OPS[change["op"]]] += 1
+        if change["kind"] == "section" and change["op"] == "update":
+            for kind in section_change_kinds(change["fields"]):
+                section_changes[kind] += 1
+    summary["section_changes"] = section_changes
+    return summary
+
+
+def _describe(name: str, value: Any) -> str:
+    """Render a field value for the change report."""
+    if name == "meetings" and isinstance(value, list):
+        return (
+            "; ".join(
+                f"{''.join(m['days'])} {m['start_time']}-{m['end_time']} "
+                f"{m['location']['building']} {m['location']['room']}".strip()
+                for m in value
+            )
+            or "none"
+        )
+    return json.dumps(value, ensure_ascii=False)
+
+
+def format_change_set(change_set: ChangeSet) -> Iterator[str]:
+    """Render a change set as a human-readable report, line by line."""
+    yield f"Changes from {change_set.old_version} to {change_set.new_version}"
+    summary = summarize(change_set)
+    for kind in KINDS:
+        counts = ", ".join(
+            f"{n} {op}" for op, n in summary[kind].items() if n or op != "moved"
+        )
+        line = f"  {kind.capitalize()}s: {counts}"
+        if kind == "section":
+            labels = [f"{n} {k}" for k, n in summary["section_changes"].items() if n]
+            if labels:
+                line += f" ({', '.join(labels)})"
+        yield line
+
+    if change_set.changes:
+        yield ""
+    for change in change_set.changes:
+        kind, key = change["kind"], change["key"]
+        where = f" ({change['course_key']})" if kind == "section" else ""
+        if change["op"] == "add":
+            yield f"+ {kind} {key}{where}"
+        elif change["op"] == "remove":
+            yield f"- {kind} {key}{where}"
+        elif change["op"] == "move":
+            after = change["after"]
+            yield f"> {kind} {key}{where}: " + (f"after {after}" if after else "first")
+        else:
+            fields = "; ".join(
+                f"{name} {_describe(name, old)} -> {_describe(name, new)}"
+                for name, (old, new) in change["fields"].items()
+            )
+            yield f"~ {kind} {key}{where}: {fields}"
+
+
+def _serialize(value: Any) -> Any:
+    """Serialize a model value the way ``asdict`` does."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, list):
+        return [_serialize(item) for item in value]
+    return value
+
+
+def _build(hint: Any, value: Any) -> Any:
+    """Build a model value of a type hint from its serialized form."""
+    if value is None:
+        return None
+    if get_origin(hint) is Union:
+        # Optional[X]
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+    if get_origin(hint) is list:
+        [item_hint] = get_args(hint)
+        return [_build(item_hint, item) for item in value]
+    if isinstance(hint, type) and is_dataclass(hint):
+        hints = get_type_hints(hint)
+        return hint(**{name: _build(hints[name], item) for name, item in value.items()})
+    return value
+
+
+class _ListEdits:
+    """Removals and placements in one list, applied in a single rebuild.
+
+    Placing an item after another attaches it to that item, so the list is
+    rebuilt by walking the items left in place and, after each one, the
+    items attached to it. Items placed after the same one are listed
+    latest first, as if each had been inserted in turn; an item placed
+    twice stays where it was placed last.
+    """
+
+    def __init__(self, items: list[Any]):
+        self.items = items
+        self.removed: set[int] = set()
+        # id of a placed item -> id of the item it follows (None for first)
+        self.anchors: dict[int, Optional[int]] = {}
+        self.attached: dict[Optional[int], list[Any]] = {}
+
+    def remove(self, item: Any) -> None:
+        """Drop an item from the list."""
+        self.removed.add(id(item))
+
+    def place(self, item: Any, after: Optional[Any]) -> None:
+        """Put an item after another, first if None."""
+        anchor = None if after is None else id(after)
+        self.anchors[id(item)] = anchor
+        self.attached.setdefault(anchor, []).append(item)
+
+    def rebuild(self) -> None:
+        """Rewrite the list with every edit applied."""
+        result = []
+        stack: list[tuple[Optional[int], Any]] = [
+            (None, item) for item in self.attached.get(None, ())
+        ]
+        pending = [
+            item for item in reversed(self.items) if id(item) not in self.anchors
+        ]
+        while stack or pending:
+            if stack:
+                anchor, item = stack.pop()
+                if self.anchors[id(item)] != anchor:
+                    continue
+            else:
+                item = pending.pop()
+            if id(item) not in self.removed:
+                result.append(item)
+            stack.extend((id(item), other) for other in self.attached.get(id(item), ()))
+        # Items placed after one never reached (only in a cyclic change set)
+        # are kept at the end rather than lost
+        listed = {id(item) for item in result}
+        for items in self.attached.values():
+            for item in items:
+                if id(item) not in listed and id(item) not in self.removed:
+                    listed.add(id(item))
+                    result.append(item)
+        self.items[:] = result
+
+
+class _Patcher:
+    """Applies operations to a schedule through key indexes."""
+
+    def __init__(self, schedule: Schedule, strict: bool):
+        self.schedule = schedule
+        self.strict = strict
+        self.conflicts: list[str] = []
+        self.subjects = {s.code: s for s in schedule.subjects}
+        self.instructors = {i.id: i for i in schedule.instructors}
+        self.courses = {c.course_key: c for c in schedule.courses}
+        self.sections = section_index(schedule.courses)
+        # Edits per list, by the list's id
+        self.edits: dict[int, _ListEdits] = {}
+
+    def conflict(self, message: str) -> None:
+        """Record a mismatch between the base and the change set."""
+        if self.strict:
+            self.conflicts.append(message)
+
+    def update(self, target: Any, fields: dict[str, list[Any]], label: str) -> None:
+        """Set a record's changed fields, checking their old values."""
+        for path, (old, new) in fields.items():
+            *parents, name = path.split(".")
+            parent = target
+            for part in parents:
+                parent = getattr(parent, part)
+            if _serialize(getattr(parent, name)) != old:
+                self.conflict(f"{label}: {path} is not {old!r}")
+            setattr(parent, name, _build(get_type_hints(type(parent))[name], new))
+
+    def list_edits(self, items: list[Any]) -> _ListEdits:
+        """Pending edits of a list, applied by ``finish``."""
+        edits = self.edits.get(id(items))
+        if edits is None:
+            edits = self.edits[id(items)] = _ListEdits(items)
+        return edits
+
+    def finish(self) -> None:
+        """Rebuild every list that was edited."""
+        for edits in self.edits.values():
+            edits.rebuild()
+        self.edits.clear()
+
+    def apply(self, change: dict[str, Any]) -> None:
+        """Apply one operation."""
+        kind, op, key = change["kind"], change["op"], change["key"]
+        label = f"{kind} {key}"
+        if kind == "section":
+            self.apply_section(change, label)
+            return
+
+        index: dict[str, Any]
+        items: list[Any]
+        model: type
+        if kind == "subject":
+            index, items, model = self.subjects, self.schedule.subjects, Subject
+        elif kind == "instructor":
+            index, items, model = (
+                self.instructors,
+                self.schedule.instructors,
+                Instructor,
+            )
+        elif kind == "course":
+            index, items, model = self.courses, self.schedule.courses, Course
+        else:
+            raise ValueError(f"Unknown record kind: {kind}")
+
+        current = index.get(key)
+        if op == "update":
+            if current is None:
+                self.conflict(f"{label}: not in the base schedule")
+            else:
+                self.update(current, change["fields"], label)
+        elif op == "remove":
+            if current is None:
+                self.conflict(f"{label}: not in the base schedule")
+                return
+            self.list_edits(items).remove(current)
+            del index[key]
+            if kind == "course":
+                for section in current.sections:
+                    self.sections.pop(section.crn, None)
+        elif op == "move":
+            if current is None:
+                self.conflict(f"{label}: not in the base schedule")
+                return
+            self.list_edits(items).place(current, index.get(change.get("after") or ""))
+        elif op == "add":
+            if current is not None:
+                self.conflict(f"{label}: already in the base schedule")
+                self.list_edits(items).remove(current)
+            record = _build(model, change["value"])
+            self.list_edits(items).place(record, index.get(change.get("after") or ""))
+            index[key] = record
+            if kind == "course":
+                for section in record.sections:
+                    self.sections[section.crn] = (record, section)
+        else:
+            raise ValueError(f"Unknown operation: {op}")
+
+    def apply_section(self, change: dict[str, Any], label: str) -> None:
+        """Apply an operation on a section within its course."""
+        op, crn = change["op"], change["key"]
+        current = self.sections.get(crn)
+        if op == "update":
+            if current is None:
+                self.conflict(f"{label}: not in the base schedule")
+            else:
+                self.update(current[1], change["fields"], label)
+        elif op == "remove":
+            if current is None:
+                self.conflict(f"{label}: not in the base schedule")
+                return
+            course, section = current
+            self.list_edits(course.sections).remove(section)
+            del self.sections[crn]
+        elif op == "move":
+            if current is None:
+                self.conflict(f"{label}: not in the base schedule")
+                return
+            course, section = current
+            after = self.sections.get(change.get("after") or "")
+            self.list_edits(course.sections).place(
+                section, after[1] if after and after[0] is course else None
+            )
+        elif op == "add":
+            course = self.courses.get(change["course_key"])
+            if course is None:
+                self.conflict(f"{label}: course {change['course_key']} not found")
+                return
+            if current is not None:
+                self.conflict(f"{label}: already in the base schedule")
+                self.list_edits(current[0].sections).remove(current[1])
+            section = _build(Section, change["value"])
+            after = self.sections.get(change.get("after") or "")
+            self.list_edits(course.sections).place(
+                section, after[1] if after and after[0] is course else None
+            )
+            self.sections[crn] = (course, section)
+        else:
+            raise ValueError(f"Unknown operation: {op}")
+
+
+def apply_change_set(
+    schedule: Schedule, change_set: ChangeSet, strict: bool = True
+) -> None:
+    """Apply a change set to a schedule in place.
+
+    Args:
+        schedule: Schedule to patch
+        change_set: Changes computed by ``diff_schedules``
+        strict: Require the schedule to match the change set's base: updated
+            fields must hold their old values, removed and updated records
+            must exist and added ones must not. Otherwise additions replace
+            existing records and missing records are skipped.
+
+    Raises:
+        ValueError: If ``strict`` and the schedule does not match the base.
+            The schedule may then be partially patched.
+    """
+    patcher = _Patcher(schedule, strict)
+    patcher.update(schedule.metadata, change_set.metadata, "metadata")
+    for change in change_set.changes:
+        patcher.apply(change)
+    patcher.finish()
+    if patcher.conflicts:
+        shown = "; ".join(patcher.conflicts[:5])
+        more = len(patcher.conflicts) - 5
+        raise ValueError(
+            f"Change set does not apply to this schedule: {shown}"
+            + (f" (and {more} more)" if more > 0 else "")
+        )
+
+
+def patch_schedule_file(
+    base_path: Union[str, Path],
+    changes_path: Union[str, Path],
+    output_path: Optional[Union[str, Path]] = None,
+    strict: bool = True,
+    compress: Iterable[str] = (),
+) -> ChangeSet:
+    """Apply a saved change set to a schedule file.
+
+    The patched schedule is saved atomically and durably (see
+    ``save_schedule_data``), and a change set that does not apply leaves
+    the output untouched.
+
+    Args:
+        base_path: Schedule to patch
+        changes_path: Change set JSON from ``diff --output``
+        output_path: Where to save the result (default: ``base_path``)
+        strict: See ``apply_change_set``
+        compress: Precompressed siblings to write, see ``save_schedule_data``
+
+    Returns:
+        The change set applied
+
+    Raises:
+        ValueError: If the change set is invalid or does not apply
+    """
+    schedule = load_schedule_data(base_path)
+    change_set = ChangeSet.from_dict(load_json_data(changes_path))
+    apply_change_set(schedule, change_set, strict)
+
+    save_schedule_data(
+        schedule, output_path or base_path, fsync=True, compress=compress
+    )
+    return change_set
@@ -0,0 +1,391 @@
+"""Local query daemon that keeps schedules loaded between queries.
+
+``python -m src.cli schedule-filter`` pays for interpreter startup, imports,
+parsing the whole file and building the dataclasses before any filtering.
+``python -m src.cli serve`` pays that once: it loads the given schedule files,
+indexes their courses by subject, and answers queries over localhost HTTP:
+
+- ``GET /filter?file=...&subject=CS&open_only=1&format=jsonl&limit=20``
+  streams matching courses, in an export format or as the text summary
+- ``GET /facets?file=...&term=202570`` counts the matching sections by
+  subject, term, college, instruction mode and status
+- ``GET /health`` lists the files served and when each was loaded
+
+Query parameters are the ``schedule-filter`` options with underscores. Each
+query checks the file's modification time and size and reloads it if it
+changed. Saves are atomic, so a reload never sees a partial file. A file
+that fails to load, or is removed, keeps being served from its previous
+version.
+
+``schedule-filter --server URL`` forwards its options to a running daemon.
+"""
+
+import itertools
+import json
+import sys
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import TextIOWrapper
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, urlencode, urlsplit
+from urllib.request import urlopen
+
+from .course_export import EXPORT_FORMATS, write_courses, write_summary
+from .data_utils import iter_filtered_courses, load_schedule_data
+from .models import Course, FilterOptions, Schedule
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8737
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+# Output formats of /filter: the export formats plus the text summary
+QUERY_FORMATS = (*EXPORT_FORMATS, "text")
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+    "csv": "text/csv",
+    "text": "text/plain",
+}
+
+# Query parameter -> FilterOptions field
+FILTER_PARAMS = {
+    "term": "term",
+    "college": "college",
+    "subject": "subject",
+    "instruction_mode": "instruction_mode",
+    "keyword": "keyword",
+    "min_units": "units_min",
+    "max_units": "units_max",
+    "open_only": "open_only",
+}
+
+# Section fields counted by /facets
+FACETS = ("subject", "term", "college", "instruction_mode", "status")
+
+# Bytes relayed at a time by the client
+RELAY_CHUNK_SIZE = 1 << 16
+
+
+@dataclass
+class Query:
+    """A parsed /filter or /facets query."""
+
+    file: Optional[str]
+    filters: FilterOptions
+    offset: int = 0
+    limit: Optional[int] = None
+    format: str = "jsonl"
+
+
+def _int_param(params: Mapping[str, str], name: str) -> Optional[int]:
+    if name not in params:
+        return None
+    try:
+        value = int(params[name])
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+    if value < 0:
+        raise ValueError(f"{name} must not be negative")
+    return value
+
+
+def parse_query(params: Mapping[str, str]) -> Query:
+    """Build a query from request parameters.
+
+    Raises:
+        ValueError: If a parameter is unknown or invalid
+    """
+    known = {*FILTER_PARAMS, "file", "offset", "limit", "format"}
+    unknown = sorted(set(params) - known)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(unknown)}")
+
+    options: dict[str, Any] = {}
+    for name, option in FILTER_PARAMS.items():
+        value = params.get(name)
+        if not value:
+            continue
+        if name == "open_only":
+            options[option] = value.lower() not in ("0", "false", "no")
+        elif name in ("min_units", "max_units"):
+            try:
+                options[option] = float(value)
+            except ValueError:
+                raise ValueError(f"{name} must be a number") from None
+        else:
+            options[option] = value
+
+    fmt = params.get("format", "jsonl")
+    if fmt not in QUERY_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(QUERY_FORMATS)}")
+    return Query(
+        file=params.get("file"),
+        filters=FilterOptions(**options),
+        offset=_int_param(params, "offset") or 0,
+        limit=_int_param(params, "limit"),
+        format=fmt,
+    )
+
+
+@dataclass
+class LoadedSchedule:
+    """A schedule held in memory with its courses indexed by subject."""
+
+    schedule: Schedule
+    # (st_mtime_ns, st_size) of the file it was loaded from
+    stamp: tuple[int, int]
+    loaded_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    by_subject: dict[str, list[Course]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        by_subject = defaultdict(list)
+        for course in self.schedule.courses:
+            by_subject[course.subject].append(course)
+        self.by_subject = dict(by_subject)
+
+    def query(self, filters: FilterOptions) -> Iterator[Course]:
+        """Matching courses, reading only the subject's courses if given."""
+        courses: Iterable[Course] = self.schedule.courses
+        if filters.subject:
+            courses = self.by_subject.get(filters.subject, [])
+        return iter_filtered_courses(courses, filters)
+
+
+def facet_counts(courses: Iterable[Course]) -> dict[str, Any]:
+    """Count sections per value of each of ``FACETS``."""
+    counts: dict[str, Counter[str]] = {name: Counter() for name in FACETS}
+    total_courses = total_sections = 0
+    for course in courses:
+        total_courses += 1
+        for section in course.sections:
+            total_sections += 1
+            counts["subject"][course.subject] += 1
+            counts["term"][section.term] += 1
+            counts["college"][section.college] += 1
+            counts["instruction_mode"][section.instruction_mode] += 1
+            counts["status"][section.status] += 1
+    return {
+        "courses": total_courses,
+        "sections": total_sections,
+        "facets": {name: dict(sorted(c.items())) for name, c in counts.items()},
+    }
+
+
+class ScheduleStore:
+    """Schedule files kept loaded, reloaded when they change on disk."""
+
+    def __init__(self, paths: Iterable[Union[str, Path]]):
+        """Load schedule files.
+
+        Args:
+            paths: Files to serve; only these can be queried
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist
+            ValueError: If no files are given, or one is not a schedule
+        """
+        self.paths = [Path(path).resolve() for path in paths]
+        if not self.paths:
+            raise ValueError("No schedule files to serve")
+        self._loaded: dict[Path, LoadedSchedule] = {}
+        # Stamp of the last version of each file that failed to load
+        self._failed: dict[Path, Optional[tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+        for path in self.paths:
+            self.get(str(path))
+
+    def resolve(self, file: Optional[str]) -> Path:
+        """Find a served file by path; optional when serving one file.
+
+        Raises:
+            KeyError: If the file is not served
+        """
+        if file is None:
+            if len(self.paths) == 1:
+                return self.paths[0]
+            raise KeyError("Serving several files; pass file=")
+        path = Path(file).resolve()
+        if path not in self.paths:
+            raise KeyError(f"Not served: {file}")
+        return path
+
+    def get(self, file: Optional[str] = None) -> LoadedSchedule:
+        """The current version of a served file, reloading it if it changed.
+
+        A file that is missing or fails to load keeps being served from its
+        previous version; a version that failed is not tried again.
+
+        Raises:
+            KeyError: If the file is not served
+        """
+        path = self.resolve(file)
+        loaded = self._loaded.get(path)
+        try:
+            stat = path.stat()
+        except OSError as error:
+            if loaded is None:
+                raise
+            with self._lock:
+                self._keep_previous(path, None, error)
+            return loaded
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if loaded is not None and stamp in (loaded.stamp, self._failed.get(path)):
+            return loaded
+
+        with self._lock:
+            loaded = self._loaded.get(path)
+            if loaded is not None and stamp in (loaded.stamp, self._failed.get(path)):
+                return loaded
+            try:
+                loaded = LoadedSchedule(load_schedule_data(path), stamp)
+            except Exception as error:
+                if loaded is None:
+                    raise
+                self._keep_previous(path, stamp, error)
+                return loaded
+            self._loaded[path] = loaded
+            self._failed.pop(path, None)
+        return loaded
+
+    def _keep_previous(
+        self, path: Path, stamp: Optional[tuple[int, int]], error: Exception
+    ) -> None:
+        """Record a version that failed (None: a missing file) so it is skipped."""
+        if path not in self._failed or self._failed[path] != stamp:
+            print(
+                f"Keeping previous {path.name}: reload failed: {error}",
+                file=sys.stderr,
+            )
+        self._failed[path] = stamp
+
+    def status(self) -> dict[str, Any]:
+        """Files served, with their course counts and load times."""
+        return {
+            str(path): {
+                "courses": len(loaded.schedule.courses),
+                "loaded_at": loaded.loaded_at,
+            }
+            for path, loaded in self._loaded.items()
+        }
+
+
+class ScheduleRequestHandler(BaseHTTPRequestHandler):
+    """Answers /filter, /facets and /health from the server's store."""
+
+    server: "ScheduleServer"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        try:
+            if url.path == "/health":
+                self.send_json(self.server.store.status())
+            elif url.path == "/filter":
+                query = parse_query(params)
+                loaded = self.server.store.get(query.file)
+                self.send_courses(loaded, query)
+            elif url.path == "/facets":
+                query = parse_query(params)
+                loaded = self.server.store.get(query.file)
+                self.send_json(facet_counts(self.page(loaded, query)))
+            else:
+                self.send_error(404, f"Unknown path: {url.path}")
+        except KeyError as error:
+            self.send_error(404, str(error.args[0]))
+        except ValueError as error:
+            self.send_error(400, str(error))
+
+    def page(self, loaded: LoadedSchedule, query: Query) -> Iterator[Course]:
+        """The requested page of matching courses."""
+        stop = None if query.limit is None else query.offset + query.limit
+        return itertools.islice(loaded.query(query.filters), query.offset, stop)
+
+    def send_json(self, data: Any) -> None:
+        body = json.dumps(data, indent=2).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_courses(self, loaded: LoadedSchedule, query: Query) -> None:
+        """Stream a page of matching courses; the connection ends the body."""
+        self.send_response(200)
+        content_type = CONTENT_TYPES[query.format]
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        out = TextIOWrapper(self.wfile, encoding="utf-8", newline="")
+        try:
+            courses = self.page(loaded, query)
+            if query.format == "text":
+                write_summary(courses, out, flush=True)
+            else:
+                write_courses(courses, out, query.format, flush=True)
+            out.flush()
+        finally:
+            out.detach()
+
+
+class ScheduleServer(ThreadingHTTPServer):
+    """Localhost HTTP server answering queries from a ScheduleStore."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        paths: Iterable[Union[str, Path]],
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+    ):
+        """Load the schedules and bind the server (port 0 picks a free port)."""
+        self.store = ScheduleStore(paths)
+        super().__init__((host, port), ScheduleRequestHandler)
+
+    @property
+    def url(self) -> str:
+        """Base URL clients connect to."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def request_courses(
+    server_url: str, params: Mapping[str, Any], out: BinaryIO, path: str = "/filter"
+) -> None:
+    """Query a running server and relay the response as it arrives.
+
+    Args:
+        server_url: Base URL of the server
+        params: Query parameters; None and False values are left out, and
+            ``file`` is made absolute so the server can find it
+        out: Binary file to copy the response to (flushed per chunk)
+        path: Endpoint to query
+
+    Raises:
+        ValueError: If the server rejects the query
+        OSError: If the server cannot be reached
+    """
+    query = {
+        name: (str(Path(value).resolve()) if name == "file" else value)
+        for name, value in params.items()
+        if value is not None and value is not False
+    }
+    if query.get("open_only") is True:
+        query["open_only"] = "1"
+    url = f"{server_url.rstrip('/')}{path}?{urlencode(query)}"
+    try:
+        response = urlopen(url)
+    except HTTPError as error:
+        with error:
+            raise ValueError(f"Server refused the query: {error.reason}") from None
+    with response:
+        while chunk := response.read1(RELAY_CHUNK_SIZE):
+            out.write(chunk)
+            out.flush()
@@ -2,10 +2,12 @@
 
 import json
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from jsonschema import Draft7Validator
 
+from .college_rules import CollegeRules, load_college_rules
+
 
 class ExtensibleSchemaValidator:
     """Validates schedule data against base schema with college-specific extensions."""
@@ -22,9 +24,10 @@ class ExtensibleSchemaValidator:
             college_config_path: Path to college configuration JSON file
         """
         self.base_schema = self._load_json(base_schema_path)
-        self.college_config = (
-            self._load_json(college_config_path) if college_config_path else None
+        self.rules: Optional[CollegeRules] = (
+            load_college_rules(college_config_path) if college_config_path else None
         )
+        self.college_config = self.rules.config if self.rules else None
         self.validator = Draft7Validator(self.base_schema)
 
     @staticmethod
@@ -53,92 +56,21 @@ class ExtensibleSchemaValidator:
             errors.extend([f"Base schema: {e.message}" for e in base_errors])
 
         # Validate college-specific requirements if strict mode
-        if strict and self.college_config:
+        if strict and self.rules:
             college_errors = self._validate_college_requirements(data)
             errors.extend(college_errors)
 
         return len(errors) == 0, errors
 
     def _validate_college_requirements(self, data: dict[str, Any]) -> list[str]:
-        """Validate college-specific requirements based on config."""
-        errors = []
-        features = self.college_config.get("features", {})
-
-        # Check if required features are present in data
-        if features.get("textbook_cost", {}).get("enabled"):
-            errors.extend(self._check_textbook_cost(data))
-
-        if features.get("instruction_modes", {}).get("enabled"):
-            errors.extend(self._check_instruction_modes(data))
-
-        if features.get("enrollment_tracking", {}).get("enabled"):
-            errors.extend(self._check_enrollment_tracking(data))
-
-        return errors
-
-    def _check_textbook_cost(self, data: dict[str, Any]) -> list[str]:
-        """Check textbook cost data."""
+        """Validate college-specific requirements using the compiled rules."""
         errors = []
-        valid_categories = {
-            cat["code"]
-            for cat in self.college_config["features"]["textbook_cost"]["categories"]
-        }
-
-        for course in data.get("schedule", {}).get("courses", []):
-            for section in course.get("sections", []):
-                # Check if textbook cost is in attributes
-                textbook_cost = section.get("attributes", {}).get("textbook_cost")
-                if textbook_cost and textbook_cost not in valid_categories:
-                    errors.append(
-                        f"Invalid textbook cost '{textbook_cost}' in section {section.get('crn')}. "
-                        f"Valid values: {valid_categories}"
-                    )
-
-        return errors
-
-    def _check_instruction_modes(self, data: dict[str, Any]) -> list[str]:
-        """Check instruction mode data."""
-        errors = []
-        # Get the mapped codes (values) from the modes configuration
-        modes_config = self.college_config["features"]["instruction_modes"]["modes"]
-        valid_modes = set()
-        for key, mode_info in modes_config.items():
-            if isinstance(mode_info, dict) and "code" in mode_info:
-                valid_modes.add(mode_info["code"])
-            else:
-                # Handle simple string values
-                valid_modes.add(key)
-
-        for course in data.get("schedule", {}).get("courses", []):
-            for section in course.get("sections", []):
-                mode = section.get("instruction_mode")
-                if mode and mode not in valid_modes:
-                    errors.append(
-                        f"Invalid instruction mode '{mode}' in section {section.get('crn')}. "
-                        f"Valid values: {valid_modes}"
-                    )
-
-        return errors
-
-    def _check_enrollment_tracking(self, data: dict[str, Any]) -> list[str]:
-        """Check enrollment tracking fields."""
-        errors = []
-        required_fields = self.college_config["features"]["enrollment_tracking"].get(
-            "fields", []
-        )
+        check_section = self.rules.check_section
 
+        # Single pass over all sections; the rules are compiled once per config
         for course in data.get("schedule", {}).get("courses", []):
             for section in course.get("sections", []):
-                attributes = section.get("attributes", {})
-                missing_fields = [
-                    field for field in required_fields if field not in attributes
-                ]
-
-                if missing_fields:
-                    errors.append(
-                        f"Section {section.get('crn')} missing enrollment tracking fields: "
-                        f"{missing_fields}"
-                    )
+                errors.extend(check_section(section))
 
         return errors
 
@@ -0,0 +1,122 @@
+"""Shared time and meeting-day parsing for schedule data."""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Optional, Union
+
+# Meeting day codes in week order
+DAY_CODES = ("M", "T", "W", "R", "F", "S", "U")
+
+# Bit for each day code, so a set of meeting days fits in one int
+DAY_BITS = {code: 1 << i for i, code in enumerate(DAY_CODES)}
+
+
+@lru_cache(maxsize=4096)
+def time_to_minutes(value: str) -> Optional[int]:
+    """Convert a 24-hour "HH:MM" time to minutes after midnight.
+
+    Args:
+        value: Time string such as "09:00" or "9:05"
+
+    Returns:
+        Minutes after midnight, or None if the string is not a valid time
+    """
+    hours, sep, minutes = value.partition(":")
+    if not sep or not hours.isdigit() or not minutes.isdigit() or len(minutes) != 2:
+        return None
+
+    h, m = int(hours), int(minutes)
+    if h > 23 or m > 59:
+        return None
+    return h * 60 + m
+
+
+@lru_cache(maxsize=4096)
+def clock_to_minutes(value: str) -> Optional[int]:
+    """Convert a time in any format found in college exports to minutes.
+
+    Accepts 12-hour times ("06:00pm", "6:00 PM"), 24-hour times ("18:00")
+    and Banner's four-digit times ("1800"). Exports repeat a small set of
+    times, so results are cached.
+
+    Args:
+        value: Time string
+
+    Returns:
+        Minutes after midnight, or None if the string is not a valid time
+    """
+    text = value.strip().lower()
+    if text.endswith(("am", "pm")):
+        hours, sep, minutes = text[:-2].rstrip().partition(":")
+        if not sep or not hours.isdigit() or not minutes.isdigit():
+            return None
+        h, m = int(hours), int(minutes)
+        if not 1 <= h <= 12 or len(minutes) != 2 or m > 59:
+            return None
+        return (h % 12 + (12 if text[-2] == "p" else 0)) * 60 + m
+
+    if len(text) == 4 and text.isdigit():
+        text = f"{text[:2]}:{text[2:]}"
+    return time_to_minutes(text)
+
+
+def minutes_to_time(minutes: int) -> str:
+    """Format minutes after midnight as a 24-hour "HH:MM" time."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+@lru_cache(maxsize=4096)
+def normalize_time(value: Optional[str]) -> Optional[str]:
+    """Convert a time in any format accepted by clock_to_minutes to "HH:MM".
+
+    Args:
+        value: Time string, or None
+
+    Returns:
+        24-hour "HH:MM" time, or None if the value is empty or not a time
+    """
+    if not value:
+        return None
+    minutes = clock_to_minutes(value)
+    return None if minutes is None else minutes_to_time(minutes)
+
+
+@lru_cache(maxsize=256)
+def _day_string_to_mask(days: str) -> int:
+    """Convert a day string such as "MWF" to a bitmask (unknown days ignored)."""
+    mask = 0
+    for day in days:
+        mask |= DAY_BITS.get(day, 0)
+    return mask
+
+
+def days_to_mask(days: Union[str, Iterable[str], None]) -> int:
+    """Convert meeting days to a bitmask of DAY_BITS.
+
+    Args:
+        days: Day string ("MWF") or iterable of day codes (["M", "W"])
+
+    Returns:
+        Bitmask with one bit per meeting day
+    """
+    if not days:
+        return 0
+    if isinstance(days, str):
+        return _day_string_to_mask(days)
+
+    mask = 0
+    for day in days:
+        mask |= DAY_BITS.get(day, 0)
+    return mask
+
+
+# Day codes for every possible bitmask, in week order
+MASK_DAYS = tuple(
+    tuple(code for code in DAY_CODES if mask & DAY_BITS[code])
+    for mask in range(1 << len(DAY_CODES))
+)
+
+
+def mask_to_days(mask: int) -> list[str]:
+    """Convert a DAY_BITS bitmask back to a list of day codes."""
+    return list(MASK_DAYS[mask])
@@ -1,10 +1,145 @@
 """Base transformer class for converting college data to standardized format."""
 
 import json
+import os
+import re
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
+
+from ..college_rules import load_college_config, load_college_rules
+from .section_cache import SectionCache
+
+# Compiled field mapping: source record -> mapped value
+FieldGetter = Callable[[dict[str, Any]], Any]
+
+# Template placeholders, e.g. "{{SUBJ_CODE}}-{{CRSE_NUMB}}"
+TEMPLATE_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+
+def compile_path(path: Optional[str]) -> FieldGetter:
+    """Compile a dot-separated path into a getter.
+
+    The getter behaves like ``BaseTransformer._get_nested_value`` with the path
+    split once up front.
+
+    Args:
+        path: Dot-separated path (e.g., "enrollment.actual")
+
+    Returns:
+        Function returning the value at ``path`` or None
+    """
+    if not path:
+        return _get_none
+
+    keys = tuple(path.split("."))
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get_key(data: dict[str, Any]) -> Any:
+            return data.get(key) if isinstance(data, dict) else None
+
+        return get_key
+
+    def get_path(data: dict[str, Any]) -> Any:
+        value: Any = data
+        for key in keys:
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                return None
+        return value
+
+    return get_path
+
+
+def compile_field_mapping(mapping: Union[str, dict, None]) -> FieldGetter:
+    """Compile a ``data_mappings`` entry into a getter.
+
+    The getter returns what ``BaseTransformer._map_field`` would for the same
+    mapping, with paths split and value-mapping tables copied once.
+
+    Args:
+        mapping: Field mapping (string for direct map, dict for complex)
+
+    Returns:
+        Function mapping a source record to the field value
+    """
+    if isinstance(mapping, str):
+        return compile_path(mapping)
+    if not isinstance(mapping, dict):
+        return _get_none
+
+    get_value = compile_path(mapping.get("field"))
+    if "mapping" not in mapping:
+        return get_value
+
+    table = dict(mapping["mapping"])
+
+    def get_mapped(data: dict[str, Any]) -> Any:
+        value = get_value(data)
+        if value is None:
+            return None
+        return table.get(value, value)
+
+    return get_mapped
+
+
+@lru_cache(maxsize=128)
+def compile_template(template: str) -> Callable[[dict[str, Any]], str]:
+    """Compile a template into a formatter, cached per template string.
+
+    The template is split once into literal segments and placeholder names;
+    the formatter fills the placeholders from a record in a single join.
+    Missing fields render as empty strings.
+
+    Args:
+        template: Template string with {{field}} placeholders
+
+    Returns:
+        Function rendering the template for a data dictionary
+    """
+    pieces = TEMPLATE_PATTERN.split(template)
+    if len(pieces) == 1:
+        return lambda _data: template
+
+    first = pieces[0]
+    # (field, literal following it) pairs
+    segments = tuple(zip(pieces[1::2], pieces[2::2]))
+
+    def render(data: dict[str, Any]) -> str:
+        parts = [first]
+        for field, literal in segments:
+            parts.append(str(data.get(field, "")))
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+
+def _get_none(_data: dict[str, Any]) -> None:
+    """Getter for missing mappings."""
+    return None
+
+
+def sort_courses(courses: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Put courses in canonical order: by course ID, with sections by CRN."""
+    for course in courses:
+        course["sections"].sort(key=_section_key)
+    return sorted(courses, key=_course_key)
+
+
+def _course_key(course: dict[str, Any]) -> str:
+    """Sort key of a course."""
+    return str(course["course_id"])
+
+
+def _section_key(section: dict[str, Any]) -> str:
+    """Sort key of a section."""
+    return str(section.get("crn") or "")
 
 
 class BaseTransformer(ABC):
@@ -16,16 +151,77 @@ class BaseTransformer(ABC):
         Args:
             college_config_path: Path to college configuration JSON file
         """
-        self.config = self._load_config(college_config_path)
+        self.rules = load_college_rules(college_config_path)
+        self.config = self.rules.config
         self.college_info = self.config["college"]
         self.features = self.config["features"]
         self.mappings = self.config.get("data_mappings", {})
+        self._compile_section_plan()
+
+        # Set to reuse sections of unchanged rows from an earlier snapshot;
+        # consulted by transformers that support incremental runs
+        self.section_cache: Optional[SectionCache] = None
+
+        # Set to take timestamps from the source and put courses in canonical
+        # order, so identical input gives byte-identical output
+        self.reproducible = False
+
+    def _compile_section_plan(self):
+        """Compile the section mappings into getters used for every section.
+
+        Called once from ``__init__``; subclasses that change ``self.mappings``
+        afterwards must call it again.
+        """
+        section_mapping = self.mappings.get("section", {})
+        enrollment_mapping = section_mapping.get("enrollment", {})
+
+        self._get_crn = compile_field_mapping(section_mapping.get("crn"))
+        self._get_status = compile_field_mapping(section_mapping.get("status", "Open"))
+        self._get_instruction_mode = (
+            compile_field_mapping(section_mapping["instruction_mode"])
+            if "instruction_mode" in section_mapping
+            else None
+        )
+
+        self._get_enrolled = compile_field_mapping(enrollment_mapping.get("enrolled"))
+        self._get_capacity = compile_field_mapping(enrollment_mapping.get("capacity"))
+        self._get_available = (
+            compile_field_mapping(enrollment_mapping["available"])
+            if "available" in enrollment_mapping
+            else None
+        )
+        self._get_waitlist = (
+            compile_field_mapping(enrollment_mapping["waitlist"])
+            if "waitlist" in enrollment_mapping
+            else None
+        )
+
+        self._attribute_getters = tuple(
+            (name, compile_field_mapping(mapping))
+            for name, mapping in section_mapping.get("attributes", {}).items()
+        )
 
     @staticmethod
     def _load_config(path: Union[str, Path]) -> dict[str, Any]:
-        """Load college configuration."""
-        with open(path) as f:
-            return json.load(f)
+        """Load college configuration (cached and shared; do not mutate)."""
+        return load_college_config(path)
+
+    @classmethod
+    def load_input(cls, path: Union[str, Path]) -> dict[str, Any]:
+        """Build transformer input for a source export.
+
+        The default reads a single JSON file; transformers for exports spread
+        over several files or too large to load override it.
+
+        Args:
+            path: Source export
+
+        Returns:
+            Input data for ``transform`` and ``transform_stream``
+        """
+        with open(path, encoding="utf-8") as f:
+            data: dict[str, Any] = json.load(f)
+        return data
 
     def transform(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Transform college-specific data to standardized format.
@@ -36,11 +232,40 @@ class BaseTransformer(ABC):
         Returns:
             Standardized schedule data
         """
+        courses = self._transform_courses(input_data)
+        if self.reproducible:
+            courses = sort_courses(courses)
+        return self._build_schedule(input_data, courses)
+
+    def transform_stream(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Transform lazily, with courses produced by an iterator.
+
+        Pass the result to ``write_json_stream`` to write it without holding
+        every course in memory.
+
+        Args:
+            input_data: Raw data from college source
+
+        In reproducible mode the courses are collected and sorted first, as
+        exports do not list them in canonical order.
+
+        Returns:
+            Standardized schedule data whose "courses" is an iterator
+        """
+        courses = self.iter_courses(input_data)
+        if self.reproducible:
+            courses = iter(sort_courses(list(courses)))
+        return self._build_schedule(input_data, courses)
+
+    def _build_schedule(
+        self, input_data: dict[str, Any], courses: Iterable[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Wrap courses with metadata and extensions."""
         # Create base structure
         schedule = {
             "schedule": {
                 "metadata": self._create_metadata(input_data),
-                "courses": self._transform_courses(input_data),
+                "courses": courses,
             }
         }
 
@@ -55,7 +280,7 @@ class BaseTransformer(ABC):
         """Create metadata section."""
         metadata = {
             "version": "1.0.0",
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": self._last_updated(input_data),
             "college": {
                 "id": self.college_info["id"],
                 "name": self.college_info["name"],
@@ -73,6 +298,38 @@ class BaseTransformer(ABC):
 
         return metadata
 
+    def _last_updated(self, input_data: dict[str, Any]) -> str:
+        """Timestamp for ``metadata.last_updated``.
+
+        Reproducible runs use the source's own timestamp, falling back to
+        ``SOURCE_DATE_EPOCH``; other runs use the current time.
+
+        Raises:
+            ValueError: If a reproducible run has neither
+        """
+        if not self.reproducible:
+            return datetime.now().isoformat()
+
+        timestamp = self._source_timestamp(input_data)
+        if timestamp:
+            return timestamp
+
+        epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        if epoch:
+            return datetime.fromtimestamp(int(epoch), timezone.utc).isoformat()
+
+        raise ValueError(
+            f"{self.college_info['id']} exports carry no timestamp; "
+            "set SOURCE_DATE_EPOCH for reproducible output"
+        )
+
+    def _source_timestamp(self, _input_data: dict[str, Any]) -> Optional[str]:
+        """When the source data was collected, if the export records it.
+
+        Can be overridden by subclasses.
+        """
+        return None
+
     @abstractmethod
     def _extract_term_info(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Extract term information from input data.
@@ -89,6 +346,17 @@ class BaseTransformer(ABC):
         """
         pass
 
+    def iter_courses(self, input_data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Yield standardized courses one at a time.
+
+        Transformers that can emit a course as soon as its sections are read
+        override this; by default all courses are transformed first.
+        """
+        courses = self._transform_courses(input_data)
+        if self.reproducible:
+            courses = sort_courses(courses)
+        return iter(courses)
+
     def _create_extensions(self, _input_data: dict[str, Any]) -> dict[str, Any]:
         """Create college-specific extensions.
 
@@ -156,18 +424,7 @@ class BaseTransformer(ABC):
         Returns:
             Filled template string
         """
-        result = template
-
-        # Find all placeholders
-        import re
-
-        placeholders = re.findall(r"\{\{(\w+)\}\}", template)
-
-        for placeholder in placeholders:
-            value = data.get(placeholder, "")
-            result = result.replace(f"{{{{{placeholder}}}}}", str(value))
-
-        return result
+        return compile_template(template)(data)
 
     def _transform_section(
         self, section_data: dict[str, Any], _course_data: dict[str, Any] = None
@@ -181,21 +438,17 @@ class BaseTransformer(ABC):
         Returns:
             Transformed section
         """
-        section_mapping = self.mappings.get("section", {})
-
         # Build base section
         section = {
-            "crn": self._map_field(section_data, section_mapping.get("crn")),
-            "status": self._map_field(
-                section_data, section_mapping.get("status", "Open")
-            ),
+            "crn": self._get_crn(section_data),
+            "status": self._get_status(section_data),
             "enrollment": self._transform_enrollment(section_data),
             "meetings": self._transform_meetings(section_data),
         }
 
         # Add optional fields
-        if "instruction_mode" in section_mapping:
-            mode = self._map_field(section_data, section_mapping["instruction_mode"])
+        if self._get_instruction_mode is not None:
+            mode = self._get_instruction_mode(section_data)
             if mode:
                 section["instruction_mode"] = mode
 
@@ -218,27 +471,17 @@ class BaseTransformer(ABC):
 
     def _transform_enrollment(self, section_data: dict[str, Any]) -> dict[str, Any]:
         """Transform enrollment data."""
-        enrollment_mapping = self.mappings.get("section", {}).get("enrollment", {})
-
         enrollment = {
-            "enrolled": self._map_field(
-                section_data, enrollment_mapping.get("enrolled", 0)
-            )
-            or 0,
-            "capacity": self._map_field(
-                section_data, enrollment_mapping.get("capacity", 0)
-            )
-            or 0,
+            "enrolled": self._get_enrolled(section_data) or 0,
+            "capacity": self._get_capacity(section_data) or 0,
         }
 
         # Add optional fields
-        if "available" in enrollment_mapping:
-            enrollment["available"] = (
-                self._map_field(section_data, enrollment_mapping["available"]) or 0
-            )
+        if self._get_available is not None:
+            enrollment["available"] = self._get_available(section_data) or 0
 
-        if "waitlist" in enrollment_mapping:
-            waitlist = self._map_field(section_data, enrollment_mapping["waitlist"])
+        if self._get_waitlist is not None:
+            waitlist = self._get_waitlist(section_data)
             if waitlist is not None:
                 enrollment["waitlist"] = waitlist
 
@@ -262,10 +505,9 @@ class BaseTransformer(ABC):
     def _extract_attributes(self, section_data: dict[str, Any]) -> dict[str, Any]:
         """Extract college-specific attributes."""
         attributes = {}
-        attribute_mapping = self.mappings.get("section", {}).get("attributes", {})
 
-        for attr_name, attr_mapping in attribute_mapping.items():
-            value = self._map_field(section_data, attr_mapping)
+        for attr_name, get_value in self._attribute_getters:
+            value = get_value(section_data)
             if value is not None:
                 attributes[attr_name] = value
 
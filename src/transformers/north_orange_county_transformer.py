@@ -0,0 +1,432 @@
+"""North Orange County CCD schedule export transformer."""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..data_utils import iter_json_array
+from ..time_utils import normalize_time
+from .base_transformer import BaseTransformer, compile_field_mapping, compile_template
+
+# Meeting schedule codes taught as labs ("72L" online lab, "HYL" hybrid lab, ...)
+LAB_SCHEDULE_CODES = frozenset({"04", "04E"})
+
+# Meeting type codes without a regular lecture or lab pattern
+OTHER_MEETING_TYPES = frozenset({"ARN"})
+
+DAY_FIELDS = (
+    "monDay",
+    "tueDay",
+    "wedDay",
+    "thuDay",
+    "friDay",
+    "satDay",
+    "sunDay",
+)
+
+# crseText carries catalog markers inline ("!TRN CSU, UC !TITLE Graphic Design I
+# This course ..."); a marker's value runs to the next marker
+TRANSFER_PATTERN = re.compile(r"!TRN\s+((?:CSU|UC)(?:\s*,\s*(?:CSU|UC))*)")
+# "!TITLE (formerly ...)" notes are skipped; see _long_title for where the
+# title ends
+TITLE_PATTERN = re.compile(r"!TITLE\s+(?!\(formerly)([^!]+)")
+# What may follow the short title's last word in the long title: a numeral
+# the short title drops, or a "(...)" note
+TITLE_SUFFIX_PATTERN = re.compile(r"(?:\s+(?:[IVX]+|\d+)(?=\s))?(?:\s*\([^)]*\))?")
+# Titles are compared word by word; "/" and "-" separate words too
+TITLE_SEPARATOR_PATTERN = re.compile(r"[\s/-]+")
+TITLE_WORD_PATTERN = re.compile(r"[^\s/-]+")
+PREREQUISITE_PATTERN = re.compile(r"^Prerequisites?:\s*(.+?)\s*$", re.MULTILINE)
+COREQUISITE_PATTERN = re.compile(
+    r"^(?:Concurrent )?Co-?requisites?:\s*(.+?)\s*$", re.MULTILINE
+)
+EMAIL_PATTERN = re.compile(r"^(?:mailto:)?([^@\s/:]+@[^@\s/]+\.[^@\s/]+)$")
+
+
+@dataclass
+class NorthOrangeCountyIndex:
+    """Lookups built once from the NOCCCD lookup files."""
+
+    # crseKey (subject + number + term) -> standardized course fields
+    courses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # "Last, First" -> email
+    instructors: dict[str, str] = field(default_factory=dict)
+    campuses: dict[str, str] = field(default_factory=dict)
+
+
+class NorthOrangeCountyTransformer(BaseTransformer):
+    """Transforms a North Orange County CCD schedule export to standardized format.
+
+    The export directory holds ``sections.json`` (sections with embedded
+    meetings and attributes) plus lookup files: ``courses.json``,
+    ``instructors.json``, ``campus.json``, ``ptrm.json``, ``terms.json`` and
+    ``subjects.json``. Each lookup file is streamed once into a dictionary,
+    course catalog markers are decoded while indexing, and ``sections.json`` is
+    then streamed and joined against the dictionaries in a single pass.
+
+    Input data is ``{"data_dir": <path to the export directory>}``. The export
+    records no collection time, so reproducible runs need ``SOURCE_DATE_EPOCH``.
+    """
+
+    def __init__(self, college_config_path: Union[str, Path]):
+        """Initialize transformer with college configuration.
+
+        Args:
+            college_config_path: Path to college configuration JSON file
+        """
+        super().__init__(college_config_path)
+
+        course_mapping = self.mappings.get("course", {})
+        self._course_id = compile_template(course_mapping.get("course_id", ""))
+        self._get_subject = compile_field_mapping(course_mapping.get("subject"))
+        self._get_course_number = compile_field_mapping(
+            course_mapping.get("course_number")
+        )
+        self._get_title = compile_field_mapping(course_mapping.get("title"))
+        self._get_units = compile_field_mapping(course_mapping.get("units"))
+        self._get_description = compile_field_mapping(course_mapping.get("description"))
+
+        self._waitlist_enabled = self.features.get("waitlist", {}).get("enabled", False)
+        self._textbook_codes = frozenset(
+            category["code"]
+            for category in self.features.get("textbook_cost", {}).get("categories", [])
+        )
+
+    @classmethod
+    def load_input(cls, path: Union[str, Path]) -> dict[str, Any]:
+        """Build transformer input for an export directory."""
+        return {"data_dir": Path(path)}
+
+    def _extract_term_info(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Extract the term from the first section and its name from terms.json."""
+        data_dir = Path(input_data["data_dir"])
+        first = next(self._iter_file(data_dir, "sections.json"), None)
+        if first is None:
+            return {}
+
+        code = first.get("sectTermCode", "")
+        term = {"code": code, "name": code}
+        for row in self._iter_file(data_dir, "terms.json"):
+            if row.get("termCode") == code:
+                term["name"] = row.get("termDesc") or code
+                break
+        return term
+
+    def _transform_courses(self, input_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Join sections against the lookup indexes into standardized courses."""
+        data_dir = Path(input_data["data_dir"])
+        index = self._build_index(data_dir)
+
+        courses: dict[str, dict[str, Any]] = {}
+        seen_crns: set[str] = set()
+        for row in self._iter_file(data_dir, "sections.json"):
+            # Sections are repeated when an instructor has several web links
+            if row.get("sectCrn") in seen_crns:
+                continue
+            seen_crns.add(row.get("sectCrn"))
+
+            course_key = (
+                f"{row.get('sectSubjCode')}{row.get('sectCrseNumb')}"
+                f"{row.get('sectTermCode')}"
+            )
+            catalog = index.courses.get(course_key)
+            if catalog is None:
+                catalog = index.courses[course_key] = self._create_course(
+                    {
+                        "crseSubjCode": row.get("sectSubjCode", ""),
+                        "crseCrseNumb": row.get("sectCrseNumb", ""),
+                        "crseCredHrLow": row.get("sectCredHrs"),
+                    }
+                )
+
+            course = courses.get(catalog["course_id"])
+            if course is None:
+                course = courses[catalog["course_id"]] = {**catalog, "sections": []}
+
+            # Attach the joined values; lowercase keys never clash with the export's
+            row["instructor_email"] = index.instructors.get(row.get("sectInstrName"))
+            row["campus_name"] = index.campuses.get(row.get("sectCampCode"))
+            course["sections"].append(self._transform_section(row))
+
+        return list(courses.values())
+
+    def _build_index(self, data_dir: Path) -> NorthOrangeCountyIndex:
+        """Stream each lookup file once into dictionaries."""
+        index = NorthOrangeCountyIndex()
+
+        for row in self._iter_file(data_dir, "courses.json"):
+            if row.get("crseKey"):
+                index.courses[row["crseKey"]] = self._create_course(row)
+
+        for row in self._iter_file(data_dir, "instructors.json"):
+            email = _email_address(row.get("instrEmailAddress"))
+            if email and row.get("instrLastName"):
+                name = f"{row['instrLastName']}, {row.get('instrFirstName') or ''}"
+                index.instructors[name.rstrip(", ")] = email
+
+        index.campuses = {
+            row["campCode"]: row.get("campDesc")
+            for row in self._iter_file(data_dir, "campus.json")
+            if row.get("campCode")
+        }
+        return index
+
+    @staticmethod
+    def _iter_file(data_dir: Path, name: str):
+        """Stream rows of an export file, or nothing if the file is missing."""
+        path = data_dir / name
+        return iter_json_array(path) if path.exists() else iter(())
+
+    def _create_course(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Create standardized course fields from a catalog row."""
+        text = row.get("crseText") or ""
+        long_text = row.get("crseLongText") or ""
+
+        title = _long_title(text, self._get_title(row) or "")
+        course_id = self._course_id(row)
+        course = {
+            "course_id": course_id,
+            "subject": self._get_subject(row) or "",
+            "course_number": self._get_course_number(row) or "",
+            "title": title or self._get_title(row) or course_id,
+            "units": float(self._get_units(row) or 0),
+        }
+
+        description = self._get_description(row)
+        if description:
+            course["description"] = description
+
+        prerequisites = PREREQUISITE_PATTERN.search(long_text)
+        if prerequisites:
+            course["prerequisites"] = prerequisites.group(1)
+
+        corequisites = COREQUISITE_PATTERN.search(long_text)
+        if corequisites:
+            course["corequisites"] = corequisites.group(1)
+        elif row.get("crseCorq"):
+            course["corequisites"] = ", ".join(
+                f"{corq['subjCodeCorq']} {corq['crseNumbCorq']}"
+                for corq in row["crseCorq"]
+            )
+
+        transferable = _decode_transfer(text, row.get("crseTrnsfrSts"))
+        if transferable is not None:
+            course["transferable"] = transferable
+
+        return course
+
+    def _transform_section(
+        self, section_data: dict[str, Any], _course_data: dict[str, Any] = None
+    ) -> dict[str, Any]:
+        """Transform a joined NOCCCD section row."""
+        section = super()._transform_section(section_data)
+
+        # Every schedulable section is active ("A"); derive the seat status
+        # shown to students from the seat counts
+        enrollment = section["enrollment"]
+        if (
+            section["status"] == "Open"
+            and enrollment["capacity"]
+            and enrollment.get("available", 1) <= 0
+        ):
+            section["status"] = "Waitlist" if self._waitlist_enabled else "Closed"
+        return section
+
+    def _transform_meetings(self, section_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Transform the meetings embedded in a section row."""
+        campus = section_data["campus_name"]
+        meetings = []
+        for row in section_data.get("sectMeetings") or ():
+            location = {
+                "building": row.get("bldgDesc") or row.get("bldgCode") or "TBA",
+                "room": row.get("roomCode") or "TBA",
+            }
+            if campus:
+                location["campus"] = campus
+            meetings.append(
+                {
+                    "type": _meeting_type(row),
+                    "days": [row[day] for day in DAY_FIELDS if row.get(day)],
+                    "start_time": normalize_time(row.get("beginTime")),
+                    "end_time": normalize_time(row.get("endTime")),
+                    "location": location,
+                }
+            )
+        return meetings
+
+    def _transform_instructor(self, section_data: dict[str, Any]) -> dict[str, Any]:
+        """Transform the section instructor, joining the email by name."""
+        name = section_data.get("sectInstrName")
+        if not name:
+            return None
+
+        instructor = {"name": name}
+        email = (
+            _email_address(section_data.get("sectInstrWebsite"))
+            or section_data["instructor_email"]
+        )
+        if email:
+            instructor["email"] = email
+        return instructor
+
+    def _transform_dates(self, section_data: dict[str, Any]) -> dict[str, Any]:
+        """Transform part-of-term dates ("06/09/2025")."""
+        dates = {}
+        start = _to_date(section_data.get("sectPtrmStartDate"))
+        end = _to_date(section_data.get("sectPtrmEndDate"))
+        if start:
+            dates["start"] = start
+        if end:
+            dates["end"] = end
+        return dates
+
+    def _extract_attributes(self, section_data: dict[str, Any]) -> dict[str, Any]:
+        """Extract mapped attributes plus attribute codes and cross-listing."""
+        attributes = super()._extract_attributes(section_data)
+        for name, value in attributes.items():
+            if isinstance(value, str) and value.endswith("T00:00:00"):
+                attributes[name] = value[:10]
+
+        # Enrollment tracking fields are always present, even when unset
+        for name in self.rules.enrollment_fields:
+            attributes.setdefault(name, None)
+
+        codes = [
+            row["attrCode"]
+            for row in section_data.get("sectAttr") or ()
+            if row.get("attrCode")
+        ]
+        if codes:
+            attributes["attribute_codes"] = codes
+            textbook_cost = next((c for c in codes if c in self._textbook_codes), None)
+            if textbook_cost:
+                attributes["textbook_cost"] = textbook_cost
+
+        cross_list = section_data.get("sectXlst")
+        if cross_list:
+            attributes["cross_list_group"] = cross_list[0].get("xlstGrp")
+
+        corequisite_crns = [
+            row["crnCorq"]
+            for row in section_data.get("sectCorq") or ()
+            if row.get("crnCorq")
+        ]
+        if corequisite_crns:
+            attributes["corequisite_crns"] = corequisite_crns
+
+        return attributes
+
+    def _create_extensions(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Add subject, part-of-term and campus descriptions."""
+        data_dir = Path(input_data["data_dir"])
+        extensions = {}
+
+        lookups = (
+            ("subjects", "subjects.json", "subjCode", "subjDesc"),
+            ("parts_of_term", "ptrm.json", "ptrmCode", "ptrmDesc"),
+            ("campuses", "campus.json", "campCode", "campDesc"),
+        )
+        for name, file_name, code_field, desc_field in lookups:
+            values = {
+                row[code_field]: row.get(desc_field)
+                for row in self._iter_file(data_dir, file_name)
+                if row.get(code_field)
+            }
+            if values:
+                extensions[name] = values
+
+        return extensions
+
+
+def _decode_transfer(
+    text: str, transfer_status: Optional[list[dict[str, Any]]]
+) -> Optional[dict[str, bool]]:
+    """Decode CSU/UC transferability from the !TRN marker or transfer codes.
+
+    The structured ``crseTrnsfrSts`` codes are used when the catalog text has
+    no marker; a "UC" code there means the course transfers to UC and CSU.
+    """
+    match = TRANSFER_PATTERN.search(text)
+    if match:
+        systems = {system.strip() for system in match.group(1).split(",")}
+        return {"csu": "CSU" in systems, "uc": "UC" in systems}
+
+    if transfer_status:
+        codes = {row.get("sbgiCode") for row in transfer_status}
+        return {"csu": bool(codes & {"CSU", "UC"}), "uc": "UC" in codes}
+    return None
+
+
+def _meeting_type(row: dict[str, Any]) -> str:
+    """Classify a meeting as Lab, Other or Lecture."""
+    if row.get("mtypCode") in OTHER_MEETING_TYPES:
+        return "Other"
+    schedule_code = row.get("schdCode") or ""
+    if (
+        row.get("mtypCode") == "LAB"
+        or schedule_code in LAB_SCHEDULE_CODES
+        or schedule_code.endswith("L")
+    ):
+        return "Lab"
+    return "Lecture"
+
+
+def _abbreviates(short: str, word: str) -> bool:
+    """Whether ``short`` abbreviates ``word``, like "Trng" does "Training".
+
+    Numbers, numerals and initials such as "101", "II" or "A" match exactly.
+    """
+    if short.isupper() or any(c.isdigit() for c in short):
+        return short.lower() == word.lower()
+    short, word = short.lower(), word.lower()
+    if short[0] != word[0]:
+        return False
+    letters = iter(word)
+    return all(letter in letters for letter in short)
+
+
+def _long_title(text: str, short_title: str) -> Optional[str]:
+    """Extract the long title from a course's catalog text.
+
+    The title has no terminator of its own: it runs to the next marker, but
+    the catalog description may follow it before that. When the value has
+    a sentence in it, the title is cut after the word the short title ends
+    with, abbreviated or not, and any numeral or "(...)" note after it,
+    where a capitalized word follows. Otherwise, or if there is no such
+    word, the marker's whole value is kept.
+    """
+    match = TITLE_PATTERN.search(text)
+    if not match:
+        return None
+    title = match.group(1).strip()
+    last = TITLE_SEPARATOR_PATTERN.split(short_title.strip())[-1]
+    if not last or "." not in title:
+        return title
+    for word in TITLE_WORD_PATTERN.finditer(title):
+        end = TITLE_SUFFIX_PATTERN.match(title, word.end()).end()
+        rest = title[end:].lstrip()
+        if _abbreviates(last, word.group()) and rest[:1].isupper():
+            return title[:end]
+    return title
+
+
+def _to_date(value: Optional[str]) -> Optional[str]:
+    """Convert "MM/DD/YYYY" dates to ISO dates; other values are kept."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%m/%d/%Y").date().isoformat()
+    except ValueError:
+        return value
+
+
+def _email_address(value: Optional[str]) -> Optional[str]:
+    """Extract an email address from a "mailto:" link or bare address.
+
+    Instructor links are free text and also hold faculty web pages, which are
+    ignored.
+    """
+    match = EMAIL_PATTERN.match(value) if value else None
+    return match.group(1) if match else None
@@ -0,0 +1,144 @@
+"""Registry of college transformers, keyed by college ID.
+
+Colleges are discovered from ``colleges/*/config.json`` and matched to a
+transformer by the config's ``college.id``. Transformer modules are imported
+only when their college is requested, so working on one college never
+imports the others.
+"""
+
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+from ..college_rules import load_college_config
+from .base_transformer import BaseTransformer
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+COLLEGES_DIR = PROJECT_ROOT / "colleges"
+EXAMPLES_DIR = PROJECT_ROOT / "ccc-schedule-examples"
+
+
+@dataclass(frozen=True)
+class TransformerSpec:
+    """Where to find a college's transformer and example export."""
+
+    college_id: str
+    module: str
+    class_name: str
+    # Example export, relative to ccc-schedule-examples/
+    example_input: str
+
+
+TRANSFORMERS = {
+    spec.college_id: spec
+    for spec in (
+        TransformerSpec(
+            "north-orange-county",
+            "north_orange_county_transformer",
+            "NorthOrangeCountyTransformer",
+            "north-orange-county/data",
+        ),
+        TransformerSpec(
+            "rio-hondo",
+            "rio_hondo_transformer",
+            "RioHondoTransformer",
+            "rio-hondo/data/202570/schedule_202570_latest.json",
+        ),
+        TransformerSpec(
+            "west-valley-mission",
+            "west_valley_transformer",
+            "WestValleyTransformer",
+            "west-valley-mission/data/202570",
+        ),
+    )
+}
+
+
+def find_college_configs(
+    colleges_dir: Union[str, Path] = COLLEGES_DIR,
+) -> dict[str, Path]:
+    """Map college IDs to their configuration files.
+
+    Args:
+        colleges_dir: Directory with one ``<college>/config.json`` per college
+
+    Returns:
+        College ID -> config path, sorted by college ID
+    """
+    configs = {}
+    for path in sorted(Path(colleges_dir).glob("*/config.json")):
+        college_id = load_college_config(path).get("college", {}).get("id")
+        if college_id:
+            configs[college_id] = path
+    return dict(sorted(configs.items()))
+
+
+def get_transformer_spec(college_id: str) -> TransformerSpec:
+    """Look up the registered transformer for a college.
+
+    Raises:
+        ValueError: If no transformer is registered for the college
+    """
+    spec = TRANSFORMERS.get(college_id)
+    if spec is None:
+        raise ValueError(
+            f"No transformer registered for college '{college_id}'. "
+            f"Registered colleges: {', '.join(sorted(TRANSFORMERS))}"
+        )
+    return spec
+
+
+def get_transformer_class(college_id: str) -> type[BaseTransformer]:
+    """Import and return a college's transformer class.
+
+    Args:
+        college_id: College ID from the college config
+
+    Returns:
+        Transformer class
+
+    Raises:
+        ValueError: If no transformer is registered for the college
+    """
+    spec = get_transformer_spec(college_id)
+    module = importlib.import_module(f"{__package__}.{spec.module}")
+    transformer_class: type[BaseTransformer] = getattr(module, spec.class_name)
+    return transformer_class
+
+
+def create_transformer(
+    college_id: str, colleges_dir: Union[str, Path] = COLLEGES_DIR
+) -> BaseTransformer:
+    """Create the transformer for a college with its configuration.
+
+    Args:
+        college_id: College ID from the college config
+        colleges_dir: Directory holding the college configs
+
+    Returns:
+        Configured transformer
+
+    Raises:
+        ValueError: If the college has no config or no registered transformer
+    """
+    config_path = find_college_configs(colleges_dir).get(college_id)
+    if config_path is None:
+        raise ValueError(f"No configuration found for college '{college_id}'")
+    return get_transformer_class(college_id)(config_path)
+
+
+def transformer_for_config(config_path: Union[str, Path]) -> BaseTransformer:
+    """Create the transformer matching a college configuration file.
+
+    Args:
+        config_path: College configuration file
+
+    Returns:
+        Transformer registered for the config's ``college.id``
+
+    Raises:
+        ValueError: If no transformer is registered for the college
+    """
+    college_id = load_college_config(config_path).get("college", {}).get("id", "")
+    return get_transformer_class(college_id)(config_path)
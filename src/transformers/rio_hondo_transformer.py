@@ -1,14 +1,73 @@
 """Rio Hondo College data transformer."""
 
-from datetime import datetime
-from typing import Any, Union
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Optional, Union
 
+from ..data_utils import JsonArrayFile, load_json_header
+from ..time_utils import MASK_DAYS, days_to_mask, normalize_time
 from .base_transformer import BaseTransformer
+from .section_cache import row_digest
+
+# Collector status values mapped to standardized statuses
+STATUS_MAP = {
+    "OPEN": "Open",
+    "CLOSED": "Closed",
+    "Waitlisted": "Waitlist",
+    "CANCELLED": "Cancelled",
+}
+
+# Keywords used to infer an instruction mode for delivery methods missing
+# from the college config, checked in order; the default is in-person
+INFERRED_MODES = (
+    (("online", "sync"), "SYNC"),
+    (("online",), "ONL"),
+    (("hybrid",), "HYB"),
+    (("arranged",), "ARR"),
+)
+
+
+def _rows_grouped(rows: Iterable[dict[str, Any]]) -> bool:
+    """Whether each course's rows are contiguous."""
+    seen = set()
+    previous = None
+    for row in rows:
+        key = (row["subject"], row["course_number"])
+        if key != previous:
+            if key in seen:
+                return False
+            seen.add(key)
+            previous = key
+    return True
 
 
 class RioHondoTransformer(BaseTransformer):
     """Transforms Rio Hondo collector data to standardized format."""
 
+    def __init__(self, college_config_path: Union[str, Path]):
+        """Initialize transformer with college configuration.
+
+        Args:
+            college_config_path: Path to college configuration JSON file
+        """
+        super().__init__(college_config_path)
+
+        # Delivery method -> instruction mode, seeded from the config and
+        # extended with inferred modes as new delivery methods are seen
+        self._instruction_modes = dict(self.rules.instruction_mode_map)
+
+    @classmethod
+    def load_input(cls, path: Union[str, Path]) -> dict[str, Any]:
+        """Build transformer input for a collector file.
+
+        The fields before "courses" are read up front; the courses are
+        streamed from the file each time they are iterated.
+        """
+        return {
+            **load_json_header(path, "courses"),
+            "courses": JsonArrayFile(path, "courses"),
+        }
+
     def _extract_term_info(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Extract term information from Rio Hondo data."""
         return {
@@ -18,49 +77,102 @@ class RioHondoTransformer(BaseTransformer):
             "end_date": "2025-12-20",
         }
 
+    def _source_timestamp(self, input_data: dict[str, Any]) -> Optional[str]:
+        """Use the collector's timestamp."""
+        return input_data.get("collection_timestamp")
+
     def _transform_courses(self, input_data: dict[str, Any]) -> list[dict[str, Any]]:
         """Transform Rio Hondo courses to standardized format."""
         # Group courses by subject + course_number
         courses_map = {}
 
-        for course_data in input_data.get("courses", []):
+        for course_data, source in self._iter_rows(input_data):
             # Create course key
             course_key = f"{course_data['subject']}-{course_data['course_number']}"
 
             # Create/update course
             if course_key not in courses_map:
-                courses_map[course_key] = {
-                    "course_id": course_key,
-                    "subject": course_data["subject"],
-                    "course_number": course_data["course_number"],
-                    "title": course_data["title"],
-                    "units": float(course_data["units"]),
-                    "description": f"{course_data['title']} - {course_data['units']} units",
-                    "sections": [],
-                }
+                courses_map[course_key] = self._create_course(course_key, course_data)
 
             # Transform section
-            section = self._transform_section(course_data)
+            section = self._section(course_data, source)
             courses_map[course_key]["sections"].append(section)
 
         return list(courses_map.values())
 
+    def iter_courses(self, input_data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Yield each course as soon as its last section is read.
+
+        The collector writes sections grouped by course, so a course is
+        complete when the next row belongs to a different one. A first pass
+        over the course keys checks this; files whose sections are not
+        grouped are transformed in memory instead.
+        """
+        if not _rows_grouped(input_data.get("courses", [])):
+            yield from self._transform_courses(input_data)
+            return
+
+        course = None
+        for course_data, source in self._iter_rows(input_data):
+            course_key = f"{course_data['subject']}-{course_data['course_number']}"
+            if course is None or course["course_id"] != course_key:
+                if course is not None:
+                    yield course
+                course = self._create_course(course_key, course_data)
+
+            course["sections"].append(self._section(course_data, source))
+
+        if course is not None:
+            yield course
+
+    def _iter_rows(
+        self, input_data: dict[str, Any]
+    ) -> Iterator[tuple[dict[str, Any], Optional[str]]]:
+        """Yield collector rows with their source text when it is needed.
+
+        The source text is only read for the section cache, which hashes it
+        instead of re-encoding each row.
+        """
+        courses = input_data.get("courses", [])
+        if self.section_cache is not None and isinstance(courses, JsonArrayFile):
+            return courses.with_source()
+        return ((course_data, None) for course_data in courses)
+
+    def _section(
+        self, course_data: dict[str, Any], source: Optional[str]
+    ) -> dict[str, Any]:
+        """Transform a row, reusing the cached section if the row is unchanged."""
+        if self.section_cache is None:
+            return self._transform_section(course_data)
+        return self.section_cache.section(
+            course_data["crn"],
+            row_digest(course_data, source),
+            lambda: self._transform_section(course_data),
+        )
+
+    def _create_course(
+        self, course_key: str, course_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Create a course from its first section row."""
+        return {
+            "course_id": course_key,
+            "subject": course_data["subject"],
+            "course_number": course_data["course_number"],
+            "title": course_data["title"],
+            "units": float(course_data["units"]),
+            "description": f"{course_data['title']} - {course_data['units']} units",
+            "sections": [],
+        }
+
     def _transform_section(
         self, section_data: dict[str, Any], _course_data: dict[str, Any] = None
     ) -> dict[str, Any]:
         """Transform a Rio Hondo section."""
-        # Map status values
-        status_map = {
-            "OPEN": "Open",
-            "CLOSED": "Closed",
-            "Waitlisted": "Waitlist",
-            "CANCELLED": "Cancelled",
-        }
         raw_status = section_data.get("status", "Open")
 
         section = {
             "crn": section_data["crn"],
-            "status": status_map.get(raw_status, raw_status),
+            "status": STATUS_MAP.get(raw_status, raw_status),
             "instruction_mode": self._map_instruction_mode(
                 section_data.get("delivery_method", "")
             ),
@@ -104,30 +216,12 @@ class RioHondoTransformer(BaseTransformer):
 
     def _map_instruction_mode(self, delivery_method: str) -> str:
         """Map Rio Hondo delivery method to standardized instruction mode."""
-        mode_mapping = {
-            "Online": "ONL",
-            "Online SYNC": "SYNC",
-            "Hybrid": "HYB",
-            "Arranged": "ARR",
-            "In Person": "INP",
-        }
-
-        # Check if we have a direct mapping
-        if delivery_method in mode_mapping:
-            return mode_mapping[delivery_method]
-
-        # Otherwise, try to infer
-        delivery_lower = delivery_method.lower()
-        if "online" in delivery_lower and "sync" in delivery_lower:
-            return "SYNC"
-        elif "online" in delivery_lower:
-            return "ONL"
-        elif "hybrid" in delivery_lower:
-            return "HYB"
-        elif "arranged" in delivery_lower:
-            return "ARR"
-        else:
-            return "INP"  # Default to in-person
+        mode = self._instruction_modes.get(delivery_method)
+        if mode is None:
+            mode = self._instruction_modes[delivery_method] = _infer_mode(
+                delivery_method
+            )
+        return mode
 
     def _transform_meetings(self, section_data: dict[str, Any]) -> list[dict[str, Any]]:
         """Transform Rio Hondo meeting times."""
@@ -179,52 +273,14 @@ class RioHondoTransformer(BaseTransformer):
         """Parse days string to list of day codes."""
         if not days_str or days_str == "ARR":
             return []
-
-        # Map full day names to codes if needed
-        day_map = {
-            "M": "M",
-            "Mon": "M",
-            "Monday": "M",
-            "T": "T",
-            "Tue": "T",
-            "Tuesday": "T",
-            "W": "W",
-            "Wed": "W",
-            "Wednesday": "W",
-            "R": "R",
-            "Thu": "R",
-            "Thursday": "R",
-            "F": "F",
-            "Fri": "F",
-            "Friday": "F",
-            "S": "S",
-            "Sat": "S",
-            "Saturday": "S",
-            "U": "U",
-            "Sun": "U",
-            "Sunday": "U",
-        }
-
-        # Extract individual day codes
-        days = []
-        for char in days_str:
-            if char in day_map:
-                days.append(day_map[char])
-
-        return days
+        return list(MASK_DAYS[days_to_mask(days_str)])
 
     def _parse_time(self, time_str: Union[str, None]) -> Union[str, None]:
         """Convert time format from '06:00pm' to '18:00'."""
         if not time_str:
             return None
-
-        try:
-            # Parse time like "06:00pm"
-            time_obj = datetime.strptime(time_str, "%I:%M%p")
-            return time_obj.strftime("%H:%M")
-        except ValueError:
-            # Try other formats or return as-is
-            return time_str
+        # Unrecognized formats are passed through as-is
+        return normalize_time(time_str) or time_str
 
     def _parse_location(self, location_str: str) -> dict[str, str]:
         """Parse location string into building/room."""
@@ -286,3 +342,12 @@ class RioHondoTransformer(BaseTransformer):
             dates["duration_weeks"] = section_data["weeks"]
 
         return dates
+
+
+def _infer_mode(delivery_method: str) -> str:
+    """Infer an instruction mode from keywords in a delivery method."""
+    delivery_lower = delivery_method.lower()
+    for keywords, mode in INFERRED_MODES:
+        if all(keyword in delivery_lower for keyword in keywords):
+            return mode
+    return "INP"  # Default to in-person
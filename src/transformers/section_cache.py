@@ -0,0 +1,164 @@
+"""Per-CRN cache of transformed sections for incremental transforms.
+
+Successive collector snapshots of a term are mostly identical; usually only
+enrollment counts change. The cache keeps, for each CRN, a digest of the
+source row and the section it was transformed into, so the next snapshot only
+re-runs ``_transform_section`` for rows whose digest changed.
+"""
+
+import hashlib
+import importlib
+import inspect
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..data_utils import atomic_replace
+
+STATE_VERSION = 1
+
+# Modules outside the transformer classes that transformed sections depend on
+SHARED_MODULES = ("college_rules", "time_utils")
+
+
+def row_digest(row: dict[str, Any], source: Optional[str] = None) -> str:
+    """Digest a source row.
+
+    Args:
+        row: Decoded row
+        source: The row's text as read from the file; hashing it avoids
+            re-encoding the row
+
+    Returns:
+        Hex digest
+    """
+    if source is None:
+        source = json.dumps(row, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def transformer_fingerprint(transformer: Any) -> str:
+    """Hash what a transformer's sections depend on besides the row.
+
+    Covers the college config and the source of the transformer's module, of
+    its base classes' modules (``base_transformer``) and of
+    ``SHARED_MODULES``, so cached sections are dropped when any of them
+    changes.
+    """
+    package = __name__.split(".")[0]
+    modules = {
+        sys.modules[cls.__module__]
+        for cls in type(transformer).__mro__
+        if cls.__module__.startswith(f"{package}.")
+    }
+    modules.update(
+        importlib.import_module(f"{package}.{name}") for name in SHARED_MODULES
+    )
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps(transformer.config, sort_keys=True).encode("utf-8"))
+    for module in sorted(modules, key=lambda m: m.__name__):
+        digest.update(b"\0")
+        digest.update(Path(inspect.getfile(module)).read_bytes())
+    return digest.hexdigest()
+
+
+class SectionCache:
+    """Transformed sections keyed by CRN, with the digest of their source row."""
+
+    def __init__(self, fingerprint: str = ""):
+        """Initialize an empty cache.
+
+        Args:
+            fingerprint: Transformer fingerprint the cached sections belong to
+        """
+        self.fingerprint = fingerprint
+        self.entries: dict[str, tuple[str, dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        # CRNs seen in the current snapshot; only these are saved
+        self._seen: set[str] = set()
+
+    @classmethod
+    def load(cls, path: Union[str, Path], fingerprint: str = "") -> "SectionCache":
+        """Load a state file.
+
+        A missing or unreadable file, or one written by another state
+        version or for another fingerprint, gives an empty cache.
+
+        Args:
+            path: State file
+            fingerprint: Current transformer fingerprint
+
+        Returns:
+            SectionCache
+        """
+        cache = cls(fingerprint)
+        path = Path(path)
+        if path.exists():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    state = json.load(f)
+            except ValueError:
+                # Not a state file (such as one cut off before saves were
+                # atomic): transform everything again
+                return cache
+            if (
+                state.get("version") == STATE_VERSION
+                and state.get("fingerprint") == fingerprint
+            ):
+                cache.entries = {
+                    crn: (entry["input"], entry["output"])
+                    for crn, entry in state["sections"].items()
+                }
+        return cache
+
+    @property
+    def changed(self) -> bool:
+        """Whether this snapshot changed, added or dropped any section."""
+        return bool(self.misses) or len(self._seen) != len(self.entries)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the sections seen in this snapshot to a state file."""
+        state = {
+            "version": STATE_VERSION,
+            "fingerprint": self.fingerprint,
+            "sections": {
+                crn: {"input": digest, "output": section}
+                for crn, (digest, section) in self.entries.items()
+                if crn in self._seen
+            },
+        }
+        # dumps, unlike dump, encodes in one pass with the C encoder; an
+        # interrupted save leaves the previous state in place
+        with atomic_replace(path) as temp:
+            temp.write_text(json.dumps(state, separators=(",", ":")), "utf-8")
+
+    def section(
+        self,
+        crn: str,
+        digest: str,
+        transform: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return the cached section for a row, transforming it if changed.
+
+        Args:
+            crn: Section CRN
+            digest: Digest of the section's source row
+            transform: Produces the section when the cached one is stale
+
+        Returns:
+            Transformed section (shared with the cache; do not mutate)
+        """
+        self._seen.add(crn)
+        entry = self.entries.get(crn)
+        if entry is not None and entry[0] == digest:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        section = transform()
+        self.entries[crn] = (digest, section)
+        return section
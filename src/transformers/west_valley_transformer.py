@@ -0,0 +1,395 @@
+"""West Valley Mission CCD Banner export transformer."""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..data_utils import iter_json_array
+from ..time_utils import normalize_time
+from .base_transformer import BaseTransformer, compile_field_mapping, compile_template
+
+# Banner schedule type codes taught as labs; other types are listed as lectures
+LAB_SCHEDULE_CODES = frozenset({"04"})
+
+# Meeting tuple stored in the join index: (days, start, end, building, room)
+MeetingRow = tuple[list[str], Optional[str], Optional[str], str, str]
+
+
+@dataclass
+class BannerTermIndex:
+    """Per-CRN and per-course lookups built from one term's Banner files."""
+
+    meetings: dict[str, list[MeetingRow]] = field(default_factory=dict)
+    instructors: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+    attribute_codes: dict[str, list[str]] = field(default_factory=dict)
+    cohorts: dict[str, list[str]] = field(default_factory=dict)
+    cross_listed: dict[str, list[str]] = field(default_factory=dict)
+    textbook_costs: dict[str, str] = field(default_factory=dict)
+    courses: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+    # Section rows from ssrmeet, used when a term has no crns.json
+    meeting_sections: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+class WestValleyTransformer(BaseTransformer):
+    """Transforms a West Valley Mission Banner term export to standardized format.
+
+    Each term directory holds separate Banner files (``crns.json``,
+    ``ssrmeet.json``, ``section-instructors.json``, ``section-attributes.json``,
+    ``courses.json``, ``xlst.json``, ...) linked by CRN and SUBJ/CRSE. The
+    transformer hash-joins them: every lookup file is streamed once into a
+    dictionary keyed by CRN or course key, then ``crns.json`` is streamed and
+    each section row is joined against those dictionaries in a single pass.
+
+    Input data is ``{"term_dir": <path to data/<term>>}``; term names and dates
+    come from ``sobterm.json`` in the parent directory when present.
+    """
+
+    def __init__(self, college_config_path: Union[str, Path]):
+        """Initialize transformer with college configuration.
+
+        Args:
+            college_config_path: Path to college configuration JSON file
+        """
+        super().__init__(college_config_path)
+
+        course_mapping = self.mappings.get("course", {})
+        self._course_id = compile_template(course_mapping.get("course_id", ""))
+        self._get_title = compile_field_mapping(course_mapping.get("title"))
+        self._get_units = compile_field_mapping(course_mapping.get("units"))
+        self._get_description = compile_field_mapping(course_mapping.get("description"))
+
+        # Banner attribute codes map to textbook cost categories by code or by
+        # description (e.g. OERE "No-cost OER course material" -> OER)
+        categories = self.features.get("textbook_cost", {}).get("categories", [])
+        self._textbook_codes = {
+            category["code"]: category["code"] for category in categories
+        }
+        self._textbook_descriptions = {
+            category["description"]: category["code"]
+            for category in categories
+            if category.get("description")
+        }
+
+    @classmethod
+    def load_input(cls, path: Union[str, Path]) -> dict[str, Any]:
+        """Build transformer input for a term directory."""
+        return {"term_dir": Path(path)}
+
+    def _extract_term_info(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Extract term information from ``sobterm.json``."""
+        term_dir = Path(input_data["term_dir"])
+        code = term_dir.name
+        term = {"code": code, "name": code}
+
+        sobterm = term_dir.parent / "sobterm.json"
+        if sobterm.exists():
+            for row in iter_json_array(sobterm):
+                if row.get("SOBTERM_TERM_CODE") == code:
+                    term["name"] = row.get("STVTERM_DESC") or code
+                    start = _to_date(row.get("STVTERM_START_DATE"))
+                    end = _to_date(row.get("STVTERM_END_DATE"))
+                    if start:
+                        term["start_date"] = start
+                    if end:
+                        term["end_date"] = end
+                    break
+
+        return term
+
+    def _source_timestamp(self, input_data: dict[str, Any]) -> Optional[str]:
+        """Use the latest section activity date of the term."""
+        term_dir = Path(input_data["term_dir"])
+        dates = (
+            row.get("SSBSECT_ACTIVITY_DATE")
+            for row in self._iter_file(term_dir, "crns.json")
+        )
+        return max(filter(None, dates), default=None)
+
+    def _transform_courses(self, input_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Join a term's Banner files into standardized courses."""
+        term_dir = Path(input_data["term_dir"])
+        index = self._build_index(term_dir)
+
+        crns_file = term_dir / "crns.json"
+        if crns_file.exists():
+            section_rows = iter_json_array(crns_file)
+        else:
+            section_rows = iter(index.meeting_sections.values())
+
+        courses: dict[str, dict[str, Any]] = {}
+        for row in section_rows:
+            crn = row.get("CRN")
+            # Attach the joined rows; lowercase keys never clash with Banner's
+            row["meetings"] = index.meetings.get(crn, [])
+            row["instructors"] = index.instructors.get(crn, [])
+            row["attribute_codes"] = index.attribute_codes.get(crn, [])
+            row["cohorts"] = index.cohorts.get(crn, [])
+            row["cross_listed"] = index.cross_listed.get(crn, [])
+            row["textbook_cost"] = index.textbook_costs.get(crn)
+
+            course_key = self._course_id(row)
+            course = courses.get(course_key)
+            if course is None:
+                course = self._create_course(
+                    course_key,
+                    row,
+                    index.courses.get((row.get("SUBJ_CODE"), row.get("CRSE_NUMB"))),
+                )
+                courses[course_key] = course
+
+            course["sections"].append(self._transform_section(row))
+
+        return list(courses.values())
+
+    def _build_index(self, term_dir: Path) -> BannerTermIndex:
+        """Stream each lookup file once into per-CRN or per-course dictionaries."""
+        index = BannerTermIndex()
+        has_crns = (term_dir / "crns.json").exists()
+
+        meetings: defaultdict[str, list[MeetingRow]] = defaultdict(list)
+        for row in self._iter_file(term_dir, "ssrmeet.json"):
+            crn = row.get("CRN")
+            meetings[crn].append(
+                (
+                    list(row.get("DOW") or ""),
+                    normalize_time(row.get("BEGIN_TIME")),
+                    normalize_time(row.get("END_TIME")),
+                    row.get("BUILDING") or "TBA",
+                    row.get("ROOM") or "TBA",
+                )
+            )
+            if not has_crns and crn not in index.meeting_sections:
+                index.meeting_sections[crn] = _section_from_meeting(row)
+        index.meetings = meetings
+
+        instructors: defaultdict[str, list[dict[str, str]]] = defaultdict(list)
+        for row in self._iter_file(term_dir, "section-instructors.json"):
+            name = row.get("INSTRUCTOR_NAME")
+            if name:
+                instructor = {"name": name}
+                if row.get("INSTRUCTOR_EMAIL"):
+                    instructor["email"] = row["INSTRUCTOR_EMAIL"]
+                instructors[row.get("SIRASGN_CRN")].append(instructor)
+        index.instructors = instructors
+
+        attribute_codes: defaultdict[str, list[str]] = defaultdict(list)
+        for row in self._iter_file(term_dir, "section-attributes.json"):
+            code = row.get("SSRATTR_ATTR_CODE")
+            if code:
+                crn = row.get("SSRATTR_CRN")
+                attribute_codes[crn].append(code)
+                textbook_cost = self._textbook_codes.get(
+                    code
+                ) or self._textbook_descriptions.get(row.get("STVATTR_DESC"))
+                if textbook_cost:
+                    index.textbook_costs.setdefault(crn, textbook_cost)
+        index.attribute_codes = attribute_codes
+
+        cohorts: defaultdict[str, list[str]] = defaultdict(list)
+        for row in self._iter_file(term_dir, "cohorts.json"):
+            if row.get("SSRRCHR_CHRT_CODE"):
+                cohorts[row.get("SSRRCHR_CRN")].append(row["SSRRCHR_CHRT_CODE"])
+        index.cohorts = cohorts
+
+        cross_listed: defaultdict[str, list[str]] = defaultdict(list)
+        for row in self._iter_file(term_dir, "xlst.json"):
+            if row.get("XLST_CRN"):
+                cross_listed[row.get("SEARCH_CRN")].append(row["XLST_CRN"])
+        index.cross_listed = cross_listed
+
+        for row in self._iter_file(term_dir, "courses.json"):
+            key = (row.get("SUBJ_CODE"), row.get("CRSE_NUMB"))
+            index.courses.setdefault(
+                key,
+                {
+                    "title": self._get_title(row),
+                    "units": self._get_units(row),
+                    "description": self._get_description(row),
+                },
+            )
+
+        return index
+
+    @staticmethod
+    def _iter_file(term_dir: Path, name: str):
+        """Stream rows of a term file, or nothing if the file is missing."""
+        path = term_dir / name
+        return iter_json_array(path) if path.exists() else iter(())
+
+    def _create_course(
+        self,
+        course_key: str,
+        row: dict[str, Any],
+        catalog: Optional[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Create a course from its first section row and catalog entry."""
+        catalog = catalog or {}
+        units = catalog.get("units")
+        if units is None:
+            units = row.get("CREDIT_HRS") or 0
+
+        course = {
+            "course_id": course_key,
+            "subject": row.get("SUBJ_CODE", ""),
+            "course_number": row.get("CRSE_NUMB", ""),
+            "title": (
+                catalog.get("title") or row.get("SSBSECT_CRSE_TITLE") or course_key
+            ),
+            "units": float(units),
+        }
+        description = catalog.get("description") or row.get("CAT_DESC")
+        if description:
+            course["description"] = description
+        course["sections"] = []
+        return course
+
+    def _transform_section(
+        self, section_data: dict[str, Any], _course_data: dict[str, Any] = None
+    ) -> dict[str, Any]:
+        """Transform a joined West Valley section row."""
+        section = super()._transform_section(section_data)
+
+        # Banner marks every schedulable section active ("A"); derive the
+        # seat status shown to students from the seat counts
+        enrollment = section["enrollment"]
+        if (
+            section["status"] == "Open"
+            and enrollment["capacity"]
+            and enrollment.get("available", 1) <= 0
+        ):
+            wait_available = section_data.get("SSBSECT_WAIT_AVAIL") or 0
+            section["status"] = "Waitlist" if wait_available > 0 else "Closed"
+
+        if section_data.get("SSBSECT_SEQ_NUMB"):
+            section["section_number"] = section_data["SSBSECT_SEQ_NUMB"]
+        return section
+
+    def _transform_meetings(self, section_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Build meetings from the joined ssrmeet rows."""
+        meeting_type = (
+            "Lab" if _is_lab(section_data.get("SSBSECT_SCHD_CODE")) else "Lecture"
+        )
+        return [
+            {
+                "type": meeting_type,
+                "days": days,
+                "start_time": start,
+                "end_time": end,
+                "location": {"building": building, "room": room},
+            }
+            for days, start, end, building, room in section_data["meetings"]
+        ]
+
+    def _transform_instructor(self, section_data: dict[str, Any]) -> dict[str, Any]:
+        """Use the first assigned instructor as the section instructor."""
+        instructors = section_data["instructors"]
+        return dict(instructors[0]) if instructors else None
+
+    def _transform_dates(self, section_data: dict[str, Any]) -> dict[str, Any]:
+        """Transform part-of-term dates."""
+        dates = {}
+        start = _to_date(section_data.get("SSBSECT_PTRM_START_DATE"))
+        end = _to_date(section_data.get("SSBSECT_PTRM_END_DATE"))
+        if start:
+            dates["start"] = start
+        if end:
+            dates["end"] = end
+        weeks = section_data.get("SSBSECT_PTRM_WEEKS")
+        if weeks:
+            dates["duration_weeks"] = weeks
+        return dates
+
+    def _extract_attributes(self, section_data: dict[str, Any]) -> dict[str, Any]:
+        """Extract mapped attributes plus joined codes, cohorts and cross-lists."""
+        attributes = super()._extract_attributes(section_data)
+        for name, value in attributes.items():
+            if isinstance(value, str) and value.endswith("Z"):
+                attributes[name] = _to_date(value)
+
+        # Enrollment tracking fields are always present, even when unset
+        for name in self.rules.enrollment_fields:
+            attributes.setdefault(name, None)
+
+        if section_data["attribute_codes"]:
+            attributes["attribute_codes"] = section_data["attribute_codes"]
+        if section_data["textbook_cost"]:
+            attributes["textbook_cost"] = section_data["textbook_cost"]
+
+        if len(section_data["instructors"]) > 1:
+            attributes["instructors"] = [
+                instructor["name"] for instructor in section_data["instructors"]
+            ]
+        if section_data["cohorts"]:
+            attributes["cohorts"] = section_data["cohorts"]
+        if section_data["cross_listed"]:
+            attributes["cross_listed_crns"] = section_data["cross_listed"]
+
+        return attributes
+
+    def _create_extensions(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """Add subject, part-of-term and attribute descriptions for the term."""
+        term_dir = Path(input_data["term_dir"])
+        extensions = {}
+
+        subjects = {
+            row["SUBJ_CODE"]: row.get("SUBJ_DESC")
+            for row in self._iter_file(term_dir, "subjects.json")
+            if row.get("SUBJ_CODE")
+        }
+        if subjects:
+            extensions["subjects"] = subjects
+
+        parts_of_term = {
+            row["SOBPTRM_PTRM_CODE"]: row.get("SOBPTRM_DESC")
+            for row in self._iter_file(term_dir, "sobptrm.json")
+            if row.get("SOBPTRM_PTRM_CODE")
+        }
+        if parts_of_term:
+            extensions["parts_of_term"] = parts_of_term
+
+        attributes = {
+            row["SSRATTR_ATTR_CODE"]: row.get("STVATTR_DESC")
+            for row in self._iter_file(term_dir, "ssrattr.json")
+            if row.get("SSRATTR_ATTR_CODE")
+        }
+        if attributes:
+            extensions["section_attributes"] = attributes
+
+        return extensions
+
+
+def _is_lab(schedule_code: Optional[str]) -> bool:
+    """Check whether a Banner schedule type code denotes a lab."""
+    return bool(schedule_code) and (
+        schedule_code in LAB_SCHEDULE_CODES or schedule_code.endswith("L")
+    )
+
+
+def _to_date(value: Optional[str]) -> Optional[str]:
+    """Convert Banner timestamps ("2025-08-23T07:00:00Z") to dates.
+
+    Banner stores local midnight as UTC (07:00 or 08:00 Z in California), so
+    the UTC date is the local date.
+    """
+    return value[:10] if value else None
+
+
+def _section_from_meeting(row: dict[str, Any]) -> dict[str, Any]:
+    """Build a section row from an ssrmeet row for terms without crns.json.
+
+    ssrmeet carries no status or enrollment; sections listed there are
+    scheduled, so they are treated as active.
+    """
+    return {
+        "CRN": row.get("CRN"),
+        "SUBJ_CODE": row.get("SUBJ"),
+        "CRSE_NUMB": row.get("CRSE"),
+        "SSBSECT_CRSE_TITLE": row.get("TITLE"),
+        "CREDIT_HRS": row.get("SSBSECT_CREDIT_HRS") or row.get("SCBCRSE_CREDIT_HR_LOW"),
+        "SSBSECT_SSTS_CODE": "A",
+        "SSBSECT_INSM_CODE": row.get("SSBSECT_INSM_CODE"),
+        "SSBSECT_PTRM_CODE": row.get("SSBSECT_PTRM_CODE"),
+        "SSBSECT_PTRM_START_DATE": row.get("SSBSECT_PTRM_START_DATE"),
+        "SSBSECT_PTRM_END_DATE": row.get("SSBSECT_PTRM_END_DATE"),
+    }
@@ -3,10 +3,25 @@ Enhanced validators for CCC Schedule data submission.
 Provides comprehensive validation with clear error messages and guardrails.
 """
 
+import json
 import re
-from datetime import datetime, time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, TextIO, Union
+
+from .college_rules import CollegeRules
+from .models import Course, Schedule
+from .time_utils import DAY_BITS, days_to_mask, time_to_minutes
+
+# Default number of example diagnostics kept per group
+DEFAULT_MAX_EXAMPLES = 5
+
+# Matches list indexes in field paths, e.g. "course[12].sections[3]"
+INDEX_PATTERN = re.compile(r"\[\d+\]")
 
 
 class ValidationError(Exception):
@@ -19,27 +34,138 @@ class ValidationError(Exception):
         super().__init__(f"{field}: {message}")
 
 
+class DiagnosticGroup:
+    """Diagnostics sharing a severity, rule and field pattern.
+
+    Only the first ``max_examples`` diagnostics are kept; the rest are counted.
+    """
+
+    def __init__(self, severity: str, rule: str, field_pattern: str):
+        self.severity = severity
+        self.rule = rule
+        self.field_pattern = field_pattern
+        self.count = 0
+        self.examples: list[dict[str, str]] = []
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the group to a JSON-serializable dictionary."""
+        return {
+            "severity": self.severity,
+            "rule": self.rule,
+            "field_pattern": self.field_pattern,
+            "count": self.count,
+            "examples": list(self.examples),
+        }
+
+
 class ValidationResult:
-    """Container for validation results with errors and warnings."""
+    """Container for validation results with errors and warnings.
 
-    def __init__(self):
+    Diagnostics are grouped by severity, rule and field pattern (list indexes
+    replaced by ``[*]``). Each group keeps a count plus the first
+    ``max_examples`` diagnostics, so ``errors`` and ``warnings`` only hold
+    those examples and memory stays bounded however bad the input is. Pass a
+    text ``stream`` to also write every diagnostic to it as JSON lines.
+    """
+
+    def __init__(
+        self,
+        max_examples: int = DEFAULT_MAX_EXAMPLES,
+        stream: Optional[TextIO] = None,
+    ):
         self.errors: list[ValidationError] = []
         self.warnings: list[dict[str, str]] = []
+        self.groups: dict[tuple[str, str, str], DiagnosticGroup] = {}
+        self.error_count: int = 0
+        self.warning_count: int = 0
         self.valid_count: int = 0
         self.total_count: int = 0
+        self.max_examples = max_examples
+        self.stream = stream
+        self._prefix = ""
 
     @property
     def is_valid(self) -> bool:
         """Check if validation passed without errors."""
-        return len(self.errors) == 0
+        return self.error_count == 0
 
-    def add_error(self, field: str, message: str, value: Any = None):
-        """Add a validation error."""
-        self.errors.append(ValidationError(field, message, value))
+    @contextmanager
+    def scope(self, prefix: str) -> Iterator["ValidationResult"]:
+        """Prefix the field of every diagnostic added inside the block."""
+        previous = self._prefix
+        self._prefix = f"{previous}{prefix}."
+        try:
+            yield self
+        finally:
+            self._prefix = previous
 
-    def add_warning(self, field: str, message: str):
+    def add_error(
+        self, field: str, message: str, value: Any = None, rule: Optional[str] = None
+    ):
+        """Add a validation error."""
+        field = self._prefix + field
+        self.error_count += 1
+        group = self._record("error", field, message, rule, value)
+        if len(group.examples) < self.max_examples:
+            group.examples.append({"field": field, "message": message})
+            self.errors.append(ValidationError(field, message, value))
+
+    def add_warning(self, field: str, message: str, rule: Optional[str] = None):
         """Add a validation warning (non-fatal)."""
-        self.warnings.append({"field": field, "message": message})
+        field = self._prefix + field
+        self.warning_count += 1
+        group = self._record("warning", field, message, rule)
+        if len(group.examples) < self.max_examples:
+            warning = {"field": field, "message": message}
+            group.examples.append(warning)
+            self.warnings.append(warning)
+
+    def _record(
+        self,
+        severity: str,
+        field: str,
+        message: str,
+        rule: Optional[str],
+        value: Any = None,
+    ) -> DiagnosticGroup:
+        """Count a diagnostic in its group and stream it if requested."""
+        rule = rule or message
+        key = (severity, rule, INDEX_PATTERN.sub("[*]", field))
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = DiagnosticGroup(*key)
+        group.count += 1
+
+        if self.stream is not None:
+            record = {
+                "severity": severity,
+                "rule": rule,
+                "field": field,
+                "message": message,
+            }
+            if value is not None:
+                record["value"] = value
+            self.stream.write(json.dumps(record, default=str) + "\n")
+
+        return group
+
+    def get_groups(self) -> list[DiagnosticGroup]:
+        """Get diagnostic groups, most frequent first."""
+        return sorted(
+            self.groups.values(),
+            key=lambda g: (g.severity != "error", -g.count, g.rule, g.field_pattern),
+        )
+
+    def get_report(self) -> dict[str, Any]:
+        """Get a bounded, JSON-serializable report of the validation results."""
+        return {
+            "valid": self.is_valid,
+            "total_count": self.total_count,
+            "valid_count": self.valid_count,
+            "error_count": self.error_count,
+            "warning_count": self.warning_count,
+            "groups": [group.to_dict() for group in self.get_groups()],
+        }
 
     def get_summary(self) -> str:
         """Get a summary of validation results."""
@@ -49,13 +175,178 @@ class ValidationResult:
             status,
             f"Total items: {self.total_count}",
             f"Valid items: {self.valid_count}",
-            f"Errors: {len(self.errors)}",
-            f"Warnings: {len(self.warnings)}",
+            f"Errors: {self.error_count}",
+            f"Warnings: {self.warning_count}",
         ]
 
+        for group in self.get_groups():
+            summary.append(
+                f"  [{group.severity}] {group.rule} at {group.field_pattern}: "
+                f"{group.count}"
+            )
+
         return "\n".join(summary)
 
 
+class ConsistencyChecker:
+    """Cross-record checks over sections using indexes built in a single pass.
+
+    Sections are fed in one at a time with ``add_section``. Duplicate CRNs and
+    unknown terms are reported immediately from hash indexes; room and
+    instructor double-booking is found in ``finish`` by sorting the meetings
+    of each (term, room, day) and (term, instructor, day) bucket by start time
+    and sweeping once, so the whole check is O(n log n) rather than pairwise.
+    Cross-listed sections legitimately share a room and instructor, so they
+    are not reported against each other; other double-booking is reported as
+    a warning.
+    """
+
+    # Placeholder names, compared uppercased without spaces and punctuation
+    # ("N/A" -> "NA", "Staff, TBD" -> "STAFFTBD")
+    IGNORED_ROOMS = frozenset({"", "ARR", "TBA", "TBD", "ONLINE", "NA"})
+    IGNORED_INSTRUCTORS = frozenset(
+        {"", "TBA", "TBD", "STAFF", "STAFFTBA", "STAFFTBD", "TOBEASSIGNED"}
+    )
+    # Per-campus or per-delivery spellings: "ONLINE-WV", "ONLINEL",
+    # "MC OFFCAMPUS", "OFFCMP"
+    PLACEHOLDER_ROOM_PATTERN = re.compile(r"ONLINE\w*|\w*OFFCA?MP\w*")
+
+    def __init__(
+        self, result: ValidationResult, known_terms: Optional[Iterable[str]] = None
+    ):
+        """Initialize checker.
+
+        Args:
+            result: Result receiving the diagnostics
+            known_terms: Term codes/names from ``metadata.terms``; when None the
+                missing-term check is skipped
+        """
+        self.result = result
+        self.known_terms = frozenset(known_terms) if known_terms is not None else None
+        self._crns: dict[tuple[str, str], str] = {}
+        self._rooms: dict[tuple[str, str, int], list[tuple[int, int, str, str]]] = (
+            defaultdict(list)
+        )
+        self._instructors: dict[
+            tuple[str, str, int], list[tuple[int, int, str, str]]
+        ] = defaultdict(list)
+        # (term, crn, crn) of cross-listed pairs, CRNs sorted
+        self._cross_listed: set[tuple[str, str, str]] = set()
+
+    @classmethod
+    def is_placeholder_room(cls, name: str) -> bool:
+        """Whether a room or building name stands for no physical room."""
+        key = _placeholder_key(name)
+        return key in cls.IGNORED_ROOMS or bool(
+            cls.PLACEHOLDER_ROOM_PATTERN.fullmatch(key)
+        )
+
+    def add_section(
+        self,
+        field: str,
+        term: str,
+        crn: Optional[str],
+        instructor: Optional[str] = None,
+        meetings: Iterable[
+            tuple[int, Optional[int], Optional[int], Optional[str]]
+        ] = (),
+        cross_listed: Iterable[str] = (),
+    ):
+        """Index a section.
+
+        Args:
+            field: Field path of the section, used in diagnostics
+            term: Term code or name of the section
+            crn: Section CRN
+            instructor: Instructor name or email, if any
+            meetings: (days_mask, start_minutes, end_minutes, room) tuples
+            cross_listed: CRNs of sections cross-listed with this one
+        """
+        term = str(term or "")
+        if self.known_terms is not None and term and term not in self.known_terms:
+            self.result.add_error(
+                f"{field}.term",
+                f"Term '{term}' is not listed in metadata.terms",
+                term,
+                rule="term_not_in_metadata",
+            )
+
+        if not crn:
+            return
+        crn = str(crn)
+        first = self._crns.setdefault((term, crn), field)
+        if first != field:
+            self.result.add_error(
+                f"{field}.crn",
+                f"Duplicate CRN '{crn}' in term '{term}' (first seen at {first})",
+                crn,
+                rule="duplicate_crn",
+            )
+
+        for other in cross_listed:
+            self._cross_listed.add((term, *sorted((crn, str(other)))))
+
+        if instructor and _placeholder_key(instructor) in self.IGNORED_INSTRUCTORS:
+            instructor = None
+
+        for days_mask, start, end, room in meetings:
+            if start is None or end is None or end <= start or not days_mask:
+                continue
+            if room and self.is_placeholder_room(room):
+                room = None
+            if not room and not instructor:
+                continue
+
+            slot = (start, end, crn, field)
+            bit = 1
+            while bit <= days_mask:
+                if days_mask & bit:
+                    if room:
+                        self._rooms[(term, room, bit)].append(slot)
+                    if instructor:
+                        self._instructors[(term, instructor, bit)].append(slot)
+                bit <<= 1
+
+    def finish(self) -> ValidationResult:
+        """Run the interval sweeps and return the result."""
+        self._sweep(self._rooms, "room", "room_double_booked")
+        self._sweep(self._instructors, "instructor", "instructor_double_booked")
+        return self.result
+
+    def _sweep(
+        self,
+        index: dict[tuple[str, str, int], list[tuple[int, int, str, str]]],
+        label: str,
+        rule: str,
+    ):
+        """Report overlapping meetings within each index bucket."""
+        reported: set[tuple[str, str, str]] = set()
+
+        for (term, name, _day), slots in index.items():
+            if len(slots) < 2:
+                continue
+            slots.sort()
+
+            # Track the meeting reaching furthest into the day so far
+            active_end = -1
+            active_crn = ""
+            for start, end, crn, field in slots:
+                if start < active_end and crn != active_crn:
+                    crns = sorted((crn, active_crn))
+                    pair = (name, *crns)
+                    if pair not in reported and (term, *crns) not in self._cross_listed:
+                        reported.add(pair)
+                        self.result.add_warning(
+                            field,
+                            f"Section {crn} overlaps section {active_crn} "
+                            f"in {label} '{name}'",
+                            rule=rule,
+                        )
+                if end > active_end:
+                    active_end = end
+                    active_crn = crn
+
+
 class CourseValidator:
     """Validator for course data with comprehensive checks."""
 
@@ -73,10 +364,19 @@ class CourseValidator:
     VALID_MEETING_DAYS = {"M", "T", "W", "R", "F", "S", "U"}
     VALID_TEXTBOOK_COSTS = {"ZTC", "LTC", "REG"}
 
-    def validate_course(self, course: dict[str, Any]) -> ValidationResult:
-        """Validate a single course and all its sections."""
-        result = ValidationResult()
-        result.total_count = 1
+    def validate_course(
+        self, course: dict[str, Any], result: Optional[ValidationResult] = None
+    ) -> ValidationResult:
+        """Validate a single course and all its sections.
+
+        Args:
+            course: Course dictionary to validate
+            result: Existing result to add diagnostics to (default: new result)
+        """
+        if result is None:
+            result = ValidationResult()
+        result.total_count += 1
+        errors_before = result.error_count
 
         try:
             # Required fields
@@ -90,35 +390,67 @@ class CourseValidator:
                 for i, section in enumerate(course.get("sections", [])):
                     self._validate_section(section, i, result)
 
-            if result.is_valid:
-                result.valid_count = 1
-
         except Exception as e:
-            result.add_error("course", f"Unexpected error: {str(e)}")
+            result.add_error(
+                "course", f"Unexpected error: {str(e)}", rule="unexpected_error"
+            )
+
+        if result.error_count == errors_before:
+            result.valid_count += 1
 
         return result
 
-    def validate_courses(self, courses: list[dict[str, Any]]) -> ValidationResult:
-        """Validate multiple courses."""
-        result = ValidationResult()
-        result.total_count = len(courses)
+    def validate_courses(
+        self,
+        courses: list[dict[str, Any]],
+        result: Optional[ValidationResult] = None,
+    ) -> ValidationResult:
+        """Validate multiple courses into a single aggregated result."""
+        if result is None:
+            result = ValidationResult()
 
         for i, course in enumerate(courses):
-            course_result = self.validate_course(course)
+            with result.scope(f"course[{i}]"):
+                self.validate_course(course, result)
 
-            # Aggregate results
-            for error in course_result.errors:
-                error.field = f"course[{i}].{error.field}"
-                result.errors.append(error)
+        return result
 
-            for warning in course_result.warnings:
-                warning["field"] = f"course[{i}].{warning['field']}"
-                result.warnings.append(warning)
+    def validate_consistency(
+        self,
+        courses: list[dict[str, Any]],
+        result: Optional[ValidationResult] = None,
+        known_terms: Optional[Iterable[str]] = None,
+    ) -> ValidationResult:
+        """Run cross-record checks over all sections of ``courses``.
+
+        Checks duplicate CRNs within a term, room and instructor
+        double-booking, and (when ``known_terms`` is given) course terms
+        missing from ``metadata.terms``.
+        """
+        if result is None:
+            result = ValidationResult()
+        checker = ConsistencyChecker(result, known_terms)
 
-            if course_result.is_valid:
-                result.valid_count += 1
+        for i, course in enumerate(courses):
+            term = course.get("term", "")
+            for j, section in enumerate(course.get("sections") or []):
+                start = section.get("startTime")
+                end = section.get("endTime")
+                meeting = (
+                    days_to_mask(section.get("days")),
+                    time_to_minutes(start) if isinstance(start, str) else None,
+                    time_to_minutes(end) if isinstance(end, str) else None,
+                    section.get("location"),
+                )
+                checker.add_section(
+                    f"course[{i}].sections[{j}]",
+                    term,
+                    section.get("crn"),
+                    section.get("instructorName") or section.get("instructorEmail"),
+                    (meeting,),
+                )
 
-        return result
+        return checker.finish()
 
     def _validate_required_fields(
         self, course: dict[str, Any], result: ValidationResult
@@ -128,9 +460,17 @@ class CourseValidator:
 
         for field in required_fields:
             if field not in course or course[field] is None:
-                result.add_error(field, f"Required field '{field}' is missing")
+                result.add_error(
+                    field,
+                    f"Required field '{field}' is missing",
+                    rule="required_field_missing",
+                )
             elif isinstance(course[field], str) and not course[field].strip():
-                result.add_error(field, f"Required field '{field}' is empty")
+                result.add_error(
+                    field,
+                    f"Required field '{field}' is empty",
+                    rule="required_field_empty",
+                )
 
     def _validate_course_fields(self, course: dict[str, Any], result: ValidationResult):
         """Validate course-level fields."""
@@ -141,6 +481,7 @@ class CourseValidator:
                 "course_id",
                 f"Invalid course ID format: '{course_id}'. Expected format: 'CS101' or 'MATH123A'",
                 course_id,
+                rule="course_id_format",
             )
 
         # Units validation
@@ -153,10 +494,14 @@ class CourseValidator:
                         "units",
                         f"Units must be between 0 and 99, got {units_float}",
                         units,
+                        rule="units_range",
                     )
             except (ValueError, TypeError):
                 result.add_error(
-                    "units", f"Units must be a number, got '{units}'", units
+                    "units",
+                    f"Units must be a number, got '{units}'",
+                    units,
+                    rule="units_type",
                 )
 
         # Credit type
@@ -166,13 +511,16 @@ class CourseValidator:
                 "creditType",
                 f"Invalid credit type '{credit_type}'. Must be one of: {', '.join(self.VALID_CREDIT_TYPES)}",
                 credit_type,
+                rule="credit_type",
             )
 
         # Term validation
         term = course.get("term")
         if term and not self.TERM_PATTERN.match(str(term)):
             result.add_warning(
-                "term", f"Term '{term}' doesn't match expected format YYYYMM"
+                "term",
+                f"Term '{term}' doesn't match expected format YYYYMM",
+                rule="term_format",
             )
 
     def _validate_section(
@@ -189,9 +537,12 @@ class CourseValidator:
                     f"{section_prefix}.crn",
                     f"Invalid CRN format: '{crn}'. CRN must be exactly 5 digits",
                     crn,
+                    rule="crn_format",
                 )
         else:
-            result.add_error(f"{section_prefix}.crn", "Section missing CRN")
+            result.add_error(
+                f"{section_prefix}.crn", "Section missing CRN", rule="crn_missing"
+            )
 
         # Instruction mode
         instr_mode = section.get("instrMethod")
@@ -200,6 +551,7 @@ class CourseValidator:
                 f"{section_prefix}.instrMethod",
                 f"Invalid instruction mode '{instr_mode}'. Must be one of: {', '.join(self.VALID_INSTRUCTION_MODES)}",
                 instr_mode,
+                rule="instruction_mode",
             )
 
         # Time validation
@@ -212,12 +564,14 @@ class CourseValidator:
                     f"{section_prefix}.startTime",
                     f"Invalid time format: '{start_time}'. Use HH:MM format (24-hour)",
                     start_time,
+                    rule="time_format",
                 )
             elif not self._validate_time_format(end_time):
                 result.add_error(
                     f"{section_prefix}.endTime",
                     f"Invalid time format: '{end_time}'. Use HH:MM format (24-hour)",
                     end_time,
+                    rule="time_format",
                 )
             else:
                 # Check time logic
@@ -225,6 +579,7 @@ class CourseValidator:
                     result.add_error(
                         f"{section_prefix}.time",
                         f"End time ({end_time}) must be after start time ({start_time})",
+                        rule="time_range",
                     )
 
         # Meeting days validation
@@ -236,6 +591,7 @@ class CourseValidator:
                     f"{section_prefix}.days",
                     f"Invalid meeting days: {', '.join(invalid_days)}. Valid days are: {', '.join(self.VALID_MEETING_DAYS)}",
                     days,
+                    rule="meeting_days",
                 )
 
         # Enrollment validation
@@ -250,6 +606,7 @@ class CourseValidator:
             result.add_warning(
                 f"{section_prefix}.textbookCost",
                 f"Unknown textbook cost type '{textbook_cost}'",
+                rule="textbook_cost",
             )
 
     def _validate_time_format(self, time_str: str) -> bool:
@@ -258,16 +615,9 @@ class CourseValidator:
 
     def _validate_time_range(self, start_time: str, end_time: str) -> bool:
         """Validate that end time is after start time."""
-        try:
-            start_h, start_m = map(int, start_time.split(":"))
-            end_h, end_m = map(int, end_time.split(":"))
-
-            start = time(start_h, start_m)
-            end = time(end_h, end_m)
-
-            return end > start
-        except (ValueError, AttributeError):
-            return False
+        start = time_to_minutes(start_time)
+        end = time_to_minutes(end_time)
+        return start is not None and end is not None and end > start
 
     def _validate_enrollment(
         self, section: dict[str, Any], prefix: str, result: ValidationResult
@@ -279,6 +629,7 @@ class CourseValidator:
                 f"{prefix}.enrollStatus",
                 f"Invalid enrollment status '{status}'. Must be one of: {', '.join(self.VALID_ENROLLMENT_STATUS)}",
                 status,
+                rule="enrollment_status",
             )
 
         # Capacity validation
@@ -293,18 +644,23 @@ class CourseValidator:
 
                 if cap < 0:
                     result.add_error(
-                        f"{prefix}.capacity", "Capacity cannot be negative", capacity
+                        f"{prefix}.capacity",
+                        "Capacity cannot be negative",
+                        capacity,
+                        rule="capacity_negative",
                     )
                 if enr < 0:
                     result.add_error(
                         f"{prefix}.enrolled",
                         "Enrolled count cannot be negative",
                         enrolled,
+                        rule="enrolled_negative",
                     )
                 if enr > cap:
                     result.add_warning(
                         f"{prefix}.enrollment",
                         f"Enrolled ({enr}) exceeds capacity ({cap})",
+                        rule="enrollment_over_capacity",
                     )
 
                 # Check status consistency
@@ -312,17 +668,20 @@ class CourseValidator:
                     result.add_warning(
                         f"{prefix}.enrollStatus",
                         "Status is 'Open' but class appears full",
+                        rule="status_open_but_full",
                     )
                 elif status == "Closed" and enr < cap:
                     result.add_warning(
                         f"{prefix}.enrollStatus",
                         "Status is 'Closed' but class has available seats",
+                        rule="status_closed_but_available",
                     )
 
             except (ValueError, TypeError):
                 result.add_error(
                     f"{prefix}.enrollment",
                     "Capacity and enrolled must be valid integers",
+                    rule="enrollment_type",
                 )
 
         if waitlist is not None:
@@ -333,10 +692,14 @@ class CourseValidator:
                         f"{prefix}.waitlist",
                         "Waitlist count cannot be negative",
                         waitlist,
+                        rule="waitlist_negative",
                     )
             except (ValueError, TypeError):
                 result.add_error(
-                    f"{prefix}.waitlist", "Waitlist must be a valid integer", waitlist
+                    f"{prefix}.waitlist",
+                    "Waitlist must be a valid integer",
+                    waitlist,
+                    rule="waitlist_type",
                 )
 
     def _validate_instructor(
@@ -348,17 +711,24 @@ class CourseValidator:
 
         if email and not self.EMAIL_PATTERN.match(email):
             result.add_error(
-                f"{prefix}.instructorEmail", f"Invalid email format: '{email}'", email
+                f"{prefix}.instructorEmail",
+                f"Invalid email format: '{email}'",
+                email,
+                rule="instructor_email_format",
             )
 
         # Check consistency
         if email and not name:
             result.add_warning(
-                f"{prefix}.instructor", "Instructor email provided but name is missing"
+                f"{prefix}.instructor",
+                "Instructor email provided but name is missing",
+                rule="instructor_name_missing",
             )
         elif name and not email:
             result.add_warning(
-                f"{prefix}.instructor", "Instructor name provided but email is missing"
+                f"{prefix}.instructor",
+                "Instructor name provided but email is missing",
+                rule="instructor_email_missing",
             )
 
 
@@ -368,32 +738,55 @@ class ScheduleValidator:
     def __init__(self):
         self.course_validator = CourseValidator()
 
-    def validate_schedule(self, schedule_data: dict[str, Any]) -> ValidationResult:
+    def validate_schedule(
+        self,
+        schedule_data: dict[str, Any],
+        result: Optional[ValidationResult] = None,
+    ) -> ValidationResult:
         """Validate a complete schedule data structure."""
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
 
         # Check top-level structure
         if "metadata" not in schedule_data:
-            result.add_error("metadata", "Missing metadata section")
+            result.add_error(
+                "metadata", "Missing metadata section", rule="metadata_missing"
+            )
         else:
             self._validate_metadata(schedule_data["metadata"], result)
 
         if "courses" not in schedule_data:
-            result.add_error("courses", "Missing courses section")
+            result.add_error(
+                "courses", "Missing courses section", rule="courses_missing"
+            )
         else:
-            # Validate all courses
-            courses_result = self.course_validator.validate_courses(
-                schedule_data["courses"]
+            # Validate all courses into the same result
+            self.course_validator.validate_courses(schedule_data["courses"], result)
+
+            # Cross-record checks, including terms listed in metadata
+            self.course_validator.validate_consistency(
+                schedule_data["courses"],
+                result,
+                self._known_terms(schedule_data.get("metadata", {})),
             )
 
-            # Merge results
-            result.errors.extend(courses_result.errors)
-            result.warnings.extend(courses_result.warnings)
-            result.total_count = courses_result.total_count
-            result.valid_count = courses_result.valid_count
-
         return result
 
+    @staticmethod
+    def _known_terms(metadata: dict[str, Any]) -> Optional[set[str]]:
+        """Collect term codes and names from metadata, if terms are listed."""
+        terms = metadata.get("terms")
+        if not isinstance(terms, list):
+            return None
+
+        known = set()
+        for term in terms:
+            if isinstance(term, dict):
+                known.update(str(term[key]) for key in ("code", "name") if key in term)
+            else:
+                known.add(str(term))
+        return known
+
     def _validate_metadata(self, metadata: dict[str, Any], result: ValidationResult):
         """Validate metadata section."""
         required_fields = ["version", "last_updated"]
@@ -401,7 +794,9 @@ class ScheduleValidator:
         for field in required_fields:
             if field not in metadata:
                 result.add_error(
-                    f"metadata.{field}", f"Missing required field '{field}'"
+                    f"metadata.{field}",
+                    f"Missing required field '{field}'",
+                    rule="metadata_field_missing",
                 )
 
         # Validate date format
@@ -413,7 +808,498 @@ class ScheduleValidator:
                 result.add_error(
                     "metadata.last_updated",
                     f"Invalid date format: '{last_updated}'. Use ISO format (YYYY-MM-DDTHH:MM:SSZ)",
+                    rule="metadata_date_format",
+                )
+
+
+class StandardizedValidator:
+    """Validator for the standardized schedule shape produced by transformers.
+
+    Works natively on the nested layout (``instruction_mode``,
+    ``meetings[].start_time``, ``enrollment.enrolled``) either as a
+    standardized dictionary or as ``Schedule`` dataclasses, so published output
+    can be validated in one pass without converting it back to the legacy flat
+    fields. Cross-record checks run in the same pass.
+    """
+
+    CRN_PATTERN = CourseValidator.CRN_PATTERN
+    EMAIL_PATTERN = CourseValidator.EMAIL_PATTERN
+
+    VALID_STATUSES = frozenset({"Open", "Closed", "Waitlist", "Cancelled"})
+    VALID_MEETING_TYPES = frozenset({"Lecture", "Lab", "Discussion", "Other"})
+
+    def __init__(
+        self, rules: Optional[CollegeRules] = None, check_consistency: bool = True
+    ):
+        """Initialize validator.
+
+        Args:
+            rules: Compiled college rules for college-specific checks
+            check_consistency: Run cross-record checks (duplicate CRNs,
+                double-booking, unknown terms)
+        """
+        self.rules = rules
+        self.check_consistency = check_consistency
+
+    def validate(
+        self, data: dict[str, Any], result: Optional[ValidationResult] = None
+    ) -> ValidationResult:
+        """Validate a standardized schedule dictionary.
+
+        Args:
+            data: Standardized data, with or without the top-level "schedule" key
+            result: Existing result to add diagnostics to (default: new result)
+        """
+        if result is None:
+            result = ValidationResult()
+        schedule = data.get("schedule", data)
+
+        courses = schedule.get("courses")
+        if not isinstance(courses, list):
+            self._check_metadata(schedule, result)
+            result.add_error(
+                "courses", "Missing courses section", rule="courses_missing"
+            )
+            return result
+
+        for _course in self.iter_validate(schedule, result):
+            pass
+        return result
+
+    def iter_validate(
+        self, schedule: dict[str, Any], result: ValidationResult
+    ) -> Iterator[dict[str, Any]]:
+        """Validate courses while passing them through.
+
+        Lets a streamed schedule (see ``BaseTransformer.transform_stream``) be
+        validated as it is written. ``result`` is complete once the returned
+        iterator is exhausted.
+
+        Args:
+            schedule: Schedule whose "courses" may be any iterable
+            result: Result to add diagnostics to
+
+        Yields:
+            The schedule's courses, unchanged
+        """
+        term = self._check_metadata(schedule, result)
+        checker = ConsistencyChecker(result) if self.check_consistency else None
+        for i, course in enumerate(schedule.get("courses") or ()):
+            self._validate_course_dict(course, f"courses[{i}]", term, checker, result)
+            yield course
+
+        if checker is not None:
+            checker.finish()
+
+    def _check_metadata(
+        self, schedule: dict[str, Any], result: ValidationResult
+    ) -> str:
+        """Check schedule metadata and return the term code."""
+        metadata = schedule.get("metadata")
+        term = ""
+        if not isinstance(metadata, dict):
+            result.add_error(
+                "metadata", "Missing metadata section", rule="metadata_missing"
+            )
+        else:
+            for field in ("version", "last_updated", "college", "term"):
+                if not metadata.get(field):
+                    result.add_error(
+                        f"metadata.{field}",
+                        f"Missing required field '{field}'",
+                        rule="metadata_field_missing",
+                    )
+            term = str((metadata.get("term") or {}).get("code", ""))
+        return term
+
+    def validate_schedule(
+        self, schedule: Schedule, result: Optional[ValidationResult] = None
+    ) -> ValidationResult:
+        """Validate ``Schedule`` dataclasses.
+
+        Each course is checked through a lightweight standardized view, so
+        the same rules apply as to dictionaries. College rules on enrollment
+        fields are skipped, as the dataclasses do not carry section attributes.
+
+        Args:
+            schedule: Schedule to validate
+            result: Existing result to add diagnostics to (default: new result)
+        """
+        if result is None:
+            result = ValidationResult()
+
+        metadata = schedule.metadata
+        term = self._check_metadata(
+            {
+                "metadata": {
+                    "version": metadata.version,
+                    "last_updated": metadata.last_updated,
+                    "college": metadata.colleges[0].id if metadata.colleges else None,
+                    "term": asdict(metadata.terms[0]) if metadata.terms else None,
+                }
+            },
+            result,
+        )
+
+        for i, instructor in enumerate(schedule.instructors):
+            self._check_email(instructor.email, f"instructors[{i}].email", result)
+
+        known_terms: set[str] = set()
+        for known in metadata.terms:
+            known_terms.update((known.code, known.name))
+        checker = (
+            ConsistencyChecker(result, known_terms or None)
+            if self.check_consistency
+            else None
+        )
+        for i, course in enumerate(schedule.courses):
+            self._validate_course_dict(
+                _course_view(course),
+                f"courses[{i}]",
+                term,
+                checker,
+                result,
+                enrollment_fields=False,
+            )
+
+        if checker is not None:
+            checker.finish()
+        return result
+
+    def _validate_course_dict(
+        self,
+        course: dict[str, Any],
+        prefix: str,
+        term: str,
+        checker: Optional[ConsistencyChecker],
+        result: ValidationResult,
+        enrollment_fields: bool = True,
+    ):
+        """Validate one standardized course dictionary and its sections."""
+        result.total_count += 1
+        errors_before = result.error_count
+
+        for field in ("course_id", "subject", "course_number", "title"):
+            value = course.get(field)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                result.add_error(
+                    f"{prefix}.{field}",
+                    f"Required field '{field}' is missing",
+                    rule="required_field_missing",
+                )
+        self._check_units(course.get("units"), prefix, result)
+
+        sections = course.get("sections")
+        if not isinstance(sections, list):
+            result.add_error(
+                f"{prefix}.sections",
+                "Required field 'sections' is missing",
+                rule="required_field_missing",
+            )
+            sections = []
+
+        for j, section in enumerate(sections):
+            section_prefix = f"{prefix}.sections[{j}]"
+            enrollment = section.get("enrollment")
+            if not isinstance(enrollment, dict):
+                result.add_error(
+                    f"{section_prefix}.enrollment",
+                    "Required field 'enrollment' is missing",
+                    rule="required_field_missing",
+                )
+                enrollment = {}
+
+            meetings = section.get("meetings")
+            if not isinstance(meetings, list):
+                result.add_error(
+                    f"{section_prefix}.meetings",
+                    "Required field 'meetings' is missing",
+                    rule="required_field_missing",
+                )
+                meetings = []
+
+            slots = self._check_section(
+                section_prefix,
+                section.get("crn"),
+                section.get("status"),
+                enrollment.get("enrolled"),
+                enrollment.get("capacity"),
+                enrollment.get("waitlist"),
+                [
+                    (
+                        m.get("type"),
+                        m.get("days"),
+                        m.get("start_time"),
+                        m.get("end_time"),
+                        self._room_name(m.get("location")),
+                    )
+                    for m in meetings
+                ],
+                result,
+            )
+
+            instructor = section.get("instructor") or {}
+            email = instructor.get("email")
+            self._check_email(email, f"{section_prefix}.instructor.email", result)
+
+            if self.rules is not None:
+                for message in self.rules.check_section(section, enrollment_fields):
+                    result.add_error(section_prefix, message, rule="college_rules")
+
+            if checker is not None:
+                checker.add_section(
+                    section_prefix,
+                    section.get("term", term),
+                    section.get("crn"),
+                    instructor.get("name") or email,
+                    slots,
+                    (section.get("attributes") or {}).get("cross_listed_crns") or (),
+                )
+
+        if result.error_count == errors_before:
+            result.valid_count += 1
+
+    @staticmethod
+    def _room_name(location: Any) -> Optional[str]:
+        """Build a room key from a standardized location dictionary.
+
+        Placeholders such as "ONLINE" or "TBA"
+        (``ConsistencyChecker.is_placeholder_room``) are checked in the
+        building and the room separately: a placeholder room gives no key,
+        and a placeholder building is left out of it.
+        """
+        if not isinstance(location, dict):
+            return None
+        room = str(location.get("room") or "").strip()
+        if ConsistencyChecker.is_placeholder_room(room):
+            return None
+        building = str(location.get("building") or "").strip()
+        if ConsistencyChecker.is_placeholder_room(building):
+            return room
+        return f"{building} {room}"
+
+    @classmethod
+    def _check_email(cls, email: Any, field: str, result: ValidationResult):
+        """Check an instructor email, if given."""
+        if email and not cls.EMAIL_PATTERN.match(email):
+            result.add_error(
+                field,
+                f"Invalid email format: '{email}'",
+                email,
+                rule="instructor_email_format",
+            )
+
+    @staticmethod
+    def _check_units(units: Any, prefix: str, result: ValidationResult):
+        """Check that units are a non-negative number."""
+        if isinstance(units, bool) or not isinstance(units, (int, float)):
+            result.add_error(
+                f"{prefix}.units",
+                f"Units must be a number, got '{units}'",
+                units,
+                rule="units_type",
+            )
+        elif units < 0:
+            result.add_error(
+                f"{prefix}.units",
+                f"Units cannot be negative, got {units}",
+                units,
+                rule="units_range",
+            )
+
+    def _check_section(
+        self,
+        prefix: str,
+        crn: Any,
+        status: Any,
+        enrolled: Any,
+        capacity: Any,
+        waitlist: Any,
+        meetings: list[tuple[Any, Any, Any, Any, Optional[str]]],
+        result: ValidationResult,
+    ) -> list[tuple[int, Optional[int], Optional[int], Optional[str]]]:
+        """Check section values and return its pre-parsed meeting slots."""
+        if not crn:
+            result.add_error(f"{prefix}.crn", "Section missing CRN", rule="crn_missing")
+        elif not self.CRN_PATTERN.match(str(crn)):
+            result.add_error(
+                f"{prefix}.crn",
+                f"Invalid CRN format: '{crn}'. CRN must be exactly 5 digits",
+                crn,
+                rule="crn_format",
+            )
+
+        if status not in self.VALID_STATUSES:
+            result.add_error(
+                f"{prefix}.status",
+                f"Invalid status '{status}'. Must be one of: "
+                f"{', '.join(sorted(self.VALID_STATUSES))}",
+                status,
+                rule="status",
+            )
+
+        counts_valid = True
+        for name, value in (("enrolled", enrolled), ("capacity", capacity)):
+            if isinstance(value, bool) or not isinstance(value, int):
+                counts_valid = False
+                result.add_error(
+                    f"{prefix}.enrollment.{name}",
+                    f"Enrollment {name} must be an integer, got '{value}'",
+                    value,
+                    rule="enrollment_type",
+                )
+            elif value < 0:
+                counts_valid = False
+                result.add_error(
+                    f"{prefix}.enrollment.{name}",
+                    f"Enrollment {name} cannot be negative",
+                    value,
+                    rule="enrollment_negative",
+                )
+
+        if waitlist is not None and (
+            isinstance(waitlist, bool) or not isinstance(waitlist, int) or waitlist < 0
+        ):
+            result.add_error(
+                f"{prefix}.enrollment.waitlist",
+                "Waitlist must be a non-negative integer",
+                waitlist,
+                rule="waitlist_type",
+            )
+
+        if counts_valid:
+            if enrolled > capacity:
+                result.add_warning(
+                    f"{prefix}.enrollment",
+                    f"Enrolled ({enrolled}) exceeds capacity ({capacity})",
+                    rule="enrollment_over_capacity",
+                )
+            if status == "Open" and capacity and enrolled >= capacity:
+                result.add_warning(
+                    f"{prefix}.status",
+                    "Status is 'Open' but class appears full",
+                    rule="status_open_but_full",
+                )
+            elif status == "Closed" and enrolled < capacity:
+                result.add_warning(
+                    f"{prefix}.status",
+                    "Status is 'Closed' but class has available seats",
+                    rule="status_closed_but_available",
+                )
+
+        slots = []
+        for k, (meeting_type, days, start_time, end_time, room) in enumerate(meetings):
+            meeting_prefix = f"{prefix}.meetings[{k}]"
+            slots.append(
+                self._check_meeting(
+                    meeting_prefix, meeting_type, days, start_time, end_time, result
+                )
+                + (room,)
+            )
+        return slots
+
+    def _check_meeting(
+        self,
+        prefix: str,
+        meeting_type: Any,
+        days: Any,
+        start_time: Any,
+        end_time: Any,
+        result: ValidationResult,
+    ) -> tuple[int, Optional[int], Optional[int]]:
+        """Check a meeting and return its (days_mask, start, end) slot."""
+        if meeting_type is not None and meeting_type not in self.VALID_MEETING_TYPES:
+            result.add_error(
+                f"{prefix}.type",
+                f"Invalid meeting type '{meeting_type}'. Must be one of: "
+                f"{', '.join(sorted(self.VALID_MEETING_TYPES))}",
+                meeting_type,
+                rule="meeting_type",
+            )
+
+        days = days or []
+        invalid_days = [d for d in days if d not in DAY_BITS]
+        if invalid_days:
+            result.add_error(
+                f"{prefix}.days",
+                f"Invalid meeting days: {', '.join(map(str, invalid_days))}",
+                days,
+                rule="meeting_days",
+            )
+        mask = days_to_mask(days)
+
+        start = end = None
+        for name, value in (("start_time", start_time), ("end_time", end_time)):
+            if value is None:
+                continue
+            minutes = time_to_minutes(value) if isinstance(value, str) else None
+            if minutes is None:
+                result.add_error(
+                    f"{prefix}.{name}",
+                    f"Invalid time format: '{value}'. Use HH:MM format (24-hour)",
+                    value,
+                    rule="time_format",
                 )
+            elif name == "start_time":
+                start = minutes
+            else:
+                end = minutes
+
+        if start is not None and end is not None and end <= start:
+            result.add_error(
+                f"{prefix}.time",
+                f"End time ({end_time}) must be after start time ({start_time})",
+                rule="time_range",
+            )
+
+        return mask, start, end
+
+
+def _placeholder_key(name: str) -> str:
+    """Uppercase a name and drop spaces and punctuation, for placeholder checks."""
+    return re.sub(r"[\W_]+", "", name.upper())
+
+
+def _course_view(course: Course) -> dict[str, Any]:
+    """Standardized dictionary view of a ``Course`` for validation."""
+    return {
+        "course_id": course.course_key,
+        "subject": course.subject,
+        "course_number": course.course_number,
+        "title": course.title,
+        "units": course.units,
+        "sections": [
+            {
+                "crn": section.crn,
+                "term": section.term,
+                "status": section.status,
+                "instruction_mode": section.instruction_mode,
+                "enrollment": {
+                    "enrolled": section.enrollment.enrolled,
+                    "capacity": section.enrollment.capacity,
+                    "waitlist": section.enrollment.waitlist,
+                },
+                "meetings": [
+                    {
+                        "type": meeting.type,
+                        "days": meeting.days,
+                        "start_time": meeting.start_time,
+                        "end_time": meeting.end_time,
+                        "location": {
+                            "building": meeting.location.building,
+                            "room": meeting.location.room,
+                        },
+                    }
+                    for meeting in section.meetings
+                ],
+                "instructor": (
+                    {"name": section.instructors[0]} if section.instructors else {}
+                ),
+                "attributes": {"textbook_cost": section.textbook.cost_category},
+            }
+            for section in course.sections
+        ],
+    }
 
 
 def validate_course_submission(
@@ -434,38 +1320,54 @@ def validate_course_submission(
     return result.is_valid, errors, warnings
 
 
-def validate_schedule_file(file_path: Union[str, Path]) -> ValidationResult:
+def validate_schedule_file(
+    file_path: Union[str, Path],
+    max_examples: int = DEFAULT_MAX_EXAMPLES,
+    diagnostics_path: Optional[Union[str, Path]] = None,
+) -> ValidationResult:
     """
     Validate a schedule JSON file.
 
     Args:
         file_path: Path to the JSON file
+        max_examples: Number of example diagnostics kept per group
+        diagnostics_path: Optional JSONL file receiving every diagnostic
 
     Returns:
         ValidationResult with detailed feedback
     """
-    import json
+    if diagnostics_path is None:
+        return _validate_schedule_file(file_path, ValidationResult(max_examples))
+
+    with open(diagnostics_path, "w", encoding="utf-8") as stream:
+        return _validate_schedule_file(
+            file_path, ValidationResult(max_examples, stream=stream)
+        )
+
 
+def _validate_schedule_file(
+    file_path: Union[str, Path], result: ValidationResult
+) -> ValidationResult:
+    """Load a schedule JSON file and validate it into ``result``."""
     path = Path(file_path)
     if not path.exists():
-        result = ValidationResult()
-        result.add_error("file", f"File not found: {file_path}")
+        result.add_error("file", f"File not found: {file_path}", rule="file_not_found")
         return result
 
     try:
         with open(path, encoding="utf-8") as f:
             data = json.load(f)
     except json.JSONDecodeError as e:
-        result = ValidationResult()
-        result.add_error("json", f"Invalid JSON: {str(e)}")
+        result.add_error("json", f"Invalid JSON: {str(e)}", rule="invalid_json")
         return result
     except Exception as e:
-        result = ValidationResult()
-        result.add_error("file", f"Error reading file: {str(e)}")
+        result.add_error(
+            "file", f"Error reading file: {str(e)}", rule="file_read_error"
+        )
         return result
 
     validator = ScheduleValidator()
-    return validator.validate_schedule(data)
+    return validator.validate_schedule(data, result)
 
 
 # Example usage and testing
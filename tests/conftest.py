@@ -2,6 +2,7 @@
 Pytest configuration and shared fixtures for all tests.
 """
 
+import json
 import os
 import sys
 from pathlib import Path
@@ -30,6 +31,226 @@ def sample_data():
     }
 
 
+def banner_crn(crn, subject="MATH", number="001A", **overrides):
+    """Build a crns.json row."""
+    row = {
+        "CRN": crn,
+        "SUBJ_CODE": subject,
+        "CRSE_NUMB": number,
+        "SSBSECT_SEQ_NUMB": "0",
+        "SSBSECT_SSTS_CODE": "A",
+        "SSBSECT_SCHD_CODE": "02",
+        "SSBSECT_INSM_CODE": "INP",
+        "SSBSECT_ENRL": 10,
+        "SSBSECT_MAX_ENRL": 30,
+        "SSBSECT_SEATS_AVAIL": 20,
+        "SSBSECT_WAIT_AVAIL": 10,
+        "SSBSECT_PTRM_START_DATE": "2025-08-23T07:00:00Z",
+        "SSBSECT_PTRM_END_DATE": "2025-12-12T08:00:00Z",
+        "SSBSECT_PTRM_WEEKS": 16,
+        "SSBSECT_CENSUS_ENRL_DATE": "2025-09-08T07:00:00Z",
+        "SSBSECT_ACTIVITY_DATE": "2025-07-01T16:00:00Z",
+        "CREDIT_HRS": 4,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def banner_term(temp_dir):
+    """Write a small West Valley Banner export for one term."""
+    files = {
+        "sobterm.json": [
+            {
+                "SOBTERM_TERM_CODE": "202570",
+                "STVTERM_DESC": "Fall 2025",
+                "STVTERM_START_DATE": "2025-08-23T07:00:00Z",
+                "STVTERM_END_DATE": "2025-12-12T08:00:00Z",
+            }
+        ],
+        "202570/crns.json": [
+            banner_crn("70001"),
+            banner_crn("70002", SSBSECT_SCHD_CODE="04", SSBSECT_SEATS_AVAIL=0),
+            banner_crn(
+                "70003",
+                "ENGL",
+                "001A",
+                SSBSECT_INSM_CODE="AON",
+                SSBSECT_ACTIVITY_DATE="2025-07-18T03:43:37Z",
+            ),
+        ],
+        "202570/ssrmeet.json": [
+            {
+                "CRN": "70001",
+                "DOW": "MW",
+                "BEGIN_TIME": "0920",
+                "END_TIME": "1045",
+                "BUILDING": "Science",
+                "ROOM": "101",
+            },
+            {
+                "CRN": "70002",
+                "DOW": "F",
+                "BEGIN_TIME": "1300",
+                "END_TIME": "1550",
+                "BUILDING": "Science",
+                "ROOM": "102",
+            },
+        ],
+        "202570/section-instructors.json": [
+            {
+                "SIRASGN_CRN": "70001",
+                "INSTRUCTOR_NAME": "Lovelace, Ada",
+                "INSTRUCTOR_EMAIL": "ada.lovelace@wvm.edu",
+            },
+            {"SIRASGN_CRN": "70001", "INSTRUCTOR_NAME": "Babbage, Charles"},
+        ],
+        "202570/section-attributes.json": [
+            {
+                "SSRATTR_CRN": "70003",
+                "SSRATTR_ATTR_CODE": "OERE",
+                "STVATTR_DESC": "No-cost OER course material",
+            },
+            {"SSRATTR_CRN": "70003", "SSRATTR_ATTR_CODE": "CSU"},
+        ],
+        "202570/courses.json": [
+            {
+                "SUBJ_CODE": "MATH",
+                "CRSE_NUMB": "001A",
+                "CRSE_TITLE": "Calculus I",
+                "SCBCRSE_CREDIT_HR_LOW": 5,
+                "CATALOG_DESC": "Limits and derivatives.",
+            }
+        ],
+        "202570/xlst.json": [
+            {"SEARCH_CRN": "70001", "XLST_CRN": "70002"},
+        ],
+        "202570/cohorts.json": [
+            {"SSRRCHR_CRN": "70003", "SSRRCHR_CHRT_CODE": "WDUAL"},
+        ],
+        "202570/subjects.json": [{"SUBJ_CODE": "MATH", "SUBJ_DESC": "Mathematics"}],
+    }
+    for name, rows in files.items():
+        path = temp_dir / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(rows, indent=2))
+    return temp_dir / "202570"
+
+
+def noccd_section(crn, subject="CHEM", number="111A C", **overrides):
+    """Build a NOCCCD sections.json row."""
+    row = {
+        "sectKey": f"202430{crn}",
+        "sectTermCode": "202430",
+        "sectSubjCode": subject,
+        "sectCrseNumb": number,
+        "sectCrn": crn,
+        "sectSchdCode": "02",
+        "sectSstsCode": "A",
+        "sectCredHrs": None,
+        "sectMaxEnrl": 30,
+        "sectEnrl": 20,
+        "sectSeatsAvail": 10,
+        "sectWaitCount": 0,
+        "sectXlst": None,
+        "sectPtrmStartDate": "06/09/2025",
+        "sectPtrmEndDate": "07/20/2025",
+        "sectPtrmCode": "SU",
+        "sectCampCode": "1",
+        "sectEnrlCutOffDate": "2025-06-16T00:00:00",
+        "sectMeetings": [
+            {
+                "beginTime": "1330",
+                "endTime": "1520",
+                "monDay": "M",
+                "tueDay": None,
+                "wedDay": "W",
+                "thuDay": None,
+                "friDay": None,
+                "satDay": None,
+                "sunDay": None,
+                "bldgCode": "SEM",
+                "bldgDesc": "Science-Eng-Math",
+                "roomCode": "116",
+                "mtypCode": "CLAS",
+                "schdCode": "02",
+            }
+        ],
+        "sectCorq": None,
+        "sectAttr": [{"attrCode": "CSUG", "attrDesc": "CSU GE"}],
+        "sectInstrName": "Curie, Marie",
+        "sectInstrWebsite": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def noccd_export(temp_dir):
+    """Write a small North Orange County schedule export."""
+    lab = noccd_section("30002", sectSeatsAvail=0, sectEnrl=30)
+    lab["sectMeetings"][0].update({"mtypCode": "LAB", "schdCode": "04E"})
+    files = {
+        "sections.json": [
+            noccd_section("30001"),
+            lab,
+            noccd_section(
+                "30003",
+                "ENGL",
+                "100 F",
+                sectSchdCode="72",
+                sectCampCode="2",
+                sectMeetings=None,
+                sectCredHrs=4,
+                sectAttr=[{"attrCode": "OER", "attrDesc": "Open Educational"}],
+                sectInstrName="Austen, Jane",
+                sectInstrWebsite="https://faculty.fullcoll.edu/jausten/",
+            ),
+        ],
+        "courses.json": [
+            {
+                "crseKey": "CHEM111A C202430",
+                "crseSubjCode": "CHEM",
+                "crseCrseNumb": "111A C",
+                "crseTitle": "General Chem I",
+                "crseText": (
+                    "!TRN CSU, UC Credit Limitation !TITLE General Chemistry I "
+                    "!TITLE (formerly CHEM 101 C) This course covers atomic "
+                    "structure. !PRQ CHEM 107 C."
+                ),
+                "crseLongText": (
+                    "Prerequisite: CHEM 107 C with a grade of C or better.\n"
+                    "Term hours: 54 lecture. This course covers atomic structure."
+                ),
+                "crseCredHrLow": 5,
+                "crseCorq": [{"subjCodeCorq": "CHEM", "crseNumbCorq": "111L C"}],
+                "crseTrnsfrSts": [{"sbgiCode": "CSU"}],
+            }
+        ],
+        "instructors.json": [
+            {
+                "instrLastName": "Curie",
+                "instrFirstName": "Marie",
+                "instrEmailAddress": "mailto:mcurie@cypresscollege.edu",
+            },
+            {
+                "instrLastName": "Austen",
+                "instrFirstName": "Jane",
+                "instrEmailAddress": None,
+            },
+        ],
+        "campus.json": [
+            {"campCode": "1", "campDesc": "Cypress College"},
+            {"campCode": "2", "campDesc": "Fullerton College"},
+        ],
+        "ptrm.json": [{"ptrmCode": "SU", "ptrmDesc": "Summer Term"}],
+        "terms.json": [{"termCode": "202430", "termDesc": "Summer 2025"}],
+    }
+    for name, rows in files.items():
+        (temp_dir / name).write_text(json.dumps(rows, indent=2))
+    return temp_dir
+
+
 @pytest.fixture(autouse=True)
 def reset_environment():
     """Reset environment variables before each test."""
@@ -0,0 +1,127 @@
+"""Tests for the parallel multi-term backfill."""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.backfill import CATALOG_NAME, MANIFEST_NAME, backfill, find_term_dirs
+
+PROJECT_ROOT = Path(__file__).parent.parent
+WEST_VALLEY_CONFIG = PROJECT_ROOT / "colleges" / "west-valley-mission" / "config.json"
+
+
+@pytest.fixture
+def archive(banner_term):
+    """Provide an archive with two terms."""
+    shutil.copytree(banner_term, banner_term.parent / "202530")
+    return banner_term.parent
+
+
+class TestBackfill:
+    """Test transforming every term of an archive."""
+
+    def test_find_term_dirs(self, archive):
+        """Test only term-code directories are picked up."""
+        (archive / "notes").mkdir()
+
+        assert [p.name for p in find_term_dirs(archive)] == ["202530", "202570"]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_outputs_catalog_and_manifest(self, archive, temp_dir, jobs):
+        """Test per-term outputs, the combined catalog and the manifest."""
+        output = temp_dir / "out"
+
+        report = backfill(archive, output, WEST_VALLEY_CONFIG, jobs=jobs)
+
+        assert [r.term for r in report.transformed] == ["202530", "202570"]
+        assert not report.failed
+        term = json.loads((output / "202570.json").read_text())
+        assert term["schedule"]["metadata"]["term"]["name"] == "Fall 2025"
+
+        catalog = json.loads((output / CATALOG_NAME).read_text())
+        assert [t["code"] for t in catalog["terms"]] == ["202530", "202570"]
+        assert [t["sections"] for t in catalog["terms"]] == [3, 3]
+        assert catalog["courses"][0]["course_id"] == "ENGL-001A"
+        assert catalog["courses"][1]["terms"] == ["202530", "202570"]
+
+        manifest = json.loads((output / MANIFEST_NAME).read_text())
+        assert set(manifest["terms"]) == {"202530", "202570"}
+
+    def test_unchanged_terms_are_skipped(self, archive, temp_dir):
+        """Test a second run only transforms terms whose inputs changed."""
+        output = temp_dir / "out"
+        backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1)
+
+        cohorts = archive / "202530" / "cohorts.json"
+        cohorts.write_text("[]")
+        report = backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1)
+
+        assert [r.term for r in report.transformed] == ["202530"]
+        assert [r.term for r in report.skipped] == ["202570"]
+        assert report.skipped[0].sections == 3
+
+        forced = backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1, force=True)
+        assert len(forced.transformed) == 2
+
+    def test_transformer_change_rebuilds_terms(self, archive, temp_dir, monkeypatch):
+        """Test a change to the transformer code invalidates every term."""
+        output = temp_dir / "out"
+        backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1)
+
+        monkeypatch.setattr(
+            "src.backfill.transformer_fingerprint", lambda _transformer: "fixed"
+        )
+        report = backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1)
+
+        assert [r.term for r in report.transformed] == ["202530", "202570"]
+
+    def test_failed_terms_are_retried(self, archive, temp_dir):
+        """Test terms that fail are reported and left out of the manifest."""
+        output = temp_dir / "out"
+        (archive / "202530" / "crns.json").write_text("{not json")
+
+        report = backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1)
+
+        assert [r.term for r in report.failed] == ["202530"]
+        manifest = json.loads((output / MANIFEST_NAME).read_text())
+        assert list(manifest["terms"]) == ["202570"]
+        catalog = json.loads((output / CATALOG_NAME).read_text())
+        assert [t["code"] for t in catalog["terms"]] == ["202570"]
+
+    def test_interrupted_write_keeps_previous_output(
+        self, archive, temp_dir, monkeypatch
+    ):
+        """Test a write that fails midway leaves the previous output intact."""
+        output = temp_dir / "out"
+        backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1)
+        before = (output / "202570.json").read_text()
+
+        def broken_dump(_data, f, **_kwargs):
+            f.write('{"schedule": ')
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(json, "dump", broken_dump)
+        with pytest.raises(OSError):
+            backfill(archive, output, WEST_VALLEY_CONFIG, jobs=1, force=True)
+
+        assert (output / "202570.json").read_text() == before
+        assert not list(output.glob(".*.tmp"))
+
+    @pytest.mark.parametrize("jobs", ["0", "-2"])
+    def test_jobs_must_be_positive(self, archive, temp_dir, jobs):
+        """Test the command refuses worker counts below 1."""
+        completed = subprocess.run(
+            [sys.executable, "-m", "src.cli", "backfill", str(archive)]
+            + ["--output", str(temp_dir / "out"), "--jobs", jobs],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+
+        assert completed.returncode == 2
+        assert "must be at least 1" in completed.stderr
+        assert not (temp_dir / "out").exists()
@@ -0,0 +1,290 @@
+"""Tests for the concurrent Banner downloader."""
+
+import hashlib
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from src.banner_download import (
+    MANIFEST_NAME,
+    TERM_DOMAINS,
+    BannerDownloader,
+    download_banner_archive,
+)
+
+TERMS = [{"SOBTERM_TERM_CODE": "202530"}, {"SOBTERM_TERM_CODE": "202570"}]
+
+
+class BannerServer(ThreadingHTTPServer):
+    """Stand-in for Banner Extensibility serving canned virtual domains."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), BannerHandler)
+        self.connections = 0
+        self.requests = Counter()
+        # Path -> number of leading requests answered with 503
+        self.failures = Counter()
+        self.chunked = set()
+        self.truncated = set()
+        # Send ETags and answer matching If-None-Match with 304
+        self.etags = True
+        self.not_modified = 0
+        # Bumped to change every term file's content
+        self.revision = 0
+
+    @property
+    def base_url(self):
+        """URL prefix for virtual domains."""
+        return f"http://127.0.0.1:{self.server_address[1]}/virtualDomains."
+
+    def body(self, domain, term):
+        """Canned JSON body of a virtual domain."""
+        if domain == "scheduleSobterm":
+            return json.dumps(TERMS).encode()
+        return json.dumps(
+            [{"domain": domain, "term": term, "revision": self.revision}]
+        ).encode()
+
+
+class BannerHandler(BaseHTTPRequestHandler):
+    """Serves BannerServer bodies over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        domain = url.path.rsplit(".", 1)[-1]
+        term = url.query.partition("=")[2]
+        server = self.server
+        server.requests[url.path] += 1
+
+        if server.failures[url.path]:
+            server.failures[url.path] -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if domain not in {"scheduleSobterm", *TERM_DOMAINS.values()}:
+            self.send_error(404)
+            return
+
+        body = server.body(domain, term)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if server.etags and self.headers.get("If-None-Match") == etag:
+            server.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if server.etags:
+            self.send_header("ETag", etag)
+        if url.path in server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 7):
+                chunk = body[start : start + 7]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        elif url.path in server.truncated:
+            self.send_header("Content-Length", str(len(body) + 100))
+            self.end_headers()
+            self.wfile.write(body)
+            self.close_connection = True
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    """Run a BannerServer in a background thread."""
+    server = BannerServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def downloader(server, **options):
+    """Create a downloader for the stand-in server with fast retries."""
+    return BannerDownloader(server.base_url, backoff=0.001, **options)
+
+
+class TestBannerDownloader:
+    """Test downloading Banner virtual domains."""
+
+    def test_download_archive(self, server, temp_dir):
+        """Test every term file is downloaded over a few reused connections."""
+        results = download_banner_archive(temp_dir, base_url=server.base_url)
+
+        assert len(results) == 1 + len(TERMS) * len(TERM_DOMAINS)
+        assert all(not r.error and r.status == 200 for r in results)
+        assert json.loads((temp_dir / "sobterm.json").read_text()) == TERMS
+        crns = json.loads((temp_dir / "202570" / "crns.json").read_text())
+        assert crns == [{"domain": "scheduleCRNs", "term": "202570", "revision": 0}]
+        assert server.connections <= 8
+
+    def test_files_are_not_private(self, server, temp_dir):
+        """Test downloaded files get the mode open() gives, not mkstemp's 0600."""
+        download_banner_archive(temp_dir, base_url=server.base_url)
+        (temp_dir / "plain.txt").write_text("")
+
+        modes = {
+            (temp_dir / name).stat().st_mode & 0o777
+            for name in ("sobterm.json", MANIFEST_NAME, "plain.txt")
+        }
+        assert len(modes) == 1
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, server, temp_dir):
+        """Test sequential requests share one keep-alive connection."""
+        async with downloader(server, concurrency=1) as client:
+            for name, domain in TERM_DOMAINS.items():
+                result = await client.fetch(
+                    client.url(domain, "202570"), temp_dir / f"{name}.json"
+                )
+                assert not result.error
+
+            assert client.pool.opened == 1
+        assert server.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_terms(self, server, temp_dir):
+        """Test only the requested terms are downloaded."""
+        async with downloader(server) as client:
+            results = await client.download_archive(temp_dir, terms=["202530"])
+
+        assert len(results) == 1 + len(TERM_DOMAINS)
+        assert (temp_dir / "202530" / "crns.json").exists()
+        assert not (temp_dir / "202570").exists()
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self, server, temp_dir):
+        """Test 503 responses are retried with backoff."""
+        server.failures["/virtualDomains.scheduleCRNs"] = 2
+
+        async with downloader(server, retries=3) as client:
+            result = await client.fetch(
+                client.url("scheduleCRNs", "202570"), temp_dir / "crns.json"
+            )
+
+        assert not result.error
+        assert result.attempts == 3
+        assert server.requests["/virtualDomains.scheduleCRNs"] == 3
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_are_not_retried(self, server, temp_dir):
+        """Test a 404 fails at once and leaves no file behind."""
+        async with downloader(server) as client:
+            result = await client.fetch(client.url("missing"), temp_dir / "x.json")
+
+        assert result.status == 404
+        assert "HTTP 404" in result.error
+        assert result.attempts == 1
+        assert list(temp_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_chunked_body(self, server, temp_dir):
+        """Test chunked transfer encoding is decoded."""
+        server.chunked.add("/virtualDomains.scheduleSobterm")
+
+        async with downloader(server) as client:
+            result = await client.fetch(
+                client.url("scheduleSobterm"), temp_dir / "sobterm.json"
+            )
+
+        assert json.loads((temp_dir / "sobterm.json").read_text()) == TERMS
+        assert result.size == len(json.dumps(TERMS))
+
+    @pytest.mark.asyncio
+    async def test_truncated_body_keeps_existing_file(self, server, temp_dir):
+        """Test an incomplete download never replaces the existing file."""
+        server.truncated.add("/virtualDomains.scheduleCRNs")
+        path = temp_dir / "crns.json"
+        path.write_text("[]")
+
+        async with downloader(server, retries=1) as client:
+            result = await client.fetch(client.url("scheduleCRNs", "202570"), path)
+
+        assert "IncompleteReadError" in result.error
+        assert result.attempts == 2
+        assert path.read_text() == "[]"
+        assert list(temp_dir.iterdir()) == [path]
+
+
+class TestConditionalDownloads:
+    """Test refreshing an archive with the download manifest."""
+
+    def mtimes(self, data_dir):
+        """Modification times of the archive's JSON files."""
+        return {
+            path: path.stat().st_mtime_ns
+            for path in data_dir.rglob("*.json")
+            if path.name != MANIFEST_NAME
+        }
+
+    def test_not_modified(self, server, temp_dir):
+        """Test a refresh sends conditional requests and rewrites nothing."""
+        download_banner_archive(temp_dir, base_url=server.base_url)
+        before = self.mtimes(temp_dir)
+        manifest = json.loads((temp_dir / MANIFEST_NAME).read_text())
+        entry = manifest["files"][server.base_url + "scheduleCRNs?term_code=202570"]
+        assert entry["etag"] and entry["size"] > 0 and len(entry["sha256"]) == 64
+
+        results = download_banner_archive(temp_dir, base_url=server.base_url)
+
+        assert all(r.status == 304 and r.unchanged for r in results)
+        assert sum(r.size for r in results) == 0
+        assert server.not_modified == len(results)
+        assert self.mtimes(temp_dir) == before
+
+    def test_same_content_is_not_rewritten(self, server, temp_dir):
+        """Test a full response with unchanged content leaves the file alone."""
+        server.etags = False
+        download_banner_archive(temp_dir, base_url=server.base_url)
+        before = self.mtimes(temp_dir)
+
+        results = download_banner_archive(temp_dir, base_url=server.base_url)
+
+        assert all(r.status == 200 and r.unchanged for r in results)
+        assert self.mtimes(temp_dir) == before
+
+    def test_changed_content_is_replaced(self, server, temp_dir):
+        """Test files whose content changed are downloaded again."""
+        download_banner_archive(temp_dir, base_url=server.base_url)
+        server.revision = 1
+
+        results = download_banner_archive(temp_dir, base_url=server.base_url)
+
+        term_list, *term_files = results
+        assert term_list.unchanged
+        assert all(r.status == 200 and not r.unchanged for r in term_files)
+        crns = json.loads((temp_dir / "202530" / "crns.json").read_text())
+        assert crns[0]["revision"] == 1
+
+    def test_since_skips_older_terms(self, server, temp_dir):
+        """Test terms before the cutoff are not requested."""
+        results = download_banner_archive(
+            temp_dir, base_url=server.base_url, since="202570"
+        )
+
+        assert len(results) == 1 + len(TERM_DOMAINS)
+        assert server.requests["/virtualDomains.scheduleCRNs"] == 1
+        assert not (temp_dir / "202530").exists()
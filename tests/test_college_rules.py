@@ -0,0 +1,100 @@
+"""Tests for compiled college configuration rules."""
+
+import json
+import os
+
+import pytest
+
+from src.college_rules import compile_college_rules, load_college_rules
+from src.schema_validator import ExtensibleSchemaValidator
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+BASE_SCHEMA = os.path.join(PROJECT_ROOT, "data", "schemas", "base.json")
+
+
+@pytest.fixture
+def college_config():
+    """Provide a minimal college configuration."""
+    return {
+        "college": {"id": "example", "name": "Example College"},
+        "features": {
+            "textbook_cost": {"enabled": True, "categories": [{"code": "ZTC"}]},
+            "instruction_modes": {
+                "enabled": True,
+                "modes": {"In Person": {"code": "INP"}, "ONL": "Online"},
+            },
+            "enrollment_tracking": {"enabled": True, "fields": ["census_date"]},
+        },
+    }
+
+
+@pytest.fixture
+def config_file(temp_dir, college_config):
+    """Write the college configuration to disk."""
+    path = temp_dir / "config.json"
+    path.write_text(json.dumps(college_config))
+    return path
+
+
+class TestCompileCollegeRules:
+    """Test compiling configurations into rules."""
+
+    def test_compiled_codes(self, college_config):
+        """Test allowed codes are compiled into frozensets."""
+        rules = compile_college_rules(college_config)
+
+        assert rules.college_id == "example"
+        assert rules.textbook_cost_codes == frozenset({"ZTC"})
+        assert rules.instruction_mode_codes == frozenset({"INP", "ONL"})
+        assert rules.instruction_mode_map["In Person"] == "INP"
+        assert rules.enrollment_fields == ("census_date",)
+
+    def test_check_section(self, college_config):
+        """Test a single pass reports every college-specific problem."""
+        rules = compile_college_rules(college_config)
+        section = {
+            "crn": "12345",
+            "instruction_mode": "XYZ",
+            "attributes": {"textbook_cost": "LTC"},
+        }
+
+        errors = list(rules.check_section(section))
+
+        assert len(errors) == 3
+        assert errors[0].startswith("Invalid textbook cost 'LTC' in section 12345")
+        assert "{'INP', 'ONL'}" in errors[1]
+        assert "['census_date']" in errors[2]
+
+    def test_disabled_features_are_skipped(self, college_config):
+        """Test that disabled features produce no errors."""
+        for feature in college_config["features"].values():
+            feature["enabled"] = False
+        rules = compile_college_rules(college_config)
+
+        assert list(rules.check_section({"instruction_mode": "XYZ"})) == []
+
+
+class TestLoadCollegeRules:
+    """Test cached loading of rules."""
+
+    def test_rules_are_cached(self, config_file):
+        """Test repeated loads reuse the compiled object."""
+        assert load_college_rules(config_file) is load_college_rules(config_file)
+
+    def test_rules_reload_when_file_changes(self, config_file, college_config):
+        """Test edits to the config file are picked up."""
+        first = load_college_rules(config_file)
+        college_config["college"]["id"] = "changed"
+        config_file.write_text(json.dumps(college_config))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_college_rules(config_file).college_id == "changed"
+        assert first.college_id == "example"
+
+    def test_validators_share_rules(self, config_file):
+        """Test schema validators reuse the cached rules."""
+        first = ExtensibleSchemaValidator(BASE_SCHEMA, config_file)
+        second = ExtensibleSchemaValidator(BASE_SCHEMA, config_file)
+
+        assert first.rules is second.rules
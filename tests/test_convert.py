@@ -0,0 +1,211 @@
+"""Tests for the transformer registry and conversions."""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.convert import convert, convert_all
+from src.transformers.registry import (
+    TRANSFORMERS,
+    create_transformer,
+    find_college_configs,
+    get_transformer_class,
+    transformer_for_config,
+)
+from src.transformers.west_valley_transformer import WestValleyTransformer
+
+PROJECT_ROOT = Path(__file__).parent.parent
+COLLEGES_DIR = PROJECT_ROOT / "colleges"
+WEST_VALLEY_CONFIG = COLLEGES_DIR / "west-valley-mission" / "config.json"
+
+
+@pytest.fixture
+def examples(banner_term, temp_dir):
+    """Provide an examples directory with a West Valley export."""
+    data_dir = temp_dir / "examples" / "west-valley-mission" / "data"
+    shutil.copytree(banner_term, data_dir / banner_term.name)
+    shutil.copy(banner_term.parent / "sobterm.json", data_dir)
+    return temp_dir / "examples"
+
+
+@pytest.fixture
+def colleges(temp_dir):
+    """Provide college configs for West Valley and a college without a transformer."""
+    colleges_dir = temp_dir / "colleges"
+    (colleges_dir / "west-valley-mission").mkdir(parents=True)
+    shutil.copy(WEST_VALLEY_CONFIG, colleges_dir / "west-valley-mission")
+
+    config = json.loads(WEST_VALLEY_CONFIG.read_text(encoding="utf-8"))
+    config["college"]["id"] = "east-valley"
+    (colleges_dir / "east-valley").mkdir()
+    (colleges_dir / "east-valley" / "config.json").write_text(json.dumps(config))
+    return colleges_dir
+
+
+class TestRegistry:
+    """Test looking up transformers by college ID."""
+
+    def test_every_config_has_a_transformer(self):
+        """Test each configured college is registered."""
+        assert sorted(find_college_configs(COLLEGES_DIR)) == sorted(TRANSFORMERS)
+
+    def test_get_transformer_class(self):
+        """Test the transformer class is imported by college ID."""
+        assert get_transformer_class("west-valley-mission") is WestValleyTransformer
+
+    def test_unknown_college(self, colleges):
+        """Test unknown colleges raise ValueError naming the registered ones."""
+        with pytest.raises(ValueError, match="rio-hondo"):
+            get_transformer_class("east-valley")
+        with pytest.raises(ValueError, match="No configuration"):
+            create_transformer("rio-hondo", colleges)
+
+    def test_transformer_for_config(self):
+        """Test the config's college ID selects the transformer."""
+        transformer = transformer_for_config(WEST_VALLEY_CONFIG)
+
+        assert isinstance(transformer, WestValleyTransformer)
+        assert transformer.college_info["id"] == "west-valley-mission"
+
+    def test_cli_imports_only_requested_transformer(self, banner_term, temp_dir):
+        """Test transforming one college leaves other transformers unimported."""
+        script = (
+            "import sys\n"
+            "from src.cli import main\n"
+            "sys.argv = ['cli', 'transform', '--college', 'west-valley-mission',\n"
+            f"    {str(banner_term)!r}, '--output', {str(temp_dir / 'out.json')!r}]\n"
+            "assert main() == 0\n"
+            "print(sorted(m for m in sys.modules if m.endswith('_transformer')))\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert completed.stdout.splitlines()[-1] == str(
+            [
+                "src.transformers.base_transformer",
+                "src.transformers.west_valley_transformer",
+            ]
+        )
+
+
+class TestConvert:
+    """Test converting college exports."""
+
+    def test_convert(self, banner_term, temp_dir):
+        """Test the streamed output matches an in-memory transform."""
+        output = temp_dir / "out" / "schedule.json"
+
+        result = convert("west-valley-mission", banner_term, output)
+
+        expected = WestValleyTransformer(WEST_VALLEY_CONFIG).transform(
+            WestValleyTransformer.load_input(banner_term)
+        )
+        written = json.loads(output.read_text(encoding="utf-8"))
+        for data in (written, expected):
+            data["schedule"]["metadata"].pop("last_updated")
+        assert written == expected
+        assert result.courses == len(expected["schedule"]["courses"])
+        assert result.sections == sum(
+            len(c["sections"]) for c in expected["schedule"]["courses"]
+        )
+        assert result.validation.total_count == result.courses
+        assert result.errors == 0
+
+    def test_incremental_state(self, temp_dir):
+        """Test a rerun with state reuses every unchanged section."""
+        input_path = temp_dir / "schedule.json"
+        input_path.write_text(
+            json.dumps(
+                {
+                    "term_code": "202570",
+                    "courses": [
+                        {
+                            "crn": crn,
+                            "subject": "MATH",
+                            "course_number": "190",
+                            "title": "Calculus",
+                            "units": 5.0,
+                            "enrollment": {"actual": 3, "capacity": 30},
+                        }
+                        for crn in ("70001", "70002")
+                    ],
+                }
+            )
+        )
+        state = temp_dir / "state.json"
+
+        first = convert("rio-hondo", input_path, temp_dir / "a.json", state_path=state)
+        second = convert("rio-hondo", input_path, temp_dir / "b.json", state_path=state)
+
+        assert (first.reused, second.reused) == (0, 2)
+        outputs = [
+            json.loads((temp_dir / name).read_text(encoding="utf-8"))
+            for name in ("a.json", "b.json")
+        ]
+        for data in outputs:
+            data["schedule"]["metadata"].pop("last_updated")
+        assert outputs[0] == outputs[1]
+
+    def test_reproducible_unsorted_input(self, temp_dir):
+        """Test reproducible output sorts courses, keeping old output on failure."""
+        rows = [
+            {
+                "crn": crn,
+                "subject": subject,
+                "course_number": "101",
+                "title": "T",
+                "units": 3,
+            }
+            for crn, subject in (("70001", "MATH"), ("70002", "ENGL"))
+        ]
+        input_path = temp_dir / "schedule.json"
+        input_path.write_text(
+            json.dumps(
+                {
+                    "term_code": "202570",
+                    "collection_timestamp": "2025-07-23T17:40:56",
+                    "courses": rows,
+                }
+            )
+        )
+        output = temp_dir / "out.json"
+
+        convert("rio-hondo", input_path, output, reproducible=True)
+
+        written = json.loads(output.read_text(encoding="utf-8"))
+        course_ids = [c["course_id"] for c in written["schedule"]["courses"]]
+        assert course_ids == ["ENGL-101", "MATH-101"]
+
+        before = output.read_bytes()
+        input_path.write_text(input_path.read_text()[:-20])
+        with pytest.raises(ValueError):
+            convert("rio-hondo", input_path, output)
+        assert output.read_bytes() == before
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            "out.json",
+            "schedule.json",
+        ]
+
+    def test_convert_all(self, examples, colleges, temp_dir):
+        """Test every configured college is converted or reported as failed."""
+        results = convert_all(temp_dir / "out", examples, colleges)
+
+        assert [r.college_id for r in results] == [
+            "east-valley",
+            "west-valley-mission",
+        ]
+        failed, converted = results
+        assert "No transformer registered" in failed.failure
+        assert not converted.failure
+        assert converted.output == temp_dir / "out" / "west-valley-mission.json"
+        assert converted.output.exists()
+        assert converted.courses > 0
@@ -0,0 +1,181 @@
+"""Tests for streaming course exports."""
+
+import csv
+import io
+import json
+import subprocess
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import generate_schedule
+from src.course_export import CSV_COLUMNS, write_courses
+from src.data_utils import (
+    iter_filtered_courses,
+    iter_schedule_courses,
+    load_schedule_data,
+)
+from src.models import FilterOptions
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def schedule_file(temp_dir):
+    """Provide a schedule file with courses ACCT-100 to BIOL-100."""
+    path = temp_dir / "schedule.json"
+    path.write_text(json.dumps(generate_schedule(16)))
+    return path
+
+
+class TestIterScheduleCourses:
+    """Test streaming courses from schedule files."""
+
+    def test_matches_full_load(self, schedule_file):
+        """Test streamed courses equal the ones load_schedule_data parses."""
+        streamed = list(iter_schedule_courses(schedule_file, chunk_size=256))
+
+        assert streamed == load_schedule_data(schedule_file).courses
+
+    def test_top_level_courses(self, temp_dir):
+        """Test files without the schedule wrapper are read too."""
+        data = generate_schedule(4)["schedule"]
+        path = temp_dir / "courses.json"
+        path.write_text(json.dumps(data))
+
+        assert [c.course_key for c in iter_schedule_courses(path)] == ["ACCT-100"]
+
+    def test_filtering_reads_lazily(self, schedule_file):
+        """Test filtered courses are produced before the file is read to the end."""
+        read = []
+
+        def courses():
+            for course in iter_schedule_courses(schedule_file):
+                read.append(course.course_key)
+                yield course
+
+        matches = iter_filtered_courses(courses(), FilterOptions())
+
+        assert next(matches).course_key == "ACCT-100"
+        assert read == ["ACCT-100"]
+
+
+class TestWriteCourses:
+    """Test the export formats."""
+
+    @pytest.fixture
+    def courses(self, schedule_file):
+        """Provide the schedule's courses."""
+        return load_schedule_data(schedule_file).courses
+
+    def write(self, courses, fmt):
+        """Write courses to a string."""
+        buffer = io.StringIO(newline="")
+        count = write_courses(iter(courses), buffer, fmt)
+        return count, buffer.getvalue()
+
+    def test_json(self, courses):
+        """Test JSON output is an array of the courses."""
+        count, text = self.write(courses, "json")
+
+        assert count == len(courses)
+        assert text == json.dumps([asdict(c) for c in courses], indent=2) + "\n"
+
+    def test_jsonl(self, courses):
+        """Test JSON Lines output has one course per line."""
+        count, text = self.write(courses, "jsonl")
+
+        lines = text.splitlines()
+        assert count == len(lines) == len(courses)
+        assert [json.loads(line) for line in lines] == [asdict(c) for c in courses]
+
+    def test_csv(self, courses):
+        """Test CSV output has a row per section."""
+        count, text = self.write(courses, "csv")
+
+        header, *rows = csv.reader(io.StringIO(text))
+        assert count == len(courses)
+        assert header == list(CSV_COLUMNS)
+        assert len(rows) == sum(len(c.sections) for c in courses)
+        row = dict(zip(header, rows[1]))
+        assert (row["course_key"], row["crn"]) == ("ACCT-100", "10001")
+        assert row["meetings"] == "TR 09:00-10:50 B0 101"
+
+    def test_unknown_format(self, courses):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="xml"):
+            self.write(courses, "xml")
+
+
+class TestScheduleFilterCommand:
+    """Test paging through filter results from the command line."""
+
+    def run(self, *args):
+        """Run the schedule-filter command."""
+        return subprocess.run(
+            [sys.executable, "-m", "src.cli", "schedule-filter", *map(str, args)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_pages(self, schedule_file):
+        """Test --offset and --limit select a page of matching courses."""
+        completed = self.run(
+            schedule_file, "--format", "jsonl", "--offset", 1, "--limit", 2
+        )
+
+        keys = [
+            json.loads(line)["course_key"] for line in completed.stdout.splitlines()
+        ]
+        assert keys == ["ART-100", "BIOL-100"]
+
+    def test_output_file(self, schedule_file, temp_dir):
+        """Test results can be streamed to a file."""
+        output = temp_dir / "open.csv"
+
+        completed = self.run(
+            schedule_file, "--format", "csv", "--open-only", "--output", output
+        )
+
+        rows = list(csv.DictReader(output.open(newline="")))
+        assert rows and {row["status"] for row in rows} == {"Open"}
+        assert "courses to:" in completed.stderr
+
+    def test_failed_run_keeps_output(self, schedule_file, temp_dir):
+        """Test a schedule that fails to parse leaves the previous output."""
+        output = temp_dir / "all.csv"
+        output.write_text("old")
+        broken = temp_dir / "broken.json"
+        broken.write_text(schedule_file.read_text()[:-200])
+
+        with pytest.raises(subprocess.CalledProcessError):
+            self.run(broken, "--format", "csv", "--output", output)
+
+        assert output.read_text() == "old"
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            "all.csv",
+            "broken.json",
+            "schedule.json",
+        ]
+
+    def test_other_commands_are_not_imported(self):
+        """Test the CLI leaves the other commands' modules unimported."""
+        script = (
+            "import sys\n"
+            "import src.cli\n"
+            "modules = ('asyncio', 'src.convert', 'src.schedule_server')\n"
+            "print([m for m in modules if m in sys.modules])\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert completed.stdout.strip() == "[]"
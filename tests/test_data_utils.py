@@ -1,10 +1,23 @@
 """Tests for data utility functions."""
 
+import io
 import json
+from dataclasses import asdict
 
 import pytest
 
-from src.data_utils import filter_courses_by_units, load_json_data, validate_course_data
+from benchmarks.synthetic import generate_schedule
+from src.data_utils import (
+    JsonArrayFile,
+    filter_courses_by_units,
+    iter_json_array,
+    load_json_data,
+    load_json_header,
+    load_schedule_data,
+    validate_course_data,
+    write_json_stream,
+    write_schedule_json,
+)
 
 
 class TestLoadJsonData:
@@ -35,6 +48,214 @@ class TestLoadJsonData:
             load_json_data(json_file)
 
 
+class TestIterJsonArray:
+    """Test streaming JSON array items."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 65536])
+    def test_matches_json_load(self, temp_dir, chunk_size):
+        """Test streamed items equal the parsed list for any chunk size."""
+        items = [1, 22, -3.5e3, "a], b", {"x": [1, {"y": None}]}, [], True, "\u00e9"]
+        json_file = temp_dir / "items.json"
+        json_file.write_text(json.dumps(items, indent=2))
+
+        assert list(iter_json_array(json_file, chunk_size)) == items
+
+    def test_empty_array(self, temp_dir):
+        """Test an empty array yields nothing."""
+        json_file = temp_dir / "empty.json"
+        json_file.write_text("  [ ]\n")
+
+        assert list(iter_json_array(json_file, chunk_size=1)) == []
+
+    @pytest.mark.parametrize("content", ['{"a": 1}', "[1, 2", "[1 2]", "[1,]", ""])
+    def test_invalid_array(self, temp_dir, content):
+        """Test non-arrays and malformed arrays raise JSONDecodeError."""
+        json_file = temp_dir / "invalid.json"
+        json_file.write_text(content)
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(json_file, chunk_size=2))
+
+    def test_missing_file(self):
+        """Test streaming a non-existent file."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            list(iter_json_array("nonexistent.json"))
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+    def test_object_member(self, temp_dir, chunk_size):
+        """Test streaming an array held by a top-level object member."""
+        data = {"term": "Fall", "skip": {"courses": [0]}, "courses": [1, {"a": 2}]}
+        json_file = temp_dir / "wrapped.json"
+        json_file.write_text(json.dumps(data, indent=2))
+
+        items = iter_json_array(json_file, chunk_size, key="courses")
+        assert list(items) == [1, {"a": 2}]
+
+    def test_missing_member(self, temp_dir):
+        """Test a missing member raises KeyError."""
+        json_file = temp_dir / "wrapped.json"
+        json_file.write_text('{"term": "Fall"}')
+
+        with pytest.raises(KeyError):
+            list(iter_json_array(json_file, key="courses"))
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    def test_with_source(self, temp_dir, chunk_size):
+        """Test items are paired with their exact source text."""
+        json_file = temp_dir / "items.json"
+        json_file.write_text('{"courses": [ {"a": [1, 2]},\n  "x" , 3.5e3]}')
+
+        items = iter_json_array(json_file, chunk_size, "courses", with_source=True)
+        assert list(items) == [
+            ({"a": [1, 2]}, '{"a": [1, 2]}'),
+            ("x", '"x"'),
+            (3.5e3, "3.5e3"),
+        ]
+
+    def test_array_file_is_reiterable(self, temp_dir):
+        """Test JsonArrayFile streams the array on every iteration."""
+        json_file = temp_dir / "wrapped.json"
+        json_file.write_text('{"courses": [1, 2]}')
+
+        courses = JsonArrayFile(json_file, "courses")
+        assert list(courses) == [1, 2]
+        assert list(courses) == [1, 2]
+
+
+class TestLoadJsonHeader:
+    """Test reading the members before a large member."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 65536])
+    def test_stops_at_key(self, temp_dir, chunk_size):
+        """Test members after the stop key are not decoded."""
+        json_file = temp_dir / "collector.json"
+        json_file.write_text('{"term": "Fall 2025", "n": 2, "courses": [1, 2')
+
+        header = load_json_header(json_file, "courses", chunk_size)
+        assert header == {"term": "Fall 2025", "n": 2}
+
+    def test_missing_key_reads_all(self, temp_dir):
+        """Test all members are returned when the key is absent."""
+        json_file = temp_dir / "collector.json"
+        json_file.write_text('{"term": "Fall 2025"}')
+
+        assert load_json_header(json_file, "courses") == {"term": "Fall 2025"}
+
+    def test_not_an_object(self, temp_dir):
+        """Test a non-object top level raises JSONDecodeError."""
+        json_file = temp_dir / "collector.json"
+        json_file.write_text("[1]")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_json_header(json_file, "courses")
+
+
+class TestWriteJsonStream:
+    """Test incremental JSON writing."""
+
+    def _write(self, data, **kwargs):
+        """Write data to a string with write_json_stream."""
+        buffer = io.StringIO()
+        write_json_stream(data, buffer, **kwargs)
+        return buffer.getvalue()
+
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    def test_matches_json_dump(self, ensure_ascii):
+        """Test output is byte-identical to json.dump of the materialized data."""
+        courses = [{"id": "MATH-1", "sections": [{"crn": "1"}]}, {"id": "ART-\u00e9"}]
+        extensions = {"subjects": {"MATH": "Mathematics"}, "empty": {}}
+
+        streamed = self._write(
+            {
+                "schedule": {
+                    "metadata": {"version": "1.0.0", "terms": []},
+                    "courses": iter(courses),
+                    "extensions": extensions,
+                }
+            },
+            ensure_ascii=ensure_ascii,
+        )
+        expected = json.dumps(
+            {
+                "schedule": {
+                    "metadata": {"version": "1.0.0", "terms": []},
+                    "courses": courses,
+                    "extensions": extensions,
+                }
+            },
+            indent=2,
+            ensure_ascii=ensure_ascii,
+        )
+        assert streamed == expected
+
+    def test_empty_iterator(self):
+        """Test an exhausted iterator is written as an empty array."""
+        assert self._write({"courses": iter(())}) == json.dumps(
+            {"courses": []}, indent=2
+        )
+
+    def test_generator_is_consumed_lazily(self):
+        """Test items are written as they are produced."""
+        buffer = io.StringIO()
+        written = []
+
+        def items():
+            for i in range(3):
+                written.append(buffer.getvalue())
+                yield i
+
+        write_json_stream(items(), buffer)
+        assert written[1] == "[\n  0"
+        assert buffer.getvalue() == json.dumps([0, 1, 2], indent=2)
+
+
+class TestWriteScheduleJson:
+    """Test writing schedules without converting them to dictionaries."""
+
+    @pytest.fixture
+    def schedule(self, temp_dir):
+        """Provide a schedule with non-ASCII text, floats and empty fields."""
+        path = temp_dir / "schedule.json"
+        path.write_text(json.dumps(generate_schedule(20)))
+        schedule = load_schedule_data(path)
+        schedule.courses[0].title = "Caf\u00e9 \u201cFran\u00e7ais\u201d \\ \n\t"
+        schedule.courses[0].units = 3.5
+        schedule.courses[0].attributes = None
+        schedule.courses[1].sections[0].instructors = []
+        return schedule
+
+    @pytest.mark.parametrize("indent", [2, 4, None])
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    def test_matches_json_dump(self, schedule, indent, ensure_ascii):
+        """Test output is byte-identical to json.dump of asdict."""
+        buffer = io.StringIO()
+        write_schedule_json(schedule, buffer, indent, ensure_ascii)
+
+        separators = (",", ":") if indent is None else None
+        expected = json.dumps(
+            {"schedule": asdict(schedule)},
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            separators=separators,
+        )
+        assert buffer.getvalue() == expected
+
+    def test_writes_course_by_course(self, schedule):
+        """Test each course is written as soon as it is encoded."""
+        writes = []
+
+        class Recorder(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        write_schedule_json(schedule, Recorder())
+
+        courses = [w for w in writes if '"course_key"' in w]
+        assert len(courses) == len(schedule.courses)
+        assert all(w.count('"course_key"') == 1 for w in courses)
+
+
 class TestValidateCourseData:
     """Test course data validation."""
 
@@ -0,0 +1,251 @@
+"""Tests for the enrollment history store."""
+
+import json
+
+import pytest
+
+from src.enrollment_history import (
+    EnrollmentHistory,
+    find_snapshots,
+    snapshot_sections,
+    snapshot_time,
+)
+
+
+def capture(time, *sections):
+    """Build a Rio Hondo capture from (crn, subject, actual, capacity, status)."""
+    return {
+        "term_code": "202570",
+        "collection_timestamp": time,
+        "courses": [
+            {
+                "crn": crn,
+                "subject": subject,
+                "course_number": "101",
+                "enrollment": {
+                    "actual": actual,
+                    "capacity": capacity,
+                    "remaining": capacity - actual,
+                },
+                "status": status,
+            }
+            for crn, subject, actual, capacity, status in sections
+        ],
+    }
+
+
+def write_capture(directory, stamp, *sections):
+    """Write a capture named like the collector's snapshots."""
+    time = f"{stamp[:4]}-{stamp[4:6]}-{stamp[6:8]}T{stamp[9:11]}:{stamp[11:13]}:00"
+    path = directory / f"schedule_202570_{stamp}.json"
+    path.write_text(json.dumps(capture(time, *sections)))
+    return path
+
+
+def history_lines(path):
+    """Decode a history file's lines."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def snapshots(temp_dir):
+    """Provide three hourly captures of one term."""
+    directory = temp_dir / "202570"
+    directory.mkdir()
+    write_capture(
+        directory,
+        "20250801_090000",
+        ("1", "MATH", 10, 40, "OPEN"),
+        ("2", "MATH", 30, 30, "CLOSED"),
+        ("3", "ENGL", 5, 25, "OPEN"),
+    )
+    write_capture(
+        directory,
+        "20250801_100000",
+        ("1", "MATH", 12, 40, "OPEN"),
+        ("2", "MATH", 30, 30, "CLOSED"),
+        ("3", "ENGL", 5, 25, "OPEN"),
+    )
+    latest = write_capture(
+        directory,
+        "20250801_110000",
+        ("1", "MATH", 20, 40, "OPEN"),
+        ("3", "ENGL", 6, 25, "OPEN"),
+        ("4", "MATH", 0, 20, "OPEN"),
+    )
+    (directory / "schedule_202570_latest.json").symlink_to(latest.name)
+    return directory
+
+
+class TestSnapshots:
+    """Test reading collector snapshots."""
+
+    def test_sections(self):
+        """Test both snapshot kinds give the tracked fields."""
+        rio_hondo = capture("2025-08-01T09:00:00", ("1", "MATH", 10, 40, "OPEN"))
+        banner = [
+            {
+                "CRN": "70001",
+                "SUBJ_CODE": "ACC",
+                "CRSE_NUMB": "001A",
+                "SSBSECT_ENRL": 35,
+                "SSBSECT_MAX_ENRL": 35,
+                "SSBSECT_WAIT_COUNT": 1,
+                "SSBSECT_SSTS_CODE": "A",
+            }
+        ]
+
+        assert snapshot_sections(rio_hondo) == {
+            "1": ("MATH", "101", 10, 40, None, "OPEN")
+        }
+        assert snapshot_sections(banner) == {"70001": ("ACC", "001A", 35, 35, 1, "A")}
+        with pytest.raises(ValueError):
+            snapshot_sections({"rows": []})
+
+    def test_time(self, temp_dir):
+        """Test the capture's timestamp wins over the file name."""
+        path = temp_dir / "schedule_202570_20250723_174056.json"
+
+        assert snapshot_time(path) == "2025-07-23T17:40:56"
+        data = {"collection_timestamp": "2025-07-23T17:40:56.146559"}
+        assert snapshot_time(path, data) == "2025-07-23T17:40:56.146559"
+
+    def test_find_skips_latest_symlink(self, snapshots):
+        """Test directories expand to their snapshots in time order."""
+        assert [p.name[-20:-5] for p in find_snapshots([snapshots])] == [
+            "20250801_090000",
+            "20250801_100000",
+            "20250801_110000",
+        ]
+
+
+class TestEnrollmentHistory:
+    """Test recording and querying snapshots."""
+
+    def test_records_only_changes(self, snapshots, temp_dir):
+        """Test each snapshot line holds only the fields that changed."""
+        path = temp_dir / "history.jsonl"
+        EnrollmentHistory(path).import_snapshots([snapshots])
+
+        header, first, second, third = history_lines(path)
+        assert header["fields"] == ["enrolled", "capacity", "waitlist", "status"]
+        assert [crn for crn, _, _ in first["new"]] == ["1", "2", "3"]
+        assert first["enrolled"] == [[0, 1, 1], [10, 30, 5]]
+        assert second == {
+            "time": "2025-08-01T10:00:00",
+            "source": "schedule_202570_20250801_100000.json",
+            "enrolled": [[0], [12]],
+        }
+        assert third["new"] == [["4", "MATH", "101"]]
+        assert third["removed"] == [1]
+        # Sections 0, 2 and 3 changed enrollment, gap-encoded
+        assert third["enrolled"] == [[0, 2, 1], [20, 6, 0]]
+
+    def test_replay_matches_last_snapshot(self, snapshots, temp_dir):
+        """Test reopening the file rebuilds the latest counts."""
+        path = temp_dir / "history.jsonl"
+        EnrollmentHistory(path).import_snapshots([snapshots])
+
+        history = EnrollmentHistory(path)
+
+        columns = history.columns
+        offered = {
+            crn: (columns.values["enrolled"][i], columns.values["status"][i])
+            for i, crn in enumerate(columns.crns)
+            if columns.present[i]
+        }
+        assert offered == {"1": (20, "OPEN"), "3": (6, "OPEN"), "4": (0, "OPEN")}
+        assert len(history.times) == 3
+
+    def test_section_curve(self, snapshots, temp_dir):
+        """Test a section's fill rate at each snapshot it is offered in."""
+        history = EnrollmentHistory(temp_dir / "history.jsonl")
+        history.import_snapshots([snapshots])
+
+        curve = history.section_curve("1")
+
+        assert [p.fill_rate for p in curve] == [0.25, 0.3, 0.5]
+        assert curve[0].waitlist is None
+        assert [p.time for p in history.section_curve("2")] == [
+            "2025-08-01T09:00:00",
+            "2025-08-01T10:00:00",
+        ]
+        with pytest.raises(KeyError):
+            history.section_curve("9")
+
+    def test_subject_curve(self, snapshots, temp_dir):
+        """Test a subject's sections are summed at each snapshot."""
+        history = EnrollmentHistory(temp_dir / "history.jsonl")
+        history.import_snapshots([snapshots])
+
+        curve = history.subject_curve("MATH")
+
+        assert [(p.enrolled, p.capacity, p.sections) for p in curve] == [
+            (40, 70, 2),
+            (42, 70, 2),
+            (20, 60, 2),
+        ]
+
+    def test_restored_section(self, temp_dir):
+        """Test a section dropped and offered again keeps its history."""
+        history = EnrollmentHistory(temp_dir / "history.jsonl")
+        history.append({"1": ("MATH", "101", 5, 10, None, "OPEN")}, "t1")
+        history.append({}, "t2")
+        history.append({"1": ("MATH", "101", 5, 10, None, "OPEN")}, "t3")
+
+        assert history.records[2]["restored"] == [0]
+        assert [p.time for p in history.section_curve("1")] == ["t1", "t3"]
+
+    def test_import_is_incremental(self, snapshots, temp_dir):
+        """Test importing again only reads new snapshots."""
+        path = temp_dir / "history.jsonl"
+        EnrollmentHistory(path).import_snapshots([snapshots])
+        write_capture(snapshots, "20250801_120000", ("1", "MATH", 21, 40, "OPEN"))
+
+        imported = EnrollmentHistory(path).import_snapshots([snapshots])
+
+        assert [p.name for p in imported] == ["schedule_202570_20250801_120000.json"]
+        assert len(history_lines(path)) == 5
+
+    def test_older_snapshot_is_rejected(self, temp_dir):
+        """Test the store only appends newer snapshots."""
+        history = EnrollmentHistory(temp_dir / "history.jsonl")
+        history.append({}, "2025-08-01T10:00:00")
+
+        with pytest.raises(ValueError, match="not newer"):
+            history.append({}, "2025-08-01T09:00:00")
+
+    def test_failed_append_leaves_no_trace(self, temp_dir, monkeypatch):
+        """Test a snapshot that fails to be written is not half-recorded."""
+        history = EnrollmentHistory(temp_dir / "history.jsonl")
+        history.append({"1": ("MATH", "101", 5, 10, None, "OPEN")}, "t1")
+
+        def broken_write(_self, _record):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(EnrollmentHistory, "_write", broken_write)
+            with pytest.raises(OSError):
+                history.append({"2": ("MATH", "102", 3, 10, None, "OPEN")}, "t2")
+        history.append({"3": ("MATH", "103", 7, 10, None, "OPEN")}, "t3")
+
+        assert history.records[-1]["new"] == [["3", "MATH", "103"]]
+        assert [p.enrolled for p in history.section_curve("3")] == [7]
+        with pytest.raises(KeyError):
+            history.section_curve("2")
+        reloaded = EnrollmentHistory(temp_dir / "history.jsonl")
+        assert reloaded.records == history.records
+
+    def test_torn_line_is_overwritten(self, snapshots, temp_dir):
+        """Test a line cut off by a crash is dropped on the next append."""
+        path = temp_dir / "history.jsonl"
+        EnrollmentHistory(path).import_snapshots([snapshots])
+        with open(path, "a") as f:
+            f.write('{"time": "2025-08-01T12:00:00", "enrol')
+
+        history = EnrollmentHistory(path)
+        history.append({}, "2025-08-01T12:30:00")
+
+        lines = history_lines(path)
+        assert len(lines) == 5
+        assert lines[-1] == {"time": "2025-08-01T12:30:00", "removed": [0, 2, 1]}
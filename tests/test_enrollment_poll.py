@@ -0,0 +1,267 @@
+"""Tests for live enrollment polling."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from src.enrollment_poll import (
+    DELTA_NAME,
+    SEATS_NAME,
+    EnrollmentPoller,
+    current_term,
+    diff_seats,
+    poll_enrollment,
+    seat_counts,
+)
+
+from .test_banner_download import BannerServer
+
+
+def crn_row(crn, enrolled=10, capacity=30, waitlist=0):
+    """Build the seat fields of a scheduleCRNs row."""
+    return {
+        "CRN": crn,
+        "SSBSECT_ENRL": enrolled,
+        "SSBSECT_MAX_ENRL": capacity,
+        "SSBSECT_SEATS_AVAIL": capacity - enrolled,
+        "SSBSECT_WAIT_COUNT": waitlist,
+    }
+
+
+def write_feed(path, rows):
+    """Write a feed and give it a new modification time."""
+    path.write_text(json.dumps(rows))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def read(path):
+    """Load a published file."""
+    return json.loads(path.read_text())
+
+
+class TestSeatCounts:
+    """Test extracting and comparing seat counts."""
+
+    def test_banner_feed(self):
+        """Test scheduleCRNs rows give counts sorted by CRN."""
+        rows = [crn_row("70002", enrolled=30, waitlist=4), crn_row("70001")]
+
+        assert seat_counts(rows) == {
+            "70001": [10, 30, 20, 0],
+            "70002": [30, 30, 0, 4],
+        }
+
+    def test_rio_hondo_capture(self):
+        """Test Rio Hondo captures have no waitlist count."""
+        capture = {
+            "courses": [
+                {
+                    "crn": 75065,
+                    "enrollment": {"capacity": 40, "actual": 38, "remaining": 2},
+                }
+            ]
+        }
+
+        assert seat_counts(capture) == {"75065": [38, 40, 2, None]}
+
+    def test_unknown_feed(self):
+        """Test data that is neither feed is rejected."""
+        with pytest.raises(ValueError, match="scheduleCRNs"):
+            seat_counts({"rows": []})
+
+    def test_diff(self):
+        """Test changed, new and removed CRNs are reported."""
+        old = {"1": [1, 2, 1, 0], "2": [2, 2, 0, 0], "3": [0, 5, 5, 0]}
+        new = {"1": [1, 2, 1, 0], "2": [2, 2, 0, 1], "4": [0, 5, 5, 0]}
+
+        assert diff_seats(old, new) == (
+            {"2": [2, 2, 0, 1], "4": [0, 5, 5, 0]},
+            ["3"],
+        )
+
+    def test_current_term(self):
+        """Test the newest listed term is current."""
+        terms = [{"SOBTERM_TERM_CODE": "202550"}, {"SOBTERM_TERM_CODE": "202570"}]
+
+        assert current_term(terms) == "202570"
+        with pytest.raises(ValueError):
+            current_term([])
+
+
+class TestEnrollmentPoller:
+    """Test polling a local feed."""
+
+    @pytest.fixture
+    def feed(self, temp_dir):
+        """Provide a feed with two sections."""
+        path = temp_dir / "crns.json"
+        write_feed(path, [crn_row("70001"), crn_row("70002")])
+        return path
+
+    def poll(self, feed, output_dir, **options):
+        """Poll a feed once."""
+        [result] = poll_enrollment(str(feed), output_dir, polls=1, **options)
+        return result
+
+    def test_first_poll(self, feed, temp_dir):
+        """Test the first poll publishes counts and no deltas."""
+        result = self.poll(feed, temp_dir / "live")
+
+        assert result.published and result.sequence == 1
+        seats = read(temp_dir / "live" / SEATS_NAME)
+        assert seats["sequence"] == 1
+        assert seats["fields"] == ["enrolled", "capacity", "available", "waitlist"]
+        assert seats["seats"] == {"70001": [10, 30, 20, 0], "70002": [10, 30, 20, 0]}
+        delta = read(temp_dir / "live" / DELTA_NAME)
+        assert delta["sequence"] == delta["since"] == 1
+        assert delta["deltas"] == []
+
+    def test_changes_are_published_as_deltas(self, feed, temp_dir):
+        """Test later polls publish only the sections that changed."""
+        output_dir = temp_dir / "live"
+        self.poll(feed, output_dir)
+        write_feed(feed, [crn_row("70001", enrolled=11), crn_row("70003")])
+
+        result = self.poll(feed, output_dir)
+
+        assert (result.sequence, result.changed, result.removed) == (2, 2, 1)
+        delta = read(output_dir / DELTA_NAME)
+        assert delta["since"] == 1
+        [entry] = delta["deltas"]
+        assert entry["sequence"] == 2
+        assert entry["changed"] == {
+            "70001": [11, 30, 19, 0],
+            "70003": [10, 30, 20, 0],
+        }
+        assert entry["removed"] == ["70002"]
+        assert set(read(output_dir / SEATS_NAME)["seats"]) == {"70001", "70003"}
+
+    def test_unchanged_counts_are_not_published(self, feed, temp_dir):
+        """Test a feed whose counts did not change leaves the files alone."""
+        output_dir = temp_dir / "live"
+        self.poll(feed, output_dir)
+        before = (output_dir / SEATS_NAME).stat().st_mtime_ns
+        # Rewritten with the same counts
+        write_feed(feed, [crn_row("70001"), crn_row("70002")])
+
+        result = self.poll(feed, output_dir)
+
+        assert not result.published and result.sequence == 1
+        assert (output_dir / SEATS_NAME).stat().st_mtime_ns == before
+
+    def test_history_is_bounded(self, feed, temp_dir):
+        """Test old deltas are dropped and ``since`` moves forward."""
+        output_dir = temp_dir / "live"
+        for enrolled in range(10, 15):
+            write_feed(feed, [crn_row("70001", enrolled=enrolled)])
+            self.poll(feed, output_dir, history=2)
+
+        delta = read(output_dir / DELTA_NAME)
+        assert delta["sequence"] == 5
+        assert [d["sequence"] for d in delta["deltas"]] == [4, 5]
+        assert delta["since"] == 3
+
+    def test_no_history(self, feed, temp_dir):
+        """Test a history of 0 keeps no deltas at all."""
+        output_dir = temp_dir / "live"
+        for enrolled in range(10, 13):
+            write_feed(feed, [crn_row("70001", enrolled=enrolled)])
+            self.poll(feed, output_dir, history=0)
+
+        delta = read(output_dir / DELTA_NAME)
+        assert delta["deltas"] == []
+        assert delta["since"] == delta["sequence"] == 3
+
+        with pytest.raises(ValueError, match="negative"):
+            EnrollmentPoller(str(feed), output_dir, history=-1)
+
+    def test_deltas_replay_to_current_counts(self, feed, temp_dir):
+        """Test a client applying the deltas ends up with the current counts."""
+        output_dir = temp_dir / "live"
+        self.poll(feed, output_dir)
+        client = read(output_dir / SEATS_NAME)
+        write_feed(feed, [crn_row("70001", enrolled=12)])
+        self.poll(feed, output_dir)
+        write_feed(feed, [crn_row("70001", enrolled=13), crn_row("70004")])
+        self.poll(feed, output_dir)
+
+        seats = client["seats"]
+        for delta in read(output_dir / DELTA_NAME)["deltas"]:
+            if delta["sequence"] > client["sequence"]:
+                seats.update(delta["changed"])
+                for crn in delta["removed"]:
+                    del seats[crn]
+        assert seats == read(output_dir / SEATS_NAME)["seats"]
+
+    def test_resumes_from_published_files(self, feed, temp_dir):
+        """Test a restarted poller continues the sequence and diffs."""
+        output_dir = temp_dir / "live"
+        self.poll(feed, output_dir)
+        write_feed(feed, [crn_row("70001", enrolled=11), crn_row("70002")])
+        self.poll(feed, output_dir)
+        write_feed(feed, [crn_row("70001", enrolled=11), crn_row("70002", enrolled=9)])
+
+        result = self.poll(feed, output_dir)
+
+        assert (result.sequence, result.changed) == (3, 1)
+        assert [d["sequence"] for d in read(output_dir / DELTA_NAME)["deltas"]] == [
+            2,
+            3,
+        ]
+
+    def test_bad_feed_keeps_published_files(self, feed, temp_dir):
+        """Test a malformed feed is reported and nothing is published."""
+        output_dir = temp_dir / "live"
+        self.poll(feed, output_dir)
+        feed.write_text('[{"CRN": "70001"')
+
+        result = self.poll(feed, output_dir)
+
+        assert "JSONDecodeError" in result.error
+        assert read(output_dir / SEATS_NAME)["sequence"] == 1
+
+
+class SeatServer(BannerServer):
+    """Banner stand-in serving a scheduleCRNs feed."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = [crn_row("70001"), crn_row("70002")]
+
+    def body(self, domain, term):
+        if domain == "scheduleCRNs":
+            return json.dumps(self.rows).encode()
+        return super().body(domain, term)
+
+
+@pytest.fixture
+def server():
+    """Run a SeatServer in a background thread."""
+    server = SeatServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestPollingUrls:
+    """Test polling a Banner feed over HTTP."""
+
+    @pytest.mark.asyncio
+    async def test_conditional_polls(self, server, temp_dir):
+        """Test unchanged feeds are answered with 304 and changes published."""
+        url = server.base_url + "scheduleCRNs?term_code=202570"
+        async with EnrollmentPoller(url, temp_dir) as poller:
+            results = await poller.run(interval=0, polls=2)
+            server.rows[0] = crn_row("70001", enrolled=30, waitlist=2)
+            changed = await poller.poll()
+
+        assert [r.published for r in results] == [True, False]
+        assert server.not_modified == 1
+        assert changed.published and changed.changed == 1
+        [delta] = read(temp_dir / DELTA_NAME)["deltas"]
+        assert delta["changed"] == {"70001": [30, 30, 0, 2]}
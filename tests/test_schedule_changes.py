@@ -0,0 +1,351 @@
+"""Tests for schedule change sets."""
+
+import copy
+import json
+import random
+from dataclasses import asdict
+
+import pytest
+
+from benchmarks.synthetic import generate_schedule
+from src.data_utils import load_schedule_data
+from src.schedule_changes import (
+    ChangeSet,
+    apply_change_set,
+    diff_schedules,
+    format_change_set,
+    patch_schedule_file,
+    section_change_kinds,
+    summarize,
+)
+
+
+@pytest.fixture
+def base():
+    """Provide a schedule with courses ACCT-100 and ART-100, four sections each."""
+    return generate_schedule(8)["schedule"]
+
+
+def load(data, temp_dir, name):
+    """Load schedule data through a file, like the CLI does."""
+    path = temp_dir / name
+    path.write_text(json.dumps({"schedule": data}))
+    return load_schedule_data(path)
+
+
+def diff(old, new, temp_dir):
+    """Diff two schedule dictionaries."""
+    return diff_schedules(
+        load(old, temp_dir, "old.json"), load(new, temp_dir, "new.json")
+    )
+
+
+def sections(data):
+    """Map CRNs to section dictionaries."""
+    return {s["crn"]: s for course in data["courses"] for s in course["sections"]}
+
+
+class TestDiffSchedules:
+    """Test aligning and comparing schedules."""
+
+    def test_identical(self, base, temp_dir):
+        """Test identical schedules have no changes."""
+        change_set = diff(base, copy.deepcopy(base), temp_dir)
+
+        assert not change_set
+        assert change_set.changes == []
+
+    def test_section_updates(self, base, temp_dir):
+        """Test changed sections are reported field by field."""
+        new = copy.deepcopy(base)
+        section = sections(new)["10001"]
+        section["status"] = "Cancelled"
+        section["enrollment"]["enrolled"] += 2
+        section["instructors"] = ["5"]
+
+        [change] = diff(base, new, temp_dir).changes
+
+        assert change["op"] == "update"
+        assert (change["kind"], change["key"]) == ("section", "10001")
+        assert change["course_key"] == "ACCT-100"
+        old = sections(base)["10001"]
+        assert change["fields"] == {
+            "enrollment.enrolled": [
+                old["enrollment"]["enrolled"],
+                old["enrollment"]["enrolled"] + 2,
+            ],
+            "instructors": [old["instructors"], ["5"]],
+            "status": [old["status"], "Cancelled"],
+        }
+        assert section_change_kinds(change["fields"]) == [
+            "status",
+            "instructor",
+            "enrollment",
+        ]
+
+    def test_meeting_changes(self, base, temp_dir):
+        """Test room and time changes are told apart."""
+        new = copy.deepcopy(base)
+        sections(new)["10000"]["meetings"][0]["location"]["room"] = "999"
+        sections(new)["10002"]["meetings"][0]["start_time"] = "06:00"
+
+        changes = {c["key"]: c for c in diff(base, new, temp_dir).changes}
+
+        assert section_change_kinds(changes["10000"]["fields"]) == ["room"]
+        assert section_change_kinds(changes["10002"]["fields"]) == ["time"]
+
+    def test_added_and_removed_sections(self, base, temp_dir):
+        """Test sections are aligned by CRN, not position."""
+        new = copy.deepcopy(base)
+        acct = new["courses"][0]["sections"]
+        removed = acct.pop(0)
+        acct.insert(2, dict(copy.deepcopy(removed), crn="20000"))
+
+        change_set = diff(base, new, temp_dir)
+
+        assert [(c["op"], c["key"]) for c in change_set.changes] == [
+            ("remove", "10000"),
+            ("add", "20000"),
+        ]
+        added = change_set.changes[1]
+        assert added["course_key"] == "ACCT-100"
+        assert added["after"] == "10002"
+        assert added["value"]["crn"] == "20000"
+
+    def test_first_section_of_course_has_no_predecessor(self, base, temp_dir):
+        """Test ``after`` never points into another course."""
+        new = copy.deepcopy(base)
+        art = new["courses"][1]["sections"]
+        art.insert(0, dict(copy.deepcopy(art[0]), crn="20000"))
+
+        [added] = diff(base, new, temp_dir).changes
+
+        assert added["course_key"] == "ART-100"
+        assert added["after"] is None
+
+    def test_moved_section(self, base, temp_dir):
+        """Test a section moved between courses is removed and added."""
+        new = copy.deepcopy(base)
+        moved = new["courses"][0]["sections"].pop()
+        new["courses"][1]["sections"].append(moved)
+
+        changes = diff(base, new, temp_dir).changes
+
+        assert [(c["op"], c["key"], c["course_key"]) for c in changes] == [
+            ("remove", "10003", "ACCT-100"),
+            ("add", "10003", "ART-100"),
+        ]
+
+    def test_course_changes(self, base, temp_dir):
+        """Test added courses carry their sections, removed ones drop theirs."""
+        new = copy.deepcopy(base)
+        new["courses"][0]["title"] = "Accounting Principles"
+        art = new["courses"].pop()
+        new["courses"].append(dict(art, course_key="ART-101", course_number="101"))
+
+        change_set = diff(base, new, temp_dir)
+
+        assert [(c["op"], c["kind"], c["key"]) for c in change_set.changes] == [
+            ("remove", "course", "ART-100"),
+            ("update", "course", "ACCT-100"),
+            ("add", "course", "ART-101"),
+        ]
+        update, added = change_set.changes[1:]
+        assert update["fields"] == {
+            "title": [base["courses"][0]["title"], "Accounting Principles"]
+        }
+        assert added["after"] == "ACCT-100"
+        assert len(added["value"]["sections"]) == 4
+
+    def test_subjects_instructors_and_metadata(self, base, temp_dir):
+        """Test reference lists and metadata are compared too."""
+        new = copy.deepcopy(base)
+        new["metadata"]["last_updated"] = "2025-02-01T00:00:00"
+        new["subjects"][0]["name"] = "Accountancy"
+        new["instructors"].pop()
+
+        change_set = diff(base, new, temp_dir)
+
+        assert change_set.new_version == "2025-02-01T00:00:00"
+        assert change_set.metadata == {
+            "last_updated": [base["metadata"]["last_updated"], "2025-02-01T00:00:00"]
+        }
+        assert [(c["op"], c["kind"]) for c in change_set.changes] == [
+            ("update", "subject"),
+            ("remove", "instructor"),
+        ]
+
+
+class TestChangeSet:
+    """Test serializing and reporting change sets."""
+
+    @pytest.fixture
+    def change_set(self, base, temp_dir):
+        """Provide a change set with section and course changes."""
+        new = copy.deepcopy(base)
+        sections(new)["10001"]["status"] = "Closed"
+        sections(new)["10001"]["meetings"][0]["location"]["room"] = "999"
+        new["courses"][1]["sections"].pop()
+        return diff(base, new, temp_dir)
+
+    def test_round_trip(self, change_set):
+        """Test change sets survive JSON serialization."""
+        data = json.loads(json.dumps(change_set.to_dict()))
+
+        assert ChangeSet.from_dict(data) == change_set
+        with pytest.raises(ValueError, match="version"):
+            ChangeSet.from_dict({**data, "version": 99})
+
+    def test_summary(self, change_set):
+        """Test operations are counted per kind."""
+        summary = summarize(change_set)
+
+        assert summary["section"] == {
+            "added": 0,
+            "removed": 1,
+            "changed": 1,
+            "moved": 0,
+        }
+        assert summary["course"] == {"added": 0, "removed": 0, "changed": 0, "moved": 0}
+        assert summary["section_changes"]["room"] == 1
+        assert summary["section_changes"]["status"] == 1
+
+    def test_report(self, change_set):
+        """Test the human-readable report lists each change."""
+        lines = list(format_change_set(change_set))
+
+        assert "  Sections: 0 added, 1 removed, 1 changed (1 status, 1 room)" in lines
+        assert "- section 10007 (ART-100)" in lines
+        [update] = [line for line in lines if line.startswith("~ section 10001")]
+        assert update.endswith('; status "Waitlist" -> "Closed"')
+        assert "meetings TR 09:00-10:50 B0 101 -> TR 09:00-10:50 B0 999" in update
+
+
+class TestApplyChangeSet:
+    """Test patching schedules with change sets."""
+
+    def patch(self, old, new, temp_dir):
+        """Apply the diff of two schedules to the first one."""
+        schedule = load(old, temp_dir, "base.json")
+        apply_change_set(schedule, diff(old, new, temp_dir))
+        return asdict(schedule)
+
+    def loaded(self, data, temp_dir):
+        """Schedule data with the defaults loading fills in."""
+        return asdict(load(data, temp_dir, "expected.json"))
+
+    def test_round_trip(self, base, temp_dir):
+        """Test patching the old schedule gives the new one, order included."""
+        new = copy.deepcopy(base)
+        new["metadata"]["last_updated"] = "2025-02-01T00:00:00"
+        new["subjects"][0]["name"] = "Accountancy"
+        acct, art = (course["sections"] for course in new["courses"])
+        acct[1]["status"] = "Closed"
+        acct[2]["meetings"][0]["location"]["room"] = "999"
+        art.insert(0, acct.pop())
+        acct.insert(1, dict(copy.deepcopy(acct[0]), crn="20000"))
+        new["courses"].insert(
+            0, dict(copy.deepcopy(new["courses"][1]), course_key="AA-100")
+        )
+        new["courses"][0]["sections"] = [dict(art[1], crn="30000")]
+
+        assert self.patch(base, new, temp_dir) == self.loaded(new, temp_dir)
+
+    def test_reordered(self, base, temp_dir):
+        """Test reordered records are moved, and only as few as needed."""
+        new = copy.deepcopy(base)
+        new["courses"].reverse()
+        new["subjects"].reverse()
+        acct = new["courses"][1]["sections"]
+        acct.append(acct.pop(0))
+
+        change_set = diff(base, new, temp_dir)
+
+        assert {c["op"] for c in change_set.changes} == {"move"}
+        # Reversing n records keeps one in place
+        codes = [subject["code"] for subject in new["subjects"]]
+        assert [c["key"] for c in change_set.operations("subject")] == codes[:-1]
+        moves = [
+            (c["kind"], c["key"], c["after"])
+            for c in change_set.changes
+            if c["kind"] != "subject"
+        ]
+        assert moves == [("course", "ART-100", None), ("section", "10000", "10003")]
+        assert summarize(change_set)["course"]["moved"] == 1
+        assert "> section 10000 (ACCT-100): after 10003" in format_change_set(
+            change_set
+        )
+        assert self.patch(base, new, temp_dir) == self.loaded(new, temp_dir)
+
+    def test_shuffled(self, temp_dir):
+        """Test patching reproduces records shuffled, added and removed at once."""
+        old = generate_schedule(64)["schedule"]
+        new = copy.deepcopy(old)
+        random.Random(7).shuffle(new["courses"])
+        for course in new["courses"]:
+            random.Random(course["course_key"]).shuffle(course["sections"])
+            added = dict(course["sections"].pop(), crn=f"X-{course['course_key']}")
+            course["sections"].insert(2, added)
+        del new["courses"][3]
+
+        assert self.patch(old, new, temp_dir) == self.loaded(new, temp_dir)
+
+    def test_removed_course(self, base, temp_dir):
+        """Test removing a course drops its sections from the index."""
+        new = copy.deepcopy(base)
+        art = new["courses"].pop()
+        new["courses"][0]["sections"].append(art["sections"][0])
+
+        assert self.patch(base, new, temp_dir) == self.loaded(new, temp_dir)
+
+    def test_conflicts(self, base, temp_dir):
+        """Test a base that does not match the change set is refused."""
+        new = copy.deepcopy(base)
+        sections(new)["10001"]["status"] = "Closed"
+        new["courses"][1]["sections"].pop()
+        change_set = diff(base, new, temp_dir)
+        stale = copy.deepcopy(base)
+        sections(stale)["10001"]["status"] = "Open"
+        del stale["courses"][1]["sections"][-1]
+
+        with pytest.raises(ValueError, match="status is not 'Waitlist'") as error:
+            apply_change_set(load(stale, temp_dir, "stale.json"), change_set)
+        assert "section 10007: not in the base schedule" in str(error.value)
+
+        schedule = load(stale, temp_dir, "stale.json")
+        apply_change_set(schedule, change_set, strict=False)
+        assert asdict(schedule) == self.loaded(new, temp_dir)
+
+    def test_forced_add_replaces(self, base, temp_dir):
+        """Test adding a record that exists replaces it unless strict."""
+        new = copy.deepcopy(base)
+        new["courses"][0]["sections"].append(
+            dict(copy.deepcopy(sections(base)["10000"]), crn="20000")
+        )
+        change_set = diff(base, new, temp_dir)
+        schedule = load(new, temp_dir, "new.json")
+
+        with pytest.raises(ValueError, match="already in the base"):
+            apply_change_set(schedule, change_set)
+
+        schedule = load(new, temp_dir, "new.json")
+        apply_change_set(schedule, change_set, strict=False)
+        assert asdict(schedule) == self.loaded(new, temp_dir)
+
+    def test_patch_file(self, base, temp_dir):
+        """Test a patched file is replaced whole and a failed patch leaves it."""
+        new = copy.deepcopy(base)
+        sections(new)["10001"]["status"] = "Closed"
+        changes = temp_dir / "changes.json"
+        changes.write_text(json.dumps(diff(base, new, temp_dir).to_dict()))
+        path = temp_dir / "schedule.json"
+        path.write_text(json.dumps({"schedule": base}))
+
+        patch_schedule_file(path, changes)
+
+        assert json.loads(path.read_text()) == {"schedule": self.loaded(new, temp_dir)}
+        assert [p.name for p in temp_dir.iterdir() if p.name.startswith(".")] == []
+        before = path.read_text()
+        with pytest.raises(ValueError, match="does not apply"):
+            patch_schedule_file(path, changes)
+        assert path.read_text() == before
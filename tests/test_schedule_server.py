@@ -0,0 +1,175 @@
+"""Tests for the schedule query daemon."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import generate_schedule
+from src.data_utils import load_schedule_data, save_schedule_data
+from src.schedule_server import ScheduleServer, parse_query, request_courses
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def schedule_file(temp_dir):
+    """Provide a schedule file with courses ACCT-100 to BIOL-100."""
+    path = temp_dir / "schedule.json"
+    path.write_text(json.dumps(generate_schedule(16)))
+    return path
+
+
+@pytest.fixture
+def server(schedule_file):
+    """Serve the schedule file from a background thread."""
+    server = ScheduleServer([schedule_file], port=0)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def query(server, path="/filter", **params):
+    """Query the server and return the response text."""
+    out = io.BytesIO()
+    request_courses(server.url, params, out, path)
+    return out.getvalue().decode("utf-8")
+
+
+class TestParseQuery:
+    """Test reading filter options from query parameters."""
+
+    def test_filters(self):
+        """Test parameters map onto FilterOptions."""
+        parsed = parse_query(
+            {"subject": "CS", "open_only": "1", "min_units": "3", "limit": "5"}
+        )
+
+        assert parsed.filters.subject == "CS"
+        assert parsed.filters.open_only is True
+        assert parsed.filters.units_min == 3.0
+        assert (parsed.offset, parsed.limit, parsed.format) == (0, 5, "jsonl")
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"subjects": "CS"}, {"limit": "-1"}, {"offset": "x"}, {"format": "xml"}],
+    )
+    def test_invalid(self, params):
+        """Test unknown and malformed parameters are rejected."""
+        with pytest.raises(ValueError):
+            parse_query(params)
+
+
+class TestScheduleServer:
+    """Test answering queries from loaded schedules."""
+
+    def test_filter(self, server, schedule_file):
+        """Test filtered courses are streamed as JSON Lines."""
+        text = query(server, file=schedule_file, subject="ART", open_only=True)
+
+        [course] = [json.loads(line) for line in text.splitlines()]
+        assert course["course_key"] == "ART-100"
+        assert {s["status"] for s in course["sections"]} == {"Open"}
+
+    def test_pages_and_text(self, server):
+        """Test paging, and the text summary of the command line."""
+        assert query(server, offset=1, limit=1, format="csv").count("ART-100") == 4
+
+        text = query(server, format="text")
+        assert text.endswith("Found 4 courses with 16 sections\n")
+
+    def test_facets(self, server):
+        """Test sections of the matching courses are counted per value."""
+        facets = json.loads(query(server, "/facets", subject="ACCT"))
+
+        assert (facets["courses"], facets["sections"]) == (1, 4)
+        assert facets["facets"]["subject"] == {"ACCT": 4}
+        assert sum(facets["facets"]["status"].values()) == 4
+
+    def test_reloads_changed_file(self, server, schedule_file):
+        """Test a file saved while serving is reloaded on the next query."""
+        query(server, subject="ACCT")
+        schedule = load_schedule_data(schedule_file)
+        schedule.courses[0].title = "Accounting Principles"
+        save_schedule_data(schedule, schedule_file)
+        # Make sure the stamp changes even within the filesystem's resolution
+        stat = schedule_file.stat()
+        os.utime(schedule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        [line] = query(server, subject="ACCT").splitlines()
+
+        assert json.loads(line)["title"] == "Accounting Principles"
+
+    def test_broken_file_keeps_previous_version(self, server, schedule_file):
+        """Test a file that fails to parse is served from memory instead."""
+        schedule_file.write_text('{"schedule": {"courses": [')
+
+        assert query(server, format="text").endswith("with 16 sections\n")
+
+    def test_failed_version_is_not_reloaded(self, server, schedule_file, monkeypatch):
+        """Test a broken file is parsed once, not on every query."""
+        schedule_file.write_text('{"schedule": {"courses": [')
+        loads = []
+
+        def load(path):
+            loads.append(path)
+            return load_schedule_data(path)
+
+        monkeypatch.setattr("src.schedule_server.load_schedule_data", load)
+        for _ in range(3):
+            query(server, format="text")
+
+        assert len(loads) == 1
+
+    def test_removed_file_keeps_previous_version(self, server, schedule_file):
+        """Test a file removed while serving is served from memory."""
+        schedule_file.unlink()
+
+        assert query(server, format="text").endswith("with 16 sections\n")
+
+    def test_only_served_files(self, server, temp_dir):
+        """Test files the server was not started with are refused."""
+        with pytest.raises(ValueError, match="Not served"):
+            query(server, file=temp_dir / "other.json")
+        with pytest.raises(ValueError, match="Unknown parameters"):
+            query(server, subjects="CS")
+
+
+class TestServerClient:
+    """Test schedule-filter --server from the command line."""
+
+    def run(self, *args):
+        """Run the schedule-filter command."""
+        return subprocess.run(
+            [sys.executable, "-m", "src.cli", "schedule-filter", *map(str, args)],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+
+    def test_output_replaced_only_on_success(self, server, schedule_file, temp_dir):
+        """Test a refused query leaves the previous output in place."""
+        output = temp_dir / "acct.jsonl"
+        args = ("--server", server.url, "--format", "jsonl", "--output", output)
+
+        completed = self.run(schedule_file, "--subject", "ACCT", *args)
+        assert completed.returncode == 0, completed.stderr
+        before = output.read_text()
+        assert json.loads(before)["course_key"] == "ACCT-100"
+
+        refused = self.run(temp_dir / "other.json", *args)
+
+        assert refused.returncode == 1
+        assert "Not served" in refused.stderr
+        assert output.read_text() == before
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            "acct.jsonl",
+            "schedule.json",
+        ]
@@ -1,6 +1,8 @@
 """Tests for schedule data utilities."""
 
+import gzip
 import json
+import os
 from datetime import datetime
 
 import pytest
@@ -239,6 +241,60 @@ class TestScheduleUtils:
         assert loaded_schedule.courses[0].course_key == "CS-101"
         assert len(loaded_schedule.courses[0].sections) == 2
 
+    def test_save_replaces_atomically(self, tmp_path, sample_schedule):
+        """Test saving renames a new file into place, keeping its mode."""
+        file_path = tmp_path / "courses.json"
+        file_path.write_text("old")
+        os.chmod(file_path, 0o640)
+        before = file_path.stat().st_ino
+
+        save_schedule_data(sample_schedule, file_path, fsync=True)
+
+        assert file_path.stat().st_ino != before
+        assert file_path.stat().st_mode & 0o777 == 0o640
+        assert load_schedule_data(file_path).courses[0].course_key == "CS-101"
+        assert [p.name for p in tmp_path.iterdir()] == ["courses.json"]
+
+    def test_new_file_mode_leaves_umask_alone(
+        self, tmp_path, sample_schedule, monkeypatch
+    ):
+        """Test a new file gets open()'s default mode without reading the umask."""
+        plain = tmp_path / "plain.json"
+        plain.write_text("{}")
+
+        def no_umask(_mask):
+            raise AssertionError("umask changed")
+
+        monkeypatch.setattr(os, "umask", no_umask)
+        file_path = tmp_path / "courses.json"
+        save_schedule_data(sample_schedule, file_path)
+
+        assert file_path.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+
+    def test_save_compressed_siblings(self, tmp_path, sample_schedule):
+        """Test precompressed siblings hold the same JSON."""
+        file_path = tmp_path / "courses.json"
+
+        save_schedule_data(sample_schedule, file_path, compress=[".gz"])
+
+        assert gzip.decompress((tmp_path / "courses.json.gz").read_bytes()) == (
+            file_path.read_bytes()
+        )
+        with pytest.raises(ValueError, match="Unknown"):
+            save_schedule_data(sample_schedule, file_path, compress=[".zip"])
+
+    def test_failed_save_keeps_file(self, tmp_path, sample_schedule):
+        """Test an error while writing leaves the old file and no temp files."""
+        file_path = tmp_path / "courses.json"
+        file_path.write_text("old")
+        sample_schedule.courses[-1].title = object()
+
+        with pytest.raises(TypeError):
+            save_schedule_data(sample_schedule, file_path)
+
+        assert file_path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["courses.json"]
+
     def test_filter_courses_by_subject(self, sample_schedule):
         """Test filtering courses by subject."""
         filters = FilterOptions(subject="CS")
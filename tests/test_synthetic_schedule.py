@@ -0,0 +1,51 @@
+"""Tests for the synthetic benchmark data generator."""
+
+import json
+from pathlib import Path
+
+from benchmarks.synthetic import (
+    generate_legacy_courses,
+    generate_schedule,
+    generate_standardized,
+)
+from src.data_utils import load_schedule_data
+from src.schema_validator import ExtensibleSchemaValidator
+from src.validators import CourseValidator
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class TestSyntheticSchedule:
+    """Test generated schedules are deterministic and valid."""
+
+    def test_deterministic(self):
+        """Test the same seed produces identical data."""
+        assert generate_schedule(50) == generate_schedule(50)
+        assert generate_schedule(50, seed=1) != generate_schedule(50, seed=0)
+
+    def test_section_count(self):
+        """Test the requested number of sections is generated."""
+        courses = generate_schedule(101)["schedule"]["courses"]
+        assert sum(len(course["sections"]) for course in courses) == 101
+
+    def test_schedule_loads(self, temp_dir):
+        """Test the model layout loads with load_schedule_data."""
+        path = temp_dir / "schedule.json"
+        path.write_text(json.dumps(generate_schedule(40)))
+
+        schedule = load_schedule_data(path)
+        assert sum(len(c.sections) for c in schedule.courses) == 40
+
+    def test_standardized_is_schema_valid(self):
+        """Test the standardized layout passes strict schema validation."""
+        validator = ExtensibleSchemaValidator(
+            PROJECT_ROOT / "data" / "schemas" / "base.json",
+            PROJECT_ROOT / "colleges" / "rio-hondo" / "config.json",
+        )
+        is_valid, errors = validator.validate(generate_standardized(40), strict=True)
+        assert is_valid, errors
+
+    def test_legacy_courses_validate(self):
+        """Test the legacy layout passes per-record validation."""
+        result = CourseValidator().validate_courses(generate_legacy_courses(40))
+        assert result.is_valid
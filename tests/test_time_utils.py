@@ -0,0 +1,63 @@
+"""Tests for time and meeting-day parsing."""
+
+from datetime import datetime
+
+import pytest
+
+from src.time_utils import (
+    MASK_DAYS,
+    clock_to_minutes,
+    days_to_mask,
+    mask_to_days,
+    normalize_time,
+)
+
+
+class TestClockTimes:
+    """Test parsing times in export formats."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("06:00pm", 18 * 60),
+            ("6:05 PM", 18 * 60 + 5),
+            ("12:00am", 0),
+            ("12:30pm", 12 * 60 + 30),
+            ("18:00", 18 * 60),
+            ("0920", 9 * 60 + 20),
+            ("13:00pm", None),
+            ("2400", None),
+            ("TBA", None),
+        ],
+    )
+    def test_clock_to_minutes(self, value, expected):
+        """Test 12-hour, 24-hour and four-digit times."""
+        assert clock_to_minutes(value) == expected
+
+    @pytest.mark.parametrize("hour", range(1, 13))
+    @pytest.mark.parametrize("suffix", ["am", "pm", "AM"])
+    def test_matches_strptime(self, hour, suffix):
+        """Test 12-hour times match datetime.strptime."""
+        value = f"{hour:02d}:45{suffix}"
+        expected = datetime.strptime(value, "%I:%M%p").strftime("%H:%M")
+        assert normalize_time(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "ARR"])
+    def test_normalize_invalid(self, value):
+        """Test empty and non-time values normalize to None."""
+        assert normalize_time(value) is None
+
+
+class TestDayMasks:
+    """Test meeting-day bitmasks."""
+
+    def test_round_trip(self):
+        """Test day strings map to masks and back in week order."""
+        assert mask_to_days(days_to_mask("RT")) == ["T", "R"]
+        assert mask_to_days(days_to_mask(["M", "W", "F"])) == ["M", "W", "F"]
+
+    def test_table_covers_every_mask(self):
+        """Test the precomputed table has an entry for every day combination."""
+        assert len(MASK_DAYS) == 128
+        assert MASK_DAYS[0] == ()
+        assert MASK_DAYS[127] == ("M", "T", "W", "R", "F", "S", "U")
@@ -0,0 +1,787 @@
+"""Tests for college data transformers."""
+
+import inspect
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from src import college_rules, time_utils
+from src.data_utils import write_json_stream
+from src.schema_validator import ExtensibleSchemaValidator
+from src.transformers import base_transformer, rio_hondo_transformer
+from src.transformers.base_transformer import (
+    BaseTransformer,
+    compile_field_mapping,
+    compile_path,
+    compile_template,
+    sort_courses,
+)
+from src.transformers.north_orange_county_transformer import (
+    NorthOrangeCountyTransformer,
+    _long_title,
+    _to_date,
+)
+from src.transformers.rio_hondo_transformer import RioHondoTransformer
+from src.transformers.section_cache import (
+    SectionCache,
+    row_digest,
+    transformer_fingerprint,
+)
+from src.transformers.west_valley_transformer import WestValleyTransformer
+from src.validators import StandardizedValidator
+
+PROJECT_ROOT = Path(__file__).parent.parent
+COLLEGES_DIR = PROJECT_ROOT / "colleges"
+WEST_VALLEY_CONFIG = COLLEGES_DIR / "west-valley-mission" / "config.json"
+WEST_VALLEY_DATA = (
+    PROJECT_ROOT / "ccc-schedule-examples" / "west-valley-mission" / "data"
+)
+
+NORTH_ORANGE_COUNTY_CONFIG = COLLEGES_DIR / "north-orange-county" / "config.json"
+NORTH_ORANGE_COUNTY_DATA = (
+    PROJECT_ROOT / "ccc-schedule-examples" / "north-orange-county" / "data"
+)
+
+RIO_HONDO_CONFIG = COLLEGES_DIR / "rio-hondo" / "config.json"
+
+
+class MappingOnlyTransformer(BaseTransformer):
+    """Transformer relying only on the configured data mappings."""
+
+    def _extract_term_info(self, _input_data):
+        return {}
+
+    def _transform_courses(self, _input_data):
+        return []
+
+    def _transform_meetings(self, _section_data):
+        return []
+
+    def _transform_instructor(self, _section_data):
+        return None
+
+    def _transform_dates(self, _section_data):
+        return None
+
+
+@pytest.fixture
+def banner_section():
+    """Provide a Banner-style section row."""
+    return {
+        "CRN": "40001",
+        "SSBSECT_SSTS_CODE": "C",
+        "SSBSECT_INSM_CODE": "ONL",
+        "SSBSECT_ENRL": 30,
+        "SSBSECT_MAX_ENRL": 30,
+        "SSBSECT_SEATS_AVAIL": 0,
+        "SSBSECT_CAMP_CODE": "1",
+        "SSBSECT_PTRM_CODE": "1",
+        "SSBSECT_WAIT_COUNT": None,
+    }
+
+
+class TestFieldMappingCompilation:
+    """Test compiling data mappings into getters."""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("crn", "12345"),
+            ("enrollment.actual", 12),
+            ("enrollment.missing", None),
+            ("crn.value", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_compile_path(self, path, expected):
+        """Test compiled paths match nested lookups."""
+        data = {"crn": "12345", "enrollment": {"actual": 12}}
+        assert compile_path(path)(data) == expected
+
+    def test_value_mapping(self):
+        """Test value-mapping tables with pass-through for unknown values."""
+        get_status = compile_field_mapping(
+            {"field": "code", "mapping": {"A": "Open", "C": "Closed"}}
+        )
+
+        assert get_status({"code": "A"}) == "Open"
+        assert get_status({"code": "Z"}) == "Z"
+        assert get_status({}) is None
+
+    @pytest.mark.parametrize("mapping", [None, 0, {"mapping": {"A": "B"}}])
+    def test_empty_mappings(self, mapping):
+        """Test mappings without a source field return None."""
+        assert compile_field_mapping(mapping)({"A": "A"}) is None
+
+    @pytest.mark.parametrize(
+        "college", ["west-valley-mission", "north-orange-county", "rio-hondo"]
+    )
+    def test_matches_map_field(self, college, banner_section):
+        """Test compiled getters agree with the interpreted mapping."""
+        transformer = MappingOnlyTransformer(COLLEGES_DIR / college / "config.json")
+        section_mapping = transformer.mappings["section"]
+
+        for name, mapping in section_mapping["attributes"].items():
+            getter = dict(transformer._attribute_getters)[name]
+            assert getter(banner_section) == transformer._map_field(
+                banner_section, mapping
+            )
+        assert transformer._get_status(banner_section) == transformer._map_field(
+            banner_section, section_mapping["status"]
+        )
+
+
+class TestTemplates:
+    """Test compiled course templates."""
+
+    @pytest.mark.parametrize(
+        "template, expected",
+        [
+            ("{{SUBJ_CODE}}-{{CRSE_NUMB}}", "MATH-001A"),
+            ("{{SUBJ_CODE}}{{CRSE_NUMB}}", "MATH001A"),
+            ("Course {{SUBJ_CODE}} ({{UNITS}} units)", "Course MATH (4.0 units)"),
+            ("{{MISSING}}-x", "-x"),
+            ("no placeholders", "no placeholders"),
+            ("{{ SUBJ_CODE }}", "{{ SUBJ_CODE }}"),
+        ],
+    )
+    def test_render(self, template, expected):
+        """Test templates render literals and field values in order."""
+        data = {"SUBJ_CODE": "MATH", "CRSE_NUMB": "001A", "UNITS": 4.0}
+        assert compile_template(template)(data) == expected
+
+    def test_cached_per_template(self):
+        """Test each template string is compiled once."""
+        template = "{{SUBJ_CODE}}-{{CRSE_NUMB}}"
+        assert compile_template(template) is compile_template(template)
+
+    def test_apply_template(self):
+        """Test the transformer helper uses the compiled formatter."""
+        transformer = MappingOnlyTransformer(
+            COLLEGES_DIR / "west-valley-mission" / "config.json"
+        )
+        template = transformer.mappings["course"]["course_id"]
+
+        assert (
+            transformer._apply_template(
+                template, {"SUBJ_CODE": "ENGL", "CRSE_NUMB": "001A"}
+            )
+            == "ENGL-001A"
+        )
+
+
+class TestBaseTransformerSections:
+    """Test section transformation through compiled mappings."""
+
+    def test_transform_section(self, banner_section):
+        """Test a Banner section is mapped through the West Valley config."""
+        transformer = MappingOnlyTransformer(
+            COLLEGES_DIR / "west-valley-mission" / "config.json"
+        )
+
+        section = transformer._transform_section(banner_section)
+
+        assert section == {
+            "crn": "40001",
+            "status": "Closed",
+            "instruction_mode": "ONL",
+            "enrollment": {"enrolled": 30, "capacity": 30, "available": 0},
+            "meetings": [],
+            "attributes": {"campus": "1", "part_of_term": "1"},
+        }
+
+
+class TestReproducibleOutput:
+    """Test byte-identical output for identical input."""
+
+    def courses(self, *ids):
+        """Build courses with sections listed in reverse CRN order."""
+        return [
+            {"course_id": course_id, "sections": [{"crn": "2"}, {"crn": "1"}]}
+            for course_id in ids
+        ]
+
+    def test_sort_courses(self):
+        """Test courses sort by ID and sections by CRN."""
+        courses = sort_courses(self.courses("MATH-190", "ENGL-101"))
+
+        assert [c["course_id"] for c in courses] == ["ENGL-101", "MATH-190"]
+        assert [s["crn"] for s in courses[0]["sections"]] == ["1", "2"]
+
+    def test_stream_sorts_unsorted_input(self):
+        """Test reproducible streams put unsorted courses in canonical order."""
+        transformer = RioHondoTransformer(RIO_HONDO_CONFIG)
+        transformer.reproducible = True
+        input_data = {
+            "term_code": "202570",
+            "collection_timestamp": "2025-07-23T17:40:56.146559",
+            "courses": [
+                collector_row("70003", subject="MATH"),
+                collector_row("70002", subject="ENGL", number="101"),
+                collector_row("70001", subject="ENGL", number="101"),
+            ],
+        }
+
+        streamed = transformer.transform_stream(input_data)
+
+        courses = list(streamed["schedule"]["courses"])
+        assert [c["course_id"] for c in courses] == ["ENGL-101", "MATH-190"]
+        assert [s["crn"] for s in courses[0]["sections"]] == ["70001", "70002"]
+
+    def test_rio_hondo_uses_collection_timestamp(self, temp_dir):
+        """Test two runs over the same snapshot write identical bytes."""
+        transformer = RioHondoTransformer(RIO_HONDO_CONFIG)
+        transformer.reproducible = True
+        path = temp_dir / "schedule.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "term_code": "202570",
+                    "collection_timestamp": "2025-07-23T17:40:56.146559",
+                    "courses": [collector_row("70002"), collector_row("70001")],
+                }
+            )
+        )
+
+        outputs = []
+        for _ in range(2):
+            buffer = io.StringIO()
+            streamed = transformer.transform_stream(transformer.load_input(path))
+            write_json_stream(streamed, buffer, indent=2)
+            outputs.append(buffer.getvalue())
+
+        expected = transformer.transform(json.loads(path.read_text()))
+        assert outputs[0] == outputs[1] == json.dumps(expected, indent=2)
+        metadata = expected["schedule"]["metadata"]
+        assert metadata["last_updated"] == "2025-07-23T17:40:56.146559"
+        (course,) = expected["schedule"]["courses"]
+        assert [s["crn"] for s in course["sections"]] == ["70001", "70002"]
+
+    def test_west_valley_uses_activity_date(self, banner_term):
+        """Test the latest section activity date stamps the output."""
+        transformer = WestValleyTransformer(WEST_VALLEY_CONFIG)
+        transformer.reproducible = True
+
+        output = transformer.transform(transformer.load_input(banner_term))
+
+        metadata = output["schedule"]["metadata"]
+        assert metadata["last_updated"] == "2025-07-18T03:43:37Z"
+        course_ids = [c["course_id"] for c in output["schedule"]["courses"]]
+        assert course_ids == sorted(course_ids)
+
+    def test_source_date_epoch(self, noccd_export, monkeypatch):
+        """Test exports without a timestamp need SOURCE_DATE_EPOCH."""
+        transformer = NorthOrangeCountyTransformer(NORTH_ORANGE_COUNTY_CONFIG)
+        transformer.reproducible = True
+        input_data = transformer.load_input(noccd_export)
+
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+        with pytest.raises(ValueError, match="SOURCE_DATE_EPOCH"):
+            transformer.transform(input_data)
+
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1750000000")
+        output = transformer.transform(input_data)
+        metadata = output["schedule"]["metadata"]
+        assert metadata["last_updated"] == "2025-06-15T15:06:40+00:00"
+
+
+class TestWestValleyTransformer:
+    """Test joining West Valley Banner files."""
+
+    @pytest.fixture
+    def transformer(self):
+        """Provide a West Valley transformer."""
+        return WestValleyTransformer(WEST_VALLEY_CONFIG)
+
+    def test_term_from_sobterm(self, transformer, banner_term):
+        """Test term name and dates come from the parent sobterm.json."""
+        output = transformer.transform(transformer.load_input(banner_term))
+
+        assert output["schedule"]["metadata"]["term"] == {
+            "code": "202570",
+            "name": "Fall 2025",
+            "start_date": "2025-08-23",
+            "end_date": "2025-12-12",
+        }
+
+    def test_join(self, transformer, banner_term):
+        """Test sections are joined with meetings, instructors and catalog."""
+        output = transformer.transform(transformer.load_input(banner_term))
+        courses = {c["course_id"]: c for c in output["schedule"]["courses"]}
+
+        math = courses["MATH-001A"]
+        assert math["title"] == "Calculus I"
+        assert math["units"] == 5.0
+        first, lab = math["sections"]
+        assert first["meetings"] == [
+            {
+                "type": "Lecture",
+                "days": ["M", "W"],
+                "start_time": "09:20",
+                "end_time": "10:45",
+                "location": {"building": "Science", "room": "101"},
+            }
+        ]
+        assert first["instructor"] == {
+            "name": "Lovelace, Ada",
+            "email": "ada.lovelace@wvm.edu",
+        }
+        assert first["attributes"]["instructors"] == [
+            "Lovelace, Ada",
+            "Babbage, Charles",
+        ]
+        assert first["attributes"]["cross_listed_crns"] == ["70002"]
+        assert first["attributes"]["census_date"] == "2025-09-08"
+        assert lab["meetings"][0]["type"] == "Lab"
+        assert lab["status"] == "Waitlist"
+
+        # Catalog entry missing: fall back to the section row
+        english = courses["ENGL-001A"]["sections"][0]
+        assert courses["ENGL-001A"]["units"] == 4.0
+        assert english["meetings"] == []
+        assert english["attributes"]["textbook_cost"] == "OER"
+        assert english["attributes"]["cohorts"] == ["WDUAL"]
+        assert output["schedule"]["extensions"]["subjects"] == {"MATH": "Mathematics"}
+
+    def test_terms_without_crns_use_meetings(self, transformer, banner_term):
+        """Test terms lacking crns.json are built from ssrmeet rows."""
+        (banner_term / "crns.json").unlink()
+        meetings = json.loads((banner_term / "ssrmeet.json").read_text())
+        for meeting in meetings:
+            meeting.update({"SUBJ": "MATH", "CRSE": "001A", "TITLE": "Calculus"})
+        (banner_term / "ssrmeet.json").write_text(json.dumps(meetings))
+
+        output = transformer.transform(transformer.load_input(banner_term))
+
+        (course,) = output["schedule"]["courses"]
+        assert [s["crn"] for s in course["sections"]] == ["70001", "70002"]
+        assert course["sections"][0]["status"] == "Open"
+
+    def test_legacy_instruction_modes(self, transformer, banner_term):
+        """Test numeric INSM codes of terms before 2022 map to current codes."""
+        sections = json.loads((banner_term / "crns.json").read_text())
+        sections[0]["SSBSECT_INSM_CODE"] = "72L"
+        sections[1]["SSBSECT_INSM_CODE"] = "02"
+        (banner_term / "crns.json").write_text(json.dumps(sections))
+
+        output = transformer.transform(transformer.load_input(banner_term))
+
+        modes = {
+            s["crn"]: s["instruction_mode"]
+            for c in output["schedule"]["courses"]
+            for s in c["sections"]
+        }
+        assert (modes["70001"], modes["70002"]) == ("AON", "INP")
+        assert StandardizedValidator(transformer.rules).validate(output).is_valid
+
+    @pytest.mark.skipif(
+        not (WEST_VALLEY_DATA / "202570").exists(), reason="example data missing"
+    )
+    def test_example_term_is_schema_valid(self, transformer):
+        """Test a full example term passes strict schema validation."""
+        validator = ExtensibleSchemaValidator(
+            PROJECT_ROOT / "data" / "schemas" / "base.json", WEST_VALLEY_CONFIG
+        )
+
+        output = transformer.transform(
+            transformer.load_input(WEST_VALLEY_DATA / "202570")
+        )
+
+        is_valid, errors = validator.validate(output, strict=True)
+        assert is_valid, errors[:5]
+        assert sum(len(c["sections"]) for c in output["schedule"]["courses"]) == 2001
+
+
+class TestNorthOrangeCountyTransformer:
+    """Test joining the North Orange County export files."""
+
+    @pytest.fixture
+    def transformer(self):
+        """Provide a North Orange County transformer."""
+        return NorthOrangeCountyTransformer(NORTH_ORANGE_COUNTY_CONFIG)
+
+    def test_term_from_sections(self, transformer, noccd_export):
+        """Test the term code comes from sections and its name from terms.json."""
+        output = transformer.transform(transformer.load_input(noccd_export))
+
+        assert output["schedule"]["metadata"]["term"] == {
+            "code": "202430",
+            "name": "Summer 2025",
+        }
+
+    def test_catalog_markers(self, transformer, noccd_export):
+        """Test !TITLE and !TRN markers are decoded from the catalog text."""
+        output = transformer.transform(transformer.load_input(noccd_export))
+        courses = {c["course_id"]: c for c in output["schedule"]["courses"]}
+
+        chem = courses["CHEM-111A C"]
+        assert chem["title"] == "General Chemistry I"
+        assert chem["units"] == 5.0
+        assert chem["transferable"] == {"csu": True, "uc": True}
+        assert chem["prerequisites"] == "CHEM 107 C with a grade of C or better."
+        assert chem["corequisites"] == "CHEM 111L C"
+
+    def test_join(self, transformer, noccd_export):
+        """Test sections are joined with instructors, campuses and meetings."""
+        output = transformer.transform(transformer.load_input(noccd_export))
+        courses = {c["course_id"]: c for c in output["schedule"]["courses"]}
+
+        lecture, lab = courses["CHEM-111A C"]["sections"]
+        assert lecture["meetings"] == [
+            {
+                "type": "Lecture",
+                "days": ["M", "W"],
+                "start_time": "13:30",
+                "end_time": "15:20",
+                "location": {
+                    "building": "Science-Eng-Math",
+                    "room": "116",
+                    "campus": "Cypress College",
+                },
+            }
+        ]
+        assert lecture["instructor"] == {
+            "name": "Curie, Marie",
+            "email": "mcurie@cypresscollege.edu",
+        }
+        assert lecture["dates"] == {"start": "2025-06-09", "end": "2025-07-20"}
+        assert lecture["attributes"]["enrollment_cutoff_date"] == "2025-06-16"
+        assert lab["meetings"][0]["type"] == "Lab"
+        assert lab["status"] == "Waitlist"
+
+        # Catalog entry missing: fall back to the section row
+        english = courses["ENGL-100 F"]
+        assert english["units"] == 4.0
+        assert "transferable" not in english
+        section = english["sections"][0]
+        assert section["meetings"] == []
+        assert section["instructor"] == {"name": "Austen, Jane"}
+        assert section["attributes"]["textbook_cost"] == "OER"
+        assert output["schedule"]["extensions"]["campuses"] == {
+            "1": "Cypress College",
+            "2": "Fullerton College",
+        }
+
+    def test_repeated_sections_are_dropped(self, transformer, noccd_export):
+        """Test a CRN listed twice produces one section."""
+        path = noccd_export / "sections.json"
+        rows = json.loads(path.read_text())
+        path.write_text(json.dumps([*rows, rows[0]]))
+
+        output = transformer.transform(transformer.load_input(noccd_export))
+
+        crns = [
+            section["crn"]
+            for course in output["schedule"]["courses"]
+            for section in course["sections"]
+        ]
+        assert crns == ["30001", "30002", "30003"]
+
+    @pytest.mark.skipif(
+        not (NORTH_ORANGE_COUNTY_DATA / "sections.json").exists(),
+        reason="example data missing",
+    )
+    def test_example_is_schema_valid(self, transformer):
+        """Test the example export passes strict schema validation."""
+        validator = ExtensibleSchemaValidator(
+            PROJECT_ROOT / "data" / "schemas" / "base.json",
+            NORTH_ORANGE_COUNTY_CONFIG,
+        )
+
+        output = transformer.transform(transformer.load_input(NORTH_ORANGE_COUNTY_DATA))
+
+        is_valid, errors = validator.validate(output, strict=True)
+        assert is_valid, errors[:5]
+        assert sum(len(c["sections"]) for c in output["schedule"]["courses"]) == 926
+
+    @pytest.mark.parametrize(
+        "text, short_title, title",
+        [
+            (
+                "!TITLE Introducción a la Química Este curso cubre la materia.",
+                "Intro a la Quím",
+                "Introducción a la Química",
+            ),
+            (
+                "!TITLE Independent Study I This course is self-paced. !TRN CSU",
+                "Indep Study",
+                "Independent Study I",
+            ),
+            (
+                "!TITLE An Introduction to The Theatre !PRQ None",
+                "Intro to The Theatre",
+                "An Introduction to The Theatre",
+            ),
+            (
+                "!TITLE Ballet I: Beginning Ballet !PRQ DANC 140 F",
+                "Ballet I: Beg",
+                "Ballet I: Beginning Ballet",
+            ),
+        ],
+    )
+    def test_long_title(self, text, short_title, title):
+        """Test the title ends at the next marker or the catalog description."""
+        assert _long_title(text, short_title) == title
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("06/09/2025", "2025-06-09"),
+            ("2025-06-09", "2025-06-09"),
+            ("TBA", "TBA"),
+            ("", None),
+        ],
+    )
+    def test_dates(self, value, expected):
+        """Test US dates are converted and other values kept."""
+        assert _to_date(value) == expected
+
+
+def collector_row(crn, subject="MATH", number="190", **overrides):
+    """Build a Rio Hondo collector row."""
+    row = {
+        "crn": crn,
+        "subject": subject,
+        "course_number": number,
+        "title": "Calculus",
+        "units": 5.0,
+        "instructor": "Noether, Emmy",
+        "status": "OPEN",
+        "delivery_method": "In Person",
+        "enrollment": {"actual": 10, "capacity": 30, "remaining": 20},
+        "meeting_times": [
+            {"days": "MW", "start_time": "08:00am", "end_time": "09:25am"}
+        ],
+        "location": "S201",
+    }
+    row.update(overrides)
+    return row
+
+
+class TestRioHondoStreaming:
+    """Test the streaming Rio Hondo pipeline."""
+
+    @pytest.fixture
+    def transformer(self):
+        """Provide a Rio Hondo transformer."""
+        return RioHondoTransformer(RIO_HONDO_CONFIG)
+
+    @pytest.fixture
+    def collector_file(self, temp_dir):
+        """Write a small collector file with sections grouped by course."""
+        path = temp_dir / "schedule.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "term": "Fall 2025",
+                    "term_code": "202570",
+                    "courses": [
+                        collector_row("70001"),
+                        collector_row("70002"),
+                        collector_row("70003", "ENGL", "101", title="Composition"),
+                    ],
+                    "total_courses": 3,
+                },
+                indent=2,
+            )
+        )
+        return path
+
+    def test_load_input(self, transformer, collector_file):
+        """Test header fields are read and courses are streamed from disk."""
+        input_data = transformer.load_input(collector_file)
+
+        assert input_data["term_code"] == "202570"
+        assert "total_courses" not in input_data
+        assert [row["crn"] for row in input_data["courses"]] == [
+            "70001",
+            "70002",
+            "70003",
+        ]
+
+    def test_stream_matches_transform(self, transformer, collector_file):
+        """Test the streamed output is byte-identical to transform()."""
+        input_data = transformer.load_input(collector_file)
+
+        expected = transformer.transform(json.loads(collector_file.read_text()))
+        streamed = transformer.transform_stream(input_data)
+        streamed["schedule"]["metadata"]["last_updated"] = expected["schedule"][
+            "metadata"
+        ]["last_updated"]
+
+        buffer = io.StringIO()
+        write_json_stream(streamed, buffer, indent=2)
+        assert buffer.getvalue() == json.dumps(expected, indent=2)
+        assert [c["course_id"] for c in expected["schedule"]["courses"]] == [
+            "MATH-190",
+            "ENGL-101",
+        ]
+
+    def test_meeting_parsing(self, transformer):
+        """Test collector times, days and delivery methods are normalized."""
+        section = transformer._transform_section(
+            collector_row(
+                "70001",
+                delivery_method="Hybrid Evening",
+                meeting_times=[
+                    {"days": "TR", "start_time": "06:00pm", "end_time": "7:15 PM"}
+                ],
+            )
+        )
+
+        (meeting,) = section["meetings"]
+        assert meeting["days"] == ["T", "R"]
+        assert (meeting["start_time"], meeting["end_time"]) == ("18:00", "19:15")
+        assert section["instruction_mode"] == "HYB"
+        assert transformer._instruction_modes["Hybrid Evening"] == "HYB"
+
+    def test_ungrouped_sections(self, transformer):
+        """Test a course whose sections are split up is still one course."""
+        input_data = {
+            "courses": [
+                collector_row("70001"),
+                collector_row("70002", "ENGL", "101"),
+                collector_row("70003"),
+            ]
+        }
+
+        courses = list(transformer.iter_courses(input_data))
+
+        assert courses == transformer.transform(input_data)["schedule"]["courses"]
+        assert [c["course_id"] for c in courses] == ["MATH-190", "ENGL-101"]
+        assert [len(c["sections"]) for c in courses] == [2, 1]
+
+
+class TestSectionCache:
+    """Test incremental transforms reusing unchanged sections."""
+
+    @pytest.fixture
+    def transformer(self):
+        """Provide a Rio Hondo transformer that counts transformed sections."""
+        transformer = RioHondoTransformer(RIO_HONDO_CONFIG)
+        transformer.transformed = []
+        transform_section = transformer._transform_section
+
+        def counting(section_data, course_data=None):
+            transformer.transformed.append(section_data["crn"])
+            return transform_section(section_data, course_data)
+
+        transformer._transform_section = counting
+        return transformer
+
+    def write_snapshot(self, path, rows):
+        """Write a collector snapshot."""
+        path.write_text(json.dumps({"term_code": "202570", "courses": rows}))
+        return path
+
+    def test_only_changed_rows_are_transformed(self, transformer, temp_dir):
+        """Test a second snapshot re-transforms only changed and new rows."""
+        state = temp_dir / "state.json"
+        fingerprint = transformer_fingerprint(transformer)
+        first = self.write_snapshot(
+            temp_dir / "first.json",
+            [collector_row("70001"), collector_row("70002"), collector_row("70003")],
+        )
+        second = self.write_snapshot(
+            temp_dir / "second.json",
+            [
+                collector_row("70001"),
+                collector_row(
+                    "70002",
+                    enrollment={"actual": 30, "capacity": 30, "remaining": 0},
+                ),
+                collector_row("70004"),
+            ],
+        )
+
+        transformer.section_cache = SectionCache.load(state, fingerprint)
+        list(transformer.iter_courses(transformer.load_input(first)))
+        transformer.section_cache.save(state)
+        assert transformer.transformed == ["70001", "70002", "70003"]
+
+        transformer.transformed.clear()
+        transformer.section_cache = cache = SectionCache.load(state, fingerprint)
+        courses = list(transformer.iter_courses(transformer.load_input(second)))
+        assert transformer.transformed == ["70002", "70004"]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        transformer.section_cache = None
+        expected = list(transformer.iter_courses(transformer.load_input(second)))
+        assert courses == expected
+        assert expected[0]["sections"][1]["enrollment"]["available"] == 0
+
+        # Dropped sections are not carried into the saved state
+        cache.save(state)
+        saved = json.loads(state.read_text())["sections"]
+        assert sorted(saved) == ["70001", "70002", "70004"]
+
+    def test_fingerprint_mismatch_discards_state(self, transformer, temp_dir):
+        """Test state written for another config or transformer is ignored."""
+        state = temp_dir / "state.json"
+        cache = SectionCache("old")
+        row = collector_row("70001")
+        cache.section("70001", row_digest(row), lambda: {"crn": "stale"})
+        cache.save(state)
+
+        assert SectionCache.load(state, "old").entries
+        assert not SectionCache.load(
+            state, transformer_fingerprint(transformer)
+        ).entries
+
+    def test_interrupted_save_keeps_state(self, temp_dir, monkeypatch):
+        """Test a save cut off midway leaves the previous state loadable."""
+        state = temp_dir / "state.json"
+        cache = SectionCache("v1")
+        cache.section("70001", "digest", lambda: {"crn": "70001"})
+        cache.save(state)
+
+        def broken_dumps(*_args, **_kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(json, "dumps", broken_dumps)
+        with pytest.raises(OSError):
+            cache.save(state)
+        monkeypatch.undo()
+
+        assert list(SectionCache.load(state, "v1").entries) == ["70001"]
+        assert [p.name for p in temp_dir.iterdir()] == ["state.json"]
+
+    def test_corrupt_state_is_a_miss(self, temp_dir):
+        """Test a state file that does not parse gives an empty cache."""
+        state = temp_dir / "state.json"
+        state.write_text('{"version": 1, "sections": {"70')
+
+        assert not SectionCache.load(state, "v1").entries
+
+    @pytest.mark.parametrize(
+        "module", [base_transformer, college_rules, time_utils, rio_hondo_transformer]
+    )
+    def test_fingerprint_covers_shared_code(
+        self, transformer, temp_dir, monkeypatch, module
+    ):
+        """Test editing the base class or shared helpers changes the fingerprint."""
+        before = transformer_fingerprint(transformer)
+        edited = temp_dir / "edited.py"
+        edited.write_bytes(Path(module.__file__).read_bytes() + b"\n# edited\n")
+        getfile = inspect.getfile
+        monkeypatch.setattr(
+            inspect, "getfile", lambda obj: edited if obj is module else getfile(obj)
+        )
+
+        assert transformer_fingerprint(transformer) != before
+
+    def test_in_memory_rows(self, transformer):
+        """Test rows without source text are digested from their content."""
+        transformer.section_cache = SectionCache()
+        input_data = {"courses": [collector_row("70001")]}
+
+        first = transformer.transform(input_data)
+        second = transformer.transform(
+            {"courses": [dict(reversed(collector_row("70001").items()))]}
+        )
+
+        assert transformer.transformed == ["70001"]
+        assert first["schedule"]["courses"] == second["schedule"]["courses"]
@@ -0,0 +1,444 @@
+"""Tests for course and schedule validators."""
+
+import copy
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import generate_schedule, generate_standardized
+from src.college_rules import load_college_rules
+from src.data_utils import load_schedule_data
+from src.validators import (
+    CourseValidator,
+    ScheduleValidator,
+    StandardizedValidator,
+    ValidationResult,
+    validate_schedule_file,
+)
+
+RIO_HONDO_CONFIG = (
+    Path(__file__).parent.parent / "colleges" / "rio-hondo" / "config.json"
+)
+WEST_VALLEY_CONFIG = (
+    Path(__file__).parent.parent / "colleges" / "west-valley-mission" / "config.json"
+)
+
+
+def make_course(index: int = 0, **section_overrides) -> dict:
+    """Build a valid legacy course dictionary with a single section."""
+    section = {
+        "crn": f"{10000 + index}",
+        "instrMethod": "INP",
+        "instructorName": f"Instructor {index}",
+        "instructorEmail": f"instructor{index}@example.edu",
+        "days": "MW",
+        "startTime": "09:00",
+        "endTime": "10:30",
+        "location": f"Room {100 + index}",
+        "capacity": 30,
+        "enrolled": 10,
+        "enrollStatus": "Open",
+    }
+    section.update(section_overrides)
+    return {
+        "course_id": "CS101",
+        "title": "Intro to CS",
+        "units": 3,
+        "college": "Example College",
+        "term": "202530",
+        "sections": [section],
+    }
+
+
+class TestValidationResult:
+    """Test diagnostic grouping and bounded storage."""
+
+    def test_groups_by_rule_and_field_pattern(self):
+        """Test that indexed fields collapse into one group."""
+        result = ValidationResult(max_examples=2)
+        for i in range(10):
+            result.add_warning(f"course[{i}].instructor", "Missing email", rule="r")
+
+        assert result.warning_count == 10
+        assert len(result.warnings) == 2
+        assert len(result.groups) == 1
+
+        group = result.get_groups()[0]
+        assert group.field_pattern == "course[*].instructor"
+        assert group.count == 10
+        assert [e["field"] for e in group.examples] == [
+            "course[0].instructor",
+            "course[1].instructor",
+        ]
+
+    def test_errors_are_counted_beyond_examples(self):
+        """Test that validity reflects every error, not just kept examples."""
+        result = ValidationResult(max_examples=1)
+        result.add_error("crn", "Invalid CRN 'a'", rule="crn_format")
+        result.add_error("crn", "Invalid CRN 'b'", rule="crn_format")
+
+        assert not result.is_valid
+        assert result.error_count == 2
+        assert len(result.errors) == 1
+        assert "Errors: 2" in result.get_summary()
+
+    def test_stream_receives_every_diagnostic(self):
+        """Test that the JSONL stream gets the full diagnostic list."""
+        stream = io.StringIO()
+        result = ValidationResult(max_examples=1, stream=stream)
+        for i in range(3):
+            result.add_error(f"sections[{i}].crn", "Section missing CRN", rule="crn")
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["field"] for line in lines] == [
+            "sections[0].crn",
+            "sections[1].crn",
+            "sections[2].crn",
+        ]
+        assert all(line["severity"] == "error" for line in lines)
+
+    def test_scope_prefixes_fields(self):
+        """Test that scoped diagnostics get the prefix without mutation."""
+        result = ValidationResult()
+        with result.scope("course[3]"):
+            result.add_warning("term", "Bad term", rule="term_format")
+        result.add_warning("term", "Bad term", rule="term_format")
+
+        assert [w["field"] for w in result.warnings] == ["course[3].term", "term"]
+
+    def test_report_is_json_serializable(self):
+        """Test the bounded report structure."""
+        result = ValidationResult()
+        result.add_error("crn", "Bad", rule="crn_format")
+        report = json.loads(json.dumps(result.get_report()))
+
+        assert report["valid"] is False
+        assert report["groups"][0]["rule"] == "crn_format"
+
+
+class TestCourseValidator:
+    """Test course validation aggregation."""
+
+    def test_validate_courses_aggregates_warnings(self):
+        """Test that identical warnings across courses stay bounded."""
+        courses = [make_course(i, instructorEmail=None) for i in range(50)]
+        result = CourseValidator().validate_courses(courses)
+
+        assert result.is_valid
+        assert result.total_count == 50
+        assert result.valid_count == 50
+        assert result.warning_count == 50
+        assert len(result.warnings) == 5
+        assert result.warnings[0]["field"] == "course[0].sections[0].instructor"
+
+        group = result.get_groups()[0]
+        assert group.rule == "instructor_email_missing"
+        assert group.field_pattern == "course[*].sections[*].instructor"
+
+    def test_validate_courses_counts_invalid(self):
+        """Test valid counts with a mix of good and bad courses."""
+        courses = [make_course(0), make_course(1, crn="12")]
+        result = CourseValidator().validate_courses(courses)
+
+        assert result.valid_count == 1
+        assert result.errors[0].field == "course[1].sections[0].crn"
+
+    def test_schedule_validator(self):
+        """Test schedule validation shares one result."""
+        data = {
+            "metadata": {"version": "1.0.0", "last_updated": "2025-01-01T00:00:00Z"},
+            "courses": [make_course(0), make_course(1)],
+        }
+        result = ScheduleValidator().validate_schedule(data)
+
+        assert result.is_valid
+        assert result.total_count == 2
+
+
+class TestConsistencyChecks:
+    """Test cross-record consistency checks."""
+
+    def test_duplicate_crn_within_term(self):
+        """Test duplicate CRNs are errors only within the same term."""
+        courses = [make_course(0), make_course(1, crn="10000"), make_course(2)]
+        courses[2]["term"] = "202570"
+        courses[2]["sections"][0]["crn"] = "10000"
+
+        result = CourseValidator().validate_consistency(courses)
+
+        assert result.error_count == 1
+        assert result.errors[0].field == "course[1].sections[0].crn"
+
+    def test_room_double_booking(self):
+        """Test overlapping meetings in one room on a shared day."""
+        courses = [
+            make_course(0, location="Room 9", days="MW"),
+            make_course(1, location="Room 9", days="W", startTime="10:00"),
+            make_course(2, location="Room 9", days="TR"),
+            make_course(3, location="Room 9", days="M", startTime="10:30"),
+        ]
+        result = CourseValidator().validate_consistency(courses)
+
+        groups = {g.rule: g.count for g in result.get_groups()}
+        assert groups == {"room_double_booked": 1}
+        assert "10001" in result.warnings[0]["message"]
+
+    def test_instructor_double_booking(self):
+        """Test overlapping meetings for one instructor in different rooms."""
+        courses = [
+            make_course(0, instructorName="Dr. Smith"),
+            make_course(1, instructorName="Dr. Smith", startTime="08:00"),
+            make_course(2, instructorName="TBA"),
+            make_course(3, instructorName="TBA"),
+        ]
+        result = CourseValidator().validate_consistency(courses)
+
+        groups = {g.rule: g.count for g in result.get_groups()}
+        assert groups == {"instructor_double_booked": 1}
+
+    def test_online_rooms_are_ignored(self):
+        """Test that shared placeholder rooms are not double-booked."""
+        courses = [
+            make_course(i, location="Online", instructorName=f"I{i}") for i in range(3)
+        ]
+        result = CourseValidator().validate_consistency(courses)
+        assert result.warning_count == 0
+
+    def test_term_missing_from_metadata(self):
+        """Test the schedule validator checks terms against metadata."""
+        courses = [make_course(0), make_course(1)]
+        courses[1]["term"] = "202570"
+        data = {
+            "metadata": {
+                "version": "1.0.0",
+                "last_updated": "2025-01-01T00:00:00Z",
+                "terms": [{"code": "202530", "name": "Spring 2025"}],
+            },
+            "courses": courses,
+        }
+        result = ScheduleValidator().validate_schedule(data)
+
+        assert [e.field for e in result.errors] == ["course[1].sections[0].term"]
+
+
+class TestValidateScheduleFile:
+    """Test file-level validation."""
+
+    def test_missing_file(self, temp_dir):
+        """Test validation of a missing file."""
+        result = validate_schedule_file(temp_dir / "missing.json")
+        assert not result.is_valid
+        assert result.errors[0].field == "file"
+
+    @pytest.mark.parametrize("max_examples", [1, 3])
+    def test_diagnostics_file(self, temp_dir, max_examples):
+        """Test streaming the full diagnostic list to a JSONL file."""
+        data = {
+            "metadata": {"version": "1.0.0", "last_updated": "2025-01-01T00:00:00Z"},
+            "courses": [make_course(i, instructorEmail=None) for i in range(4)],
+        }
+        schedule_file = temp_dir / "schedule.json"
+        schedule_file.write_text(json.dumps(data))
+        diagnostics = temp_dir / "diagnostics.jsonl"
+
+        result = validate_schedule_file(
+            schedule_file, max_examples=max_examples, diagnostics_path=diagnostics
+        )
+
+        assert len(result.warnings) == max_examples
+        assert len(diagnostics.read_text().splitlines()) == 4
+
+
+class TestStandardizedValidator:
+    """Test validation of the standardized (nested) layout."""
+
+    @pytest.fixture
+    def standardized(self):
+        """Provide standardized data without room or instructor clashes."""
+        data = generate_standardized(8)
+        for i, section in enumerate(self._sections(data)):
+            section["meetings"][0]["location"]["room"] = str(500 + i)
+            section["instructor"] = {
+                "name": f"Instructor {i}",
+                "email": f"instructor{i}@example.edu",
+            }
+        return data
+
+    @staticmethod
+    def _sections(data):
+        return [
+            section
+            for course in data["schedule"]["courses"]
+            for section in course["sections"]
+        ]
+
+    def test_valid_dict(self, standardized):
+        """Test valid standardized data produces no errors."""
+        result = StandardizedValidator().validate(standardized)
+
+        assert result.is_valid, result.get_summary()
+        assert result.total_count == len(standardized["schedule"]["courses"])
+        assert result.valid_count == result.total_count
+
+    def test_invalid_section_fields(self, standardized):
+        """Test nested section fields are checked."""
+        section = self._sections(standardized)[0]
+        section["crn"] = "12"
+        section["status"] = "Full"
+        section["enrollment"]["enrolled"] = -1
+        section["instructor"]["email"] = "not-an-email"
+        meeting = section["meetings"][0]
+        meeting["type"] = "Seminar"
+        meeting["days"] = ["M", "X"]
+        meeting["start_time"] = "10:00"
+        meeting["end_time"] = "09:00"
+
+        result = StandardizedValidator().validate(standardized)
+
+        rules = {group.rule for group in result.get_groups()}
+        assert {
+            "crn_format",
+            "status",
+            "enrollment_negative",
+            "instructor_email_format",
+            "meeting_type",
+            "meeting_days",
+            "time_range",
+        } <= rules
+        assert result.errors[0].field.startswith("courses[0].sections[0]")
+
+    def test_iter_validate_streamed_courses(self, standardized):
+        """Test courses passed through iter_validate get the same diagnostics."""
+        self._sections(standardized)[0]["crn"] = "12"
+        schedule = standardized["schedule"]
+        expected = StandardizedValidator().validate(standardized)
+
+        result = ValidationResult()
+        streamed = {**schedule, "courses": iter(schedule["courses"])}
+        courses = list(StandardizedValidator().iter_validate(streamed, result))
+
+        assert courses == schedule["courses"]
+        assert result.get_report() == expected.get_report()
+
+    def test_missing_metadata(self, standardized):
+        """Test metadata requirements are checked."""
+        del standardized["schedule"]["metadata"]["term"]
+
+        result = StandardizedValidator().validate(standardized)
+
+        assert [e.field for e in result.errors] == ["metadata.term"]
+
+    def test_consistency_in_same_pass(self, standardized):
+        """Test duplicate CRNs and double-booked rooms are reported."""
+        sections = self._sections(standardized)
+        sections[1]["crn"] = sections[0]["crn"]
+        sections[3]["meetings"] = copy.deepcopy(sections[2]["meetings"])
+
+        result = StandardizedValidator().validate(standardized)
+
+        rules = {group.rule for group in result.get_groups()}
+        assert "duplicate_crn" in rules
+        assert "room_double_booked" in rules
+
+        skipped = StandardizedValidator(check_consistency=False).validate(standardized)
+        assert skipped.is_valid
+
+    @pytest.mark.parametrize(
+        "building,room",
+        [
+            ("ONLINE", "ONLINE"),
+            ("ZOOM", "TBA"),
+            ("Online", "Online"),
+            ("ONLINE-WV", "ONLINE"),
+            ("ONLINE-WV", "ONLINEL"),
+            ("ONLINE", "ONLINE L"),
+            ("MC OFFCAMPUS", "TBA"),
+            ("WV Off Campus", "OFFCMP"),
+        ],
+    )
+    def test_placeholder_rooms(self, standardized, building, room):
+        """Test placeholder rooms are not double-booked, whatever the building."""
+        sections = self._sections(standardized)
+        sections[1]["meetings"] = copy.deepcopy(sections[0]["meetings"])
+        for section in sections[:2]:
+            section["meetings"][0]["location"].update(building=building, room=room)
+
+        result = StandardizedValidator().validate(standardized)
+
+        assert "room_double_booked" not in {g.rule for g in result.get_groups()}
+
+    def test_cross_listed_and_placeholder_instructors(self, standardized):
+        """Test cross-listed sections and placeholder instructors never clash."""
+        sections = self._sections(standardized)
+        for section in sections[1:4]:
+            section["meetings"] = copy.deepcopy(sections[0]["meetings"])
+        sections[0]["attributes"]["cross_listed_crns"] = [sections[1]["crn"]]
+        sections[1]["instructor"] = dict(sections[0]["instructor"])
+        for i, section in enumerate(sections[2:4]):
+            section["meetings"][0]["location"]["room"] = str(600 + i)
+            section["instructor"] = {"name": "Staff, TBD"}
+
+        result = StandardizedValidator().validate(standardized)
+
+        assert not [g for g in result.get_groups() if "double_booked" in g.rule]
+
+    def test_college_rules(self, standardized):
+        """Test college-specific rules are applied per section."""
+        rules = load_college_rules(RIO_HONDO_CONFIG)
+        self._sections(standardized)[0]["instruction_mode"] = "XYZ"
+
+        result = StandardizedValidator(rules).validate(standardized)
+
+        assert [g.rule for g in result.get_groups() if g.severity == "error"] == [
+            "college_rules"
+        ]
+
+    def test_schedule_dataclasses(self, temp_dir):
+        """Test validating loaded Schedule dataclasses."""
+        data = generate_schedule(12)
+        for i, section in enumerate(
+            s for c in data["schedule"]["courses"] for s in c["sections"]
+        ):
+            section["meetings"][0]["location"]["room"] = str(500 + i)
+            section["instructors"] = [str(i)]
+        data["schedule"]["courses"][0]["sections"][0]["meetings"][0]["end_time"] = (
+            "25:00"
+        )
+        path = temp_dir / "schedule.json"
+        path.write_text(json.dumps(data))
+
+        result = StandardizedValidator().validate_schedule(load_schedule_data(path))
+
+        assert [g.rule for g in result.get_groups() if g.severity == "error"] == [
+            "time_format"
+        ]
+        assert result.total_count == len(data["schedule"]["courses"])
+
+    def test_schedule_dataclasses_match_dict_rules(self, temp_dir):
+        """Test dataclasses get the email, metadata and college rule checks."""
+        data = generate_schedule(12)
+        schedule = data["schedule"]
+        sections = [s for c in schedule["courses"] for s in c["sections"]]
+        for i, section in enumerate(sections):
+            section["meetings"][0]["location"]["room"] = str(500 + i)
+            section["instructors"] = [str(i)]
+            section["instruction_mode"] = "INP"
+            section["textbook"]["cost_category"] = "ZTC"
+        sections[0]["instruction_mode"] = ""
+        sections[1]["textbook"]["cost_category"] = "FREE"
+        schedule["instructors"][0]["email"] = "not-an-email"
+        schedule["metadata"]["version"] = ""
+        path = temp_dir / "schedule.json"
+        path.write_text(json.dumps(data))
+
+        validator = StandardizedValidator(load_college_rules(WEST_VALLEY_CONFIG))
+        result = validator.validate_schedule(load_schedule_data(path))
+
+        errors = {(e.field, e.message.split("'")[0]) for e in result.errors}
+        assert errors == {
+            ("metadata.version", "Missing required field "),
+            ("instructors[0].email", "Invalid email format: "),
+            ("courses[0].sections[1]", "Invalid textbook cost "),
+        }